@@ -133,6 +133,8 @@ class Ammus(pygame.sprite.Sprite):
         init_y = y + world_offset.y
         self.rect = self.image.get_rect(center=(init_x, init_y))
         self.pos = pygame.math.Vector2(init_x, init_y)
+        # position at the start of the last update; collisions sweep prev_pos -> pos
+        self.prev_pos = pygame.math.Vector2(self.pos)
         self.angle = angle
 
         # velocity vector based on speed and angle
@@ -140,6 +142,7 @@ class Ammus(pygame.sprite.Sprite):
 
     def update(self, dt):
         dt_s = dt / 1000.0
+        self.prev_pos.update(self.pos)
         self.pos += self.vel * dt_s
         self.rect.center = (int(self.pos.x), int(self.pos.y))
 
@@ -1,11 +1,41 @@
 """Collision utilities package."""
 
-from .collisions import SpatialHash, apply_impact, separate, _get_pos, get_collision_radius
+from .collisions import (
+    SpatialHash,
+    HierarchicalSpatialHash,
+    apply_impact,
+    separate,
+    _get_pos,
+    get_collision_radius,
+    query_radius,
+    segment_aabb_toi,
+    swept_rect_toi,
+    swept_bounds,
+    swept_point,
+)
+from .numpy_narrowphase import NUMPY_AVAILABLE, NumpyNarrowphase
+from .layers import CollisionCategory, CollisionMatrix, build_collision_matrix
+from .events import KillEvent, KillQueue
+from .separation import CrowdSeparator
 
 __all__ = [
     "SpatialHash",
+    "HierarchicalSpatialHash",
     "apply_impact",
     "separate",
     "_get_pos",
     "get_collision_radius",
+    "query_radius",
+    "segment_aabb_toi",
+    "swept_rect_toi",
+    "swept_bounds",
+    "swept_point",
+    "NUMPY_AVAILABLE",
+    "NumpyNarrowphase",
+    "CollisionCategory",
+    "CollisionMatrix",
+    "build_collision_matrix",
+    "KillEvent",
+    "KillQueue",
+    "CrowdSeparator",
 ]
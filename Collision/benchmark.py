@@ -0,0 +1,289 @@
+"""Micro-benchmark for the projectile collision backends.
+
+Usage:
+
+    python -m Collision.benchmark --bullets 16 64 256 --targets 40 160 640
+
+Builds synthetic scenes (moving bullets with ``prev_pos``, static target rects
+spread over a level-sized area) and times one "find the earliest hit for every
+bullet" pass with each backend:
+
+    brute    every bullet against every target with swept_rect_toi
+    spatial  SpatialHash.query_into(swept_bounds) + swept_rect_toi
+    numpy    NumpyNarrowphase.first_hits (skipped without NumPy)
+
+All backends must agree on the hits; a mismatch raises AssertionError so the
+numbers are never reported for a broken backend.
+
+``--grids`` compares the flat ``SpatialHash`` with ``HierarchicalSpatialHash``
+instead, on scenes that mix small bodies with large ones:
+
+    python -m Collision.benchmark --grids --small 200 800 --large 2 8 32
+
+    boss   few very large rects (boss sprites, 300-520 px) among small ones
+    bomb   many 300 px blast areas among small ones
+
+Each grid is timed on a re-sync after every body moved, small queries (bullet
+swept bounds) and blast queries (300 px rects). Query results are filtered
+with ``colliderect`` and must match between the grids.
+"""
+
+import argparse
+import random
+import time
+
+import pygame
+
+from Collision.collisions import HierarchicalSpatialHash, SpatialHash, swept_bounds, swept_rect_toi
+from Collision.numpy_narrowphase import NUMPY_AVAILABLE, NumpyNarrowphase
+
+
+class _Body:
+    __slots__ = ("rect", "pos", "prev_pos")
+
+    def __init__(self, rect, pos=None, prev_pos=None):
+        self.rect = rect
+        self.pos = pos
+        self.prev_pos = prev_pos
+
+
+def make_scene(bullet_count, target_count, world=(3000, 2000), seed=0):
+    """Random bullets (10x10, 8-16 px/tick) and targets (48x48) in ``world``."""
+    rng = random.Random(seed)
+    width, height = world
+    targets = []
+    for _ in range(target_count):
+        rect = pygame.Rect(0, 0, 48, 48)
+        rect.center = (rng.randrange(width), rng.randrange(height))
+        targets.append(_Body(rect))
+    bullets = []
+    for _ in range(bullet_count):
+        pos = pygame.Vector2(rng.uniform(0, width), rng.uniform(0, height))
+        velocity = pygame.Vector2(rng.uniform(8, 16), 0).rotate(rng.uniform(0, 360))
+        rect = pygame.Rect(0, 0, 10, 10)
+        rect.center = (round(pos.x), round(pos.y))
+        bullets.append(_Body(rect, pos, pos - velocity))
+    return bullets, targets
+
+
+def _earliest(bullet, candidates):
+    best = None
+    best_t = None
+    for target in candidates:
+        t = swept_rect_toi(bullet, target.rect)
+        if t is not None and (best_t is None or t < best_t):
+            best, best_t = target, t
+    return best
+
+
+def run_brute(bullets, targets):
+    return [_earliest(bullet, targets) for bullet in bullets]
+
+
+def run_spatial(bullets, targets, spatial_hash, rank, buf):
+    spatial_hash.sync(targets)
+    hits = []
+    for bullet in bullets:
+        candidates = spatial_hash.query_into(swept_bounds(bullet), buf)
+        if len(candidates) > 1:
+            candidates.sort(key=rank.__getitem__)
+        hits.append(_earliest(bullet, candidates))
+    return hits
+
+
+def run_numpy(bullets, targets, narrowphase):
+    hits = [None] * len(bullets)
+    for bullet_index, target_index, _t in narrowphase.first_hits(bullets, targets):
+        hits[bullet_index] = targets[target_index]
+    return hits
+
+
+def _time(fn, repeats):
+    best = float("inf")
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000.0, result
+
+
+def benchmark(bullet_counts, target_counts, repeats=20, seed=0, world=(3000, 2000)):
+    """Return rows of (bullets, targets, {backend: best ms})."""
+    narrowphase = NumpyNarrowphase() if NUMPY_AVAILABLE else None
+    rows = []
+    for bullet_count in bullet_counts:
+        for target_count in target_counts:
+            bullets, targets = make_scene(bullet_count, target_count, world=world, seed=seed)
+            rank = {target: index for index, target in enumerate(targets)}
+            spatial_hash = SpatialHash()
+            buf = []
+
+            timings = {}
+            timings["brute"], expected = _time(lambda: run_brute(bullets, targets), repeats)
+            timings["spatial"], hits = _time(
+                lambda: run_spatial(bullets, targets, spatial_hash, rank, buf), repeats)
+            assert hits == expected, "spatial backend disagrees with brute force"
+            if narrowphase is not None:
+                timings["numpy"], hits = _time(lambda: run_numpy(bullets, targets, narrowphase), repeats)
+                assert hits == expected, "numpy backend disagrees with brute force"
+            rows.append((bullet_count, target_count, timings))
+    return rows
+
+
+LARGE_SIZES = {
+    "boss": (300, 520),
+    "bomb": (300, 300),
+}
+
+
+def make_mixed_scene(kind, small_count, large_count, world=(3000, 2000), seed=0):
+    """``small_count`` 24-64 px bodies plus ``large_count`` bodies sized for ``kind``."""
+    rng = random.Random(seed)
+    width, height = world
+    low, high = LARGE_SIZES[kind]
+    bodies = []
+    for _ in range(small_count):
+        size = rng.randint(24, 64)
+        rect = pygame.Rect(0, 0, size, size)
+        rect.center = (rng.randrange(width), rng.randrange(height))
+        bodies.append(_Body(rect))
+    for _ in range(large_count):
+        size = rng.randint(low, high)
+        rect = pygame.Rect(0, 0, size, size)
+        rect.center = (rng.randrange(width), rng.randrange(height))
+        bodies.append(_Body(rect))
+    return bodies
+
+
+def _query_rects(count, size, world, rng):
+    width, height = world
+    rects = []
+    for _ in range(count):
+        rect = pygame.Rect(0, 0, size, size)
+        rect.center = (rng.randrange(width), rng.randrange(height))
+        rects.append(rect)
+    return rects
+
+
+def _jitter(bodies, rng):
+    for body in bodies:
+        body.rect.move_ip(rng.randint(-12, 12), rng.randint(-12, 12))
+
+
+def _run_queries(grid, rects, buf):
+    visited = 0
+    hits = []
+    for rect in rects:
+        candidates = grid.query_into(rect, buf)
+        visited += len(candidates)
+        hits.append(sorted(id(body) for body in candidates if body.rect.colliderect(rect)))
+    return visited, hits
+
+
+def _cell_entries(grid):
+    if isinstance(grid, HierarchicalSpatialHash):
+        return grid.cell_count()
+    return sum((x2 - x1 + 1) * (y2 - y1 + 1) for x1, y1, x2, y2 in grid.items.values())
+
+
+def benchmark_grids(small_counts, large_counts, kinds=("boss", "bomb"), repeats=20, seed=0,
+                    world=(3000, 2000), queries=256):
+    """Return rows of (kind, small, large, {grid: {metric: value}})."""
+    rows = []
+    for kind in kinds:
+        for small_count in small_counts:
+            for large_count in large_counts:
+                bodies = make_mixed_scene(kind, small_count, large_count, world=world, seed=seed)
+                rng = random.Random(seed + 1)
+                small_rects = _query_rects(queries, 24, world, rng)
+                blast_rects = _query_rects(queries // 4, 300, world, rng)
+                grids = {"flat": SpatialHash(), "hier": HierarchicalSpatialHash()}
+                results = {}
+                expected = None
+                for name, grid in grids.items():
+                    buf = []
+                    grid.sync(bodies)
+                    move_rng = random.Random(seed + 2)
+
+                    def resync():
+                        _jitter(bodies, move_rng)
+                        return grid.sync(bodies)
+
+                    sync_ms, _ = _time(resync, repeats)
+                    small_ms, (small_visited, small_hits) = _time(
+                        lambda: _run_queries(grid, small_rects, buf), repeats)
+                    blast_ms, (blast_visited, blast_hits) = _time(
+                        lambda: _run_queries(grid, blast_rects, buf), repeats)
+                    results[name] = {
+                        "sync": sync_ms,
+                        "small": small_ms,
+                        "blast": blast_ms,
+                        "visited": small_visited + blast_visited,
+                        "cells": _cell_entries(grid),
+                    }
+                    # Both grids see the same moves (same seed), so the final
+                    # positions and therefore the exact hits must agree.
+                    hits = (small_hits, blast_hits)
+                    if expected is None:
+                        expected = hits
+                    else:
+                        assert hits == expected, f"{name} grid disagrees with the flat grid"
+                    _reset_positions(bodies, kind, small_count, large_count, world, seed)
+                rows.append((kind, small_count, large_count, results))
+    return rows
+
+
+def _reset_positions(bodies, kind, small_count, large_count, world, seed):
+    fresh = make_mixed_scene(kind, small_count, large_count, world=world, seed=seed)
+    for body, original in zip(bodies, fresh):
+        body.rect = original.rect
+
+
+def _print_grid_rows(rows):
+    metrics = ("sync", "small", "blast")
+    header = f"{'scene':>6} {'small':>6} {'large':>6} "
+    header += " ".join(f"{grid + ' ' + metric:>12}" for grid in ("flat", "hier") for metric in metrics)
+    header += f" {'flat cells':>10} {'hier cells':>10} {'flat seen':>10} {'hier seen':>10}"
+    print(header)
+    for kind, small_count, large_count, results in rows:
+        cells = " ".join(f"{results[grid][metric]:12.3f}" for grid in ("flat", "hier") for metric in metrics)
+        print(f"{kind:>6} {small_count:>6} {large_count:>6} {cells}"
+              f" {results['flat']['cells']:>10} {results['hier']['cells']:>10}"
+              f" {results['flat']['visited']:>10} {results['hier']['visited']:>10}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the projectile collision backends.")
+    parser.add_argument("--bullets", type=int, nargs="+", default=[4, 16, 64, 256])
+    parser.add_argument("--targets", type=int, nargs="+", default=[10, 40, 160, 640])
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--world", type=int, nargs=2, default=[3000, 2000], metavar=("W", "H"),
+                        help="scene size; a screen-sized area gives the dense case")
+    parser.add_argument("--grids", action="store_true",
+                        help="compare SpatialHash with HierarchicalSpatialHash instead")
+    parser.add_argument("--small", type=int, nargs="+", default=[200, 800])
+    parser.add_argument("--large", type=int, nargs="+", default=[2, 8, 32])
+    args = parser.parse_args(argv)
+
+    if args.grids:
+        rows = benchmark_grids(args.small, args.large, repeats=args.repeats, seed=args.seed,
+                               world=tuple(args.world))
+        _print_grid_rows(rows)
+        return rows
+
+    rows = benchmark(args.bullets, args.targets, repeats=args.repeats, seed=args.seed,
+                     world=tuple(args.world))
+    backends = ["brute", "spatial"] + (["numpy"] if NUMPY_AVAILABLE else [])
+    print(f"{'bullets':>8} {'targets':>8} {'pairs':>8} " + " ".join(f"{name + ' ms':>11}" for name in backends))
+    for bullet_count, target_count, timings in rows:
+        cells = " ".join(f"{timings[name]:11.3f}" for name in backends)
+        print(f"{bullet_count:>8} {target_count:>8} {bullet_count * target_count:>8} {cells}")
+    if not NUMPY_AVAILABLE:
+        print("NumPy not installed: numpy backend skipped")
+    return rows
+
+
+if __name__ == "__main__":
+    main()
@@ -1,44 +1,530 @@
+import math
 import random
+
 import pygame
 
 SPATIAL_GRID_SIZE = 64
 
 class SpatialHash:
+    """Uniform grid broadphase keyed by integer cell coordinates.
+
+    The index is incremental: every entity remembers the cell range it was
+    filed under, so ``move()`` only touches the grid when the entity's rect
+    crosses a cell boundary. That makes it cheap to keep one long-lived index
+    of slow-changing sets (enemies, meteors, pickups) and ``sync()`` it once
+    per tick instead of clearing and refilling it.
+
+    Queries come in three flavours:
+
+    * ``query(rect)`` returns a new ``set`` (legacy API).
+    * ``query_each(rect, callback)`` calls ``callback(entity)`` once per
+      unique entity and allocates nothing.
+    * ``query_into(rect, out)`` clears and fills a caller-owned list.
+    """
+
     def __init__(self, cell_size=SPATIAL_GRID_SIZE):
         self.cell_size = int(cell_size)
         self.grid = {}
-        self.items = set()
+        # entity -> (x1, y1, x2, y2) inclusive cell range it is filed under
+        self.items = {}
+        # Query/sync stamps for duplicate suppression without temporary sets.
+        self._stamp = 0
+        self._seen = {}
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, entity):
+        return entity in self.items
+
+    def clear(self):
+        # Drop the cell keys too: queries and sync would otherwise keep
+        # walking empty buckets left behind by earlier worlds.
+        self.grid.clear()
+        self.items.clear()
+        self._seen.clear()
 
     def rebuild(self):
-        self.grid = {}
-        for item in self.items:
-            self.insert(item)
+        """Re-file every entity from its current rect."""
+        for entity in list(self.items):
+            self.move(entity)
+
+    def _cell_range(self, rect):
+        cs = self.cell_size
+        return (rect.left // cs, rect.top // cs, rect.right // cs, rect.bottom // cs)
+
+    def _add_to_cells(self, entity, bounds):
+        grid = self.grid
+        x1, y1, x2, y2 = bounds
+        for cx in range(x1, x2 + 1):
+            for cy in range(y1, y2 + 1):
+                bucket = grid.get((cx, cy))
+                if bucket is None:
+                    grid[(cx, cy)] = [entity]
+                else:
+                    bucket.append(entity)
+
+    def _remove_from_cells(self, entity, bounds):
+        grid = self.grid
+        x1, y1, x2, y2 = bounds
+        for cx in range(x1, x2 + 1):
+            for cy in range(y1, y2 + 1):
+                key = (cx, cy)
+                bucket = grid.get(key)
+                if bucket:
+                    try:
+                        bucket.remove(entity)
+                    except ValueError:
+                        continue
+                    # Drop emptied cells so the grid only holds occupied keys
+                    if not bucket:
+                        del grid[key]
 
     def insert(self, entity):
-        self.items.add(entity)
-        for cell in self._rect_cells(entity.rect):
-            items = self.grid.get(cell)
-            if items is None:
-                self.grid[cell] = [entity]
-            else:
-                items.append(entity)
-
-    def _rect_cells(self, rect):
-        x1, y1 = rect.topleft
-        x1 //= self.cell_size
-        y1 //= self.cell_size
-        x2, y2 = rect.bottomright
-        x2 = x2 // self.cell_size + 1
-        y2 = y2 // self.cell_size + 1
-        from itertools import product
-        return product(range(x1, x2), range(y1, y2))
+        """Add ``entity`` (or re-file it if already present)."""
+        if entity in self.items:
+            self.move(entity)
+            return
+        bounds = self._cell_range(entity.rect)
+        self.items[entity] = bounds
+        self._add_to_cells(entity, bounds)
+
+    def remove(self, entity):
+        """Drop ``entity`` from the index. Returns False if it was not indexed."""
+        bounds = self.items.pop(entity, None)
+        if bounds is None:
+            return False
+        self._remove_from_cells(entity, bounds)
+        self._seen.pop(entity, None)
+        return True
+
+    def move(self, entity):
+        """Update ``entity`` after its rect changed.
+
+        Returns True only if the entity changed cells; unknown entities are
+        inserted.
+        """
+        old = self.items.get(entity)
+        if old is None:
+            self.insert(entity)
+            return True
+        bounds = self._cell_range(entity.rect)
+        if bounds == old:
+            return False
+        self._remove_from_cells(entity, old)
+        self._add_to_cells(entity, bounds)
+        self.items[entity] = bounds
+        return True
+
+    def sync(self, entities):
+        """Make the index match ``entities``: move/insert each and drop the rest.
+
+        Returns the number of entities that changed cells (including inserts).
+        """
+        self._stamp += 1
+        stamp = self._stamp
+        seen = self._seen
+        moved = 0
+        for entity in entities:
+            if self.move(entity):
+                moved += 1
+            seen[entity] = stamp
+        if len(self.items) != len(entities):
+            stale = [e for e in self.items if seen.get(e) != stamp]
+            for entity in stale:
+                self.remove(entity)
+        return moved
 
     def query(self, rect):
+        x1, y1, x2, y2 = self._cell_range(rect)
+        grid = self.grid
+        if x1 == x2 and y1 == y2:
+            # Common case: a small projectile inside a single cell.
+            return set(grid.get((x1, y1), ()))
         items = set()
-        for cell in self._rect_cells(rect):
-            items.update(self.grid.get(cell, ()))
+        for cx in range(x1, x2 + 1):
+            for cy in range(y1, y2 + 1):
+                bucket = grid.get((cx, cy))
+                if bucket:
+                    items.update(bucket)
         return items
 
+    def query_each(self, rect, callback):
+        """Call ``callback(entity)`` once for every entity in ``rect``'s cells.
+
+        If the callback returns True the query stops early. Returns the number
+        of entities visited.
+        """
+        x1, y1, x2, y2 = self._cell_range(rect)
+        grid = self.grid
+        visited = 0
+        if x1 == x2 and y1 == y2:
+            bucket = grid.get((x1, y1))
+            if bucket:
+                for entity in bucket:
+                    visited += 1
+                    if callback(entity):
+                        break
+            return visited
+
+        self._stamp += 1
+        stamp = self._stamp
+        seen = self._seen
+        for cx in range(x1, x2 + 1):
+            for cy in range(y1, y2 + 1):
+                bucket = grid.get((cx, cy))
+                if not bucket:
+                    continue
+                for entity in bucket:
+                    if seen.get(entity) == stamp:
+                        continue
+                    seen[entity] = stamp
+                    visited += 1
+                    if callback(entity):
+                        return visited
+        return visited
+
+    def query_into(self, rect, out):
+        """Clear ``out`` and fill it with the unique entities in ``rect``'s cells."""
+        out.clear()
+        return self._collect_into(rect, out)
+
+    def _collect_into(self, rect, out):
+        """Append the unique entities in ``rect``'s cells to ``out``."""
+        x1, y1, x2, y2 = self._cell_range(rect)
+        grid = self.grid
+        if x1 == x2 and y1 == y2:
+            bucket = grid.get((x1, y1))
+            if bucket:
+                out.extend(bucket)
+            return out
+
+        self._stamp += 1
+        stamp = self._stamp
+        seen = self._seen
+        for cx in range(x1, x2 + 1):
+            for cy in range(y1, y2 + 1):
+                bucket = grid.get((cx, cy))
+                if not bucket:
+                    continue
+                for entity in bucket:
+                    if seen.get(entity) != stamp:
+                        seen[entity] = stamp
+                        out.append(entity)
+        return out
+
+
+# Cell sizes of the hierarchical grid, finest first. The finest level matches
+# SPATIAL_GRID_SIZE so small bodies are filed exactly as in the flat grid;
+# 512 px fits the boss sprite and anything larger spans a few top cells.
+HIERARCHY_CELL_SIZES = (64, 128, 256, 512)
+
+
+class HierarchicalSpatialHash:
+    """Multi-resolution grid: one ``SpatialHash`` per cell size.
+
+    Each entity is filed on the finest level whose cells are at least as big
+    as its rect, so it covers at most 2x2 cells no matter how large it is,
+    and small entities are not crowded into cells sized for big ones.
+    Queries visit every non-empty level. An entity lives on exactly one
+    level, so results need no cross-level de-duplication.
+
+    Drop-in replacement for ``SpatialHash``: same ``insert``/``remove``/
+    ``move``/``sync``/``query``/``query_each``/``query_into`` API. Game uses
+    it for the enemy index with ``RG_HIERARCHICAL_GRID=1``.
+    """
+
+    def __init__(self, cell_sizes=HIERARCHY_CELL_SIZES):
+        self.cell_sizes = tuple(sorted(int(size) for size in cell_sizes))
+        self.levels = [SpatialHash(cell_size=size) for size in self.cell_sizes]
+        # entity -> index of the level it is filed on
+        self.items = {}
+        self._level_counts = [0] * len(self.levels)
+        self._active = []
+        self._stamp = 0
+        self._seen = {}
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, entity):
+        return entity in self.items
+
+    def clear(self):
+        for level in self.levels:
+            level.clear()
+        self.items.clear()
+        self._level_counts = [0] * len(self.levels)
+        self._active = []
+        self._seen.clear()
+
+    def rebuild(self):
+        """Re-file every entity from its current rect."""
+        for entity in list(self.items):
+            self.move(entity)
+
+    def level_of(self, entity):
+        """The ``SpatialHash`` level ``entity`` is filed on, or None."""
+        index = self.items.get(entity)
+        return None if index is None else self.levels[index]
+
+    def _level_for(self, rect):
+        size = rect.width if rect.width > rect.height else rect.height
+        for index, cell_size in enumerate(self.cell_sizes):
+            if size <= cell_size:
+                return index
+        return len(self.cell_sizes) - 1
+
+    def _count(self, index, delta):
+        before = self._level_counts[index]
+        self._level_counts[index] = before + delta
+        if before == 0 or before + delta == 0:
+            self._active = [lvl for i, lvl in enumerate(self.levels) if self._level_counts[i]]
+
+    def insert(self, entity):
+        """Add ``entity`` (or re-file it if already present)."""
+        if entity in self.items:
+            self.move(entity)
+            return
+        index = self._level_for(entity.rect)
+        self.levels[index].insert(entity)
+        self.items[entity] = index
+        self._count(index, 1)
+
+    def remove(self, entity):
+        """Drop ``entity`` from the index. Returns False if it was not indexed."""
+        index = self.items.pop(entity, None)
+        if index is None:
+            return False
+        self.levels[index].remove(entity)
+        self._count(index, -1)
+        self._seen.pop(entity, None)
+        return True
+
+    def move(self, entity):
+        """Update ``entity`` after its rect changed (also when it changed size).
+
+        Returns True if it changed cells or levels; unknown entities are inserted.
+        """
+        old_index = self.items.get(entity)
+        if old_index is None:
+            self.insert(entity)
+            return True
+        index = self._level_for(entity.rect)
+        if index == old_index:
+            return self.levels[index].move(entity)
+        self.levels[old_index].remove(entity)
+        self._count(old_index, -1)
+        self.levels[index].insert(entity)
+        self._count(index, 1)
+        self.items[entity] = index
+        return True
+
+    def sync(self, entities):
+        """Make the index match ``entities``: move/insert each and drop the rest.
+
+        Returns the number of entities that changed cells (including inserts).
+        """
+        self._stamp += 1
+        stamp = self._stamp
+        seen = self._seen
+        moved = 0
+        for entity in entities:
+            if self.move(entity):
+                moved += 1
+            seen[entity] = stamp
+        if len(self.items) != len(entities):
+            stale = [e for e in self.items if seen.get(e) != stamp]
+            for entity in stale:
+                self.remove(entity)
+        return moved
+
+    def query(self, rect):
+        items = set()
+        for level in self._active:
+            items |= level.query(rect)
+        return items
+
+    def query_each(self, rect, callback):
+        """Call ``callback(entity)`` once per entity near ``rect``; True stops early.
+
+        Returns the number of entities visited.
+        """
+        # Walks the level grids directly with one stamp (no per-query closure).
+        self._stamp += 1
+        stamp = self._stamp
+        seen = self._seen
+        visited = 0
+        for level in self._active:
+            x1, y1, x2, y2 = level._cell_range(rect)
+            grid = level.grid
+            for cx in range(x1, x2 + 1):
+                for cy in range(y1, y2 + 1):
+                    bucket = grid.get((cx, cy))
+                    if not bucket:
+                        continue
+                    for entity in bucket:
+                        if seen.get(entity) == stamp:
+                            continue
+                        seen[entity] = stamp
+                        visited += 1
+                        if callback(entity):
+                            return visited
+        return visited
+
+    def query_into(self, rect, out):
+        """Clear ``out`` and fill it with the unique entities near ``rect``."""
+        out.clear()
+        for level in self._active:
+            level._collect_into(rect, out)
+        return out
+
+    def cell_count(self):
+        """Number of (cell, entity) entries across all levels (memory/insert cost)."""
+        return sum(
+            (x2 - x1 + 1) * (y2 - y1 + 1)
+            for level in self.levels
+            for x1, y1, x2, y2 in level.items.values()
+        )
+
+
+def query_radius(index, center, radius, inner_radius=0.0, buf=None):
+    """Entities in ``index`` whose rect center lies in a circle or annulus.
+
+    Only the cells under the circle's bounding box are visited, so the cost
+    follows the area, not the entity count. Works with ``SpatialHash`` and
+    ``HierarchicalSpatialHash`` (anything with ``query_into``); the index must
+    be in sync with the entities' current rects.
+
+    Args:
+        index: spatial index to query.
+        center: (x, y) of the area effect.
+        radius: outer radius; centers farther away are skipped.
+        inner_radius: centers closer than this are skipped (0 = full circle).
+        buf: optional scratch list for the broadphase candidates.
+
+    Returns:
+        list of ``(entity, dx, dy, dist)`` where (dx, dy) is the offset from
+        ``center`` to the entity's rect center, in index order.
+    """
+    cx = float(center[0])
+    cy = float(center[1])
+    radius = float(radius)
+    if radius < 0.0:
+        return []
+    left = math.floor(cx - radius)
+    top = math.floor(cy - radius)
+    area = pygame.Rect(left, top, math.ceil(cx + radius) - left + 1, math.ceil(cy + radius) - top + 1)
+    outer_sq = radius * radius
+    inner_sq = float(inner_radius) * float(inner_radius) if inner_radius > 0.0 else -1.0
+    hits = []
+    for entity in index.query_into(area, buf if buf is not None else []):
+        x, y = entity.rect.center
+        dx = x - cx
+        dy = y - cy
+        dist_sq = dx * dx + dy * dy
+        if dist_sq > outer_sq or dist_sq < inner_sq:
+            continue
+        hits.append((entity, dx, dy, math.sqrt(dist_sq)))
+    return hits
+
+
+def segment_aabb_toi(x0, y0, x1, y1, left, top, right, bottom):
+    """Return the first fraction t in [0, 1] where the segment (x0, y0) -> (x1, y1)
+    is inside the box, or None if it never is (slab test)."""
+    t_enter = 0.0
+    t_exit = 1.0
+
+    dx = x1 - x0
+    if -1e-9 < dx < 1e-9:
+        if x0 < left or x0 > right:
+            return None
+    else:
+        inv = 1.0 / dx
+        ta = (left - x0) * inv
+        tb = (right - x0) * inv
+        if ta > tb:
+            ta, tb = tb, ta
+        if ta > t_enter:
+            t_enter = ta
+        if tb < t_exit:
+            t_exit = tb
+        if t_enter > t_exit:
+            return None
+
+    dy = y1 - y0
+    if -1e-9 < dy < 1e-9:
+        if y0 < top or y0 > bottom:
+            return None
+    else:
+        inv = 1.0 / dy
+        ta = (top - y0) * inv
+        tb = (bottom - y0) * inv
+        if ta > tb:
+            ta, tb = tb, ta
+        if ta > t_enter:
+            t_enter = ta
+        if tb < t_exit:
+            t_exit = tb
+        if t_enter > t_exit:
+            return None
+
+    return t_enter
+
+
+def _sweep_delta(mover):
+    prev = getattr(mover, 'prev_pos', None)
+    if prev is None:
+        return 0.0, 0.0
+    pos = mover.pos
+    return pos.x - prev.x, pos.y - prev.y
+
+
+def swept_rect_toi(mover, target_rect):
+    """Time of impact of ``mover.rect`` travelling from ``prev_pos`` to ``pos``
+    against a static ``target_rect``.
+
+    Returns t in [0, 1] (0 = already overlapping at the start of the move) or
+    None. Movers without ``prev_pos`` fall back to a plain ``colliderect``, so
+    the end position is always tested the same way as before.
+    """
+    rect = mover.rect
+    dx, dy = _sweep_delta(mover)
+    if dx == 0.0 and dy == 0.0:
+        return 0.0 if rect.colliderect(target_rect) else None
+
+    # Minkowski-expand the target by the mover's half extents (matching the
+    # integer centering pygame uses), then sweep the mover's center point.
+    # The 0.5 inset makes integer end positions agree with colliderect, which
+    # does not count touching edges as a hit.
+    half_w = rect.width // 2
+    half_h = rect.height // 2
+    cx = rect.centerx
+    cy = rect.centery
+    return segment_aabb_toi(
+        cx - dx, cy - dy, cx, cy,
+        target_rect.left - (rect.width - half_w) + 0.5,
+        target_rect.top - (rect.height - half_h) + 0.5,
+        target_rect.right + half_w - 0.5,
+        target_rect.bottom + half_h - 0.5,
+    )
+
+
+def swept_bounds(mover):
+    """Rect covering ``mover.rect`` over its whole last move (broadphase query)."""
+    rect = mover.rect
+    dx, dy = _sweep_delta(mover)
+    if dx == 0.0 and dy == 0.0:
+        return rect
+    return rect.union(rect.move(-int(round(dx)), -int(round(dy))))
+
+
+def swept_point(mover, t):
+    """Center of ``mover`` at fraction ``t`` of its last move."""
+    dx, dy = _sweep_delta(mover)
+    cx, cy = mover.rect.center
+    return (int(cx - dx * (1.0 - t)), int(cy - dy * (1.0 - t)))
+
 
 def _get_pos(entity):
     try:
@@ -0,0 +1,99 @@
+"""Per-tick kill event queue.
+
+Collision code does not destroy entities on the spot any more. It pushes a
+``KillEvent`` and keeps going; the owner drains the queue once per tick,
+resolves the side effects (explosions, sounds, drops, points) in one place
+and compacts the entity list with a single mark-and-sweep pass instead of a
+``list.remove`` per kill.
+
+An entity can only be killed once per tick: the first event wins and later
+pushes for the same entity are dropped. Collision loops use ``in`` on the
+queue (a set lookup) to skip entities that are already dead this tick.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class KillEvent:
+    """One entity destroyed this tick and how its death should be shown.
+
+    Attributes:
+        entity: the destroyed entity (enemy or boss).
+        pos: where to spawn the explosion.
+        points: score awarded once the kill is resolved.
+        is_boss: passed on to ``HazardSystem.on_enemy_destroyed``.
+        explosion: "enemy", "boss" or None for no explosion.
+        explosion_fps: explosion animation speed.
+        sound: sound effect name, or None.
+        drop_item: roll ``ItemSpawner.should_enemy_drop`` for this kill.
+        cause: what killed it ("bullet", "meteor", "contact", "nuke"), for debugging.
+    """
+
+    entity: object
+    pos: tuple
+    points: int = 1
+    is_boss: bool = False
+    explosion: Optional[str] = "enemy"
+    explosion_fps: int = 20
+    sound: Optional[str] = None
+    drop_item: bool = False
+    cause: str = ""
+
+
+class KillQueue:
+    """Deduplicating queue of ``KillEvent``s, drained once per tick."""
+
+    def __init__(self):
+        self._events = []
+        self._pending = set()
+        self.total_pushed = 0
+        self.total_duplicates = 0
+
+    def __len__(self):
+        return len(self._events)
+
+    def __contains__(self, entity):
+        return entity in self._pending
+
+    def push(self, event):
+        """Queue ``event``. Returns False if its entity is already queued."""
+        if event.entity in self._pending:
+            self.total_duplicates += 1
+            return False
+        self._pending.add(event.entity)
+        self._events.append(event)
+        self.total_pushed += 1
+        return True
+
+    def kill(self, entity, pos, **fields):
+        """Shorthand for ``push(KillEvent(entity, pos, **fields))``."""
+        return self.push(KillEvent(entity, pos, **fields))
+
+    def sweep(self, entities):
+        """Remove every queued entity from the list ``entities`` in place.
+
+        One O(n) pass that keeps the survivors in their original order.
+        Returns the number of entities removed.
+        """
+        if not self._pending:
+            return 0
+        pending = self._pending
+        before = len(entities)
+        entities[:] = [entity for entity in entities if entity not in pending]
+        return before - len(entities)
+
+    def drain(self):
+        """Return the queued events in push order and empty the queue."""
+        events = self._events
+        self._events = []
+        self._pending = set()
+        return events
+
+    def clear(self):
+        self._events.clear()
+        self._pending.clear()
+
+
+__all__ = ["KillEvent", "KillQueue"]
@@ -0,0 +1,118 @@
+"""Collision layers and the layer/mask matrix shared by all collision code.
+
+Every collidable thing belongs to one ``CollisionCategory`` bit. A
+``CollisionMatrix`` stores, per category, the mask of categories it can touch
+(the same categoryBits/maskBits idea Box2D fixtures use). Gameplay collision
+loops ask the matrix before enumerating a pair of groups, so combinations that
+cannot interact on the current level are never tested at all.
+"""
+
+
+class CollisionCategory:
+    PLAYER = 0x0001
+    ENEMY = 0x0002
+    PROJECTILE = 0x0004        # player projectiles
+    METEOR = 0x0008
+    SENSOR = 0x0010
+    ENEMY_PROJECTILE = 0x0020  # enemy bullets and boss missiles
+    BOMB = 0x0040              # hazard bombs/mines and their blast radius
+    PICKUP = 0x0080            # hazard pickups
+
+
+CATEGORY_NAMES = {
+    CollisionCategory.PLAYER: "player",
+    CollisionCategory.ENEMY: "enemy",
+    CollisionCategory.PROJECTILE: "projectile",
+    CollisionCategory.METEOR: "meteor",
+    CollisionCategory.SENSOR: "sensor",
+    CollisionCategory.ENEMY_PROJECTILE: "enemy_projectile",
+    CollisionCategory.BOMB: "bomb",
+    CollisionCategory.PICKUP: "pickup",
+}
+
+
+# Pairs that interact on every level.
+DEFAULT_COLLISION_RULES = (
+    (CollisionCategory.PROJECTILE, CollisionCategory.ENEMY),
+    (CollisionCategory.PROJECTILE, CollisionCategory.ENEMY_PROJECTILE),
+    (CollisionCategory.PROJECTILE, CollisionCategory.BOMB),
+    (CollisionCategory.PROJECTILE, CollisionCategory.METEOR),
+    (CollisionCategory.PLAYER, CollisionCategory.ENEMY),
+    (CollisionCategory.PLAYER, CollisionCategory.ENEMY_PROJECTILE),
+    (CollisionCategory.PLAYER, CollisionCategory.METEOR),
+    (CollisionCategory.PLAYER, CollisionCategory.BOMB),
+    (CollisionCategory.PLAYER, CollisionCategory.PICKUP),
+    (CollisionCategory.PLAYER, CollisionCategory.SENSOR),  # trigger areas, report only
+    (CollisionCategory.ENEMY, CollisionCategory.ENEMY),  # crowd separation, no damage
+)
+
+
+class CollisionMatrix:
+    """Symmetric category -> mask table.
+
+    ``can_collide(a, b)`` is a dict lookup and a bit test, cheap enough to
+    guard every pair loop once per tick.
+    """
+
+    def __init__(self, rules=DEFAULT_COLLISION_RULES):
+        self._masks = {}
+        for a, b in rules:
+            self.enable(a, b)
+
+    def enable(self, a, b):
+        self._masks[a] = self._masks.get(a, 0) | b
+        self._masks[b] = self._masks.get(b, 0) | a
+        return self
+
+    def disable(self, a, b):
+        self._masks[a] = self._masks.get(a, 0) & ~b
+        self._masks[b] = self._masks.get(b, 0) & ~a
+        return self
+
+    def mask(self, category):
+        """Bitmask of every category ``category`` can touch (Box2D maskBits)."""
+        return self._masks.get(category, 0)
+
+    def can_collide(self, a, b):
+        return bool(self._masks.get(a, 0) & b)
+
+    def pairs(self):
+        """Enabled (a, b) pairs with a <= b, in bit order."""
+        result = []
+        for a in sorted(self._masks):
+            mask = self._masks[a]
+            for b in sorted(self._masks):
+                if b >= a and mask & b:
+                    result.append((a, b))
+        return result
+
+    def copy(self):
+        clone = CollisionMatrix(rules=())
+        clone._masks = dict(self._masks)
+        return clone
+
+
+def build_collision_matrix(meteors_hit_enemies=False):
+    """Matrix for one level.
+
+    Args:
+        meteors_hit_enemies: Test2 lets falling meteors sweep enemies; every
+            other level keeps meteors and enemies apart.
+    """
+    matrix = CollisionMatrix()
+    if meteors_hit_enemies:
+        matrix.enable(CollisionCategory.METEOR, CollisionCategory.ENEMY)
+    return matrix
+
+
+DEFAULT_COLLISION_MATRIX = CollisionMatrix()
+
+
+__all__ = [
+    "CollisionCategory",
+    "CollisionMatrix",
+    "CATEGORY_NAMES",
+    "DEFAULT_COLLISION_RULES",
+    "DEFAULT_COLLISION_MATRIX",
+    "build_collision_matrix",
+]
@@ -0,0 +1,147 @@
+"""Optional NumPy narrowphase for projectile hits.
+
+Packs the projectiles' centers, sweep deltas and half extents and the targets'
+boxes into arrays and runs the same slab test as ``swept_rect_toi`` for every
+(projectile, target) pair at once. On dense screens this replaces thousands of
+Python-level rect tests with a handful of array operations; on sparse screens
+the fixed per-call overhead makes the Python paths cheaper, so callers should
+only switch to it above a pair-count threshold.
+
+NumPy is not a hard dependency of the game: ``NUMPY_AVAILABLE`` is False when
+it is missing and ``NumpyNarrowphase`` then refuses to construct.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+NUMPY_AVAILABLE = np is not None
+
+# Same threshold as segment_aabb_toi for "not moving along this axis".
+_AXIS_EPSILON = 1e-9
+
+
+def _axis_slab(start, delta, low, high):
+    """Entry/exit fractions of one axis for broadcast (movers x targets) arrays.
+
+    Mirrors one axis of ``segment_aabb_toi``: a mover that does not move along
+    the axis is either always inside the slab (-inf, inf) or never (inf, -inf).
+    """
+    moving = np.abs(delta) >= _AXIS_EPSILON
+    inv = 1.0 / np.where(moving, delta, 1.0)
+    ta = (low - start) * inv
+    tb = (high - start) * inv
+    inside = (start >= low) & (start <= high)
+    enter = np.where(moving, np.minimum(ta, tb), np.where(inside, -np.inf, np.inf))
+    leave = np.where(moving, np.maximum(ta, tb), np.where(inside, np.inf, -np.inf))
+    return enter, leave
+
+
+class NumpyNarrowphase:
+    """Batched swept-AABB kernel.
+
+    Results match ``Collision.collisions.swept_rect_toi`` pair for pair, so the
+    backend can be swapped in without changing which hits happen. Packing
+    buffers are reused between calls and only grow.
+    """
+
+    def __init__(self, capacity=128):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("NumPy is required for NumpyNarrowphase")
+        self._movers = np.zeros((capacity, 8), dtype=np.float64)
+        self._targets = np.zeros((capacity, 4), dtype=np.float64)
+        self.last_pair_count = 0
+
+    @staticmethod
+    def _grow(buf, count):
+        if count <= buf.shape[0]:
+            return buf
+        return np.zeros((max(count, 2 * buf.shape[0]), buf.shape[1]), dtype=buf.dtype)
+
+    def pack_movers(self, movers):
+        """Rows: end center x, y, move dx, dy, then left/top/right/bottom extents.
+
+        The extents follow pygame's integer centering (``width // 2`` to the
+        right of the center, the remainder to the left) like ``swept_rect_toi``.
+        """
+        count = len(movers)
+        self._movers = buf = self._grow(self._movers, count)
+        for i, mover in enumerate(movers):
+            rect = mover.rect
+            prev = getattr(mover, 'prev_pos', None)
+            if prev is None:
+                dx = dy = 0.0
+            else:
+                pos = mover.pos
+                dx = pos.x - prev.x
+                dy = pos.y - prev.y
+            width = rect.width
+            height = rect.height
+            half_w = width // 2
+            half_h = height // 2
+            buf[i] = (rect.centerx, rect.centery, dx, dy,
+                      width - half_w, height - half_h, half_w, half_h)
+        return buf[:count]
+
+    def pack_targets(self, targets):
+        """Rows: left, top, right, bottom of each target rect."""
+        count = len(targets)
+        self._targets = buf = self._grow(self._targets, count)
+        for i, target in enumerate(targets):
+            rect = target.rect
+            buf[i] = (rect.left, rect.top, rect.right, rect.bottom)
+        return buf[:count]
+
+    def toi_matrix(self, movers, targets):
+        """Time of impact for every (mover, target) pair.
+
+        Returns:
+            float array of shape (len(movers), len(targets)) with t in [0, 1],
+            or ``inf`` where the pair does not touch during the move.
+        """
+        m = self.pack_movers(movers)
+        t = self.pack_targets(targets)
+        self.last_pair_count = m.shape[0] * t.shape[0]
+
+        # Start point and delta computed exactly as swept_rect_toi does, so the
+        # rounding (and therefore every hit time) is bit-for-bit the same.
+        x1 = m[:, 0:1]
+        y1 = m[:, 1:2]
+        x0 = x1 - m[:, 2:3]
+        y0 = y1 - m[:, 3:4]
+        # Minkowski-expanded target boxes with the same 0.5 inset as swept_rect_toi
+        enter_x, leave_x = _axis_slab(
+            x0, x1 - x0,
+            t[:, 0] - m[:, 4:5] + 0.5, t[:, 2] + m[:, 6:7] - 0.5)
+        enter_y, leave_y = _axis_slab(
+            y0, y1 - y0,
+            t[:, 1] - m[:, 5:6] + 0.5, t[:, 3] + m[:, 7:8] - 0.5)
+
+        enter = np.maximum(np.maximum(enter_x, enter_y), 0.0)
+        leave = np.minimum(np.minimum(leave_x, leave_y), 1.0)
+        return np.where(enter <= leave, enter, np.inf)
+
+    def first_hits(self, movers, targets):
+        """Earliest target hit by each mover during its last move.
+
+        Args:
+            movers: sequence of objects with ``rect`` and optionally
+                ``pos``/``prev_pos`` (e.g. player bullets).
+            targets: sequence of objects with ``rect``, in priority order.
+
+        Returns:
+            list of (mover_index, target_index, toi) for movers that hit
+            something, in mover order. Ties go to the lower target index.
+        """
+        if not movers or not targets:
+            self.last_pair_count = 0
+            return []
+        toi = self.toi_matrix(movers, targets)
+        best = toi.argmin(axis=1)
+        best_toi = toi[np.arange(toi.shape[0]), best]
+        hits = np.flatnonzero(np.isfinite(best_toi))
+        return [(int(i), int(best[i]), float(best_toi[i])) for i in hits]
+
+
+__all__ = ["NUMPY_AVAILABLE", "NumpyNarrowphase"]
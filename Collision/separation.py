@@ -0,0 +1,131 @@
+"""Budgeted crowd separation for enemies.
+
+Chasers all steer at the player, so a big wave ends up stacked on the same
+pixel. ``CrowdSeparator`` pushes overlapping pairs apart with ``separate`` and
+(optionally) bounces closing pairs with ``apply_impact``. Neighbours come from
+a ``SpatialHash``, and a per-call pair budget keeps the cost bounded: when the
+budget runs out the pass stops, and the next call starts where this one left
+off, so every entity still gets its turn within a few ticks.
+"""
+
+import pygame
+
+from .collisions import _get_pos, _get_vel, apply_impact, get_collision_radius, separate
+
+
+class CrowdSeparator:
+    """Pairwise overlap resolution over a spatial index, at most ``pair_budget`` tests per call.
+
+    Args:
+        pair_budget: maximum number of circle-vs-circle tests per ``resolve``.
+        frac: fraction of the overlap ``separate`` removes per call; < 1 spreads
+            the push over a few ticks so crowds relax instead of jittering.
+        elasticity: if not None, closing pairs also exchange velocity with
+            ``apply_impact`` at this elasticity.
+    """
+
+    def __init__(self, pair_budget=256, frac=0.5, elasticity=None):
+        self.pair_budget = int(pair_budget)
+        self.frac = float(frac)
+        self.elasticity = elasticity
+        self.cursor = 0
+        self.last_pair_tests = 0
+        self.last_resolved = 0
+        self.budget_exhausted = False
+        self._rank = {}
+        self._buf = []
+
+    def reset(self):
+        self.cursor = 0
+        self.last_pair_tests = 0
+        self.last_resolved = 0
+        self.budget_exhausted = False
+        self._rank.clear()
+        self._buf.clear()
+
+    def resolve(self, entities, index, is_pinned=None):
+        """Separate overlapping entities; ``index`` must already hold ``entities``.
+
+        Each pair is tested once, from its lower-ranked member. Entities that
+        ``separate`` moved are re-filed in ``index``. Pairs where
+        ``is_pinned(entity)`` is true for either member are skipped (bosses do
+        not get shoved around by their escorts).
+
+        Returns the number of pairs that were pushed apart.
+        """
+        count = len(entities)
+        self.last_pair_tests = 0
+        self.last_resolved = 0
+        self.budget_exhausted = False
+        if count < 2 or self.pair_budget <= 0:
+            return 0
+
+        rank = self._rank
+        rank.clear()
+        radii = []
+        max_radius = 0.0
+        for i, entity in enumerate(entities):
+            rank[entity] = i
+            radius = get_collision_radius(entity)
+            radii.append(radius)
+            # Pinned entities are never paired, so they do not widen the queries.
+            if radius > max_radius and (is_pinned is None or not is_pinned(entity)):
+                max_radius = radius
+
+        budget = self.pair_budget
+        tests = 0
+        resolved = 0
+        buf = self._buf
+        query = pygame.Rect(0, 0, 0, 0)
+        start = self.cursor % count
+        stopped_at = None
+        for step in range(count):
+            i = (start + step) % count
+            a = entities[i]
+            if is_pinned is not None and is_pinned(a):
+                continue
+            ra = radii[i]
+            a_pos = _get_pos(a)
+            reach = int(ra + max_radius) + 1
+            query.size = (reach * 2, reach * 2)
+            query.center = (int(a_pos.x), int(a_pos.y))
+            for b in index.query_into(query, buf):
+                j = rank.get(b)
+                if j is None or j <= i:
+                    continue
+                if tests >= budget:
+                    stopped_at = i
+                    break
+                if is_pinned is not None and is_pinned(b):
+                    continue
+                tests += 1
+                rsum = ra + radii[j]
+                if a_pos.distance_squared_to(_get_pos(b)) >= rsum * rsum:
+                    continue
+                if self.elasticity is not None:
+                    normal = _get_pos(b) - a_pos
+                    if normal.dot(_get_vel(b) - _get_vel(a)) < 0:
+                        apply_impact(a, b, elasticity=self.elasticity)
+                separate(a, b, frac=self.frac)
+                index.move(a)
+                index.move(b)
+                a_pos = _get_pos(a)
+                resolved += 1
+            if stopped_at is not None:
+                break
+
+        # Resume from the entity whose neighbours were cut off (always moving
+        # forward, so one entity with a huge neighbourhood cannot stall the rest).
+        if stopped_at is None:
+            self.cursor = 0
+        elif stopped_at == start:
+            self.cursor = start + 1
+        else:
+            self.cursor = stopped_at
+        self.budget_exhausted = stopped_at is not None
+        self.last_pair_tests = tests
+        self.last_resolved = resolved
+        return resolved
+
+
+__all__ = ["CrowdSeparator"]
@@ -18,6 +18,13 @@ import pygame
 from typing import Optional
 from Enemies.enemy import Enemy
 from Physics.animation import DampedOscillator
+from rotation_cache import ROTATION_CACHE
+
+# Default StraightEnemy magnet toward the player. Batched enemies with these
+# parameters get the pull from Game.player_magnet (Physics.forces.RadialMagnet).
+MAGNET_RADIUS = 1000.0
+MAGNET_STRENGTH = 400.0
+MAGNET_MIN_DISTANCE = 48.0
 
 
 class StraightEnemy(Enemy):
@@ -88,14 +95,21 @@ class StraightEnemy(Enemy):
 
         # Magneettinen vetovoima pelaajaan, joka saa vihollisen kiertämään pelaajaa ja yrittämään osua siihen. Vältetään seinäkiinnittymistä ja luodaan dynaamisempi liike.
         self.magnet_enabled = True
-        self.magnet_radius = float(params.get('magnet_radius', 1000.0))
-        self.magnet_strength = float(params.get('magnet_strength', 400.0))
-        self.magnet_min_distance = float(params.get('magnet_min_distance', 48.0))
+        self.magnet_radius = float(params.get('magnet_radius', MAGNET_RADIUS))
+        self.magnet_strength = float(params.get('magnet_strength', MAGNET_STRENGTH))
+        self.magnet_min_distance = float(params.get('magnet_min_distance', MAGNET_MIN_DISTANCE))
+        # Random-path movement goes through RigidBody integration -> Game batches
+        # it, and applies the default magnet to the whole batch as one force field
+        self.batch_physics = path_type != 'figure8' and self.magnet_enabled and (
+            self.magnet_radius, self.magnet_strength, self.magnet_min_distance
+        ) == (MAGNET_RADIUS, MAGNET_STRENGTH, MAGNET_MIN_DISTANCE)
         
         # Boundary avoidance: intelligent course correction before hitting walls
         self.boundary_avoidance_enabled = True
         self.boundary_avoidance_distance = float(params.get('avoidance_distance', 120.0))  # Distance to start avoiding
         self.boundary_turn_strength = 0.5  # How strongly to turn away (0-1)
+        # Steering acceleration from the last steering tick (see steer_this_tick)
+        self._steer_accel = None
 
     def update(self, dt_ms, player=None, world_rect=None):
         """
@@ -173,41 +187,13 @@ class StraightEnemy(Enemy):
         # For normal straight/random movement, set velocity and use RigidBody physics
         dt = dt_ms / 1000.0
 
-        # Boundary avoidance: predict and steer away from walls BEFORE collision
-        if getattr(self, 'boundary_avoidance_enabled', True) and world_rect is not None:
-            try:
-                avoidance_dist = getattr(self, 'boundary_avoidance_distance', 120.0)
-                turn_strength = getattr(self, 'boundary_turn_strength', 0.5)
-                
-                # Check distances to all four walls
-                dist_left = self.pos.x - world_rect.left
-                dist_right = world_rect.right - self.pos.x
-                dist_top = self.pos.y - world_rect.top
-                dist_bottom = world_rect.bottom - self.pos.y
-                
-                # Calculate steering force away from walls
-                steering = pygame.Vector2(0, 0)
-                
-                # Left wall
-                if dist_left < avoidance_dist and self.vel.x < 0:
-                    steering.x += (1.0 - dist_left / avoidance_dist) * turn_strength * self.speed
-                
-                # Right wall
-                if dist_right < avoidance_dist and self.vel.x > 0:
-                    steering.x -= (1.0 - dist_right / avoidance_dist) * turn_strength * self.speed
-                
-                # Top wall
-                if dist_top < avoidance_dist and self.vel.y < 0:
-                    steering.y += (1.0 - dist_top / avoidance_dist) * turn_strength * self.speed
-                
-                # Bottom wall
-                if dist_bottom < avoidance_dist and self.vel.y > 0:
-                    steering.y -= (1.0 - dist_bottom / avoidance_dist) * turn_strength * self.speed
-                
-                # Apply steering to velocity (smooth course correction)
-                self.vel += steering * dt
-            except Exception:
-                pass
+        # AI steering (wall avoidance + magnet) as one acceleration. With
+        # RG_PHYSICS_LOD=1, far enemies get steer_this_tick=False from Game's
+        # LODScheduler on most ticks and keep applying the acceleration
+        # computed on their last steering tick.
+        if self.steer_this_tick or self._steer_accel is None:
+            self._steer_accel = self._steering_accel(player, world_rect)
+        self.vel += self._steer_accel * dt
 
         # Apply gravity acceleration if enabled
         if self.gravity_enabled:
@@ -215,28 +201,15 @@ class StraightEnemy(Enemy):
             if dir_to_center.length_squared() > 0.0:
                 acc = dir_to_center.normalize() * float(self.gravity_strength)
                 self.vel += acc * dt
-
-        # Magnetic attraction toward player
-        if getattr(self, 'magnet_enabled', False) and player is not None:
-            try:
-                to_player = pygame.Vector2(player.rect.center) - self.pos
-                dist = to_player.length()
-                if dist > 0.0:
-                    if dist < self.magnet_radius:
-                        dirp = to_player.normalize()
-                        strength = self.magnet_strength * max(0.0, (1.0 - dist / self.magnet_radius))
-                        self.vel += dirp * (strength * dt)
-                    if dist < self.magnet_min_distance:
-                        dirp = to_player.normalize()
-                        repulse = -dirp * max(self.magnet_strength * 2.0, 160.0)
-                        self.vel += repulse * dt
-            except Exception:
-                pass
-
         # Only call parent update AFTER setting velocity fields
         # This will call RigidBody.update() which handles physics and position sync
         super().update(dt_ms, player, world_rect)
-        
+        if self.batch_dt_ms is not None:
+            return  # Batched row: Game integrates it and calls finish_update()
+        self._after_move(dt_ms, player, world_rect)
+
+    def _after_move(self, dt_ms, player=None, world_rect=None):
+        """Wall bounce, facing and random nudges on the integrated position."""
         # Wall collision handling (after position is updated by parent)
         if world_rect is not None:
             collided_sides = []
@@ -337,6 +310,57 @@ class StraightEnemy(Enemy):
                 self._apply_random_nudge()
                 self._change_interval = random.randint(self._change_interval_min, self._change_interval_max)
 
+    def _steering_accel(self, player=None, world_rect=None):
+        """Wall avoidance plus magnet pull/repulse toward the player, in px/s^2."""
+        accel = pygame.Vector2(0, 0)
+
+        # Boundary avoidance: predict and steer away from walls BEFORE collision
+        if getattr(self, 'boundary_avoidance_enabled', True) and world_rect is not None:
+            try:
+                avoidance_dist = getattr(self, 'boundary_avoidance_distance', 120.0)
+                turn_strength = getattr(self, 'boundary_turn_strength', 0.5)
+                
+                # Check distances to all four walls
+                dist_left = self.pos.x - world_rect.left
+                dist_right = world_rect.right - self.pos.x
+                dist_top = self.pos.y - world_rect.top
+                dist_bottom = world_rect.bottom - self.pos.y
+                
+                # Left wall
+                if dist_left < avoidance_dist and self.vel.x < 0:
+                    accel.x += (1.0 - dist_left / avoidance_dist) * turn_strength * self.speed
+                
+                # Right wall
+                if dist_right < avoidance_dist and self.vel.x > 0:
+                    accel.x -= (1.0 - dist_right / avoidance_dist) * turn_strength * self.speed
+                
+                # Top wall
+                if dist_top < avoidance_dist and self.vel.y < 0:
+                    accel.y += (1.0 - dist_top / avoidance_dist) * turn_strength * self.speed
+                
+                # Bottom wall
+                if dist_bottom < avoidance_dist and self.vel.y > 0:
+                    accel.y -= (1.0 - dist_bottom / avoidance_dist) * turn_strength * self.speed
+            except Exception:
+                pass
+
+        # Magnetic attraction toward player (batched rows: Game.player_magnet)
+        if getattr(self, 'magnet_enabled', False) and player is not None and self.body_array is None:
+            try:
+                to_player = pygame.Vector2(player.rect.center) - self.pos
+                dist = to_player.length()
+                if dist > 0.0:
+                    if dist < self.magnet_radius:
+                        dirp = to_player.normalize()
+                        strength = self.magnet_strength * max(0.0, (1.0 - dist / self.magnet_radius))
+                        accel += dirp * strength
+                    if dist < self.magnet_min_distance:
+                        dirp = to_player.normalize()
+                        accel -= dirp * max(self.magnet_strength * 2.0, 160.0)
+            except Exception:
+                pass
+        return accel
+
     def _apply_random_nudge(self):
         # Extract angle from velocity (standard convention: atan2(y, x) - π/2 for sprite orientation)
         angle = math.atan2(self.vel.y, self.vel.x) - math.pi / 2
@@ -649,6 +673,45 @@ class ChaseEnemy(Enemy):
         self.speed = speed
         self.vel = pygame.Vector2(0, 0)
         self.hit_player_cooldown = 0.0
+        # Chase direction from the last steering tick (see steer_this_tick)
+        self._steer_dir = None
+
+    def _chase_direction(self, player, world_rect=None):
+        """Unit direction toward the player blended with wall avoidance, or None on top of the player."""
+        target = pygame.Vector2(player.rect.center)
+        direction = target - self.pos
+
+        if direction.length_squared() <= 0:
+            return None
+        direction = direction.normalize()
+        
+        # Boundary avoidance: steer away from walls
+        if world_rect is not None:
+            avoidance_dist = 100.0
+            turn_strength = 0.4
+            
+            # Check distances to walls
+            dist_left = self.pos.x - world_rect.left
+            dist_right = world_rect.right - self.pos.x
+            dist_top = self.pos.y - world_rect.top
+            dist_bottom = world_rect.bottom - self.pos.y
+            
+            # Create avoidance steering
+            avoidance = pygame.Vector2(0, 0)
+            
+            if dist_left < avoidance_dist:
+                avoidance.x += (1.0 - dist_left / avoidance_dist) * turn_strength
+            if dist_right < avoidance_dist:
+                avoidance.x -= (1.0 - dist_right / avoidance_dist) * turn_strength
+            if dist_top < avoidance_dist:
+                avoidance.y += (1.0 - dist_top / avoidance_dist) * turn_strength
+            if dist_bottom < avoidance_dist:
+                avoidance.y -= (1.0 - dist_bottom / avoidance_dist) * turn_strength
+            
+            # Blend chase direction with avoidance
+            if avoidance.length_squared() > 0:
+                direction = (direction * 0.7 + avoidance.normalize() * 0.3).normalize()
+        return direction
 
     def update(self, dt_ms, player=None, world_rect=None):
         dt = dt_ms / 1000.0
@@ -657,41 +720,13 @@ class ChaseEnemy(Enemy):
         if self.hit_player_cooldown > 0:
             self.hit_player_cooldown -= dt
 
-        # Move toward player if cooldown is not active
+        # Move toward player if cooldown is not active. Far enemies re-aim only
+        # on steering ticks and keep their last direction in between.
         if player is not None and self.hit_player_cooldown <= 0:
-            target = pygame.Vector2(player.rect.center)
-            direction = target - self.pos
-
-            if direction.length_squared() > 0:
-                direction = direction.normalize()
-                
-                # Boundary avoidance: steer away from walls
-                if world_rect is not None:
-                    avoidance_dist = 100.0
-                    turn_strength = 0.4
-                    
-                    # Check distances to walls
-                    dist_left = self.pos.x - world_rect.left
-                    dist_right = world_rect.right - self.pos.x
-                    dist_top = self.pos.y - world_rect.top
-                    dist_bottom = world_rect.bottom - self.pos.y
-                    
-                    # Create avoidance steering
-                    avoidance = pygame.Vector2(0, 0)
-                    
-                    if dist_left < avoidance_dist:
-                        avoidance.x += (1.0 - dist_left / avoidance_dist) * turn_strength
-                    if dist_right < avoidance_dist:
-                        avoidance.x -= (1.0 - dist_right / avoidance_dist) * turn_strength
-                    if dist_top < avoidance_dist:
-                        avoidance.y += (1.0 - dist_top / avoidance_dist) * turn_strength
-                    if dist_bottom < avoidance_dist:
-                        avoidance.y -= (1.0 - dist_bottom / avoidance_dist) * turn_strength
-                    
-                    # Blend chase direction with avoidance
-                    if avoidance.length_squared() > 0:
-                        direction = (direction * 0.7 + avoidance.normalize() * 0.3).normalize()
-                
+            if self.steer_this_tick or self._steer_dir is None:
+                self._steer_dir = self._chase_direction(player, world_rect)
+            direction = self._steer_dir
+            if direction is not None:
                 self.pos += direction * self.speed * dt
                 self.vel = direction * self.speed
                 # Update angle to face chase direction
@@ -816,7 +851,7 @@ class UltimateEnemy(Enemy):
         try:
             if abs(deg) > 0.0001:
                 # Rotate using rotozoom
-                surf = pygame.transform.rotozoom(self.image, deg, 1.0)
+                surf = ROTATION_CACHE.rotozoom(self.image, deg)
                 r = surf.get_rect(center=(self.rect.centerx - camera_x, self.rect.centery - camera_y))
                 screen.blit(surf, r.topleft)
             else:
@@ -10,6 +10,8 @@ import random
 import pygame
 from typing import Optional, TYPE_CHECKING
 
+from rotation_cache import ROTATION_CACHE
+
 if TYPE_CHECKING:
     from Enemies.enemy import Enemy
 
@@ -39,6 +41,9 @@ def advance_frames(frames: list, frame_index: int, anim_timer: int, anim_speed:
 
 
 class EnemyBullet(pygame.sprite.Sprite):
+    # Physics.snapshot: the attached muzzle enemy and homing target are kept by reference
+    SNAPSHOT_REFS = ("parent_enemy", "homing_target")
+
     def __init__(self, pos: pygame.Vector2, vel: pygame.Vector2,
                  start_frames: Optional[list] = None,
                  flight_frames: Optional[list] = None,
@@ -47,6 +52,8 @@ class EnemyBullet(pygame.sprite.Sprite):
                  parent_enemy: Optional['Enemy'] = None):
         super().__init__()
         self.pos = pygame.Vector2(pos)
+        # position at the start of the last update; collisions sweep prev_pos -> pos
+        self.prev_pos = pygame.Vector2(self.pos)
         self.vel = pygame.Vector2(vel)
         self.speed = speed
 
@@ -107,6 +114,7 @@ class EnemyBullet(pygame.sprite.Sprite):
         return cls(spawn, vel, start_frames=start_list, flight_frames=flight_list, explode_frames=explode_list, speed=speed, parent_enemy=enemy)
 
     def update(self, dt_ms: int, world_rect: pygame.Rect | None = None):
+        self.prev_pos.update(self.pos)
         if self.state == 'start':
             if self.parent_enemy is not None:
                 p = self.parent_enemy
@@ -118,6 +126,8 @@ class EnemyBullet(pygame.sprite.Sprite):
                 self.dir_vec = dir_vec
                 spawn = pygame.Vector2(p.rect.center) + dir_vec * (max(p.rect.width, p.rect.height) // 2 + 6)
                 self.pos = spawn
+                # Attached to the muzzle: follows the parent, no sweep.
+                self.prev_pos.update(self.pos)
                 self.rect.center = (int(self.pos.x), int(self.pos.y))
 
             if self.start_frames:
@@ -211,7 +221,7 @@ class EnemyBullet(pygame.sprite.Sprite):
             if abs(vx) > 0.001 or abs(vy) > 0.001:
                 angle = math.atan2(-vy, vx)
                 deg = math.degrees(angle)
-                rotated = pygame.transform.rotate(self.image, deg)
+                rotated = ROTATION_CACHE.rotate(self.image, deg)
                 rrect = rotated.get_rect(center=(self.rect.centerx - camera_x, self.rect.centery - camera_y))
                 screen.blit(rotated, rrect.topleft)
                 return
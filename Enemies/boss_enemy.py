@@ -5,6 +5,8 @@ import math
 import re
 from Enemies.enemy import Enemy
 from ui import get_enemy_bar_images, draw_healthbar_custom
+from rotation_cache import ROTATION_CACHE
+from sprite_atlas import SPRITE_ATLAS
 
 class BossMissile(pygame.sprite.Sprite):
     """Boss missile with staged launch and car-like steering/drift."""
@@ -12,6 +14,8 @@ class BossMissile(pygame.sprite.Sprite):
     def __init__(self, pos, flight_frames, explode_frames, player, launch_dir=(1, 0)):
         super().__init__()
         self.pos = pygame.Vector2(pos)
+        # position at the start of the last update; collisions sweep prev_pos -> pos
+        self.prev_pos = pygame.Vector2(self.pos)
         self.target = player
         self.dead = False
 
@@ -150,6 +154,7 @@ class BossMissile(pygame.sprite.Sprite):
     def update(self, dt_ms: int, world_rect: pygame.Rect | None = None):
         dt = max(0.0, float(dt_ms) / 1000.0)
         self.timer_ms += int(dt_ms)
+        self.prev_pos.update(self.pos)
 
         if self.state == "drop":
             # Horizontal release, then a short visible drop.
@@ -223,7 +228,7 @@ class BossMissile(pygame.sprite.Sprite):
 
     def draw(self, screen: pygame.Surface, camera_x: int, camera_y: int):
         if self.state == "explode":
-            rotated = pygame.transform.rotate(self.image, self.explosion_draw_angle)
+            rotated = ROTATION_CACHE.rotate(self.image, self.explosion_draw_angle)
             r = rotated.get_rect(center=(int(self.rect.centerx - camera_x), int(self.rect.centery - camera_y)))
             screen.blit(rotated, r.topleft)
             return
@@ -233,7 +238,7 @@ class BossMissile(pygame.sprite.Sprite):
         draw_angle = -ang + self.sprite_heading_offset_deg
         if self.state == "ignite":
             draw_angle += self._render_spin_deg
-        rotated = pygame.transform.rotate(self.image, draw_angle)
+        rotated = ROTATION_CACHE.rotate(self.image, draw_angle)
         r = rotated.get_rect(center=(int(self.rect.centerx - camera_x), int(self.rect.centery - camera_y)))
         screen.blit(rotated, r.topleft)
 
@@ -328,6 +333,14 @@ class BossEnemy(Enemy):
             for variant in ("3", "2", "1"):
                 flight_paths = _select_index_range(sorted(root.glob(f"Missile_{variant}_Flying_*.png")), "Flying", 0, 9)
                 explode_paths = _select_index_range(sorted(root.glob(f"Missile_{variant}_Explosion_*.png")), "Explosion", 0, 8)
+                # Pre-scaled frames from the sprite atlas skip loading the full-size PNGs.
+                flight_key = f"missile/{variant}/flight@{missile_scale}"
+                explode_key = f"missile/{variant}/explode@{missile_scale}"
+                flight = SPRITE_ATLAS.family(flight_key, flight_paths)
+                explode = SPRITE_ATLAS.family(explode_key, explode_paths)
+                if flight and explode is not None:
+                    variants[variant] = {"flight": flight, "explode": explode}
+                    continue
                 flight = []
                 explode = []
                 for p in flight_paths:
@@ -347,6 +360,8 @@ class BossEnemy(Enemy):
                     except Exception:
                         continue
                 if flight:
+                    flight = SPRITE_ATLAS.pack(flight_key, flight, flight_paths)
+                    explode = SPRITE_ATLAS.pack(explode_key, explode, explode_paths)
                     variants[variant] = {"flight": flight, "explode": explode}
         except Exception:
             # If anything fails, just continue to fallback
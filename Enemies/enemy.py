@@ -9,6 +9,7 @@ import random
 from Physics.core import RigidBody
 from Physics.animation import DampedOscillator
 from Enemies.sprite_config import get_sprite_config, apply_angle_constraints
+from rotation_cache import ROTATION_CACHE
 
 # Collision configuration:
 # `DEFAULT_COLLISION_RADIUS_FACTOR` is multiplied by the sprite's max dimension
@@ -32,8 +33,16 @@ class Enemy(RigidBody, pygame.sprite.Sprite):
         mass: physics mass (from RigidBody)
         collision_radius: collision detection radius
         oscillator: DampedOscillator for collision bounces
+        bounce_pool: OscillatorPool holding this enemy's bounce (batched path)
+        body_array: RigidBodyArray integrating this enemy (batched path)
+        batch_dt_ms: step left for body_array to integrate, until finish_update()
     """
     
+    # Physics.snapshot: the bounce oscillator is copied into snapshots and the
+    # pool reference kept, so a restored bounce is read from Game.bounce_pool
+    SNAPSHOT_COPY = ("oscillator",)
+    SNAPSHOT_REFS = ("bounce_pool",)
+
     def __init__(self, image: pygame.Surface, x: float, y: float, hp: int = 1):
         """
         Initialize enemy with physics and sprite attributes.
@@ -59,6 +68,18 @@ class Enemy(RigidBody, pygame.sprite.Sprite):
         
         # Collision bounce animation (replaces old collision_bounce_* logic)
         self.oscillator = None
+        self.bounce_pool = None
+
+        # Batched integration: subclasses that move through RigidBody.update()
+        # set batch_physics; Game then integrates them as rows of its
+        # RigidBodyArray (body_array) once per tick, after the AI updates
+        self.batch_physics = False
+        self.body_array = None
+        self.batch_dt_ms = None
+
+        # AI steering LOD: Game's LODScheduler clears this for far enemies on
+        # ticks where they should reuse their last steering decision
+        self.steer_this_tick = True
         
         # Display angle for rotation (radians)
         self.display_angle = 0.0
@@ -86,6 +107,16 @@ class Enemy(RigidBody, pygame.sprite.Sprite):
         """
         dt = dt_ms / 1000.0
         
+        # Batched bounce: the pool has already evaluated this tick's position
+        pool = self.bounce_pool
+        if pool is not None:
+            bounce = pool.positions.get(self)
+            if bounce is not None:
+                self.pos.update(bounce)
+                self.rect.center = (int(self.pos.x), int(self.pos.y))
+                return  # Skip regular physics update during bounce
+            self.bounce_pool = None
+
         # Update damped oscillator if active (collision bounce animation)
         if self.oscillator is not None and self.oscillator.is_active():
             # Oscillator modifies position during collision bounce
@@ -95,18 +126,43 @@ class Enemy(RigidBody, pygame.sprite.Sprite):
         else:
             self.oscillator = None
         
-        # Regular physics update: apply forces, update velocity and position
+        # Regular physics update: apply forces, update velocity and position.
+        # A RigidBodyArray row is integrated by its owner after every enemy has
+        # steered, which then calls finish_update().
+        if self.body_array is not None:
+            self.batch_dt_ms = dt_ms
+            return
         RigidBody.update(self, dt)
         
         # Sync rect with physics position
         self.rect.center = (int(self.pos.x), int(self.pos.y))
 
+    def finish_update(self, player=None, world_rect: pygame.Rect | None = None):
+        """
+        Complete an update() that left its integration to body_array.
+
+        Args:
+            player: player reference (for AI targeting)
+            world_rect: world boundaries (for movement constraints)
+        """
+        dt_ms = self.batch_dt_ms
+        self.batch_dt_ms = None
+        if dt_ms is None:
+            return
+        self.rect.center = (int(self.pos.x), int(self.pos.y))
+        self._after_move(dt_ms, player, world_rect)
+
+    def _after_move(self, dt_ms: int, player=None, world_rect: pygame.Rect | None = None):
+        """Hook for subclass logic that needs this tick's integrated position."""
+
     
-    def start_collision_bounce(self, base_pos, initial_disp, duration=2.0, oscillations=2.0, damping=2.2):
+    def start_collision_bounce(self, base_pos, initial_disp, duration=2.0, oscillations=2.0, damping=2.2, pool=None):
         """
         Start damped oscillation animation (collision bounce).
         
-        Creates a DampedOscillator that will be applied in next update() calls.
+        Creates a DampedOscillator that will be applied in next update() calls,
+        or, when a pool is given, a recycled row in that OscillatorPool (the
+        owner advances the pool once per tick for all enemies).
         
         Args:
             base_pos: position to oscillate around
@@ -114,7 +170,13 @@ class Enemy(RigidBody, pygame.sprite.Sprite):
             duration: animation duration in seconds
             oscillations: number of oscillation cycles
             damping: exponential decay rate
+            pool: optional OscillatorPool (e.g. Game.bounce_pool)
         """
+        if pool is not None:
+            pool.start(self, base_pos, initial_disp, duration, oscillations, damping)
+            self.bounce_pool = pool
+            self.oscillator = None
+            return
         self.oscillator = DampedOscillator(
             base_pos=base_pos,
             initial_displacement=initial_disp,
@@ -231,7 +293,7 @@ class Enemy(RigidBody, pygame.sprite.Sprite):
         try:
             if abs(deg) > 0.0001:
                 # Rotoi ja skaalaa 1.0-kertoimella (vain rotointi käytössä)
-                surf = pygame.transform.rotozoom(self.image, deg, 1.0)
+                surf = ROTATION_CACHE.rotozoom(self.image, deg)
                 r = surf.get_rect(center=(self.rect.centerx - camera_x, self.rect.centery - camera_y))
                 screen.blit(surf, r.topleft)
             else:
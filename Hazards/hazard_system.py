@@ -4,6 +4,10 @@ from pathlib import Path
 
 import pygame
 from Audio import pelimusat
+from Collision.collisions import SpatialHash, query_radius, swept_bounds, swept_rect_toi
+from Collision.layers import DEFAULT_COLLISION_MATRIX, CollisionCategory
+from rotation_cache import ROTATION_CACHE
+from sprite_atlas import SPRITE_ATLAS
 
 
 DEFAULT_HAZARD_CONFIG = {
@@ -40,6 +44,10 @@ DEFAULT_HAZARD_CONFIG = {
     "mine_fuse_seconds": 1.6,
 }
 
+# Hazards are 46-108 px and mines look 180 px around them, so coarser cells
+# than the enemy grid keep both rect and radius queries to a few buckets.
+HAZARD_GRID_SIZE = 128
+
 
 class HazardSpriteLibrary:
     """Loads and maps hazard sprites with safe fallbacks."""
@@ -49,8 +57,22 @@ class HazardSpriteLibrary:
         self.config = config or {}
         self.mapping = {}
         self._fallback_cache = {}
+        self._scaled_cache = {}
         self._load_all()
 
+    def scaled(self, key, size_px):
+        """Shared smoothscaled copy of ``mapping[key]`` (one per key and size).
+
+        Meteors of the same tier share one source surface, so ROTATION_CACHE
+        keeps one set of rotated frames per tier instead of one per meteor.
+        """
+        cache_key = (key, int(size_px))
+        image = self._scaled_cache.get(cache_key)
+        if image is None:
+            image = pygame.transform.smoothscale(self.mapping[key], (int(size_px), int(size_px)))
+            self._scaled_cache[cache_key] = image
+        return image
+
     def _scale_to_square(self, image, size_px):
         size_px = max(18, int(size_px))
         return pygame.transform.smoothscale(image, (size_px, size_px))
@@ -105,7 +127,16 @@ class HazardSpriteLibrary:
 
     def _load_all(self):
         meteor_paths = self._glob_sorted("PNG/Meteors/*.png")
-        meteors = self._pick_by_area(meteor_paths)
+        # The atlas keeps only the three picked meteors, so the rest are never loaded.
+        meteor_tiers = ("small", "medium", "large")
+        packed_meteors = SPRITE_ATLAS.family("hazards/meteors", meteor_paths)
+        if packed_meteors is not None:
+            meteors = dict(zip(meteor_tiers, packed_meteors))
+        else:
+            meteors = self._pick_by_area(meteor_paths)
+            if meteor_paths:
+                packed_meteors = SPRITE_ATLAS.pack("hazards/meteors", [meteors[t] for t in meteor_tiers], meteor_paths)
+                meteors = dict(zip(meteor_tiers, packed_meteors))
 
         # Load all available bomb families so game logic can choose different styles.
         preferred = str(self.config.get("bomb_family", "3")).strip() or "3"
@@ -118,9 +149,18 @@ class HazardSpriteLibrary:
             if not idle_paths or not explosion_paths:
                 continue
 
-            idle_frames = [self._load_image(p, (74, 74), (220, 90, 70, 230)) for p in idle_paths]
-            idle_frames = [self._scale_to_square(img, bomb_size) for img in idle_frames]
-            explosion_frames = [self._load_image(p, (110, 110), (255, 165, 70, 190)) for p in explosion_paths]
+            idle_key = f"hazards/bomb{family}/idle@{bomb_size}"
+            idle_frames = SPRITE_ATLAS.family(idle_key, idle_paths)
+            if idle_frames is None:
+                idle_frames = [self._load_image(p, (74, 74), (220, 90, 70, 230)) for p in idle_paths]
+                idle_frames = [self._scale_to_square(img, bomb_size) for img in idle_frames]
+                idle_frames = SPRITE_ATLAS.pack(idle_key, idle_frames, idle_paths)
+            # Explosion frames are not scaled, so every bomb size shares one packed set.
+            explode_key = f"hazards/bomb{family}/explode"
+            explosion_frames = SPRITE_ATLAS.family(explode_key, explosion_paths)
+            if explosion_frames is None:
+                explosion_frames = [self._load_image(p, (110, 110), (255, 165, 70, 190)) for p in explosion_paths]
+                explosion_frames = SPRITE_ATLAS.pack(explode_key, explosion_frames, explosion_paths)
             bomb_sets[family] = {
                 "idle": idle_frames,
                 "warning": idle_frames,
@@ -269,7 +309,12 @@ class BombHazard:
         self.fuse_seconds = min(self.fuse_seconds, self.mine_fuse_seconds)
         self.warning_seconds = min(self.warning_seconds, max(0.6, self.fuse_seconds * 0.55))
 
-    def update(self, dt_seconds, proximity_positions=None):
+    def update(self, dt_seconds, proximity_positions=None, proximity_query=None):
+        """Advance the bomb.
+
+        Proximity mines arm when ``proximity_query(pos, radius)`` returns True
+        or, without a query, when any of ``proximity_positions`` is in range.
+        """
         countdown_tick = None
         self._update_motion(dt_seconds)
 
@@ -281,10 +326,14 @@ class BombHazard:
         self.timer += dt_seconds
 
         if self.is_proximity_mine and self.state == self.STATE_IDLE:
-            for p in proximity_positions or []:
-                if (pygame.Vector2(p) - self.pos).length_squared() <= self.mine_trigger_radius * self.mine_trigger_radius:
+            if proximity_query is not None:
+                if proximity_query(self.pos, self.mine_trigger_radius):
                     self._arm_mine()
-                    break
+            else:
+                for p in proximity_positions or []:
+                    if (pygame.Vector2(p) - self.pos).length_squared() <= self.mine_trigger_radius * self.mine_trigger_radius:
+                        self._arm_mine()
+                        break
 
             if self.state == self.STATE_IDLE and self.timer >= self.mine_auto_arm_seconds:
                 self._arm_mine()
@@ -339,7 +388,7 @@ class BombHazard:
         self._player_damaged = True
 
     def draw(self, surface, camera_x, camera_y):
-        rotated = pygame.transform.rotozoom(self.current_image, self.angle, 1.0)
+        rotated = ROTATION_CACHE.rotozoom(self.current_image, self.angle)
         draw_rect = rotated.get_rect(center=(int(self.pos.x - camera_x), int(self.pos.y - camera_y)))
         surface.blit(rotated, draw_rect.topleft)
 
@@ -382,13 +431,17 @@ class MeteorHazard:
         self.angle = random.uniform(0.0, 360.0)
 
     def _scaled_image(self):
-        base = self.sprites.mapping[self.TIER_TO_KEY[self.tier]]
         size_map = {1: 54, 2: 78, 3: 108}
-        size = size_map[self.tier]
-        return pygame.transform.smoothscale(base, (size, size))
+        return self.sprites.scaled(self.TIER_TO_KEY[self.tier], size_map[self.tier])
 
-    def update(self, dt_seconds, world_rect):
-        self.pos += self.vel * dt_seconds
+    def update(self, dt_seconds, world_rect, integrate=True):
+        """Move, spin and cull the meteor.
+
+        ``integrate=False`` skips the position step when a physics world
+        (Box2D entity mode) already moved the meteor this tick.
+        """
+        if integrate:
+            self.pos += self.vel * dt_seconds
         self.angle = (self.angle + self.spin * dt_seconds) % 360.0
 
         # Meteors that fly beyond level bounds are removed (no edge bounce).
@@ -426,7 +479,7 @@ class MeteorHazard:
         return children
 
     def draw(self, surface, camera_x, camera_y):
-        rotated = pygame.transform.rotozoom(self.image, self.angle, 1.0)
+        rotated = ROTATION_CACHE.rotozoom(self.image, self.angle)
         r = rotated.get_rect(center=(int(self.pos.x - camera_x), int(self.pos.y - camera_y)))
         surface.blit(rotated, r.topleft)
 
@@ -488,9 +541,27 @@ class Shockwave:
 
 
 class HazardSystem:
-    """Unified update/render/collision pipeline for meteors, bombs, and pickups."""
+    """Unified update/render/collision pipeline for meteors, bombs, and pickups.
+
+    ``collision_matrix`` is the level's shared ``CollisionMatrix``; layer pairs
+    it disables (e.g. bullets vs bombs) are skipped without testing any pair.
+
+    Meteors, bombs and pickups live in long-lived ``SpatialHash`` indexes that
+    are synced once per update, so bullet hits, mine proximity and pickup
+    collection only look at nearby hazards. ``update`` can also be given the
+    caller's enemy index for mine proximity instead of a list of positions.
 
-    def __init__(self, world_size, sprite_root, config=None):
+    Set ``integrate_meteors`` to False when meteors are bodies in a physics
+    world that moves them; ``update`` then only spins and culls them.
+
+    Set ``lod`` to a ``Physics.lod.LODScheduler`` (already begun for this tick)
+    to update far-away meteors and idle bombs at a reduced rate; they receive
+    the skipped time on their next update. Bombs past their idle/armed state
+    always run every tick so fuse countdowns and blasts stay exact. Set
+    ``lod_bombs`` to False to keep all bombs at the full rate.
+    """
+
+    def __init__(self, world_size, sprite_root, config=None, collision_matrix=None):
         merged = dict(DEFAULT_HAZARD_CONFIG)
         if config:
             merged.update(config)
@@ -498,6 +569,7 @@ class HazardSystem:
         self.enabled = bool(self.config.get("enabled", True))
         self.world_rect = pygame.Rect(0, 0, int(world_size[0]), int(world_size[1]))
         self.sprites = HazardSpriteLibrary(sprite_root, config=self.config)
+        self.collision_matrix = collision_matrix if collision_matrix is not None else DEFAULT_COLLISION_MATRIX
 
         self.bombs = []
         self.meteors = []
@@ -505,6 +577,17 @@ class HazardSystem:
         self.shockwaves = []
         self.debug_countdown_tick = None
         self.debug_last_damage = 0
+        self.debug_pair_tests = 0
+        self.integrate_meteors = True
+        self.lod = None
+        self.lod_bombs = True
+
+        self.meteor_index = SpatialHash(cell_size=HAZARD_GRID_SIZE)
+        self.bomb_index = SpatialHash(cell_size=HAZARD_GRID_SIZE)
+        self.pickup_index = SpatialHash(cell_size=HAZARD_GRID_SIZE)
+        self._meteor_rank = {}
+        self._bomb_rank = {}
+        self._query_buf = []
 
         self._meteor_spawn_timer = 0.0
         self._boss_drop_timer = random.uniform(
@@ -524,6 +607,11 @@ class HazardSystem:
         self._player_hazard_cooldown = 0.0
         self.debug_countdown_tick = None
         self.debug_last_damage = 0
+        self.meteor_index.clear()
+        self.bomb_index.clear()
+        self.pickup_index.clear()
+        self._meteor_rank.clear()
+        self._bomb_rank.clear()
 
     def _random_world_edge_spawn(self):
         side = random.choice(("top", "right", "bottom", "left"))
@@ -639,7 +727,78 @@ class HazardSystem:
                 positions.append((item[0], item[1]))
         return positions
 
-    def update(self, dt_ms, player, player_bullets, boss_positions=None, nearby_positions=None):
+    def _in_radius(self, pos, radius, positions, indexes):
+        """True if any point in ``positions`` or any indexed entity's center is
+        within ``radius`` of ``pos``."""
+        px = pos[0]
+        py = pos[1]
+        radius_sq = radius * radius
+        for x, y in positions:
+            dx = x - px
+            dy = y - py
+            if dx * dx + dy * dy <= radius_sq:
+                return True
+
+        left = math.floor(px - radius)
+        top = math.floor(py - radius)
+        area = pygame.Rect(left, top, math.ceil(px + radius) - left + 1, math.ceil(py + radius) - top + 1)
+        buf = self._query_buf
+        for index in indexes:
+            for entity in index.query_into(area, buf):
+                x, y = entity.rect.center
+                dx = x - px
+                dy = y - py
+                if dx * dx + dy * dy <= radius_sq:
+                    return True
+        return False
+
+    def _sorted_candidates(self, index, rect, rank):
+        """Indexed entities near ``rect`` in list order (same priority as a plain loop)."""
+        candidates = index.query_into(rect, self._query_buf)
+        if len(candidates) > 1:
+            candidates.sort(key=rank.__getitem__)
+        return candidates
+
+    def _sync_meteor_index(self):
+        rank = self._meteor_rank
+        rank.clear()
+        for i, meteor in enumerate(self.meteors):
+            rank[meteor] = i
+        self.meteor_index.sync(self.meteors)
+
+    def meteors_in_radius(self, center, radius, inner_radius=0.0):
+        """``query_radius`` over the meteor index, re-synced to the meteors' current rects.
+
+        For area effects applied outside ``update`` (the game moves meteors
+        after the hazard step, e.g. meteor-enemy impacts).
+        """
+        self._sync_meteor_index()
+        return query_radius(self.meteor_index, center, radius, inner_radius, self._query_buf)
+
+    def _add_meteors(self, meteors):
+        """Append split children to the list and the index mid-update."""
+        rank = self._meteor_rank
+        for meteor in meteors:
+            rank[meteor] = len(rank)
+            self.meteor_index.insert(meteor)
+        self.meteors.extend(meteors)
+
+    def update(self, dt_ms, player, player_bullets, boss_positions=None, nearby_positions=None, enemy_index=None):
+        """Advance all hazards one step and resolve their collisions.
+
+        Args:
+            dt_ms: step length in milliseconds.
+            player: the player (``rect`` is used for hits and pickups).
+            player_bullets: list of player bullets; hits are removed from it.
+            boss_positions: boss centers (boss bomb drops and mine proximity).
+            nearby_positions: extra centers that can trigger proximity mines.
+            enemy_index: optional ``SpatialHash`` of enemies, queried for mine
+                proximity instead of passing every enemy in ``nearby_positions``.
+
+        Returns:
+            dict of effects for the caller (damage, pickups, destroyed meteors,
+            shockwave push events).
+        """
         if not self.enabled:
             return {
                 "player_damage": 0,
@@ -663,19 +822,42 @@ class HazardSystem:
         boss_pos_list = self._coerce_positions(boss_positions)
         self._maybe_boss_drop(dt_seconds, boss_pos_list)
 
+        # Mine proximity: a handful of explicit points plus index queries for
+        # enemies and meteors (meteor positions from before this step).
         proximity_positions = [player.rect.center]
         proximity_positions.extend(boss_pos_list)
         proximity_positions.extend(self._coerce_positions(nearby_positions))
-        proximity_positions.extend([m.rect.center for m in self.meteors])
+        proximity_indexes = [self.meteor_index] if enemy_index is None else [enemy_index, self.meteor_index]
+        self._sync_meteor_index()
+
+        def proximity_query(pos, radius):
+            return self._in_radius(pos, radius, proximity_positions, proximity_indexes)
 
+        lod = self.lod
+        bomb_lod = lod if self.lod_bombs else None
         for bomb in self.bombs:
-            tick = bomb.update(dt_seconds, proximity_positions=proximity_positions)
+            step_seconds = dt_seconds
+            if bomb_lod is not None:
+                pinned = bomb.state not in (BombHazard.STATE_IDLE, BombHazard.STATE_ARMED)
+                step_ms = bomb_lod.due(bomb, dt_seconds * 1000.0, pinned=pinned)
+                if step_ms is None:
+                    continue
+                step_seconds = step_ms / 1000.0
+            tick = bomb.update(step_seconds, proximity_query=proximity_query)
             if tick is not None:
                 self.debug_countdown_tick = tick
 
+        integrate = self.integrate_meteors
         for meteor in self.meteors:
-            meteor.update(dt_seconds, self.world_rect)
-        self.meteors = [m for m in self.meteors if not m.dead]
+            step_seconds = dt_seconds
+            if lod is not None:
+                step_ms = lod.due(meteor, dt_seconds * 1000.0)
+                if step_ms is None:
+                    continue
+                step_seconds = step_ms / 1000.0
+            meteor.update(step_seconds, self.world_rect, integrate=integrate)
+        # In place: Game keeps a reference to this list.
+        self.meteors[:] = [m for m in self.meteors if not m.dead]
 
         for pickup in self.pickups:
             pickup.update(dt_seconds)
@@ -684,25 +866,45 @@ class HazardSystem:
             wave.update(dt_seconds)
 
         meteor_destroyed_positions = []
-
-        # Bullet collisions with hazards.
-        for bullet in list(player_bullets):
+        layers = self.collision_matrix
+        bullet_bombs = layers.can_collide(CollisionCategory.PROJECTILE, CollisionCategory.BOMB) and bool(self.bombs)
+        bullet_meteors = layers.can_collide(CollisionCategory.PROJECTILE, CollisionCategory.METEOR) and bool(self.meteors)
+        pair_tests = 0
+
+        if bullet_bombs:
+            bomb_rank = self._bomb_rank
+            bomb_rank.clear()
+            for i, bomb in enumerate(self.bombs):
+                bomb_rank[bomb] = i
+            self.bomb_index.sync(self.bombs)
+        if bullet_meteors:
+            self._sync_meteor_index()
+
+        # Bullet collisions with hazards: bombs first, then meteors, each in
+        # list order. Destroyed meteors are swept out after the loop.
+        for bullet in (list(player_bullets) if bullet_bombs or bullet_meteors else ()):
+            area = swept_bounds(bullet)
             removed = False
 
-            for bomb in self.bombs:
-                if bomb.state != BombHazard.STATE_DONE and bullet.rect.colliderect(bomb.rect):
-                    try:
-                        player_bullets.remove(bullet)
-                    except ValueError:
-                        pass
-                    bomb.early_detonate()
-                    removed = True
-                    break
-            if removed:
+            if bullet_bombs:
+                for bomb in self._sorted_candidates(self.bomb_index, area, self._bomb_rank):
+                    if bomb.state == BombHazard.STATE_DONE:
+                        continue
+                    pair_tests += 1
+                    if swept_rect_toi(bullet, bomb.rect) is not None:
+                        try:
+                            player_bullets.remove(bullet)
+                        except ValueError:
+                            pass
+                        bomb.early_detonate()
+                        removed = True
+                        break
+            if removed or not bullet_meteors:
                 continue
 
-            for meteor in list(self.meteors):
-                if bullet.rect.colliderect(meteor.rect):
+            for meteor in self._sorted_candidates(self.meteor_index, area, self._meteor_rank):
+                pair_tests += 1
+                if swept_rect_toi(bullet, meteor.rect) is not None:
                     try:
                         player_bullets.remove(bullet)
                     except ValueError:
@@ -711,18 +913,17 @@ class HazardSystem:
                     destroyed = meteor.take_hit(1)
                     if destroyed:
                         meteor_destroyed_positions.append((int(meteor.pos.x), int(meteor.pos.y)))
-                        self.meteors.remove(meteor)
-                        self.meteors.extend(meteor.split_children())
+                        self.meteor_index.remove(meteor)
+                        self._add_meteors(meteor.split_children())
 
                         if random.random() <= float(self.config["pickup_drop_chance"]):
                             pickup_kind = random.choice(("hp", "shield"))
                             key = "pickup_hp" if pickup_kind == "hp" else "pickup_shield"
                             self.pickups.append(Pickup(meteor.pos, pickup_kind, self.sprites.mapping[key]))
-
-                    removed = True
                     break
-            if removed:
-                continue
+
+        if meteor_destroyed_positions:
+            self.meteors[:] = [m for m in self.meteors if not m.dead]
 
         effects = {
             "player_damage": 0,
@@ -734,17 +935,24 @@ class HazardSystem:
         }
 
         # Player collisions with meteors.
-        if self._player_hazard_cooldown <= 0.0:
-            for meteor in list(self.meteors):
+        if (
+            self._player_hazard_cooldown <= 0.0
+            and self.meteors
+            and layers.can_collide(CollisionCategory.PLAYER, CollisionCategory.METEOR)
+        ):
+            if not bullet_meteors:
+                self._sync_meteor_index()
+            for meteor in self._sorted_candidates(self.meteor_index, player.rect, self._meteor_rank):
+                pair_tests += 1
                 if player.rect.colliderect(meteor.rect):
                     effects["player_damage"] += int(self.config["meteor_contact_damage"])
                     self._player_hazard_cooldown = float(self.config["player_hit_cooldown"])
 
                     # Collision shatters meteor into smaller chunks.
                     meteor_destroyed_positions.append((int(meteor.pos.x), int(meteor.pos.y)))
-                    if meteor in self.meteors:
-                        self.meteors.remove(meteor)
-                    self.meteors.extend(meteor.split_children())
+                    self.meteor_index.remove(meteor)
+                    self.meteors.remove(meteor)
+                    self._add_meteors(meteor.split_children())
                     break
 
         # Bomb explosion damage region.
@@ -770,7 +978,7 @@ class HazardSystem:
                 )
             )
 
-            if bomb.can_damage_player():
+            if bomb.can_damage_player() and layers.can_collide(CollisionCategory.PLAYER, CollisionCategory.BOMB):
                 dist_sq = self._distance_sq_to_player(player, damage_event["center"])
                 max_r = damage_event["radius"] + player_radius
                 if dist_sq <= max_r * max_r:
@@ -778,7 +986,13 @@ class HazardSystem:
                     bomb.mark_player_damaged()
 
         # Pickup collect.
-        for pickup in list(self.pickups):
+        if self.pickups and layers.can_collide(CollisionCategory.PLAYER, CollisionCategory.PICKUP):
+            self.pickup_index.sync(self.pickups)
+            nearby_pickups = self.pickup_index.query_into(player.rect, self._query_buf)
+        else:
+            nearby_pickups = ()
+        for pickup in nearby_pickups:
+            pair_tests += 1
             if pickup.rect.colliderect(player.rect):
                 if pickup.kind == "hp":
                     effects["pickup_hp"] += 1
@@ -786,13 +1000,14 @@ class HazardSystem:
                     effects["pickup_shield"] += 1
                 pickup.dead = True
 
-        self.bombs = [b for b in self.bombs if not b.is_done]
-        self.pickups = [p for p in self.pickups if not p.dead]
-        self.shockwaves = [w for w in self.shockwaves if not w.dead]
+        self.bombs[:] = [b for b in self.bombs if not b.is_done]
+        self.pickups[:] = [p for p in self.pickups if not p.dead]
+        self.shockwaves[:] = [w for w in self.shockwaves if not w.dead]
 
         effects["shockwaves"] = [w.to_push_event() for w in self.shockwaves]
 
         self.debug_last_damage = effects["player_damage"]
+        self.debug_pair_tests = pair_tests
         return effects
 
     def draw(self, surface, camera_x, camera_y):
@@ -809,7 +1024,8 @@ class HazardSystem:
         lines = [
             (
                 f"Hazards bombs={len(self.bombs)} meteors={len(self.meteors)} "
-                f"shockwaves={len(self.shockwaves)} pickups={len(self.pickups)}"
+                f"shockwaves={len(self.shockwaves)} pickups={len(self.pickups)} "
+                f"pair tests={self.debug_pair_tests}"
             ),
             (
                 f"Hazard cfg fuse={self.config['fuse_seconds']:.1f}s radius={self.config['bomb_radius']:.0f} "
@@ -4,6 +4,7 @@ import math
 from Box2D import b2Vec2
 from PLAYER_LUOKAT.PlayerInput import PlayerInput
 from PLAYER_LUOKAT.PlayerWeapons import PlayerWeapons
+from rotation_cache import ROTATION_CACHE
 
 # Debug: näytä spriten ja rectin keskikohdat + offset (aseta False poistaaksesi)
 # rivi 274: self.show_physics_debug_vectors = True
@@ -711,7 +712,7 @@ class Player(pygame.sprite.Sprite):
     def draw(self, screen, cam_x, cam_y):
         if self.is_destroyed and self.destroyed_frames:
             destroyed_sprite = self.destroyed_frames[self.destroyed_frame_index]
-            destroyed_rot = pygame.transform.rotate(destroyed_sprite, -self.destroyed_angle)
+            destroyed_rot = ROTATION_CACHE.rotate(destroyed_sprite, -self.destroyed_angle)
             destroyed_rect = destroyed_rot.get_rect(center=(self.pos.x - cam_x, self.pos.y - cam_y))
             screen.blit(destroyed_rot, destroyed_rect.topleft)
             return
@@ -761,11 +762,11 @@ class Player(pygame.sprite.Sprite):
                     idx = int(elapsed / max(1, getattr(self, 'hurt_frame_speed', 40)))
                     idx = max(0, min(frame_count - 1, idx))
                     dmg = frames[idx]
-                    dmg_rot = pygame.transform.rotate(dmg, -self.angle)
+                    dmg_rot = ROTATION_CACHE.rotate(dmg, -self.angle)
                     dmg_rect = dmg_rot.get_rect(center=base_center)
                     screen.blit(dmg_rot, dmg_rect.topleft)
         else:
-            rotated = pygame.transform.rotate(self.image, -self.angle)
+            rotated = ROTATION_CACHE.rotate(self.image, -self.angle)
             rot_rect = rotated.get_rect(center=base_center)
             screen.blit(rotated, rot_rect.topleft)
 
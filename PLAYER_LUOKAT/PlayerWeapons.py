@@ -21,6 +21,9 @@ Lyhyt kuvaus:
 """
 
 class PlayerWeapons:
+    # Physics.snapshot: per-preset cooldown dicts are copied into snapshots
+    SNAPSHOT_COPY = ("preset_timers", "preset_fire_timers")
+
     def __init__(self, scale_factor):
         self.scale_factor = scale_factor
         # Find a default bullet image from available ship folders instead of hardcoding a single ship
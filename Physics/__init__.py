@@ -3,8 +3,12 @@ Fysiikkamoduuli - Yhtenäinen fysiikkamoottori RocketGame-pelille
 
 Tarjoaa:
 - RigidBody: Fysiikan kantaluokka kaikille entiteeteille (pelaaja, viholliset, ammukset)
-- Forces (Voimat): Painovoima, ilmanvastus, magnetismi, työntövoima
-- Animations (Animaatiot): Vaimennettu värähtelijä (DampedOscillator) törmäyspompuille
+- RigidBodyArray: Monen RigidBodyn integrointi kerralla NumPy-taulukoissa (valinnainen NumPy)
+- Forces (Voimat): Painovoima, ilmanvastus, magnetismi, työntövoima, jousi, säteittäinen magneetti; ForceFieldRegistry laskee kentät taulukoille kerralla
+- Animations (Animaatiot): Vaimennettu värähtelijä (DampedOscillator) törmäyspompuille, OscillatorPool parville
+- Interpolation: RenderInterpolator piirtää entiteetit kiinteiden tickien väliin
+- LOD: LODScheduler päivittää näkymän ulkopuoliset ja kaukaiset entiteetit harvemmin
+- Snapshot: capture_state/restore_state ja SnapshotRing uusintayrityksiin ja takaisinkelaukseen
 - Presets (Esiasetukset): Ennalta määritetyt fysiikkaprofiilit eri vihollistyypeille
 - Box2D-integraatio: Valinnaiset edistyneet fysiikkasimulaatiot Box2D-kirjastolla
 - Collision Categories (Törmäyskategoriat): Määrittele, mitkä objektit voivat törmätä keskenään
@@ -15,20 +19,34 @@ Tarjoaa:
 
 
 from Physics.core import RigidBody
-from Physics.forces import Force, Gravity, Drag, Magnetism, Thrust
-from Physics.animation import DampedOscillator
+from Physics.batch import RigidBodyArray
+from Physics.forces import Force, ForceFieldRegistry, Gravity, Drag, Magnetism, Thrust, Spring, RadialMagnet
+from Physics.animation import DampedOscillator, OscillatorPool
+from Physics.interpolation import RenderInterpolator
+from Physics.lod import LODScheduler
+from Physics.snapshot import SnapshotRing, capture_state, restore_state
 from Physics.presets import ENEMY_PRESETS, create_enemy_physics
 from Physics.box2d_config import PHYSICS_PROFILES, PhysicsProfile, get_physics_profile
 from Physics.box2d_world import Box2DPhysicsWorld, CollisionCategory
 
 __all__ = [
     'RigidBody',
+    'RigidBodyArray',
     'Force',
     'Gravity',
     'Drag',
     'Magnetism',
     'Thrust',
+    'Spring',
+    'RadialMagnet',
+    'ForceFieldRegistry',
     'DampedOscillator',
+    'OscillatorPool',
+    'RenderInterpolator',
+    'LODScheduler',
+    'SnapshotRing',
+    'capture_state',
+    'restore_state',
     'ENEMY_PRESETS',
     'create_enemy_physics',
     'PHYSICS_PROFILES',
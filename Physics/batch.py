@@ -0,0 +1,278 @@
+"""
+Physics/batch.py - RigidBodyArray: monen RigidBodyn integrointi NumPy-taulukoissa
+
+Struct-of-arrays: sijainnit, nopeudet ja voimakertymät ovat (n, 2)-taulukoita,
+käänteismassat, maksiminopeudet ja vastuskertoimet (n,)-taulukoita, ja step()
+integroi kaikki rivit kerralla samalla kaavalla kuin RigidBody.update():
+
+    a = (F - drag * v) * inv_mass
+    v += a * dt, rajaa |v| <= max_speed
+    p += v * dt
+
+Kappaleet pysyvät tavallisina RigidBody-olioina (pygame.Vector2 pos/vel), koska
+vihollisten tekoäly muokkaa niitä suoraan (pos.x = ..., vel += ...). pull() lukee
+olioiden tilan taulukoihin ja push() kirjoittaa tuloksen takaisin paikallaan;
+integrate(dt) = pull + olioiden forces-listat + step + push.
+
+Pelissä Game.enemy_bodies integroi kaikki batch_physics-viholliset (suoraan
+lentävät StraightEnemyt) kerran tickissä Game.force_fields-kentillä (pelaajan
+magneetti). Järjestys on sama kuin RigidBody.update()-polulla: Enemy.update()
+laskee ohjauksen ja jättää integroinnin kesken (batch_dt_ms), Game integroi
+kaikki rivit tekoälyn jälkeen rivikohtaisella dt:llä ja kutsuu lopuksi
+finish_update() (seinät, suunta). sync() pitää rivit vihollislistan mukaisina.
+
+Mittaus (python -m Physics.benchmark --integrator, 500 kappaletta): update()-
+silmukka 1.07 ms, integrate() 1.14 ms, pelkkä step() 0.05 ms. Pull/push
+Vector2-attribuuttien kautta maksaa siis yhtä paljon kuin olioiden oma update();
+hyöty tulee vasta, kun taulukoita käytetään useammin kuin kerran pull/push-paria
+kohden (useita steppejä, voimakentät suoraan taulukoille). Kahdella painovoima-
+kaivolla ja magneetilla (--fields) 500 kappaletta: update() 3.37 ms,
+integrate(dt, fields) 1.26 ms, step(dt, fields) 0.21 ms.
+
+NumPy ei ole pelin pakollinen riippuvuus: NUMPY_AVAILABLE on False, kun se
+puuttuu, eikä RigidBodyArray silloin suostu luomaan itseään.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+NUMPY_AVAILABLE = np is not None
+
+
+class RigidBodyArray:
+    """
+    RigidBody-olioiden tila rinnakkaisissa NumPy-taulukoissa.
+
+    Massa, max_speed ja is_dynamic luetaan add()- ja refresh()-kutsuissa;
+    sijainti ja nopeus pull()-kutsussa. Rivit pysyvät tiiviinä: remove()
+    siirtää viimeisen rivin poistetun paikalle.
+
+    Attribuutit:
+        bodies (list): kappaleet rivijärjestyksessä
+        pos, vel, force (np.ndarray): (kapasiteetti, 2), käytössä [:len(self)]
+        inv_mass, max_speed, drag (np.ndarray): (kapasiteetti,)
+    """
+
+    def __init__(self, capacity=64):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("NumPy is required for RigidBodyArray")
+        capacity = max(1, int(capacity))
+        self.bodies = []
+        self._rows = {}
+        self.pos = np.zeros((capacity, 2))
+        self.vel = np.zeros((capacity, 2))
+        self.force = np.zeros((capacity, 2))
+        self.inv_mass = np.ones(capacity)
+        self.max_speed = np.full(capacity, np.inf)
+        self.drag = np.zeros(capacity)
+        self._dynamic = np.ones(capacity, dtype=bool)
+
+    def __len__(self):
+        return len(self.bodies)
+
+    def __contains__(self, body):
+        return body in self._rows
+
+    def _grow(self, count):
+        capacity = self.pos.shape[0]
+        if count <= capacity:
+            return
+        capacity = max(count, capacity * 2)
+        for name, fill in (("pos", 0.0), ("vel", 0.0), ("force", 0.0)):
+            old = getattr(self, name)
+            new = np.full((capacity, 2), fill)
+            new[:old.shape[0]] = old
+            setattr(self, name, new)
+        for name, fill, dtype in (("inv_mass", 1.0, float), ("max_speed", np.inf, float),
+                                  ("drag", 0.0, float), ("_dynamic", True, bool)):
+            old = getattr(self, name)
+            new = np.full(capacity, fill, dtype=dtype)
+            new[:old.shape[0]] = old
+            setattr(self, name, new)
+
+    def add(self, body, drag=0.0):
+        """
+        Lisää kappale (tai päivitä olemassa olevan rivin parametrit).
+
+        Parametrit:
+            body (RigidBody): kappale, jolla on pos, vel, inv_mass ja max_speed
+            drag (float): lineaarinen vastuskerroin (kuten Drag(coefficient))
+
+        Palauttaa:
+            int: kappaleen rivi
+        """
+        row = self._rows.get(body)
+        if row is None:
+            row = len(self.bodies)
+            self._grow(row + 1)
+            self.bodies.append(body)
+            self._rows[body] = row
+            self.force[row] = 0.0
+        self.pos[row] = (body.pos.x, body.pos.y)
+        self.vel[row] = (body.vel.x, body.vel.y)
+        self.drag[row] = float(drag)
+        self._refresh_row(row, body)
+        return row
+
+    def _refresh_row(self, row, body):
+        self.inv_mass[row] = float(getattr(body, "inv_mass", 1.0))
+        max_speed = getattr(body, "max_speed", None)
+        self.max_speed[row] = float(max_speed) if max_speed is not None and max_speed > 0 else np.inf
+        self._dynamic[row] = bool(getattr(body, "is_dynamic", True))
+
+    def refresh(self):
+        """Lue massat, maksiminopeudet ja is_dynamic uudelleen kaikista kappaleista."""
+        for row, body in enumerate(self.bodies):
+            self._refresh_row(row, body)
+
+    def remove(self, body):
+        """Poista kappale. Palauttaa False, jos sitä ei ollut taulukossa."""
+        row = self._rows.pop(body, None)
+        if row is None:
+            return False
+        last = len(self.bodies) - 1
+        if row != last:
+            moved = self.bodies[last]
+            self.bodies[row] = moved
+            self._rows[moved] = row
+            for array in (self.pos, self.vel, self.force, self.inv_mass,
+                          self.max_speed, self.drag, self._dynamic):
+                array[row] = array[last]
+        self.bodies.pop()
+        return True
+
+    def clear(self):
+        self.bodies.clear()
+        self._rows.clear()
+
+    def sync(self, bodies, drag=0.0):
+        """
+        Pidä taulukossa täsmälleen annetut kappaleet (esim. elossa olevat viholliset).
+
+        Parametrit:
+            bodies (list): kappaleet, joiden kuuluu olla taulukossa
+            drag (float): uusien rivien vastuskerroin
+
+        Palauttaa:
+            (list, list): lisätyt ja poistetut kappaleet
+        """
+        wanted = set(bodies)
+        removed = [body for body in self.bodies if body not in wanted]
+        for body in removed:
+            self.remove(body)
+        added = [body for body in bodies if body not in self._rows]
+        for body in added:
+            self.add(body, drag)
+        return added, removed
+
+    def apply_force(self, body, fx, fy):
+        """Lisää voima kappaleen kertymään (tyhjennetään step()-kutsussa)."""
+        row = self._rows[body]
+        self.force[row, 0] += fx
+        self.force[row, 1] += fy
+
+    def pull(self):
+        """Lue kappaleiden pos/vel taulukoihin (tekoäly on voinut muuttaa niitä)."""
+        count = len(self.bodies)
+        if not count:
+            return
+        flat = np.fromiter(
+            (c for body in self.bodies for c in (body.pos.x, body.pos.y, body.vel.x, body.vel.y)),
+            dtype=float,
+            count=count * 4,
+        ).reshape(count, 4)
+        self.pos[:count] = flat[:, 0:2]
+        self.vel[:count] = flat[:, 2:4]
+
+    def push(self, sync_rect=True):
+        """Kirjoita taulukoiden pos/vel kappaleisiin paikallaan (ja rect.center, jos on)."""
+        count = len(self.bodies)
+        if not count:
+            return
+        rows = np.hstack((self.pos[:count], self.vel[:count])).tolist()
+        for body, (x, y, vx, vy) in zip(self.bodies, rows):
+            body.pos.update(x, y)
+            body.vel.update(vx, vy)
+            if sync_rect:
+                rect = getattr(body, "rect", None)
+                if rect is not None:
+                    rect.center = (int(x), int(y))
+
+    def _row_dt(self, dt, count):
+        """Aika-askel riveittäin: skalaari kaikille tai (n,)-taulukko; staattisille 0."""
+        dt = np.asarray(dt, dtype=float)
+        return np.where(self._dynamic[:count], dt, 0.0)
+
+    def step(self, dt, fields=None):
+        """
+        Integroi kaikki dynaamiset rivit yhdellä kertaa ja nollaa voimakertymät.
+
+        Parametrit:
+            dt (float | sekvenssi): aika-askel sekunteina, tai rivikohtaiset
+                askeleet (0 = riviä ei integroida tällä kertaa)
+            fields: valinnainen ForceFieldRegistry (tai Force), jonka
+                apply(positions, velocities, masses, out_acc) lisää kiihtyvyydet
+        """
+        count = len(self.bodies)
+        if not count:
+            return
+        pos = self.pos[:count]
+        vel = self.vel[:count]
+        force = self.force[:count]
+        inv_mass = self.inv_mass[:count, None]
+        row_dt = self._row_dt(dt, count)
+        dt_rows = row_dt[:, None]
+
+        force -= vel * self.drag[:count, None]
+        acc = force * inv_mass
+        if fields is not None:
+            fields.apply(pos, vel, 1.0 / self.inv_mass[:count], acc)
+        vel += acc * dt_rows
+
+        speed = np.hypot(vel[:, 0], vel[:, 1])
+        max_speed = self.max_speed[:count]
+        over = (speed > max_speed) & (row_dt > 0.0)
+        if over.any():
+            vel[over] *= (max_speed[over] / speed[over])[:, None]
+
+        pos += vel * dt_rows
+        force[:] = 0.0
+
+    def integrate(self, dt, fields=None):
+        """
+        Sama kuin body.update(dt) jokaiselle kappaleelle, yhtenä eräajona.
+
+        Lukee tilan olioista, lisää olioiden forces-listojen voimat (ja
+        fields-voimakentät kaikille riveille), integroi ja kirjoittaa tuloksen
+        takaisin. dt voi olla rivikohtainen kuten step()-kutsussa; rivit, joiden
+        dt on 0, eivät liiku eivätkä kuluta forces-listaansa.
+
+        Palauttaa:
+            int: integroitujen kappaleiden määrä
+        """
+        self.pull()
+        force = self.force
+        row_dt = self._row_dt(dt, len(self.bodies)).tolist()
+        for row, body in enumerate(self.bodies):
+            forces = getattr(body, "forces", None)
+            if not forces:
+                continue
+            body_dt = row_dt[row]
+            if body_dt > 0.0:
+                for item in forces:
+                    try:
+                        f = item.get_force(body, body_dt)
+                    except Exception:
+                        continue
+                    if f is not None:
+                        force[row, 0] += f.x
+                        force[row, 1] += f.y
+                forces.clear()
+        self.step(row_dt, fields)
+        self.push()
+        return sum(1 for body_dt in row_dt if body_dt > 0.0)
+
+
+__all__ = ["NUMPY_AVAILABLE", "RigidBodyArray"]
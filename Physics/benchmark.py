@@ -0,0 +1,252 @@
+"""Ruutuaika vs. entiteettimäärä: Python-liike vs. Box2D-entiteettitila.
+
+Käyttö:
+
+    python -m Physics.benchmark --enemies 25 50 100 200 400 --frames 300
+
+Ajaa headless-pelin (oletuksena TestLevel2: meteorit, pommit ja
+meteori-vihollinen-törmäykset päällä) ja pitää kentällä joka ruudun alussa
+vakiomäärän ChaseEnemy-vihollisia, meteoreita (enemies // 4) ja pommeja
+(enemies // 20). Sama siemen kummallekin tilalle:
+
+    python   Game.USE_BOX2D_ENTITIES = False (liike ja erottelu Pythonissa)
+    box2d    Game.USE_BOX2D_ENTITIES = True  (kappaleet Box2D-maailmassa)
+
+Tulostaa ruutuajan keskiarvon ja p95:n sekä Box2D-stepin keston.
+
+    python -m Physics.benchmark --integrator --enemies 100 500 2000
+
+vertaa RigidBody.update()-silmukkaa RigidBodyArrayn integrate()- (pull + step
++ push) ja pelkkään step()-kutsuun samoilla kappaleilla. --fields lisää
+kaikille kappaleille kaksi painovoimakaivoa ja magneetin (olioille add_force,
+taulukoille ForceFieldRegistry).
+
+    python -m Physics.benchmark --bounces --enemies 100 500 2000
+
+vertaa DampedOscillator.update()-kutsuja per olio OscillatorPool.advance()-
+eräajoon (Python-silmukka ja NumPy) samoilla, koko ajon kestävillä pompuilla.
+"""
+
+import argparse
+import random
+import time
+
+from simulation import SimulationRunner, _percentile
+
+
+def _far_point(rng, world, player_center, min_dist=600):
+    width, height = world
+    px, py = player_center
+    while True:
+        x = rng.randrange(40, width - 40)
+        y = rng.randrange(40, height - 40)
+        if (x - px) ** 2 + (y - py) ** 2 >= min_dist * min_dist:
+            return x, y
+
+
+def populate(game, enemy_count, rng):
+    """Täydennä viholliset, meteorit ja pommit tavoitemääriin."""
+    from Enemies.EnemyAI import ChaseEnemy
+    from RocketGame import HITBOX_SIZE_ENEMY, apply_hitbox
+
+    world = (game.tausta_leveys, game.tausta_korkeus)
+    player_center = game.player.rect.center
+    while len(game.enemies) < enemy_count:
+        x, y = _far_point(rng, world, player_center)
+        enemy = ChaseEnemy(game.enemy_imgs[0], x, y, speed=rng.uniform(160, 260))
+        apply_hitbox(enemy, HITBOX_SIZE_ENEMY)
+        game.enemies.append(enemy)
+
+    hazards = game.hazard_system
+    if hazards is None:
+        return
+    while len(hazards.meteors) < enemy_count // 4:
+        center = _far_point(rng, world, player_center)
+        velocity = (rng.uniform(-140, 140), rng.uniform(-140, 140))
+        hazards.spawn_meteor(tier=rng.randint(1, 3), center=center, velocity=velocity)
+    while len(hazards.bombs) < enemy_count // 20:
+        hazards.spawn_bomb(_far_point(rng, world, player_center))
+
+
+def run_mode(level, enemy_count, frames, box2d_entities, seed=0, warmup=30):
+    """Aja yksi tila ja palauta dict (mean_ms, p95_ms, physics_ms)."""
+    runner = SimulationRunner(level_number=level, seed=seed, box2d_entities=box2d_entities)
+    game = runner.game
+    rng = random.Random(seed)
+    frame_times = []
+    physics_times = []
+    for frame in range(warmup + frames):
+        populate(game, enemy_count, rng)
+        start = time.perf_counter()
+        runner.step()
+        elapsed = (time.perf_counter() - start) * 1000.0
+        if frame >= warmup:
+            frame_times.append(elapsed)
+            physics_times.append(float(game.physics_metrics.get('physics_step_ms', 0.0)))
+    ordered = sorted(frame_times)
+    return {
+        "mean_ms": sum(frame_times) / len(frame_times),
+        "p95_ms": _percentile(ordered, 95),
+        "physics_ms": sum(physics_times) / len(physics_times),
+        "bodies": len(game.physics_world.entity_to_body),
+    }
+
+
+def benchmark(enemy_counts, frames=300, level=6, seed=0):
+    """Palauttaa rivit (vihollisia, {tila: tulokset})."""
+    rows = []
+    for enemy_count in enemy_counts:
+        results = {}
+        for name, box2d_entities in (("python", False), ("box2d", True)):
+            results[name] = run_mode(level, enemy_count, frames, box2d_entities, seed=seed)
+        rows.append((enemy_count, results))
+    return rows
+
+
+def _integrator_bodies(count, seed):
+    from Physics.core import RigidBody
+
+    rng = random.Random(seed)
+    bodies = []
+    for _ in range(count):
+        body = RigidBody(rng.uniform(0, 3000), rng.uniform(0, 2000), mass=rng.uniform(0.8, 1.6))
+        body.vel.update(rng.uniform(-300, 300), rng.uniform(-300, 300))
+        body.max_speed = 220.0
+        bodies.append(body)
+    return bodies
+
+
+def _benchmark_fields():
+    from Physics.core import RigidBody
+    from Physics.forces import ForceFieldRegistry, Gravity, Magnetism
+
+    magnet = RigidBody(1500, 1000)
+    return ForceFieldRegistry([
+        Gravity((800, 600), strength=4.0e6),
+        Gravity((2200, 1400), strength=6.0e6),
+        Magnetism(magnet, strength=120.0, min_distance=40.0),
+    ])
+
+
+def benchmark_integrator(body_counts, frames=300, seed=0, fields=False):
+    """Palauttaa rivit (kappaleita, {tapa: ms/ruutu})."""
+    from Physics.batch import RigidBodyArray
+
+    dt = 1.0 / 60.0
+    registry = _benchmark_fields() if fields else None
+    rows = []
+    for count in body_counts:
+        objects = _integrator_bodies(count, seed)
+        start = time.perf_counter()
+        for _ in range(frames):
+            for body in objects:
+                if registry is not None:
+                    for field in registry.fields:
+                        body.add_force(field)
+                body.update(dt)
+        per_object = (time.perf_counter() - start) * 1000.0 / frames
+
+        batched = _integrator_bodies(count, seed)
+        batch = RigidBodyArray(capacity=count)
+        for body in batched:
+            batch.add(body)
+        start = time.perf_counter()
+        for _ in range(frames):
+            batch.integrate(dt, registry)
+        integrate = (time.perf_counter() - start) * 1000.0 / frames
+        for a, b in zip(objects, batched):
+            assert a.pos.distance_to(b.pos) < 1e-5, "RigidBodyArray drifted from RigidBody.update"
+
+        start = time.perf_counter()
+        for _ in range(frames):
+            batch.step(dt, registry)
+        step_only = (time.perf_counter() - start) * 1000.0 / frames
+        rows.append((count, {"objects": per_object, "integrate": integrate, "step": step_only}))
+    return rows
+
+
+def _bounce_specs(count, seed):
+    rng = random.Random(seed)
+    return [
+        ((rng.uniform(0, 3000), rng.uniform(0, 2000)), (rng.uniform(-30, 30), rng.uniform(-30, 30)))
+        for _ in range(count)
+    ]
+
+
+def benchmark_bounces(counts, frames=300, seed=0):
+    """Palauttaa rivit (pomppuja, {tapa: ms/ruutu})."""
+    from Physics.animation import DampedOscillator, OscillatorPool
+
+    dt = 1.0 / 60.0
+    duration = frames * dt + 1.0
+    rows = []
+    for count in counts:
+        specs = _bounce_specs(count, seed)
+        oscillators = [DampedOscillator(base, disp, duration=duration) for base, disp in specs]
+        start = time.perf_counter()
+        for _ in range(frames):
+            for osc in oscillators:
+                osc.update(dt)
+        per_object = (time.perf_counter() - start) * 1000.0 / frames
+
+        stats = {"objects": per_object}
+        for name, numpy_min in (("pool", None), ("numpy", 1)):
+            pool = OscillatorPool(capacity=count)
+            if numpy_min is not None:
+                if pool._array is None:
+                    continue
+                pool.NUMPY_MIN_ACTIVE = numpy_min
+            elif pool._array is not None:
+                pool.NUMPY_MIN_ACTIVE = count + 1
+            for i, (base, disp) in enumerate(specs):
+                pool.start(i, base, disp, duration=duration)
+            start = time.perf_counter()
+            for _ in range(frames):
+                pool.advance(dt)
+            stats[name] = (time.perf_counter() - start) * 1000.0 / frames
+            x, y = pool.positions[count - 1]
+            last = oscillators[-1].update(0.0)
+            assert abs(x - last.x) < 1e-6 and abs(y - last.y) < 1e-6, "OscillatorPool drifted from DampedOscillator"
+        rows.append((count, stats))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Vertaa ruutuaikaa Python- ja Box2D-entiteettitilassa.")
+    parser.add_argument("--enemies", type=int, nargs="+", default=[25, 50, 100, 200, 400])
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--level", type=int, default=6, help="tason numero (6=TestLevel2)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--integrator", action="store_true",
+                        help="vertaa RigidBody.update()-silmukkaa ja RigidBodyArrayta (--enemies = kappalemäärät)")
+    parser.add_argument("--fields", action="store_true",
+                        help="--integrator: lisää painovoimakaivot ja magneetti kaikille kappaleille")
+    parser.add_argument("--bounces", action="store_true",
+                        help="vertaa DampedOscillator-olioita ja OscillatorPoolia (--enemies = pomppumäärät)")
+    args = parser.parse_args(argv)
+
+    if args.bounces:
+        rows = benchmark_bounces(args.enemies, frames=args.frames, seed=args.seed)
+        print(f"{'bounces':>8} {'objects ms':>11} {'pool ms':>8} {'numpy ms':>9}")
+        for count, stats in rows:
+            print(f"{count:>8} {stats['objects']:11.3f} {stats['pool']:8.3f} {stats.get('numpy', float('nan')):9.3f}")
+        return rows
+
+    if args.integrator:
+        rows = benchmark_integrator(args.enemies, frames=args.frames, seed=args.seed, fields=args.fields)
+        print(f"{'bodies':>8} {'update ms':>10} {'integrate ms':>13} {'step ms':>9}")
+        for count, stats in rows:
+            print(f"{count:>8} {stats['objects']:10.3f} {stats['integrate']:13.3f} {stats['step']:9.3f}")
+        return rows
+
+    rows = benchmark(args.enemies, frames=args.frames, level=args.level, seed=args.seed)
+    print(f"{'enemies':>8} {'mode':>7} {'mean ms':>9} {'p95 ms':>9} {'box2d ms':>9} {'bodies':>7}")
+    for enemy_count, results in rows:
+        for name, stats in results.items():
+            print(f"{enemy_count:>8} {name:>7} {stats['mean_ms']:9.3f} {stats['p95_ms']:9.3f}"
+                  f" {stats['physics_ms']:9.3f} {stats['bodies']:>7}")
+    return rows
+
+
+if __name__ == "__main__":
+    main()
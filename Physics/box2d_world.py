@@ -1,17 +1,21 @@
 import time
-from collections import deque
+from dataclasses import dataclass
 
 import pygame
 
+from Collision.layers import CollisionCategory
+from frame_clock import TimeDilationMeter
 from Physics.box2d_config import get_physics_profile
 
 try:
     from Box2D import (
+        b2AABB,
         b2CircleShape,
         b2ContactListener,
         b2_dynamicBody,
         b2Filter,
         b2_kinematicBody,
+        b2QueryCallback,
         b2_staticBody,
         b2Vec2,
         b2World,
@@ -20,34 +24,171 @@ except Exception as exc:  # pragma: no cover - handled by caller
     raise RuntimeError("Box2D is required for Box2DPhysicsWorld") from exc
 
 
-class CollisionCategory:
-    PLAYER = 0x0001
-    ENEMY = 0x0002
-    PROJECTILE = 0x0004
-    METEOR = 0x0008
-    SENSOR = 0x0010
+class _BodyQuery(b2QueryCallback):
+    """Kerää QueryAABB:n löytämät kappaleet kerran kukin (entiteetti -> kappale)."""
+
+    def __init__(self):
+        super().__init__()
+        self.found = {}
+
+    def ReportFixture(self, fixture):
+        body = fixture.body
+        entity = body.userData
+        if entity is not None and entity not in self.found:
+            self.found[entity] = body
+        return True
+
+
+CONTACT_BEGIN = "begin"
+CONTACT_END = "end"
+CONTACT_PRE_SOLVE = "pre_solve"
+
+
+@dataclass
+class ContactEvent:
+    """Yksi Box2D-kontaktitapahtuma.
+
+    Attributes:
+        phase: CONTACT_BEGIN, CONTACT_END tai CONTACT_PRE_SOLVE.
+        entity_a, entity_b: kappaleiden userData (entiteetit).
+        category_a, category_b: fixtureiden CollisionCategory-bitit.
+        approach_speed: lähestymisnopeus kontaktin normaalin suuntaan (px/s,
+            positiivinen = lähestyvät). Sensoreilla normaalina käytetään
+            keskipisteiden välistä suuntaa.
+        sensor: True, jos jompikumpi fixture on sensori.
+    """
+
+    phase: str
+    entity_a: object
+    entity_b: object
+    category_a: int
+    category_b: int
+    approach_speed: float = 0.0
+    sensor: bool = False
+
+
+@dataclass
+class WorldSnapshot:
+    """Box2DPhysicsWorldin kappaleiden tila (ks. Box2DPhysicsWorld.snapshot).
+
+    Attributes:
+        bodies: tuple (entiteetti, x, y, kulma, vx, vy, kulmanopeus, hereillä)
+            metreinä/radiaaneina, yksi per kappale.
+        previous: entiteetti -> (x, y, kulma) piirron interpolointia varten.
+        accumulator: stepin kertynyt aika sekunteina.
+        alpha: viimeisimmän stepin interpolointikerroin.
+    """
+
+    bodies: tuple
+    previous: dict
+    accumulator: float = 0.0
+    alpha: float = 0.0
 
 
 class ContactCollector(b2ContactListener):
-    def __init__(self):
+    """Kerää begin/end-kontaktit häviöttömästi; pelilogiikka tyhjentää ne drain()-kutsulla.
+
+    Args:
+        categories: tallenna vain tapahtumat, joissa jommankumman fixturen
+            kategoria osuu tähän maskiin (begin_contacts lasketaan silti kaikista).
+    """
+
+    def __init__(self, categories=0xFFFF):
         super().__init__()
+        self.categories = int(categories)
         self.begin_contacts = 0
-        self.contact_events = deque(maxlen=64)
+        self.total_events = 0
+        self._events = []
 
     def BeginContact(self, contact):
         self.begin_contacts += 1
-        a = getattr(contact.fixtureA.body, "userData", None)
-        b = getattr(contact.fixtureB.body, "userData", None)
-        self.contact_events.append((a, b))
+        self._record(CONTACT_BEGIN, contact, None)
+
+    def EndContact(self, contact):
+        self._record(CONTACT_END, contact, None)
+
+    def _record(self, phase, contact, normal):
+        fixture_a = contact.fixtureA
+        fixture_b = contact.fixtureB
+        category_a = fixture_a.filterData.categoryBits
+        category_b = fixture_b.filterData.categoryBits
+        if not (category_a | category_b) & self.categories:
+            return
+        body_a = fixture_a.body
+        body_b = fixture_b.body
+        sensor = fixture_a.sensor or fixture_b.sensor
+        approach = 0.0
+        if phase != CONTACT_END:
+            if normal is None:
+                normal = body_b.position - body_a.position
+                length = normal.length
+                if length > 0.0:
+                    normal = normal / length
+            relative = body_b.linearVelocity - body_a.linearVelocity
+            approach = -(relative.x * normal[0] + relative.y * normal[1]) * Box2DPhysicsWorld.PPM
+        self._events.append(ContactEvent(
+            phase, body_a.userData, body_b.userData, category_a, category_b, approach, sensor,
+        ))
+        self.total_events += 1
+
+    def drain(self):
+        """Palauta kertyneet tapahtumat järjestyksessä ja tyhjennä puskuri."""
+        events = self._events
+        self._events = []
+        return events
+
+    def pending(self):
+        return len(self._events)
 
     def reset_frame_metrics(self):
         self.begin_contacts = 0
 
 
+class PreSolveContactCollector(ContactCollector):
+    """ContactCollector, joka kirjaa lisäksi kiinteiden kontaktien pre-solve-vaiheen.
+
+    PreSolve kutsutaan joka stepillä jokaiselle koskettavalle kiinteälle
+    kontaktille (400 vihollisen parvessa step ~4x hitaampi), joten se on
+    erillinen luokka: Box2DPhysicsWorld(record_pre_solve=True).
+    """
+
+    def PreSolve(self, contact, old_manifold):
+        self._record(CONTACT_PRE_SOLVE, contact, contact.worldManifold.normal)
+
+
+# Pysyy steppien laskennassa liukulukuvirheen yli: 1000/60 ms tickit eivät
+# saa jättää yhtään steppiä väliin, kun kappaleita ohjataan tickin sijainneista.
+_STEP_EPSILON = 1e-9
+
+# Mitä tehdään, kun kutsu tuo enemmän aikaa kuin max_substeps ehtii simuloida:
+#   catch_up  jäännös kirotaan seuraavissa kutsuissa enintään yhdellä ylimääräisellä
+#             stepillä per kutsu; velkaa enintään max_debt, velka näkyy dilataationa
+#   drop      kokonaiset jäljelle jääneet stepit pudotetaan heti (murto-osa jää alphaksi)
+#   clamp     kutsun dt rajataan max_frame_dt:hen; jäännös jää velaksi (enintään
+#             max_frame_dt) ja maksetaan takaisin täysillä max_substeps-kutsuilla
+STEP_POLICY_CATCH_UP = "catch_up"
+STEP_POLICY_DROP = "drop"
+STEP_POLICY_CLAMP = "clamp"
+STEP_POLICIES = (STEP_POLICY_CATCH_UP, STEP_POLICY_DROP, STEP_POLICY_CLAMP)
+
+SYNC_VELOCITY = 0x1
+SYNC_ANGLE = 0x2
+SYNC_ALL = SYNC_VELOCITY | SYNC_ANGLE
+
+# Rekisteröinnissä välimuistiin tallennetut kyvyt (synkkausliput ylemmissä biteissä)
+_HAS_POS = 0x10
+_HAS_RECT = 0x20
+_RAD_TO_DEG = 57.29577951308232
+
+
 class Box2DPhysicsWorld:
     """Small adapter that keeps Box2D in fixed-step mode and syncs sprites."""
 
     PPM = 30.0  # pixels per meter
+    # Box2D rajoittaa siirtymän 2 m/step; isommat hypyt (teleportit) asetetaan suoraan.
+    MAX_DRIVE_JUMP_PX = 48.0
+    # Piirron interpolointi: pidempää siirtymää yhden stepin aikana ei interpoloida.
+    RENDER_SNAP_PX = 160.0
 
     def __init__(
         self,
@@ -57,19 +198,38 @@ class Box2DPhysicsWorld:
         position_iterations=3,
         max_substeps=5,
         profile_name="balanced",
+        record_pre_solve=False,
+        step_policy=STEP_POLICY_CLAMP,
+        max_frame_dt=0.25,
+        max_debt=None,
     ):
+        if step_policy not in STEP_POLICIES:
+            raise ValueError(f"Unknown step policy: {step_policy!r} (expected one of {STEP_POLICIES})")
         self.profile = get_physics_profile(profile_name)
         self.fixed_dt = float(fixed_dt)
         self.velocity_iterations = int(velocity_iterations)
         self.position_iterations = int(position_iterations)
         self.max_substeps = int(max_substeps)
         self.accumulator = 0.0
+        self.step_policy = step_policy
+        self.max_frame_dt = float(max_frame_dt)
+        # catch_up: oletuksena yhden ruudun verran steppejä velkaa
+        self.max_debt = float(max_debt) if max_debt is not None else self.max_substeps * self.fixed_dt
+        self.dilation = TimeDilationMeter()
 
         self.world = b2World(gravity=gravity, doSleep=True)
-        self.contact_collector = ContactCollector()
+        collector_cls = PreSolveContactCollector if record_pre_solve else ContactCollector
+        self.contact_collector = collector_cls()
         self.world.contactListener = self.contact_collector
 
         self.entity_to_body = {}
+        # entity -> (body, liput): mitä stepin jälkeen kopioidaan ja mihin (ks. _register_sync)
+        self._sync_records = {}
+        # entity -> [x, y, kulma] ennen viimeisintä steppiä (piirron interpolointi)
+        self._previous = {}
+        self._render_saved = []
+        self.alpha = 0.0
+        self._groups = {}
 
         self.step_time_ms = 0.0
         self.last_substeps = 0
@@ -94,7 +254,14 @@ class Box2DPhysicsWorld:
         mask=0xFFFF,
         restitution=0.05,
         friction=0.2,
+        sensor_mask=0,
+        sensor_radius_px=None,
     ):
+        """Luo dynaaminen (tai kinemaattinen) ympyräkappale, jota Box2D liikuttaa.
+
+        ``sensor_mask``: valinnainen massaton sensori (säde ``sensor_radius_px``),
+        joka raportoi kosketukset näihin kategorioihin kiinteän fixturen sijaan.
+        """
         x_px, y_px = self._entity_center(entity)
         body_type = b2_dynamicBody if dynamic else b2_kinematicBody
         body = self.world.CreateBody(
@@ -114,9 +281,18 @@ class Box2DPhysicsWorld:
             restitution=float(restitution),
         )
         fixture.filterData = b2Filter(categoryBits=int(category), maskBits=int(mask), groupIndex=0)
+        if sensor_mask:
+            sensor_px = radius_px if sensor_radius_px is None else sensor_radius_px
+            sensor = body.CreateFixture(
+                shape=b2CircleShape(radius=max(0.05, self.pixels_to_meters(sensor_px))),
+                density=0.0,
+                isSensor=True,
+            )
+            sensor.filterData = b2Filter(categoryBits=int(category), maskBits=int(sensor_mask), groupIndex=0)
 
         body.userData = entity
         self.entity_to_body[entity] = body
+        self._register_sync(entity, body, SYNC_ALL)
         return body
 
     def add_static_circle(
@@ -145,67 +321,482 @@ class Box2DPhysicsWorld:
         self.entity_to_body[entity] = body
         return body
 
+    def add_entity_body(
+        self,
+        entity,
+        radius_px,
+        category,
+        solid_mask=0,
+        sensor_mask=0,
+        sensor_radius_px=None,
+        kinematic=False,
+        mass=1.0,
+        sync=SYNC_VELOCITY,
+    ):
+        """Luo pelientiteetille kappale, joka ajetaan Pythonin tilasta.
+
+        Kiinteä fixture (``solid_mask``) ratkaisee päällekkäisyydet Box2D:n
+        kontaktisolverilla, sensori (``sensor_mask``) vain raportoi kosketukset.
+        Kumpikin jätetään pois, jos sen maski on 0.
+
+        Args:
+            entity: objekti, jolla on pos/rect (ja vel).
+            radius_px: kiinteän fixturen säde pikseleinä.
+            category: CollisionCategory-bitti.
+            solid_mask: kategoriat, joihin kappale törmää fyysisesti.
+            sensor_mask: kategoriat, joiden kosketukset raportoidaan.
+            sensor_radius_px: sensorin säde (oletus radius_px).
+            kinematic: True = solveri ei liikuta kappaletta (pomot, pommit).
+            mass: tiheys kiinteälle fixturelle.
+            sync: mitä kappaleesta kopioidaan takaisin entiteettiin steppien jälkeen
+                (sijainti aina, lisäksi SYNC_VELOCITY/SYNC_ANGLE).
+
+        Returns:
+            Luotu b2Body.
+        """
+        x_px, y_px = self._entity_center(entity)
+        body = self.world.CreateBody(
+            type=b2_kinematicBody if kinematic else b2_dynamicBody,
+            position=(self.pixels_to_meters(x_px), self.pixels_to_meters(y_px)),
+            linearDamping=0.0,
+            angularDamping=0.0,
+            fixedRotation=True,
+            allowSleep=False,
+        )
+        if solid_mask:
+            fixture = body.CreateFixture(
+                shape=b2CircleShape(radius=max(0.05, self.pixels_to_meters(radius_px))),
+                density=max(0.001, float(mass)),
+                friction=0.0,
+                restitution=0.0,
+            )
+            fixture.filterData = b2Filter(categoryBits=int(category), maskBits=int(solid_mask), groupIndex=0)
+        if sensor_mask:
+            sensor_px = radius_px if sensor_radius_px is None else sensor_radius_px
+            fixture = body.CreateFixture(
+                shape=b2CircleShape(radius=max(0.05, self.pixels_to_meters(sensor_px))),
+                density=0.0 if solid_mask else max(0.001, float(mass)),
+                isSensor=True,
+            )
+            fixture.filterData = b2Filter(categoryBits=int(category), maskBits=int(sensor_mask), groupIndex=0)
+
+        vel = getattr(entity, "vel", None)
+        if vel is not None and not kinematic:
+            body.linearVelocity = (self.pixels_to_meters(vel[0]), self.pixels_to_meters(vel[1]))
+
+        body.userData = entity
+        self.entity_to_body[entity] = body
+        self._register_sync(entity, body, sync)
+        return body
+
+    def _register_sync(self, entity, body, sync):
+        """Selvitä entiteetin kyvyt kerran, jotta stepin synkkaus on pelkkiä sijoituksia.
+
+        pos/vel muutetaan tarvittaessa pygame.Vector2:ksi tässä, jolloin
+        step päivittää ne paikallaan (update) eikä luo uusia olioita.
+        Staattisia kappaleita ei synkata lainkaan.
+        """
+        if body.type == b2_staticBody:
+            return
+        flags = 0
+        x_px, y_px = self._entity_center(entity)
+        if self._ensure_vector(entity, "pos", (x_px, y_px)):
+            flags |= _HAS_POS
+        if sync & SYNC_VELOCITY and self._ensure_vector(entity, "vel", (0.0, 0.0)):
+            flags |= SYNC_VELOCITY
+        if getattr(entity, "rect", None) is not None:
+            flags |= _HAS_RECT
+        if sync & SYNC_ANGLE:
+            flags |= SYNC_ANGLE
+        self._sync_records[entity] = (body, flags)
+        self._previous[entity] = [x_px, y_px, float(getattr(entity, "angle", 0.0) or 0.0)]
+
+    @staticmethod
+    def _ensure_vector(entity, name, default):
+        value = getattr(entity, name, None)
+        if isinstance(value, pygame.math.Vector2):
+            return True
+        try:
+            setattr(entity, name, pygame.Vector2(default if value is None else value))
+        except Exception:
+            return False
+        return True
+
+    def sync_group(self, name, entities, create):
+        """Pidä nimetyssä ryhmässä yksi kappale per ``entities``-listan entiteetti.
+
+        Uusille kutsutaan ``create(entity)``, listasta poistuneiden kappaleet
+        tuhotaan. Palauttaa (lisätyt, poistetut).
+        """
+        previous = self._groups.get(name, ())
+        current = set(entities)
+        removed = 0
+        for entity in previous:
+            if entity not in current:
+                self.remove_entity(entity)
+                removed += 1
+        added = 0
+        entity_to_body = self.entity_to_body
+        for entity in entities:
+            if entity not in entity_to_body:
+                create(entity)
+                added += 1
+        self._groups[name] = current
+        return added, removed
+
+    def remove_group(self, name):
+        for entity in self._groups.pop(name, ()):
+            self.remove_entity(entity)
+
+    def drive_bodies(self, entities):
+        """Aseta kappaleiden nopeus niin, että seuraava steppi vie ne entiteetin sijaintiin.
+
+        Entiteetin AI/Python-logiikka ehdottaa sijainnin, solveri ratkaisee
+        päällekkäisyydet stepissä. Yli MAX_DRIVE_JUMP_PX:n hypyt siirretään suoraan.
+        """
+        ppm = self.PPM
+        inv_dt = 1.0 / self.fixed_dt if self.fixed_dt > 0 else 0.0
+        max_jump = self.MAX_DRIVE_JUMP_PX / ppm
+        entity_to_body = self.entity_to_body
+        for entity in entities:
+            body = entity_to_body.get(entity)
+            if body is None:
+                continue
+            x_px, y_px = self._entity_center(entity)
+            tx = x_px / ppm
+            ty = y_px / ppm
+            position = body.position
+            dx = tx - position.x
+            dy = ty - position.y
+            if abs(dx) > max_jump or abs(dy) > max_jump:
+                body.position = (tx, ty)
+                body.linearVelocity = (0.0, 0.0)
+            else:
+                body.linearVelocity = (dx * inv_dt, dy * inv_dt)
+
+    def push_velocities(self, entities):
+        """Kopioi entiteettien nopeus (ja Pythonissa tehty siirto) kappaleisiin.
+
+        Box2D integroi liikkeen itse; tätä käytetään kappaleille, joiden
+        liikettä Python ei enää laske (meteorit).
+        """
+        ppm = self.PPM
+        entity_to_body = self.entity_to_body
+        for entity in entities:
+            body = entity_to_body.get(entity)
+            if body is None:
+                continue
+            x_px, y_px = self._entity_center(entity)
+            position = body.position
+            if abs(x_px / ppm - position.x) * ppm > 0.5 or abs(y_px / ppm - position.y) * ppm > 0.5:
+                body.position = (x_px / ppm, y_px / ppm)
+            vel = entity.vel
+            body.linearVelocity = (vel[0] / ppm, vel[1] / ppm)
+
+    def touching_pairs(self, entities, category):
+        """Parit (entiteetti, toinen) joissa entiteetin kappale koskettaa ``category``-fixturea.
+
+        Käy läpi vain annettujen entiteettien kappaleiden kontaktireunat
+        (Box2D:n broadphase ja fixture-testit on tehty jo stepissä), joten
+        kustannus riippuu niiden kontakteista eikä koko maailman kontaktimäärästä.
+        Tulos on ``entities``-listan järjestyksessä.
+        """
+        pairs = []
+        entity_to_body = self.entity_to_body
+        for entity in entities:
+            body = entity_to_body.get(entity)
+            if body is None:
+                continue
+            for edge in body.contacts:
+                contact = edge.contact
+                if not contact.touching:
+                    continue
+                fixture_a = contact.fixtureA
+                fixture_b = contact.fixtureB
+                other = fixture_b if fixture_a.body.userData is entity else fixture_a
+                if other.filterData.categoryBits & category:
+                    pairs.append((entity, other.body.userData))
+        return pairs
+
     def remove_entity(self, entity):
         body = self.entity_to_body.pop(entity, None)
+        self._sync_records.pop(entity, None)
+        self._previous.pop(entity, None)
         if body is not None:
             self.world.DestroyBody(body)
 
     def get_body(self, entity):
         return self.entity_to_body.get(entity)
 
+    def drain_contact_events(self):
+        """Palauttaa edellisen tyhjennyksen jälkeen kertyneet ContactEventit (järjestyksessä).
+
+        Tapahtumia ei karsita: pelilogiikan pitää tyhjentää puskuri kerran
+        tickissä. Myös DestroyBody-kutsut (remove_entity) tuottavat end-tapahtumat.
+        """
+        return self.contact_collector.drain()
+
     def step(self, dt_seconds):
-        dt_seconds = max(0.0, float(dt_seconds))
+        """Etene dt_seconds kiinteinä steppeinä; ylijäämä käsitellään step_policyn mukaan.
+
+        Pudotettu simulointiaika ja liukuva aikadilataatio näkyvät get_metrics()-tuloksessa.
+        """
+        real_dt = max(0.0, float(dt_seconds))
+        dropped = 0.0
+        dt_seconds = real_dt
+        if self.step_policy == STEP_POLICY_CLAMP and dt_seconds > self.max_frame_dt:
+            dropped = dt_seconds - self.max_frame_dt
+            dt_seconds = self.max_frame_dt
+        debt_before = self._whole_steps(self.accumulator)
         self.accumulator += dt_seconds
 
+        max_substeps = self.max_substeps
+        if self.step_policy == STEP_POLICY_CATCH_UP:
+            # Kutsun omat stepit + enintään yksi velan lyhennys: hitaan ruudun
+            # jälkeen seuraavat ruudut eivät aja max_substepsiä putkeen.
+            own = int((dt_seconds + _STEP_EPSILON) / self.fixed_dt) if self.fixed_dt > 0 else 0
+            max_substeps = min(max_substeps, own + 1)
+
         self.contact_collector.reset_frame_metrics()
         substeps = 0
         t0 = time.perf_counter()
 
-        while self.accumulator >= self.fixed_dt and substeps < self.max_substeps:
+        while self.accumulator + _STEP_EPSILON >= self.fixed_dt and substeps < max_substeps:
             self.world.Step(self.fixed_dt, self.velocity_iterations, self.position_iterations)
             self.world.ClearForces()
-            self.accumulator -= self.fixed_dt
+            self.accumulator = max(0.0, self.accumulator - self.fixed_dt)
             substeps += 1
 
+        deferred = 0.0
+        if self.accumulator + _STEP_EPSILON >= self.fixed_dt:
+            if self.step_policy == STEP_POLICY_DROP:
+                kept = max(0.0, self.accumulator - self._whole_steps(self.accumulator))
+                dropped += self.accumulator - kept
+                self.accumulator = kept
+            else:
+                max_debt = self.max_debt if self.step_policy == STEP_POLICY_CATCH_UP else self.max_frame_dt
+                if self.accumulator > max_debt:
+                    dropped += self.accumulator - max_debt
+                    self.accumulator = max_debt
+                # Velaksi jäänyt aika hidastaa peliä kuten pudotettu, kunnes se kirotaan
+                deferred = max(0.0, self._whole_steps(self.accumulator) - debt_before)
+        self.dilation.record(real_dt, dropped, deferred)
+
         alpha = self.accumulator / self.fixed_dt if self.fixed_dt > 0 else 0.0
-        for entity, body in list(self.entity_to_body.items()):
-            self._sync_entity_from_body(entity, body, alpha)
+        self.alpha = alpha
+        if substeps:
+            self._sync_bodies(alpha)
 
         self.step_time_ms = (time.perf_counter() - t0) * 1000.0
         self.last_substeps = substeps
         self.frame_contacts = self.contact_collector.begin_contacts
 
-    def apply_explosion_impulse(self, center_px, radius_px, impulse_strength):
-        center = pygame.Vector2(center_px)
-        radius_px = max(1.0, float(radius_px))
-
-        for body in self.entity_to_body.values():
-            if body.type != b2_dynamicBody:
+    def _whole_steps(self, seconds):
+        """Kokonaisten steppien osuus ajasta (sekunteina); murto-osa on alphaa."""
+        if self.fixed_dt <= 0:
+            return 0.0
+        return int((seconds + _STEP_EPSILON) / self.fixed_dt) * self.fixed_dt
+
+    # ------------------------------------------------------------------
+    # Piirron interpolointi
+    # ------------------------------------------------------------------
+    def render_alpha(self, extra_seconds=0.0):
+        """Interpolointikerroin 0..1 viimeisimmän stepin ja seuraavan välillä.
+
+        Args:
+            extra_seconds: kutsujan oma, vielä simuloimaton aika (esim. pelin
+                tick-akkumulaattori), joka lisätään maailman akkumulaattoriin.
+        """
+        if self.fixed_dt <= 0:
+            return 0.0
+        return max(0.0, min(1.0, (self.accumulator + float(extra_seconds)) / self.fixed_dt))
+
+    def render_transform(self, entity, alpha=None):
+        """Palauttaa (x, y, kulma_astetta) piirtoa varten tai None, jos entiteetillä ei ole kappaletta.
+
+        Interpoloi edellisestä stepistä entiteetin nykyiseen tilaan. Yli
+        RENDER_SNAP_PX:n hypyt (teleportit) piirretään suoraan nykyiseen.
+        """
+        prev = self._previous.get(entity)
+        if prev is None:
+            return None
+        body, flags = self._sync_records[entity]
+        if alpha is None:
+            alpha = self.alpha
+        if flags & _HAS_POS:
+            x, y = entity.pos.x, entity.pos.y
+        else:
+            x, y = entity.rect.center
+        angle = float(getattr(entity, "angle", 0.0) or 0.0) if flags & SYNC_ANGLE else prev[2]
+        dx = x - prev[0]
+        dy = y - prev[1]
+        if dx * dx + dy * dy > self.RENDER_SNAP_PX * self.RENDER_SNAP_PX:
+            return x, y, angle
+        # Lyhyempi kaari, ettei 359 -> 1 astetta pyöri koko kierrosta
+        da = (angle - prev[2] + 180.0) % 360.0 - 180.0
+        return prev[0] + dx * alpha, prev[1] + dy * alpha, prev[2] + da * alpha
+
+    def apply_render_states(self, alpha=None):
+        """Siirrä kappaleisiin sidotut entiteetit interpoloituihin sijainteihin piirron ajaksi.
+
+        Palauta oikea tila restore_render_states()-kutsulla piirron jälkeen.
+        Palauttaa siirrettyjen entiteettien määrän.
+        """
+        if alpha is None:
+            alpha = self.alpha
+        saved = self._render_saved
+        for entity, (body, flags) in self._sync_records.items():
+            x, y, angle = self.render_transform(entity, alpha)
+            pos = entity.pos if flags & _HAS_POS else None
+            rect = entity.rect if flags & _HAS_RECT else None
+            saved.append((
+                entity,
+                (pos.x, pos.y) if pos is not None else None,
+                rect.center if rect is not None else None,
+                entity.angle if flags & SYNC_ANGLE else None,
+            ))
+            if pos is not None:
+                pos.update(x, y)
+            if rect is not None:
+                rect.center = (round(x), round(y))
+            if flags & SYNC_ANGLE:
+                entity.angle = angle
+        return len(saved)
+
+    def restore_render_states(self):
+        """Palauta apply_render_states()-kutsua edeltänyt tila."""
+        for entity, saved_pos, saved_center, saved_angle in self._render_saved:
+            if saved_pos is not None:
+                entity.pos.update(saved_pos)
+            if saved_center is not None:
+                entity.rect.center = saved_center
+            if saved_angle is not None:
+                entity.angle = saved_angle
+        self._render_saved.clear()
+
+    # ------------------------------------------------------------------
+    # Tilannevedokset (uusintayritys, takaisinkelaus)
+    # ------------------------------------------------------------------
+    def snapshot(self):
+        """Tallenna kaikkien entiteettikappaleiden sijainti, kulma, nopeudet ja akkumulaattori.
+
+        Kappaleita, fixtureita ja kontakteja ei kopioida: vedos on pelkkiä
+        lukuja, ja restore() olettaa kappaleiden olevan yhä olemassa.
+        """
+        bodies = []
+        for entity, body in self.entity_to_body.items():
+            position = body.position
+            velocity = body.linearVelocity
+            bodies.append((
+                entity, position.x, position.y, body.angle,
+                velocity.x, velocity.y, body.angularVelocity, body.awake,
+            ))
+        previous = {entity: tuple(prev) for entity, prev in self._previous.items()}
+        return WorldSnapshot(tuple(bodies), previous, self.accumulator, self.alpha)
+
+    def restore(self, snapshot):
+        """Palauta snapshot()-vedos olemassa oleviin kappaleisiin ja synkkaa entiteetit.
+
+        Vedoksen jälkeen luotuihin kappaleisiin ei kosketa. Box2D:n kontaktien
+        lämpökäynnistysimpulsseja ei tallenneta, joten palautuksen jälkeinen
+        simulointi on lähellä alkuperäistä mutta ei bitilleen sama. Kertyneet
+        kontaktitapahtumat hylätään, koska ne kuvaavat hylättyä aikajanaa.
+
+        Returns:
+            list: vedoksen entiteetit, joilla ei enää ole kappaletta (kutsuja
+            luo ne uudelleen, esim. sync_group).
+        """
+        missing = []
+        restored = []
+        entity_to_body = self.entity_to_body
+        for entity, x, y, angle, vx, vy, spin, awake in snapshot.bodies:
+            body = entity_to_body.get(entity)
+            if body is None:
+                missing.append(entity)
                 continue
-
-            pos_px = pygame.Vector2(
-                self.meters_to_pixels(body.position.x),
-                self.meters_to_pixels(body.position.y),
-            )
-            delta = pos_px - center
-            dist = delta.length()
-            if dist <= 1e-5 or dist > radius_px:
+            body.transform = ((x, y), angle)
+            body.linearVelocity = (vx, vy)
+            body.angularVelocity = spin
+            body.awake = True
+            restored.append((body, awake))
+
+        self.accumulator = snapshot.accumulator
+        self.alpha = snapshot.alpha
+        self._sync_bodies(self.alpha)
+        for body, awake in restored:
+            body.awake = awake
+        previous = self._previous
+        for entity, prev in snapshot.previous.items():
+            if entity in previous:
+                previous[entity][:] = prev
+        self.contact_collector.drain()
+        return missing
+
+    def query_radius(self, center_px, radius_px, inner_radius_px=0.0, dynamic_only=False):
+        """Kappaleet, joiden keskipiste on ympyrän tai renkaan sisällä.
+
+        Laajavaihe on b2World.QueryAABB (Box2D:n oma puu), joten kustannus
+        riippuu alueen kappaleista, ei kaikkien kappaleiden määrästä.
+        Kappaleet ilman fixtureita (add_entity_body ilman maskeja) eivät löydy.
+
+        Args:
+            center_px: alueen keskipiste pikseleinä.
+            radius_px: ulkosäde pikseleinä.
+            inner_radius_px: tätä lähempänä olevat ohitetaan (rengas, esim. shokkiaalto).
+            dynamic_only: palauta vain dynaamiset kappaleet (impulssit).
+
+        Returns:
+            lista (entity, body, dx_px, dy_px, dist_px) -tupleja.
+        """
+        ppm = self.PPM
+        cx = float(center_px[0]) / ppm
+        cy = float(center_px[1]) / ppm
+        radius = max(0.0, float(radius_px)) / ppm
+        inner_sq = (float(inner_radius_px) / ppm) ** 2 if inner_radius_px > 0.0 else -1.0
+        query = _BodyQuery()
+        self.world.QueryAABB(query, b2AABB(lowerBound=(cx - radius, cy - radius),
+                                           upperBound=(cx + radius, cy + radius)))
+        outer_sq = radius * radius
+        hits = []
+        for entity, body in query.found.items():
+            if dynamic_only and body.type != b2_dynamicBody:
+                continue
+            position = body.position
+            dx = position.x - cx
+            dy = position.y - cy
+            dist_sq = dx * dx + dy * dy
+            if dist_sq > outer_sq or dist_sq < inner_sq:
                 continue
+            hits.append((entity, body, dx * ppm, dy * ppm, dist_sq ** 0.5 * ppm))
+        return hits
 
-            direction = delta.normalize()
-            falloff = max(0.0, 1.0 - (dist / radius_px))
-            impulse = direction * (float(impulse_strength) * falloff)
-            body.ApplyLinearImpulse(
-                impulse=(self.pixels_to_meters(impulse.x), self.pixels_to_meters(impulse.y)),
-                point=body.worldCenter,
-                wake=True,
-            )
+    def apply_explosion_impulse(self, center_px, radius_px, impulse_strength):
+        """Työnnä säteen sisällä olevia dynaamisia kappaleita poispäin keskipisteestä.
+
+        Voima heikkenee lineaarisesti reunaa kohti. Palauttaa työnnettyjen määrän.
+        """
+        radius_px = max(1.0, float(radius_px))
+        strength_m = self.pixels_to_meters(impulse_strength)
+        pushed = 0
+        for entity, body, dx, dy, dist in self.query_radius(center_px, radius_px, dynamic_only=True):
+            if dist <= 1e-5:
+                continue
+            scale = strength_m * (1.0 - dist / radius_px) / dist
+            body.ApplyLinearImpulse(impulse=(dx * scale, dy * scale), point=body.worldCenter, wake=True)
+            pushed += 1
+        return pushed
 
     def get_metrics(self):
         return {
             "physics_step_ms": self.step_time_ms,
             "substeps": self.last_substeps,
             "contacts": self.frame_contacts,
+            "contact_events_pending": self.contact_collector.pending(),
+            "step_policy": self.step_policy,
+            "physics_dropped_ms": self.dilation.last_dropped * 1000.0,
+            "physics_dropped_total_ms": self.dilation.total_dropped * 1000.0,
+            "physics_time_dilation": self.dilation.dilation,
+            "physics_debt_ms": self.accumulator * 1000.0,
             "profile": self.profile.name,
             "fixed_dt": self.fixed_dt,
         }
@@ -224,28 +815,69 @@ class Box2DPhysicsWorld:
             return float(rect.centerx), float(rect.centery)
         return 0.0, 0.0
 
-    def _sync_entity_from_body(self, entity, body, alpha):
+    def _sync_bodies(self, alpha):
+        """Kopioi hereillä olevien kappaleiden tila entiteetteihin paikallaan.
+
+        Ennen kopiointia entiteetin nykyinen sijainti ja kulma talletetaan
+        "edelliseksi" piirron interpolointia varten. Nukkuvat kappaleet eivät
+        liiku, joten ne ohitetaan (ja niiden edellinen = nykyinen). Jos
+        entiteetin attribuutti on vaihtunut rekisteröinnin jälkeen (esim. pos
+        ei enää Vector2), käytetään hidasta _sync_entity_from_body-polkua.
+        """
+        ppm = self.PPM
+        previous = self._previous
+        for entity, (body, flags) in self._sync_records.items():
+            prev = previous[entity]
+            if flags & _HAS_POS:
+                pos = entity.pos
+                prev[0] = pos.x
+                prev[1] = pos.y
+            elif flags & _HAS_RECT:
+                prev[0], prev[1] = entity.rect.center
+            if flags & SYNC_ANGLE:
+                prev[2] = entity.angle
+            if not body.awake:
+                continue
+            try:
+                position = body.position
+                x_px = position.x * ppm
+                y_px = position.y * ppm
+                if flags & _HAS_POS:
+                    entity.pos.update(x_px, y_px)
+                if flags & SYNC_VELOCITY:
+                    velocity = body.linearVelocity
+                    entity.vel.update(velocity.x * ppm, velocity.y * ppm)
+                if flags & _HAS_RECT:
+                    entity.rect.center = (int(x_px), int(y_px))
+                if flags & SYNC_ANGLE:
+                    entity.angle = -body.angle * _RAD_TO_DEG
+            except Exception:
+                self._sync_entity_from_body(entity, body, alpha, flags)
+
+    def _sync_entity_from_body(self, entity, body, alpha, flags=SYNC_ALL):
         x_px = self.meters_to_pixels(body.position.x)
         y_px = self.meters_to_pixels(body.position.y)
-        vx_px = self.meters_to_pixels(body.linearVelocity.x)
-        vy_px = self.meters_to_pixels(body.linearVelocity.y)
 
         try:
             entity.pos = pygame.Vector2(x_px, y_px)
         except Exception:
             pass
 
-        try:
-            entity.vel = pygame.Vector2(vx_px, vy_px)
-        except Exception:
-            pass
+        if flags & SYNC_VELOCITY:
+            vx_px = self.meters_to_pixels(body.linearVelocity.x)
+            vy_px = self.meters_to_pixels(body.linearVelocity.y)
+            try:
+                entity.vel = pygame.Vector2(vx_px, vy_px)
+            except Exception:
+                pass
 
         try:
             entity.rect.center = (int(x_px), int(y_px))
         except Exception:
             pass
 
-        try:
-            entity.angle = -float(body.angle) * 57.29577951308232
-        except Exception:
-            pass
+        if flags & SYNC_ANGLE:
+            try:
+                entity.angle = -float(body.angle) * 57.29577951308232
+            except Exception:
+                pass
@@ -31,6 +31,9 @@ class RigidBody:
         is_dynamic (bool): Voiko tähän kappaleeseen vaikuttaa voimat?
     """
     
+    # Physics.snapshot: forces kertyy vain tickin sisällä, palautus tyhjentää sen
+    SNAPSHOT_CLEAR = ("forces",)
+    
     def __init__(self, x=0, y=0, mass=1.0):
         """
         Alustaa fysiikkaolion.
@@ -79,7 +82,9 @@ class RigidBody:
         Parametrit:
             dt (float): Aikaväli sekunneissa
         """
-        self.acc = pygame.Vector2(0, 0)
+        self.acc.update(0, 0)
+        if not self.forces:
+            return
         
         for force in self.forces:
             try:
@@ -90,7 +95,7 @@ class RigidBody:
                 # Silently skip invalid forces
                 pass
         
-        self.forces = []  # Clear for next frame
+        self.forces.clear()  # Clear for next frame
     
     def apply_velocity_constraints(self):
         """
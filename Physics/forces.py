@@ -7,10 +7,22 @@ Tarjoaa yleisimmät voimatyypit:
 - Ilmanvastus/Kitka (Drag): Nopeudesta riippuva vastus
 - Magnetismi (Magnetism): Suunnattu vetovoima (tekoälylle)
 - Työntövoima (Thrust): Suunnattu kiihtyvyys (pelaajan liikkumiseen)
+- Jousi (Spring): Palauttava voima ankkuria kohti
+- Säteittäinen magneetti (RadialMagnet): Vihollisten magneetti pelaajaa kohti
+
+Jokaisella voimalla on kaksi polkua: get_force(body, dt) yhdelle kappaleelle
+ja apply(positions, velocities, masses, out_acc) koko joukolle NumPy-
+taulukoina (ks. RigidBodyArray). ForceFieldRegistry kokoaa voimakentät, jotka
+vaikuttavat samoihin kappaleisiin, ja laskee ne kaikki kerralla.
 """
 import pygame
 import math
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
 
 class Force:
     """
@@ -31,6 +43,50 @@ class Force:
         """
         return pygame.Vector2(0, 0)
 
+    def forces(self, positions, velocities):
+        """
+        Laske voima kaikille kappaleille kerralla.
+        Ylikirjoita aliluokassa; oletus kutsuu get_force()-metodia rivi kerrallaan.
+        Args:
+            positions (np.ndarray): (n, 2) sijainnit
+            velocities (np.ndarray): (n, 2) nopeudet
+        Returns:
+            np.ndarray: (n, 2) voimat (tai skalaaria/riviä, joka levitetään kaikille)
+        """
+        if np is None:
+            raise RuntimeError("NumPy is required for Force.forces")
+        out = np.zeros((len(positions), 2))
+        body = _RowBody()
+        for i in range(len(positions)):
+            body.pos.update(positions[i, 0], positions[i, 1])
+            body.vel.update(velocities[i, 0], velocities[i, 1])
+            f = self.get_force(body, 0.0)
+            if f is not None:
+                out[i] = (f.x, f.y)
+        return out
+
+    def apply(self, positions, velocities, masses, out_acc):
+        """
+        Lisää voiman aiheuttama kiihtyvyys F / m taulukkoon out_acc paikallaan.
+        Args:
+            positions (np.ndarray): (n, 2) sijainnit
+            velocities (np.ndarray): (n, 2) nopeudet
+            masses (np.ndarray): (n,) massat
+            out_acc (np.ndarray): (n, 2) kiihtyvyydet, joihin lisätään
+        """
+        if np is None:
+            raise RuntimeError("NumPy is required for Force.apply")
+        out_acc += self.forces(positions, velocities) / masses[:, None]
+        return out_acc
+
+
+class _RowBody:
+    """Kevyt kappale Force.forces()-oletuspolulle (get_force tarvitsee pos/vel)."""
+
+    def __init__(self):
+        self.pos = pygame.Vector2()
+        self.vel = pygame.Vector2()
+
 
 class Gravity(Force):
     """
@@ -68,6 +124,15 @@ class Gravity(Force):
         except ValueError:
             return pygame.Vector2(0, 0)
 
+    def forces(self, positions, velocities):
+        direction = (self.center.x, self.center.y) - positions
+        length = np.hypot(direction[:, 0], direction[:, 1])
+        distance = np.maximum(1.0, length)
+        # Sama kuin normalize() * strength / distance^2; nollapituus -> nollavoima
+        scale = np.divide(self.strength / (distance * distance), length,
+                          out=np.zeros_like(length), where=length > 0.0)
+        return direction * scale[:, None]
+
 
 class Drag(Force):
     """
@@ -95,6 +160,9 @@ class Drag(Force):
         """
         return -body.vel * self.coefficient
 
+    def forces(self, positions, velocities):
+        return velocities * -self.coefficient
+
 
 class Magnetism(Force):
     """
@@ -143,6 +211,16 @@ class Magnetism(Force):
         except ValueError:
             return pygame.Vector2(0, 0)
 
+    def forces(self, positions, velocities):
+        if self.target is None:
+            return np.zeros((len(positions), 2))
+        target = self.target.pos
+        direction = (target.x, target.y) - positions
+        distance = np.hypot(direction[:, 0], direction[:, 1])
+        # normalize() * strength * distance / 500 = direction * strength / 500
+        active = (distance >= self.min_distance) & (distance > 0.0)
+        return direction * np.where(active, self.strength / 500.0, 0.0)[:, None]
+
 
 class Thrust(Force):
     """
@@ -177,6 +255,9 @@ class Thrust(Force):
         """
         return self.direction * self.magnitude
 
+    def forces(self, positions, velocities):
+        return np.array((self.direction.x * self.magnitude, self.direction.y * self.magnitude))
+
 
 class Spring(Force):
     """
@@ -214,4 +295,113 @@ class Spring(Force):
         displacement = self.anchor - body.pos
         spring_force = displacement * self.stiffness
         damping_force = body.vel * (-self.damping)
-        return spring_force + damping_force
\ No newline at end of file
+        return spring_force + damping_force
+
+    def forces(self, positions, velocities):
+        return ((self.anchor.x, self.anchor.y) - positions) * self.stiffness - velocities * self.damping
+
+
+class RadialMagnet(Force):
+    """
+    Vihollisten magneetti kohdetta (pelaajaa) kohti, sama laki kuin
+    StraightEnemyn ohjauksessa: säteen sisällä veto heikkenee lineaarisesti
+    reunaa kohti, ja min_distancea lähempänä kappale työnnetään pois.
+    Kohdepiste on target.rect.center (tai target.pos, jos rectiä ei ole).
+    Attributes:
+        target: Kohde-entiteetti, None = ei voimaa
+        radius (float): Vaikutussäde pikseleinä
+        strength (float): Veto kohteen kohdalla
+        min_distance (float): Tätä lähempänä työntö max(2 * strength, 160)
+    """
+
+    def __init__(self, target=None, radius=1000.0, strength=400.0, min_distance=48.0):
+        self.target = target
+        self.radius = float(radius)
+        self.strength = float(strength)
+        self.min_distance = float(min_distance)
+
+    def _target_point(self):
+        rect = getattr(self.target, "rect", None)
+        if rect is not None:
+            return rect.center
+        return (self.target.pos.x, self.target.pos.y)
+
+    def get_force(self, body, dt):
+        """
+        Laske veto kohti kohdetta ja läheltä työntö poispäin.
+        Returns:
+            pygame.Vector2: Voima kohdetta kohti (negatiivinen = poispäin)
+        """
+        if self.target is None:
+            return pygame.Vector2(0, 0)
+        direction = pygame.Vector2(self._target_point()) - body.pos
+        distance = direction.length()
+        if distance <= 0.0:
+            return pygame.Vector2(0, 0)
+        magnitude = 0.0
+        if distance < self.radius:
+            magnitude += self.strength * max(0.0, 1.0 - distance / self.radius)
+        if distance < self.min_distance:
+            magnitude -= max(self.strength * 2.0, 160.0)
+        return direction / distance * magnitude
+
+    def forces(self, positions, velocities):
+        if self.target is None:
+            return np.zeros((len(positions), 2))
+        direction = self._target_point() - positions
+        distance = np.hypot(direction[:, 0], direction[:, 1])
+        magnitude = np.where(distance < self.radius, self.strength * np.maximum(0.0, 1.0 - distance / self.radius), 0.0)
+        magnitude -= np.where(distance < self.min_distance, max(self.strength * 2.0, 160.0), 0.0)
+        scale = np.divide(magnitude, distance, out=np.zeros_like(distance), where=distance > 0.0)
+        return direction * scale[:, None]
+
+
+class ForceFieldRegistry:
+    """
+    Joukko voimakenttiä, jotka vaikuttavat samoihin kappaleisiin.
+
+    Esim. Game.force_fields: pelaajan magneetti (RadialMagnet) kaikille
+    eräajetuille vihollisille. Jokainen kenttä on yksi taulukko-operaatio,
+    ei N get_force()-kutsua.
+    """
+
+    def __init__(self, fields=()):
+        self.fields = list(fields)
+
+    def __len__(self):
+        return len(self.fields)
+
+    def add(self, field):
+        """Lisää kenttä (Force-olio) ja palauta se."""
+        self.fields.append(field)
+        return field
+
+    def remove(self, field):
+        """Poista kenttä. Palauttaa False, jos sitä ei ollut."""
+        try:
+            self.fields.remove(field)
+        except ValueError:
+            return False
+        return True
+
+    def clear(self):
+        self.fields.clear()
+
+    def apply(self, positions, velocities, masses, out_acc):
+        """
+        Lisää kaikkien kenttien kiihtyvyydet out_acc-taulukkoon paikallaan.
+        Args:
+            positions (np.ndarray): (n, 2) sijainnit
+            velocities (np.ndarray): (n, 2) nopeudet
+            masses (np.ndarray): (n,) massat
+            out_acc (np.ndarray): (n, 2) kiihtyvyydet, joihin lisätään
+        """
+        if not self.fields or not len(positions):
+            return out_acc
+        if np is None:
+            raise RuntimeError("NumPy is required for ForceFieldRegistry")
+        total = np.zeros((len(positions), 2))
+        for field in self.fields:
+            total += field.forces(positions, velocities)
+        out_acc += total / masses[:, None]
+        return out_acc
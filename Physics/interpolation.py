@@ -0,0 +1,107 @@
+"""
+Physics/interpolation.py - Renderöinnin interpolointi kiinteän aika-askeleen välillä
+
+Pelilogiikka etenee kiinteillä tickeillä, mutta ruutuja piirretään omalla
+tahdillaan. RenderInterpolator tallentaa entiteettien sijainnit ennen
+jokaista tickiä ja siirtää ne piirron ajaksi edellisen ja nykyisen tilan
+väliin (alpha = jäljelle jäänyt aika / tick), minkä jälkeen oikeat sijainnit
+palautetaan. Pelilogiikka ei siis koskaan näe interpoloituja arvoja.
+"""
+
+
+class RenderInterpolator:
+    """
+    Tallentaa edelliset sijainnit ja interpoloi ne piirron ajaksi.
+
+    Tukee sekä `rect.center`-pohjaisia (viholliset, ammukset, pelaaja) että
+    `pos`-pohjaisia (meteorit, pommit) entiteettejä: molemmat siirretään,
+    koska piirtokoodi käyttää luokasta riippuen jompaakumpaa.
+
+    Attribuutit:
+        snap_distance (float): Jos entiteetti liikkui yhden tickin aikana tätä
+            pidemmälle (teleporttaus, respawn), sitä ei interpoloida.
+    """
+
+    def __init__(self, snap_distance=160.0):
+        self.snap_distance_sq = float(snap_distance) * float(snap_distance)
+        self._previous = {}
+        self._applied = []
+
+    def capture(self, *groups):
+        """
+        Tallenna entiteettien nykyiset sijainnit "edellisiksi" (kutsu ennen tickiä).
+
+        Args:
+            *groups: iteroitavia entiteettijoukkoja (listat, sprite-ryhmät)
+        """
+        previous = {}
+        for group in groups:
+            for entity in group:
+                rect = getattr(entity, 'rect', None)
+                pos = getattr(entity, 'pos', None)
+                previous[id(entity)] = (
+                    rect.center if rect is not None else None,
+                    (pos.x, pos.y) if pos is not None else None,
+                )
+        self._previous = previous
+
+    def clear(self):
+        """Unohda tallennetut sijainnit (esim. tason vaihdon jälkeen)."""
+        self._previous = {}
+
+    def apply(self, alpha, *groups, skip=None):
+        """
+        Siirrä entiteetit interpoloituihin sijainteihin piirtoa varten.
+
+        Args:
+            alpha (float): 0..1, kuinka pitkällä seuraavaan tickiin ollaan
+            *groups: samat joukot kuin capture()-kutsussa
+            skip: entiteetit (esim. dict/set), jotka interpoloidaan muualla
+                (Box2D-maailman kappaleet, ks. Box2DPhysicsWorld.apply_render_states)
+
+        Returns:
+            int: interpoloitujen entiteettien määrä
+        """
+        alpha = max(0.0, min(1.0, float(alpha)))
+        applied = self._applied
+        previous = self._previous
+        for group in groups:
+            for entity in group:
+                prev = previous.get(id(entity))
+                if prev is None or (skip is not None and entity in skip):
+                    continue
+                prev_center, prev_pos = prev
+                rect = getattr(entity, 'rect', None)
+                pos = getattr(entity, 'pos', None)
+                saved_center = rect.center if rect is not None else None
+                saved_pos = (pos.x, pos.y) if pos is not None else None
+
+                moved = False
+                if rect is not None and prev_center is not None:
+                    dx = saved_center[0] - prev_center[0]
+                    dy = saved_center[1] - prev_center[1]
+                    if dx * dx + dy * dy <= self.snap_distance_sq:
+                        rect.center = (
+                            round(prev_center[0] + dx * alpha),
+                            round(prev_center[1] + dy * alpha),
+                        )
+                        moved = True
+                if pos is not None and prev_pos is not None:
+                    dx = saved_pos[0] - prev_pos[0]
+                    dy = saved_pos[1] - prev_pos[1]
+                    if dx * dx + dy * dy <= self.snap_distance_sq:
+                        pos.x = prev_pos[0] + dx * alpha
+                        pos.y = prev_pos[1] + dy * alpha
+                        moved = True
+                if moved:
+                    applied.append((entity, saved_center, saved_pos))
+        return len(applied)
+
+    def restore(self):
+        """Palauta apply()-kutsua edeltäneet todelliset sijainnit."""
+        for entity, saved_center, saved_pos in self._applied:
+            if saved_center is not None:
+                entity.rect.center = saved_center
+            if saved_pos is not None:
+                entity.pos.x, entity.pos.y = saved_pos
+        self._applied.clear()
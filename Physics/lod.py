@@ -0,0 +1,226 @@
+"""
+Physics/lod.py - LODScheduler: kaukaisten entiteettien harvennettu päivitys
+
+Jokainen vihollinen, meteori, pommi ja vihollisammus päivitettiin joka tickillä
+täydellä taajuudella, vaikka se olisi kaukana kamerasta. LODScheduler jakaa
+entiteetit tasoihin (tier) jokaisella tickillä:
+
+    LOD_FULL     näkymän (+ marginaali) sisällä: joka tick
+    LOD_HALF     näkymän ulkopuolella, alle far_distance pelaajasta: joka 2. tick
+    LOD_QUARTER  yli far_distance pelaajasta: joka 4. tick
+
+Väliin jäävien tickien aika kertyy entiteetille, ja seuraava päivitys saa koko
+kertymän kerralla (update(owed_ms)), joten ajastimet, animaatiot ja liike etenevät
+pitkällä aikavälillä samaa tahtia kuin täydellä taajuudella. Näkyvät entiteetit
+ovat aina LOD_FULL, joten harvennus ei näy ruudulla nykimisenä.
+
+Tekoälyn ohjaus harvenee lisäksi pelkän etäisyyden mukaan, myös näkymän sisällä:
+steer_due() kertoo, laskeeko vihollinen suuntansa tällä tickillä uudelleen
+(yli steer_distance joka 2., yli far_distance joka 4. tick). Muina tickeinä
+vihollinen liikkuu joka tick, mutta edellisen ohjauspäätöksen mukaan
+(ChaseEnemyn suunta, StraightEnemyn seinien väistö ja magneetti).
+
+Pelissä oletuksena harvennetaan vain näkymän ulkopuolisia meteoreja ja
+vihollisammuksia (RG_OFFSCREEN_LOD); vihollisten ja pommien tasot sekä
+ohjauksen harvennus muuttavat pelattavuutta ja ovat päällä vain, kun
+RG_PHYSICS_LOD=1.
+
+Entiteetit saavat ensimmäisellä kerralla vaiheen (phase), jolla saman tason
+päivitykset jakautuvat eri tickeille eivätkä osu kaikki samaan.
+"""
+
+import pygame
+
+LOD_FULL = 0
+LOD_HALF = 1
+LOD_QUARTER = 2
+LOD_TIER_NAMES = ("full", "half", "quarter")
+
+
+class LODScheduler:
+    """
+    Päättää tickeittäin, mitkä entiteetit päivitetään ja kuinka pitkällä dt:llä.
+
+    Käyttö tickin aikana:
+
+        lod.begin_tick(view_rect, player.rect.center)
+        for e in enemies:
+            step_ms = lod.due(e, tick_ms)
+            if step_ms is None:
+                continue            # ei tällä tickillä, aika kertyy
+            e.update(step_ms, ...)
+
+    Parametrit:
+        far_distance (float): etäisyys (px) pelaajasta, jonka yli LOD_QUARTER
+        steer_distance (float): etäisyys (px), jonka yli ohjaus lasketaan harvemmin
+        view_margin (int): näkymän laajennus (px) joka suuntaan LOD_FULL-alueelle
+        intervals (tuple): päivitysväli tickeinä tasoille (full, half, quarter)
+
+    Attribuutit:
+        counts (list): tämän tickin entiteetit tasoittain
+        skipped (int): tämän tickin ohitetut päivitykset
+        steer_skipped (int): tämän tickin ohitetut ohjauspäätökset
+        last_counts, last_skipped: edellisen tickin luvut (overlay, metriikat)
+    """
+
+    STALE_TICKS = 30
+
+    def __init__(self, far_distance=1400.0, view_margin=240, intervals=(1, 2, 4), steer_distance=500.0):
+        if len(intervals) != len(LOD_TIER_NAMES) or min(intervals) < 1:
+            raise ValueError("intervals must give a tick interval >= 1 for each LOD tier")
+        self.far_distance = float(far_distance)
+        self.steer_distance = float(steer_distance)
+        self.view_margin = int(view_margin)
+        self.intervals = tuple(int(i) for i in intervals)
+        self.tick = 0
+        self.counts = [0] * len(LOD_TIER_NAMES)
+        self.skipped = 0
+        self.last_counts = tuple(self.counts)
+        self.last_skipped = 0
+        self.steer_skipped = 0
+        self.last_steer_skipped = 0
+        self._view = pygame.Rect(0, 0, 0, 0)
+        self._fx = 0.0
+        self._fy = 0.0
+        self._far_sq = self.far_distance * self.far_distance
+        self._steer_sq = self.steer_distance * self.steer_distance
+        self._state = {}
+        self._next_phase = 0
+
+    def reset(self):
+        """Unohda kertymät ja laskurit (tason vaihto, uudelleenkäynnistys)."""
+        self.tick = 0
+        self.counts = [0] * len(LOD_TIER_NAMES)
+        self.skipped = 0
+        self.last_counts = tuple(self.counts)
+        self.last_skipped = 0
+        self.steer_skipped = 0
+        self.last_steer_skipped = 0
+        self._state.clear()
+        self._next_phase = 0
+
+    def begin_tick(self, view_rect, focus):
+        """
+        Aloita uusi tick: aseta näkymä ja pelaajan sijainti, nollaa laskurit.
+
+        Parametrit:
+            view_rect (pygame.Rect): kameran näkymä maailman koordinaateissa
+            focus (tuple): piste, josta etäisyys mitataan (pelaajan keskipiste)
+        """
+        self.last_counts = tuple(self.counts)
+        self.last_skipped = self.skipped
+        self.last_steer_skipped = self.steer_skipped
+        self.counts = [0] * len(LOD_TIER_NAMES)
+        self.skipped = 0
+        self.steer_skipped = 0
+        self.tick += 1
+        self._view = pygame.Rect(view_rect).inflate(self.view_margin * 2, self.view_margin * 2)
+        self._fx = float(focus[0])
+        self._fy = float(focus[1])
+        self._far_sq = self.far_distance * self.far_distance
+        self._steer_sq = self.steer_distance * self.steer_distance
+        if self.tick % self.STALE_TICKS == 0:
+            self._prune()
+
+    def _prune(self):
+        # Kuolleet entiteetit eivät enää kysy due():ta; pudota niiden kertymät.
+        oldest = self.tick - self.STALE_TICKS
+        stale = [entity for entity, state in self._state.items() if state[2] < oldest]
+        for entity in stale:
+            del self._state[entity]
+
+    def tier_of(self, entity):
+        """Palauttaa entiteetin LOD-tason nykyisellä näkymällä."""
+        rect = getattr(entity, 'rect', None)
+        if rect is not None:
+            if self._view.colliderect(rect):
+                return LOD_FULL
+            x, y = rect.center
+        else:
+            pos = entity.pos
+            x, y = pos.x, pos.y
+            if self._view.collidepoint(x, y):
+                return LOD_FULL
+        dx = x - self._fx
+        dy = y - self._fy
+        return LOD_HALF if dx * dx + dy * dy <= self._far_sq else LOD_QUARTER
+
+    def steer_due(self, entity, pinned=False):
+        """
+        Laskeeko entiteetti tekoälyn ohjauksen tällä tickillä uudelleen.
+
+        Väli riippuu vain etäisyydestä pelaajaan: alle steer_distance joka
+        tick, alle far_distance intervals[LOD_HALF], muuten intervals[LOD_QUARTER].
+
+        Palauttaa:
+            bool: True = laske ohjaus, False = käytä edellistä päätöstä
+        """
+        if pinned:
+            return True
+        x, y = entity.rect.center
+        dx = x - self._fx
+        dy = y - self._fy
+        dist_sq = dx * dx + dy * dy
+        if dist_sq <= self._steer_sq:
+            return True
+        interval = self.intervals[LOD_HALF if dist_sq <= self._far_sq else LOD_QUARTER]
+        state = self._state.get(entity)
+        phase = state[1] if state is not None else 0
+        if interval > 1 and (self.tick + phase) % interval:
+            self.steer_skipped += 1
+            return False
+        return True
+
+    def due(self, entity, dt_ms, pinned=False):
+        """
+        Kirjaa tickin aika entiteetille ja kerro, päivitetäänkö se nyt.
+
+        Parametrit:
+            entity: entiteetti, jolla on rect tai pos
+            dt_ms (float): tickin pituus millisekunteina
+            pinned (bool): True = aina LOD_FULL (pomot, räjähtävät pommit)
+
+        Palauttaa:
+            float | None: päivityksen dt millisekunteina (kertymä mukaan lukien)
+            tai None, jos entiteetti ohitetaan tällä tickillä
+        """
+        tier = LOD_FULL if pinned else self.tier_of(entity)
+        self.counts[tier] += 1
+        state = self._state.get(entity)
+        if state is None:
+            state = [0.0, self._next_phase, self.tick]
+            self._next_phase += 1
+            self._state[entity] = state
+        tick = self.tick
+        state[2] = tick
+        interval = self.intervals[tier]
+        if interval > 1 and (tick + state[1]) % interval:
+            state[0] += dt_ms
+            self.skipped += 1
+            return None
+        owed = state[0] + dt_ms
+        state[0] = 0.0
+        return owed
+
+    def get_state(self):
+        """Kertymät ja vaiheet tilannevedokseen (ks. set_state)."""
+        return self.tick, self._next_phase, {entity: tuple(state) for entity, state in self._state.items()}
+
+    def set_state(self, state):
+        """Palauta get_state()-tila (takaisinkelaus toistaa samat päivitysvälit)."""
+        self.tick, self._next_phase, entries = state
+        self._state = {entity: list(values) for entity, values in entries.items()}
+
+    def forget(self, entity):
+        """Poista entiteetin kertymä (esim. kun se poistetaan pelistä)."""
+        self._state.pop(entity, None)
+
+    def get_metrics(self):
+        """Palauttaa edellisen kokonaisen tickin tasomäärät ja ohitukset."""
+        metrics = {f"lod_{name}": count for name, count in zip(LOD_TIER_NAMES, self.last_counts)}
+        metrics["lod_skipped"] = self.last_skipped
+        metrics["lod_steer_skipped"] = self.last_steer_skipped
+        return metrics
+
+
+__all__ = ["LODScheduler", "LOD_FULL", "LOD_HALF", "LOD_QUARTER", "LOD_TIER_NAMES"]
@@ -0,0 +1,245 @@
+"""
+Physics/snapshot.py - Entiteettien tilannevedokset (snapshot) ja rengaspuskuri
+
+capture_state(obj) kopioi olion litteän tilan: luvut, merkkijonot, totuusarvot,
+None sekä pygame.Vector2- ja pygame.Rect-arvot (kopioina). pygame.Surface-kuvat
+tallennetaan viittauksina (animaatio vaihtaa image-attribuutin kehyksestä
+toiseen, kuvia ei muokata paikallaan). Listat, sanakirjat ja viittaukset muihin
+olioihin jätetään pois, joten vedos on pieni:
+avainjoukko jaetaan saman muotoisten olioiden kesken ja arvot ovat yksi tuple
+per olio. Ajastimet (bounce_timer, _change_timer, hit_player_cooldown, pommin
+timer, meteorin angle...) ovat tavallisia lukuattribuutteja ja tulevat mukaan
+ilman luokkakohtaisia listoja.
+
+Luokka voi laajentaa vedosta luokka-attribuuteilla:
+
+    SNAPSHOT_COPY = ("oscillator",)    # tallennetaan copy.copy()-kopiona
+    SNAPSHOT_REFS = ("parent_enemy",)  # tallennetaan viittauksena sellaisenaan
+    SNAPSHOT_CLEAR = ("forces",)       # tyhjennetään palautuksessa (ruutukohtaiset kertymät)
+
+restore_state() kirjoittaa arvot takaisin. Vector2 ja Rect päivitetään paikallaan,
+jotta muualla säilytetyt viittaukset (Box2DPhysicsWorldin synkkaus) pysyvät
+voimassa. Vedoksen jälkeen laiskasti luodut vedoskelpoiset attribuutit (esim.
+Enemy.shoot_timer) poistetaan, jotta hasattr()-tarkistukset toimivat kuten
+vedoshetkellä; fields-rajatun vedoksen palautus ohittaa tämän (prune=False).
+
+capture_random() pakkaa random-moduulin tilan (625 Mersenne Twister -sanaa)
+tavuiksi: tuple Python-kokonaislukuja veisi ~24 KB, pakattuna ~2.5 KB.
+
+SnapshotRing on kiinteän kokoinen rengaspuskuri: kun se on täynnä, vanhin vedos
+putoaa pois, joten muistia kuluu enintään capacity vedoksen verran.
+"""
+
+import copy
+import random
+import sys
+from array import array
+from collections import deque
+
+import pygame
+
+_SCALARS = (int, float, bool, str, type(None))
+_Vector2 = pygame.math.Vector2
+# Sama avainjoukko jaetaan kaikkien saman muotoisten olioiden vedoksille.
+_KEY_CACHE = {}
+
+
+def capture_state(obj, fields=None):
+    """
+    Kopioi olion tila vedokseksi.
+
+    Parametrit:
+        obj: olio, jonka __dict__ luetaan
+        fields: valinnainen nimilista; oletuksena kaikki kelvolliset attribuutit
+
+    Palauttaa:
+        tuple: (avaimet, arvot), käytetään restore_state()-kutsussa
+    """
+    cls = type(obj)
+    copy_fields = getattr(cls, "SNAPSHOT_COPY", ())
+    ref_fields = getattr(cls, "SNAPSHOT_REFS", ())
+    attrs = obj.__dict__
+    items = attrs.items() if fields is None else ((name, attrs[name]) for name in fields if name in attrs)
+    names = []
+    values = []
+    for name, value in items:
+        if not _capturable(name, value, copy_fields, ref_fields):
+            continue
+        if isinstance(value, _Vector2):
+            value = _Vector2(value)
+        elif isinstance(value, pygame.Rect):
+            value = pygame.Rect(value)
+        elif name in copy_fields:
+            value = copy.copy(value)
+        names.append(name)
+        values.append(value)
+    keys = tuple(names)
+    return _KEY_CACHE.setdefault(keys, keys), tuple(values)
+
+
+def _capturable(name, value, copy_fields, ref_fields):
+    return (
+        isinstance(value, (_SCALARS, _Vector2, pygame.Rect, pygame.Surface))
+        or name in ref_fields
+        or name in copy_fields
+    )
+
+
+def restore_state(obj, state, prune=True):
+    """
+    Palauta capture_state()-vedos olioon. Sama vedos voidaan palauttaa monta kertaa.
+
+    Parametrit:
+        obj: olio, josta vedos otettiin
+        state: capture_state()-vedos
+        prune (bool): poista vedoksen jälkeen lisätyt vedoskelpoiset attribuutit;
+            False, kun vedos otettiin fields-listalla
+    """
+    keys, values = state
+    cls = type(obj)
+    copy_fields = getattr(cls, "SNAPSHOT_COPY", ())
+    attrs = obj.__dict__
+    if prune:
+        ref_fields = getattr(cls, "SNAPSHOT_REFS", ())
+        captured = set(keys)
+        stale = [
+            name for name, value in attrs.items()
+            if name not in captured and _capturable(name, value, copy_fields, ref_fields)
+        ]
+        for name in stale:
+            del attrs[name]
+    # Hylätyn aikajanan kertymät (esim. RigidBody.forces) eivät saa siirtyä palautettuun tilaan
+    for name in getattr(cls, "SNAPSHOT_CLEAR", ()):
+        pending = attrs.get(name)
+        if pending:
+            pending.clear()
+    for name, value in zip(keys, values):
+        if isinstance(value, _Vector2):
+            current = attrs.get(name)
+            if isinstance(current, _Vector2):
+                current.update(value)
+                continue
+            value = _Vector2(value)
+        elif isinstance(value, pygame.Rect):
+            current = attrs.get(name)
+            if isinstance(current, pygame.Rect):
+                current.update(value)
+                continue
+            value = pygame.Rect(value)
+        elif name in copy_fields and value is not None:
+            value = copy.copy(value)
+        setattr(obj, name, value)
+
+
+def capture_group(entities):
+    """Vedos entiteettilistasta: järjestys ja jokaisen entiteetin tila."""
+    return tuple((entity, capture_state(entity)) for entity in entities)
+
+
+def restore_group(target, group):
+    """
+    Palauta capture_group()-vedos: target-listan (tai pygame.sprite.Groupin)
+    sisältö korvataan paikallaan (muut viittaukset siihen pysyvät voimassa) ja
+    jokaisen entiteetin tila palautetaan.
+    """
+    if isinstance(target, pygame.sprite.AbstractGroup):
+        target.empty()
+        target.add(*[entity for entity, _ in group])
+    else:
+        target[:] = [entity for entity, _ in group]
+    for entity, state in group:
+        restore_state(entity, state)
+
+
+def capture_random():
+    """random-moduulin tila pakattuna (ks. restore_random)."""
+    version, internal, gauss_next = random.getstate()
+    return version, array("I", internal).tobytes(), gauss_next
+
+
+def restore_random(state):
+    """Palauta capture_random()-tila random-moduuliin."""
+    version, words, gauss_next = state
+    random.setstate((version, tuple(array("I", words)), gauss_next))
+
+
+def estimate_nbytes(snapshot):
+    """
+    Arvioi vedoksen muistinkäyttö tavuina (tuplet, listat, sanakirjat ja arvot).
+
+    Entiteetit itse eivät kuulu vedokseen (vain viittaukset), joten niitä ei lasketa.
+    Jaetut avaintuplet lasketaan kerran.
+    """
+    seen = set()
+    total = 0
+    stack = [snapshot]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        if isinstance(item, (tuple, list)):
+            total += sys.getsizeof(item)
+            stack.extend(item)
+        elif isinstance(item, dict):
+            total += sys.getsizeof(item)
+            stack.extend(item.values())
+        elif isinstance(item, _SCALARS) or isinstance(item, (bytes, _Vector2, pygame.Rect)):
+            total += sys.getsizeof(item)
+        elif hasattr(item, "__dataclass_fields__"):
+            stack.extend(getattr(item, name) for name in item.__dataclass_fields__)
+    return total
+
+
+class SnapshotRing:
+    """
+    Kiinteän kokoinen vedospuskuri takaisinkelaukseen (rollback).
+
+    Parametrit:
+        capacity (int): vedosten enimmäismäärä; vanhin putoaa pois
+    """
+
+    def __init__(self, capacity=8):
+        self.capacity = max(1, int(capacity))
+        self._items = deque(maxlen=self.capacity)
+
+    def __len__(self):
+        return len(self._items)
+
+    def clear(self):
+        self._items.clear()
+
+    def push(self, snapshot):
+        self._items.append(snapshot)
+
+    def latest(self):
+        """Uusin vedos tai None."""
+        return self._items[-1] if self._items else None
+
+    def rewind(self, steps=0):
+        """
+        Palauttaa vedoksen ``steps`` askelta uusimmasta taaksepäin (0 = uusin)
+        ja hylkää sitä uudemmat. None, jos puskurissa ei ole niin monta.
+        """
+        steps = int(steps)
+        if steps < 0 or steps >= len(self._items):
+            return None
+        for _ in range(steps):
+            self._items.pop()
+        return self._items[-1]
+
+    def nbytes(self):
+        """Kaikkien vedosten arvioitu koko tavuina (ks. estimate_nbytes)."""
+        return sum(estimate_nbytes(snapshot) for snapshot in self._items)
+
+
+__all__ = [
+    "SnapshotRing",
+    "capture_group",
+    "capture_random",
+    "capture_state",
+    "estimate_nbytes",
+    "restore_group",
+    "restore_random",
+    "restore_state",
+]
@@ -35,6 +35,7 @@ from Enemies import enemy
 import pygame
 import random
 from Enemies.EnemyAI import StraightEnemy, CircleEnemy, DownEnemy, UpEnemy, ZigZagEnemy, ChaseEnemy, UltimateEnemy
+from Enemies.EnemyAI import MAGNET_MIN_DISTANCE, MAGNET_RADIUS, MAGNET_STRENGTH
 from Enemies.boss_enemy import BossEnemy
 from points import Points
 sys.path.append(os.path.dirname(__file__))
@@ -44,9 +45,22 @@ from Valikot.gameOver import GameOverScreen
 from leaderboard import Leaderboard, DEFAULT_LEADERBOARD_FILE
 from SpriteSettings import SpriteSettings
 from explosion import ExplosionManager
-from Collision.collisions import SpatialHash, apply_impact, separate, _get_pos, get_collision_radius
+from Collision.collisions import HierarchicalSpatialHash, SpatialHash, apply_impact, separate, _get_pos, get_collision_radius, query_radius, swept_rect_toi, swept_bounds, swept_point
+from Collision.numpy_narrowphase import NUMPY_AVAILABLE, NumpyNarrowphase
+from Collision.layers import CollisionCategory, build_collision_matrix
+from Collision.events import KillQueue
+from Collision.separation import CrowdSeparator
 from ui import init_enemy_health_bars, draw_hud
-from Physics.box2d_world import Box2DPhysicsWorld, CollisionCategory
+from Physics.box2d_world import CONTACT_BEGIN, CONTACT_END, STEP_POLICIES, STEP_POLICY_CLAMP, Box2DPhysicsWorld, SYNC_VELOCITY
+from Physics.animation import OscillatorPool
+from Physics.batch import RigidBodyArray
+from Physics.forces import ForceFieldRegistry, RadialMagnet
+from Physics.interpolation import RenderInterpolator
+from Physics.lod import LODScheduler
+from Physics.snapshot import (
+    SnapshotRing, capture_group, capture_random, capture_state, estimate_nbytes,
+    restore_group, restore_random, restore_state,
+)
 from physics_settings import load_physics_settings
 import planets
 from Audio import pelimusat
@@ -59,6 +73,9 @@ from Tasot.Taso2 import spawn_wave_taso2
 from Tasot.Taso3 import spawn_wave_taso3
 from Tasot.TestLevel import spawn_wave_test
 from Tasot.TestLevel2 import spawn_wave_test2
+from frame_clock import SimulatedClock, TimeDilationMeter
+from rotation_cache import ROTATION_CACHE
+from sprite_atlas import SPRITE_ATLAS
 
 from States.GameStateManager import GameStateManager
 # ============================================================================
@@ -80,6 +97,40 @@ PLAYER_DEATH_HOLD_MS = 1100       # PELAAJAN KUOLEMA-NÄYTÖN KESTO
 PLAYER_DEATH_EXPLOSION_FPS = 12   # PELAAJAN KUOLEMA-EXPLOSION KUVATAAJUUS
 PLAYER_DESTROYED_FRAME_MS = 95    # PELAAJAN DESTRUCTION-FRAME AIKA
 
+# KIINTEÄ PELILOGIIKAN TAAJUUS - PIIRTO INTERPOLOI TICKIEN VÄLILLÄ
+FIXED_TICK_HZ = 60                # PELILOGIIKAN PÄIVITYKSIÄ SEKUNNISSA
+BOX2D_PHYSICS_HZ = FIXED_TICK_HZ  # BOX2D-STEPPEJÄ SEKUNNISSA (RG_PHYSICS_HZ, ESIM. 30 KEVENTÄÄ FYSIIKKAA)
+MAX_TICKS_PER_FRAME = 5           # YLÄRAJA TICKEILLE YHDESSÄ RUUDUSSA (HIDAS RUUTU)
+
+# AMMUSTEN BROADPHASE - PIENILLÄ MÄÄRILLÄ BRUTE FORCE (colliderect ON C:TÄ) ON NOPEAMPI
+SPATIAL_BROADPHASE_MIN_TARGETS = 40   # VIHOLLISET + VIHOLLISAMMUKSET VÄHINTÄÄN
+SPATIAL_BROADPHASE_MIN_BULLETS = 16   # PELAAJAN AMMUKSIA VÄHINTÄÄN
+# NUMPY-KERNELI AMMUKSET x KOHTEET -PARIMÄÄRÄN IKKUNASSA (python -m Collision.benchmark):
+# ALLE IKKUNAN KUTSUN KIINTEÄ HINTA HALLITSEE, YLI IKKUNAN TÄYSI PARIMATRIISI HÄVIÄÄ SPATIAL HASHILLE
+NUMPY_NARROWPHASE_MIN_PAIRS = 500
+NUMPY_NARROWPHASE_MAX_PAIRS = 20000
+# VIHOLLISTEN EROTTELU (EI PINOUDU SAMAAN PISTEESEEN) - YMPYRÄPARITESTEJÄ ENINTÄÄN PER TICK
+ENEMY_SEPARATION_PAIR_BUDGET = 400
+# FYSIIKAN LOD - NÄKYMÄN ULKOPUOLELLA JOKA 2. TICK, YLI FAR-ETÄISYYDEN JOKA 4. TICK.
+# OLETUKSENA VAIN METEORIT JA VIHOLLISAMMUKSET (RG_OFFSCREEN_LOD=0 POIS); VIHOLLISET,
+# POMMIT JA OHJAUKSEN HARVENNUS VAIN VALINNAISESTI (RG_PHYSICS_LOD=1)
+PHYSICS_LOD_FAR_PX = 1400         # ETÄISYYS PELAAJASTA, JONKA YLI NELJÄNNESTAAJUUS
+PHYSICS_LOD_VIEW_MARGIN_PX = 240  # NÄKYMÄN LAAJENNUS, JONKA SISÄLLÄ AINA TÄYSI TAAJUUS
+PHYSICS_LOD_STEER_PX = 500        # ETÄISYYS, JONKA YLI VIHOLLISEN OHJAUS LASKETAAN HARVEMMIN
+# TILANNEVEDOKSET - AALLON ALKU (UUSINTAYRITYS) JA RENGASPUSKURI TAKAISINKELAUKSEEN
+SNAPSHOT_RING_SIZE = 8            # VEDOKSIA ENINTÄÄN (MUISTIRAJA)
+SNAPSHOT_INTERVAL_TICKS = 0       # VÄLI TICKEINÄ RENGASPUSKURIIN, 0 = POIS (RG_SNAPSHOT_TICKS)
+# GAME-OLION KENTÄT, JOTKA KUULUVAT VEDOKSEEN (AALTO, AJASTIMET, ELÄMÄT, KAMERA)
+SNAPSHOT_GAME_FIELDS = (
+    'current_wave', 'wave_cleared', 'boss_clear_menu_delay_remaining', 'player_death_menu_delay_remaining',
+    'level_completed', 'game_over', 'running', 'lives', 'enemy_hit_cooldown', 'enemy_calm_timer_ms', 'game_time',
+    'enemy_speed_debuff_time', 'player_speed_boost_time', '_meteor_hit_cooldown',
+    '_boss_storm_active', '_boss_storm_next_ms', '_boss_storm_hide_remaining_ms', '_boss_storm_spawn_timer_ms',
+    '_test2_shower_cd_ms', '_test2_storm_phase', '_test2_storm_side', '_test2_storm_timer_ms',
+    '_test2_storm_burst_remaining', '_test2_storm_burst_step_ms', 'camera_x', 'camera_y', 'boss',
+    '_tick_accumulator_ms', 'render_alpha',
+)
+
 
 # ============================================================================
 # APUFUNKTIOT
@@ -109,6 +160,30 @@ def apply_hitbox(obj, size=None):
     obj.collision_radius = max(8, int(max(obj.rect.width, obj.rect.height)*0.45))
 
 
+def load_enemy_images(viholliset_path, size=(64, 64)):
+    """
+    LATAA VIHOLLISTEN KUVAT (1.png, 2.png, ...) SKAALATTUINA SPRITE-ATLAKSEEN.
+
+    PARAMETRIT:
+        viholliset_path : KANSIO, JOSSA NUMEROIDUT .png-KUVAT OVAT
+        size            : TUPLE (LEVEYS, KORKEUS) JOHON KUVAT SKAALATAAN
+
+    PALAUTTAA:
+        list: KUVAT NUMERO-JÄRJESTYKSESSÄ (ATLAKSEN ALIPINTOJA, JOS NÄYTTÖ ON ALUSTETTU)
+    """
+    paths = [
+        os.path.join(viholliset_path, f)
+        for f in sorted([fn for fn in os.listdir(viholliset_path) if fn.lower().endswith(".png")],
+                        key=lambda name: int(os.path.splitext(name)[0]))
+    ]
+    atlas_key = f"enemies/viholliset@{size[0]}x{size[1]}"
+    frames = SPRITE_ATLAS.family(atlas_key, paths)
+    if frames is not None:
+        return frames
+    frames = [pygame.transform.scale(pygame.image.load(path).convert_alpha(), size) for path in paths]
+    return SPRITE_ATLAS.pack(atlas_key, frames, paths)
+
+
 # ============================================================================
 # PELAPELIN PÄÄLUOKKA - GAME
 # ============================================================================
@@ -126,13 +201,18 @@ class Game:
         - AALTOJEN HALLINTA: SPAWN-LOGIIKKA TASOITTAIN
     """
 
-    def __init__(self, screen, level_number=1):
+    # Physics.snapshot: POMO ON VIITTAUS self.enemies-LISTAN OLIOON, EI KOPIOITA
+    SNAPSHOT_REFS = ('boss',)
+
+    def __init__(self, screen, level_number=1, headless=False):
         """
         ALUSTA PELAPELIN PÄÄLUOKKA.
         
         PARAMETRIT:
-            screen       : PYGAME SURFACE (NÄYTTÖ JOHON PIIRRETÄÄN)
+            screen       : PYGAME SURFACE (NÄYTTÖ JOHON PIIRRETÄÄN), HEADLESS-TILASSA VOI OLLA None
             level_number : TASON NUMERO (1-5, 0=TestLevel, 6=TestLevel2)
+            headless     : TRUE = EI IKKUNAA EIKÄ PIIRTOA, KEVYET PLACEHOLDER-RESURSSIT
+                           JA AJETTU KELLO (SimulatedClock) SEINÄKELLON SIJAAN
         
         LOGIIKKA:
             1. ALUSTA NÄYTÖN PARAMETRIT JA KAMERA
@@ -142,6 +222,9 @@ class Game:
             5. ALUSTA PISTEJÄRJESTELMÄ JA LEADERBOARD
             6. SPAWN ENSIMMÄINEN AALTO VIHOLLISIA
         """
+        self.headless = bool(headless)
+        if screen is None and self.headless:
+            screen = pygame.Surface(DEFAULT_VIEW_SIZE)
         self.screen = screen
         self.view_width, self.view_height = DEFAULT_VIEW_SIZE
         self.health_icon_scale_size = HEALTH_ICON_SIZE
@@ -150,8 +233,19 @@ class Game:
         self.level_number = level_number  # Track which level this instance manages (1-5)
         self.is_test_level = int(level_number) == 0
         self.is_test2_level = int(level_number) == 6
+        # TÖRMÄYSMATRIISI: MITKÄ KERROKSET VOIVAT TÖRMÄTÄ TÄLLÄ TASOLLA (JAETTU HazardSystemin KANSSA)
+        self.collision_matrix = build_collision_matrix(meteors_hit_enemies=self.is_test2_level)
         self.dt = 0
+        self.frame_dt = 0
         self.game_time = 0.0  # Cumulative game time (seconds)
+        # Kiinteä tick: pelilogiikka etenee aina fixed_tick_ms kerrallaan
+        self.fixed_tick_ms = 1000.0 / FIXED_TICK_HZ
+        self.max_ticks_per_frame = MAX_TICKS_PER_FRAME
+        self._tick_accumulator_ms = 0.0
+        self.render_alpha = 0.0
+        self.render_interpolator = RenderInterpolator()
+        # PUDOTETTU PELIAIKA (LIIAN HITAAT RUUDUT) JA LIUKUVA AIKADILATAATIO
+        self.loop_dilation = TimeDilationMeter()
         self.camera_x = 0
         self.camera_y = 0
         self.running = True
@@ -191,6 +285,8 @@ class Game:
         self._test2_storm_burst_step_ms = 0
         self.pistejarjestelma = None
         self.leaderboard = Leaderboard()
+        # PISTEET TALLENNETAAN KERRAN AJOA KOHDEN, VASTA KUN AJO PÄÄTTYY (submit_score)
+        self.score_submitted = False
         self.leaderboard.load_from_file(DEFAULT_LEADERBOARD_FILE)
 
         # Enemy speed debuff tracking
@@ -198,13 +294,62 @@ class Game:
         self.player_speed_boost_time = 0.0  # Seconds remaining
 
         # Pygame-resurssit
-        self.clock = pygame.time.Clock()
+        self.clock = SimulatedClock() if self.headless else pygame.time.Clock()
         self.explosion_manager = ExplosionManager()
-        self.spatial_hash = SpatialHash()
+        # VIHOLLISTEN BROADPHASE: MONITASOINEN RUUDUKKO (ISOT POMOT VIEVÄT VAIN
+        # MUUTAMAN KARKEAN SOLUN), VALINNAINEN: RG_HIERARCHICAL_GRID=1 PÄÄLLE
+        self.USE_HIERARCHICAL_GRID = os.environ.get('RG_HIERARCHICAL_GRID', '0').strip() in ('1', 'true', 'True', 'yes', 'on')
+        self.spatial_hash = HierarchicalSpatialHash() if self.USE_HIERARCHICAL_GRID else SpatialHash()
+        self.enemy_bullet_hash = SpatialHash()
+        self._broadphase_rank = {}
+        self._broadphase_live_bullets = []
+        self._broadphase_bullet_buf = []
+        self._broadphase_enemy_buf = []
+        self._broadphase_active = False
+        self._bullet_target_groups = ((), ())
+        self.narrowphase = NumpyNarrowphase() if NUMPY_AVAILABLE else None
+        self._bullet_backend = 'brute'
         self.collisions = set()
+        self.kill_queue = KillQueue()
+        self.enemy_separator = CrowdSeparator(pair_budget=ENEMY_SEPARATION_PAIR_BUDGET)
+        self.physics_lod = LODScheduler(
+            far_distance=PHYSICS_LOD_FAR_PX,
+            view_margin=PHYSICS_LOD_VIEW_MARGIN_PX,
+            steer_distance=PHYSICS_LOD_STEER_PX,
+        )
+        # VIHOLLISTEN TÖRMÄYSPOMPUT YHDESSÄ POOLISSA (KIERRÄTETYT RIVIT, EI OLIOTA PER POMPPU)
+        self.bounce_pool = OscillatorPool()
+        # VIHOLLISTEN RIGIDBODY-INTEGROINTI YHTENÄ NUMPY-ERÄNÄ (ILMAN NUMPYA OLIOIDEN OMA update())
+        self.enemy_bodies = RigidBodyArray() if NUMPY_AVAILABLE else None
+        # VOIMAKENTÄT, JOTKA step() LASKEE KOKO TAULUKOLLE: PELAAJAN MAGNEETTI (StraightEnemyn OLETUS)
+        self.force_fields = ForceFieldRegistry()
+        self.player_magnet = self.force_fields.add(
+            RadialMagnet(None, radius=MAGNET_RADIUS, strength=MAGNET_STRENGTH, min_distance=MAGNET_MIN_DISTANCE)
+        )
+        # TILANNEVEDOKSET: AALLON ALKU (retry_wave) JA RENGASPUSKURI (rollback)
+        self.snapshots = SnapshotRing(SNAPSHOT_RING_SIZE)
+        self.wave_snapshot = None
+        try:
+            self.snapshot_interval_ticks = max(0, int(os.environ.get('RG_SNAPSHOT_TICKS', '') or SNAPSHOT_INTERVAL_TICKS))
+        except ValueError:
+            self.snapshot_interval_ticks = SNAPSHOT_INTERVAL_TICKS
+        self._ticks_since_snapshot = 0
         self.DEBUG_DRAW_COLLISIONS = True
         self.DEBUG_DRAW_ENEMY_FACING = os.environ.get('RG_DEBUG_ENEMY_FACING', '0').strip() in ('1', 'true', 'True', 'yes', 'on')
         self.USE_SPATIAL_COLLISIONS = True
+        self.USE_NUMPY_NARROWPHASE = NUMPY_AVAILABLE
+        self.USE_BATCH_PHYSICS = NUMPY_AVAILABLE
+        # VIHOLLISTEN KESKINÄINEN EROTTELU (CrowdSeparator), VALINNAINEN: RG_ENEMY_SEPARATION=1 PÄÄLLE
+        self.USE_ENEMY_SEPARATION = os.environ.get('RG_ENEMY_SEPARATION', '0').strip() in ('1', 'true', 'True', 'yes', 'on')
+        # Näkymän ulkopuoliset meteorit ja vihollisammukset päivitetään harvemmin (LODScheduler)
+        self.USE_OFFSCREEN_LOD = os.environ.get('RG_OFFSCREEN_LOD', '1').strip() in ('1', 'true', 'True', 'yes', 'on')
+        # VALINNAINEN (PELATTAVUUS MUUTTUU): LOD MYÖS VIHOLLISILLE JA POMMEILLE + OHJAUKSEN HARVENNUS
+        self.USE_PHYSICS_LOD = os.environ.get('RG_PHYSICS_LOD', '0').strip() in ('1', 'true', 'True', 'yes', 'on')
+        # VIHOLLISET, METEORIT JA POMMIT BOX2D-KAPPALEIKSI (KOKEELLINEN, OLETUKSENA POIS)
+        self.USE_BOX2D_ENTITIES = os.environ.get('RG_BOX2D_ENTITIES', '0').strip() in ('1', 'true', 'True', 'yes', 'on')
+        self._box2d_entities_live = False
+        # VIHOLLISET, JOIHIN PELAAJA KOSKEE BOX2D:N MUKAAN (BEGIN LISÄÄ, END POISTAA)
+        self._player_enemy_contacts = {}
         self.physics_world = None
         self.physics_metrics = {
             'physics_step_ms': 0.0,
@@ -213,15 +358,48 @@ class Game:
             'profile': 'disabled',
             'fixed_dt': 0.0,
             'frame_ms': 0.0,
+            'ticks': 0,
+            'render_alpha': 0.0,
+            'bullet_pair_tests': 0,
+            'separation_pair_tests': 0,
+            'contact_events': 0,
+            'loop_dropped_ms': 0.0,
+            'loop_time_dilation': 1.0,
+            'physics_dropped_ms': 0.0,
+            'physics_time_dilation': 1.0,
+            'lod_full': 0,
+            'lod_half': 0,
+            'lod_quarter': 0,
+            'lod_skipped': 0,
+            'lod_steer_skipped': 0,
+            'snapshots': 0,
+            'snapshot_kb': 0.0,
+            'bounces': 0,
+            'batched_bodies': 0,
         }
         self.show_physics_stats = False #fysiikka-debug tiedot
+        self.frame_scheduler = None  # LevelManager asettaa (FrameScheduler, työ/nukkumis-ajat overlayhin)
         self.physics_font = pygame.font.SysFont('Consolas', 16)
         self.enemy_debug_font = pygame.font.SysFont('Consolas', 14)
         self.user_physics_settings = load_physics_settings()
         env_profile = os.environ.get('RG_PHYSICS_PROFILE', '').strip().lower()
         self.physics_profile_name = env_profile or str(self.user_physics_settings.get('physics_profile', 'balanced')).strip().lower() or 'balanced'
 
-        self.physics_world = Box2DPhysicsWorld(profile_name=self.physics_profile_name)
+        try:
+            physics_hz = float(os.environ.get('RG_PHYSICS_HZ', '') or BOX2D_PHYSICS_HZ)
+        except ValueError:
+            physics_hz = BOX2D_PHYSICS_HZ
+        physics_hz = max(20.0, min(240.0, physics_hz))
+        step_policy = os.environ.get('RG_STEP_POLICY', '').strip().lower() or STEP_POLICY_CLAMP
+        if step_policy not in STEP_POLICIES:
+            step_policy = STEP_POLICY_CLAMP
+        self.physics_world = Box2DPhysicsWorld(
+            profile_name=self.physics_profile_name,
+            fixed_dt=1.0 / physics_hz,
+            step_policy=step_policy,
+        )
+        # Pelilogiikka kuluttaa vain pelaajan kontakteja; vihollisparven keskinäisiä ei kirjata
+        self.physics_world.contact_collector.categories = CollisionCategory.PLAYER
         self.physics_metrics['profile'] = self.physics_profile_name
         self.physics_metrics['fixed_dt'] = self.physics_world.fixed_dt
 
@@ -232,6 +410,7 @@ class Game:
             self.hazard_system = HazardSystem(
                 world_size=(self.tausta_leveys, self.tausta_korkeus),
                 sprite_root=os.path.join(self.base_path, "images", "Space-Shooter_objects"),
+                collision_matrix=self.collision_matrix,
                 config={
                     "enabled": True,
                     "fuse_seconds": 3.0,
@@ -258,6 +437,7 @@ class Game:
             self.hazard_system = HazardSystem(
                 world_size=(self.tausta_leveys, self.tausta_korkeus),
                 sprite_root=os.path.join(self.base_path, "images", "Space-Shooter_objects"),
+                collision_matrix=self.collision_matrix,
                 config={
                     "enabled": True,
                     "fuse_seconds": 2.8,
@@ -286,6 +466,7 @@ class Game:
             self.hazard_system = HazardSystem(
                 world_size=(self.tausta_leveys, self.tausta_korkeus),
                 sprite_root=os.path.join(self.base_path, "images", "Space-Shooter_objects"),
+                collision_matrix=self.collision_matrix,
                 config={
                     "enabled": True,
                     "meteor_spawn_rate": 9999.0,
@@ -392,23 +573,24 @@ class Game:
             - PELAAJAN TERVEYSPALKKIEN KUVAT (0-5 HP)
             - VIHOLLISTEN TERVEYSPALKKIEN KUVAT
             - EXPLOSION-ANIMAATIOT
+
+        VIHOLLIS-, RÄJÄHDYS-, POMMI- JA OHJUSKEHYKSET PAKATAAN SPRITE-ATLAKSEEN
+        (sprite_atlas.py); VALMIS ATLAS LUETAAN images/atlas-KANSIOSTA.
+
+        HEADLESS-TILASSA LADATAAN VAIN PLACEHOLDERIT (_load_placeholder_assets).
         """
         base_path = os.path.dirname(__file__)
         self.base_path = base_path
+        if self.headless:
+            self._load_placeholder_assets()
+            return
         self.tausta_source = pygame.image.load(os.path.join(base_path,'images','taustat','avaruus.png')).convert()
         self.tausta = pygame.transform.scale(self.tausta_source, (self.view_width, self.view_height))
         self.tausta_leveys, self.tausta_korkeus = self.tausta.get_width(), self.tausta.get_height()
 
         # Lataa vihollisten kuvat
         viholliset_path = os.path.join(base_path, "images", "viholliset")
-        self.enemy_imgs = [
-            pygame.transform.scale(
-                pygame.image.load(os.path.join(viholliset_path, f)).convert_alpha(),
-                (64, 64)
-            )
-            for f in sorted([fn for fn in os.listdir(viholliset_path) if fn.lower().endswith(".png")],
-                            key=lambda name: int(os.path.splitext(name)[0]))
-        ]
+        self.enemy_imgs = load_enemy_images(viholliset_path, (64, 64))
 
         # SpriteSettings vihollisille
         self.ss = SpriteSettings(base_path=os.path.join(base_path, 'enemy-sprite'))
@@ -458,6 +640,32 @@ class Game:
         # LATAA EXPLOSION-ANIMAATIOT ENNEN PELIN ALKUA
         self.explosion_manager.load_all_defaults()
 
+    def _load_placeholder_assets(self):
+        """
+        HEADLESS-TILAN KEVYET RESURSSIT: PIENET TYHJÄT SURFACET OIKEILLA MITOILLA.
+
+        PELILOGIIKKA TARVITSEE VAIN KOOT (HITBOXIT, MAAILMAN KOKO), EI PIKSELEITÄ.
+        TAUSTA, PLANEETAT, HUD-KUVAT JA EXPLOSION-KEHYKSET OHITETAAN KOKONAAN,
+        JOTEN .convert()/.convert_alpha()-KUTSUJA EI TARVITA.
+        """
+        self.tausta_source = None
+        self.tausta = pygame.Surface((self.view_width, self.view_height))
+        self.tausta_leveys, self.tausta_korkeus = self.tausta.get_width(), self.tausta.get_height()
+
+        # Sama määrä vihollisikoneita kuin levyllä, jotta tasojen indeksit pysyvät ennallaan.
+        viholliset_path = os.path.join(self.base_path, "images", "viholliset")
+        enemy_count = len([fn for fn in os.listdir(viholliset_path) if fn.lower().endswith(".png")])
+        self.enemy_imgs = [pygame.Surface((64, 64), pygame.SRCALPHA) for _ in range(max(1, enemy_count))]
+
+        # SpriteSettings ilman latausta: pakokaasu- ja luotilistat jäävät tyhjiksi.
+        self.ss = SpriteSettings(base_path=os.path.join(self.base_path, 'enemy-sprite'))
+
+        self.boss_image = pygame.Surface((320, 320), pygame.SRCALPHA)
+        self.planeetat = []
+        self.planeetta_paikat = []
+        self.health_raw_imgs = {}
+        self.health_imgs = {}
+
     # ============================================================================
     # PELAAJAN JA PELIN OBJEKTIEN ALUSTUS
     # ============================================================================
@@ -488,6 +696,7 @@ class Game:
         self._init_player_physics()
         self.lives = int(getattr(self.player, 'health', getattr(self.player, 'max_health', 5)))
         self.spawn_wave(self.current_wave)
+        self._record_wave_snapshot()
 
     def _init_player_physics(self):
         """
@@ -507,6 +716,9 @@ class Game:
             self.physics_world.remove_entity(self.player)
 
         radius = max(8, int(getattr(self.player, 'collision_radius', 24)))
+        player_mask = self.collision_matrix.mask(CollisionCategory.PLAYER)
+        # VIHOLLISKONTAKTIT ERILLISELLÄ MASSATTOMALLA SENSORILLA RECTIN PUOLIDIAGONAALIN
+        # SÄTEELLÄ: JOKAINEN RECT-PÄÄLLEKKÄISYYS (MYÖS KULMAT) ON EHDOKAS, KUTEN PYTHON-TILASSA
         body = self.physics_world.add_circle_body(
             self.player,
             radius_px=radius,
@@ -514,7 +726,9 @@ class Game:
             dynamic=True,
             bullet=False,
             category=CollisionCategory.PLAYER,
-            mask=(CollisionCategory.ENEMY | CollisionCategory.METEOR | CollisionCategory.SENSOR),
+            mask=player_mask & ~CollisionCategory.ENEMY,
+            sensor_mask=player_mask & CollisionCategory.ENEMY,
+            sensor_radius_px=max(radius, math.hypot(self.player.rect.width, self.player.rect.height) * 0.5),
         )
         speed_mul = float(self.user_physics_settings.get('speed_multiplier', 1.0))
         turn_mul = float(self.user_physics_settings.get('turn_multiplier', 1.0))
@@ -590,7 +804,8 @@ class Game:
         if not waves:
             return
 
-        dt_seconds = max(0.001, self.dt / 1000.0)
+        enemies_synced = False
+        buf = self._broadphase_enemy_buf
         for wave in waves:
             center = pygame.Vector2(wave.get('center', (0, 0)))
             radius = float(wave.get('radius', 0.0))
@@ -603,38 +818,49 @@ class Game:
 
             low = max(0.0, min(prev_radius, radius) - band * 0.5)
             high = max(prev_radius, radius) + band * 0.5
-
-            def _intensity_and_dir(pos):
-                rel = pygame.Vector2(pos) - center
-                dist = rel.length()
-                if dist < 1e-6:
-                    rel = pygame.Vector2(1, 0)
-                    dist = 1.0
-                if dist < low or dist > high:
-                    return 0.0, pygame.Vector2(0, 0)
-                intensity = max(0.0, 1.0 - abs(dist - radius) / (band * 0.5))
-                return intensity, rel.normalize()
+            half_band = band * 0.5
 
             # Player push
-            i_player, d_player = _intensity_and_dir(self.player.rect.center)
-            if i_player > 0.0:
-                self._apply_player_knockback(d_player, strength * i_player, blend_with_current=0.62)
-
-            # Enemy and meteor push
-            for entity in self.enemies:
-                i_ent, d_ent = _intensity_and_dir(entity.rect.center)
-                if i_ent > 0.0:
-                    self._add_velocity_to_entity(entity, d_ent * (strength * i_ent * 0.28))
-
-            for meteor in self.meteors:
-                i_met, d_met = _intensity_and_dir(meteor.rect.center)
-                if i_met > 0.0:
-                    self._add_velocity_to_entity(meteor, d_met * (strength * i_met * 0.32))
+            rel = pygame.Vector2(self.player.rect.center) - center
+            dist = rel.length()
+            if dist < 1e-6:
+                rel = pygame.Vector2(1, 0)
+                dist = 1.0
+            if low <= dist <= high:
+                i_player = max(0.0, 1.0 - abs(dist - radius) / half_band)
+                if i_player > 0.0:
+                    self._apply_player_knockback(rel / dist, strength * i_player, blend_with_current=0.62)
+
+            # Enemy, meteor and enemy bullet push: only entities inside the ring
+            if not enemies_synced:
+                self.spatial_hash.sync(self.enemies)
+                self.enemy_bullet_hash.sync(self.enemy_bullets)
+                enemies_synced = True
+            self._push_ring(query_radius(self.spatial_hash, center, high, low, buf),
+                            radius, half_band, strength * 0.28)
+            if self.hazard_system is not None:
+                self._push_ring(self.hazard_system.meteors_in_radius(center, high, low),
+                                radius, half_band, strength * 0.32)
+            self._push_ring(query_radius(self.enemy_bullet_hash, center, high, low, buf),
+                            radius, half_band, strength * 0.22)
+
+    def _push_ring(self, hits, radius, half_band, strength):
+        """
+        TYÖNNÄ query_radius-OSUMAT ULOSPÄIN, VOIMAKKAIMMIN AALLON HARJALLA.
 
-            for bullet in self.enemy_bullets:
-                i_b, d_b = _intensity_and_dir(bullet.rect.center)
-                if i_b > 0.0:
-                    self._add_velocity_to_entity(bullet, d_b * (strength * i_b * 0.22))
+        PARAMETRIT:
+            hits : (entity, dx, dy, dist) -TUPLET
+            radius : AALLON SÄDE
+            half_band : PUOLET AALLON LEVEYDESTÄ
+            strength : TYÖNNÖN VOIMAKKUUS HARJALLA
+        """
+        for entity, dx, dy, dist in hits:
+            if dist < 1e-6:
+                dx, dy, dist = 1.0, 0.0, 1.0
+            intensity = 1.0 - abs(dist - radius) / half_band
+            if intensity > 0.0:
+                scale = strength * intensity / dist
+                self._add_velocity_to_entity(entity, (dx * scale, dy * scale))
 
     def _start_enemy_calm_period(self):
         """
@@ -754,6 +980,7 @@ class Game:
         self.hazard_system = HazardSystem(
             world_size=(self.tausta_leveys, self.tausta_korkeus),
             sprite_root=os.path.join(self.base_path, "images", "Space-Shooter_objects"),
+            collision_matrix=self.collision_matrix,
             config={
                 "enabled": True,
                 "meteor_spawn_rate": 9999.0,
@@ -863,11 +1090,9 @@ class Game:
         RAUHOITA LAHELLA OLEVAT VIHOLLISET LYONNIN JALKEEN.
         VAHENTAA NIIDEN AMPUMISNOPEUTTA HETEKSI.
         """
-        c = pygame.Vector2(center)
-        r2 = float(radius_px) * float(radius_px)
-        for enemy in self.enemies:
-            d2 = (pygame.Vector2(enemy.rect.center) - c).length_squared()
-            if d2 <= r2 and hasattr(enemy, 'hit_player_cooldown'):
+        self.spatial_hash.sync(self.enemies)
+        for enemy, _, _, _ in query_radius(self.spatial_hash, center, radius_px, buf=self._broadphase_enemy_buf):
+            if hasattr(enemy, 'hit_player_cooldown'):
                 enemy.hit_player_cooldown = max(float(getattr(enemy, 'hit_player_cooldown', 0.0)), float(cooldown_seconds))
 
     def _draw_physics_overlay(self, screen):
@@ -877,13 +1102,46 @@ class Game:
         """
         if not self.show_physics_stats:
             return
+        atlas = SPRITE_ATLAS.get_metrics()
         lines = [
             f"Physics profile: {self.physics_metrics.get('profile', 'n/a')}",
             f"Frame ms: {self.physics_metrics.get('frame_ms', 0.0):5.2f}",
+            f"Ticks: {self.physics_metrics.get('ticks', 0)}  alpha {self.render_alpha:4.2f}",
             f"Physics ms: {self.physics_metrics.get('physics_step_ms', 0.0):5.2f}",
-            f"Substeps: {self.physics_metrics.get('substeps', 0)}",
-            f"Contacts: {self.physics_metrics.get('contacts', 0)}",
+            f"Substeps: {self.physics_metrics.get('substeps', 0)}"
+            f"  policy {self.physics_metrics.get('step_policy', 'n/a')}",
+            f"Time dilation: loop {self.physics_metrics.get('loop_time_dilation', 1.0):4.2f}"
+            f"  physics {self.physics_metrics.get('physics_time_dilation', 1.0):4.2f}",
+            f"Dropped ms: loop {self.physics_metrics.get('loop_dropped_ms', 0.0):.0f}"
+            f"  physics {self.physics_metrics.get('physics_dropped_total_ms', 0.0):.0f}",
+            f"Contacts: {self.physics_metrics.get('contacts', 0)}"
+            f"  events {self.physics_metrics.get('contact_events', 0)}",
+            f"Bullet pair tests: {self.physics_metrics.get('bullet_pair_tests', 0)} "
+            f"({self._bullet_backend})",
+            f"Collision layers: {len(self.collision_matrix.pairs())} pairs",
+            f"LOD full/half/quarter: {self.physics_metrics.get('lod_full', 0)}"
+            f"/{self.physics_metrics.get('lod_half', 0)}/{self.physics_metrics.get('lod_quarter', 0)}"
+            f"  skipped {self.physics_metrics.get('lod_skipped', 0)}"
+            f"  steer {self.physics_metrics.get('lod_steer_skipped', 0)}",
+            f"Snapshots: {self.physics_metrics.get('snapshots', 0)}/{self.snapshots.capacity}"
+            f"  wave {self.physics_metrics.get('snapshot_kb', 0.0):.1f} KB",
+            f"Separation pairs: {self.physics_metrics.get('separation_pair_tests', 0)}"
+            f"/{self.enemy_separator.pair_budget}"
+            f"{' (budget hit)' if self.enemy_separator.budget_exhausted else ''}",
+            f"Bounces: {self.physics_metrics.get('bounces', 0)}"
+            f"  recycled {self.bounce_pool.recycled}"
+            f"  batched bodies {self.physics_metrics.get('batched_bodies', 0)}",
+            f"Rotation cache: hit {ROTATION_CACHE.hit_rate * 100.0:5.1f}%"
+            f"  {len(ROTATION_CACHE)} frames  {ROTATION_CACHE.nbytes / 1048576.0:.1f}"
+            f"/{ROTATION_CACHE.max_bytes / 1048576.0:.0f} MB  evicted {ROTATION_CACHE.evictions}",
+            f"Sprite atlas: {atlas['atlas_pages_loaded']}/{atlas['atlas_pages']} pages"
+            f"  {atlas['atlas_families']} families  {atlas['atlas_kb'] / 1024.0:.1f} MB"
+            f"  prebuilt {atlas['atlas_prebuilt']}",
         ]
+        if self.frame_scheduler is not None:
+            fs = self.frame_scheduler
+            lines.append(f"Pacing: {fs.mode}  fps {fs.get_fps():5.1f}")
+            lines.append(f"Work ms: {fs.work_ms:5.2f}  Sleep ms: {fs.sleep_ms:5.2f}")
         if self.hazard_system is not None:
             lines.extend(self.hazard_system.get_debug_lines())
         y = 10
@@ -991,14 +1249,24 @@ class Game:
         self.player_death_menu_delay_remaining = None
         self.level_completed = False
         self.game_over = False
+        self.running = True
+        self.score_submitted = False
         self.enemies.clear()
         self.enemy_bullets.clear()
         self.muzzles.clear()
         self.meteors.clear()
+        self.reset_frame_timing()
         if self.hazard_system is not None:
             self.hazard_system.reset()
             self.meteors = self.hazard_system.meteors
         self.collisions.clear()
+        self.kill_queue.clear()
+        self.enemy_separator.reset()
+        self.physics_lod.reset()
+        self.bounce_pool.clear()
+        self._release_enemy_bodies()
+        self.snapshots.clear()
+        self._release_box2d_entities()
         self.player.health = getattr(self.player, 'max_health', 5)
         if hasattr(self.player, 'is_destroyed'):
             self.player.is_destroyed = False
@@ -1011,8 +1279,174 @@ class Game:
         self.lives = self.player.health
         self.spawn_wave(self.current_wave)
         self.pistejarjestelma = Points()
+        self._record_wave_snapshot()
         pygame.event.clear()
 
+    # ============================================================================
+    # TILANNEVEDOKSET - AALLON UUSINTAYRITYS JA TAKAISINKELAUS
+    # ============================================================================
+    def capture_snapshot(self):
+        """
+        TALLENNA PELIN TILA VEDOKSEKSI ILMAN OLIOIDEN KOPIOINTIA.
+        
+        LOGIIKKA:
+            1. ENTITEETTILISTOJEN JÄRJESTYS JA JOKAISEN ENTITEETIN LITTEÄ TILA
+               (SIJAINTI, NOPEUS, KULMA, HP, AJASTIMET) - Physics.snapshot
+            2. PELAAJA, ASEET, PISTEET, ITEMIT, VAARATEKIJÄT, EROTTELU JA LOD
+            3. random-TILA (DETERMINISTINEN TOISTO) JA BOX2D-KAPPALEET
+        
+        PALAUTTAA:
+            dict : VEDOS restore_snapshot()-KUTSULLE
+        """
+        hazards = self.hazard_system
+        return {
+            'game': capture_state(self, SNAPSHOT_GAME_FIELDS),
+            'random': capture_random(),
+            'player': capture_state(self.player),
+            'weapons': capture_state(self.player.weapons),
+            'player_bullets': capture_group(self.player.weapons.bullets),
+            'enemies': capture_group(self.enemies),
+            'enemy_bullets': capture_group(self.enemy_bullets),
+            'meteors': capture_group(self.meteors) if hazards is None else None,
+            'hazards': None if hazards is None else (
+                capture_state(hazards),
+                capture_group(hazards.bombs),
+                capture_group(hazards.meteors),
+                capture_group(hazards.pickups),
+                capture_group(hazards.shockwaves),
+            ),
+            'points': capture_state(self.pistejarjestelma),
+            'items': (capture_state(self.item_spawner), capture_group(self.item_spawner.items)),
+            'contacts': tuple(self._player_enemy_contacts.items()),
+            'separator': capture_state(self.enemy_separator),
+            'lod': self.physics_lod.get_state(),
+            'bounces': self.bounce_pool.get_state(),
+            'world': self.physics_world.snapshot() if self.physics_world is not None else None,
+        }
+
+    def restore_snapshot(self, snapshot, replay_random=True):
+        """
+        PALAUTA capture_snapshot()-VEDOS SAMOIHIN OLIOIHIN (EI UUSIA OLIOITA).
+        
+        PARAMETRIT:
+            snapshot       : capture_snapshot()-VEDOS
+            replay_random  : TRUE = MYÖS random-TILA (TAKAISINKELAUS TOISTAA SAMAN),
+                             FALSE = UUSINTAYRITYS SAA UUDET SATUNNAISLUVUT
+        
+        LOGIIKKA:
+            1. LISTAT KORVATAAN PAIKALLAAN, JOTEN MUUT VIITTAUKSET PYSYVÄT VOIMASSA
+            2. LYHYTIKÄISET EFEKTIT (SUULIEKIT, RÄJÄHDYKSET, KILL-JONO) TYHJENNETÄÄN
+            3. VIHOLLISTAULUKKO (enemy_bodies) SYNKATAAN PALAUTETTUUN LISTAAN
+            4. BOX2D-KAPPALEET PALAUTETAAN ENNEN ENTITEETTEJÄ; PUUTTUVAT LUODAAN
+               HETI UUDELLEEN
+        """
+        restore_state(self, snapshot['game'], prune=False)
+        if replay_random:
+            restore_random(snapshot['random'])
+        # Box2D ensin: sen synkkaus kirjoittaa entiteetteihin float32-pyöristetyt
+        # sijainnit, jotka entiteettien omat vedokset korvaavat alla
+        world_restored = self.physics_world is not None and snapshot['world'] is not None
+        if world_restored:
+            self.physics_world.restore(snapshot['world'])
+        restore_state(self.player, snapshot['player'])
+        restore_state(self.player.weapons, snapshot['weapons'])
+        restore_group(self.player.weapons.bullets, snapshot['player_bullets'])
+        restore_group(self.enemies, snapshot['enemies'])
+        restore_group(self.enemy_bullets, snapshot['enemy_bullets'])
+        hazards = self.hazard_system
+        if hazards is not None and snapshot['hazards'] is not None:
+            state, bombs, meteors, pickups, shockwaves = snapshot['hazards']
+            restore_state(hazards, state)
+            restore_group(hazards.bombs, bombs)
+            restore_group(hazards.meteors, meteors)
+            restore_group(hazards.pickups, pickups)
+            restore_group(hazards.shockwaves, shockwaves)
+            self.meteors = hazards.meteors
+        elif snapshot['meteors'] is not None:
+            restore_group(self.meteors, snapshot['meteors'])
+        restore_state(self.pistejarjestelma, snapshot['points'])
+        spawner_state, items = snapshot['items']
+        restore_state(self.item_spawner, spawner_state)
+        restore_group(self.item_spawner.items, items)
+        self._player_enemy_contacts.clear()
+        self._player_enemy_contacts.update(snapshot['contacts'])
+        restore_state(self.enemy_separator, snapshot['separator'])
+        self.physics_lod.set_state(snapshot['lod'])
+        self.bounce_pool.set_state(snapshot['bounces'])
+        self._sync_enemy_bodies()
+        self.muzzles.clear()
+        self.explosion_manager.explosions.clear()
+        self.kill_queue.clear()
+        self.collisions.clear()
+        self.render_interpolator.clear()
+        if world_restored and self._box2d_entities_live:
+            # Vedoksen jälkeen poistetut kappaleet luodaan heti, uudet poistetaan
+            self._sync_box2d_entities()
+
+    def _record_wave_snapshot(self):
+        """
+        TALLENNA AALLON ALUN VEDOS (retry_wave) JA PÄIVITÄ SEN KOKO METRIIKKOIHIN.
+        """
+        if self.player is None or self.pistejarjestelma is None:
+            return
+        self.wave_snapshot = self.capture_snapshot()
+        self.physics_metrics['snapshot_kb'] = estimate_nbytes(self.wave_snapshot) / 1024.0
+
+    def submit_score(self):
+        """
+        TALLENNA AJON PISTEET LEADERBOARDIIN (KERRAN AJOA KOHDEN).
+        
+        KUTSUTAAN, KUN AJO PÄÄTTYY (UUSI PELI, PÄÄVALIKKO TAI LOPETUS), EI
+        KUOLEMASSA: AALLON UUSINTA JATKAA SAMAA AJOA EIKÄ SAA LISÄTÄ RIVEJÄ.
+        
+        PALAUTTAA:
+            bool : TRUE, JOS PISTEET TALLENNETTIIN NYT
+        """
+        # Simulaatioajot eivät saa sotkea oikeaa leaderboardia.
+        if self.headless or self.score_submitted or self.pistejarjestelma is None:
+            return False
+        self.text = get_current_player_name()
+        self.leaderboard.add_score(self.text, self.pistejarjestelma.hae_pisteet())
+        self.leaderboard.save_to_file(DEFAULT_LEADERBOARD_FILE)
+        clear_current_player_name()
+        self.score_submitted = True
+        return True
+
+    def retry_wave(self):
+        """
+        ALOITA NYKYINEN AALTO ALUSTA AALLON ALUN VEDOKSESTA (EI UUSIA OLIOITA).
+        
+        PALAUTTAA:
+            bool : FALSE, JOS VEDOSTA EI OLE (KUTSUJA VOI KÄYTTÄÄ reset_game())
+        """
+        if self.wave_snapshot is None:
+            return False
+        self.restore_snapshot(self.wave_snapshot, replay_random=False)
+        # Kuolema pysäytti silmukan (running = False): aalto jatkuu normaalisti
+        self.running = True
+        self.game_over = False
+        self.reset_frame_timing()
+        self.snapshots.clear()
+        self._ticks_since_snapshot = 0
+        self.physics_metrics['snapshots'] = 0
+        pygame.event.clear()
+        return True
+
+    def rollback(self, steps=0):
+        """
+        KELAA TAKAISIN RENGASPUSKURIN VEDOKSEEN (0 = UUSIN), MYÖS random-TILA.
+        
+        PALAUTTAA:
+            bool : FALSE, JOS PUSKURISSA EI OLE NIIN MONTA VEDOSTA
+        """
+        snapshot = self.snapshots.rewind(steps)
+        if snapshot is None:
+            return False
+        self.restore_snapshot(snapshot)
+        self._ticks_since_snapshot = 0
+        self.physics_metrics['snapshots'] = len(self.snapshots)
+        return True
+
     # ============================================================================
     # VIHOLLISTEN AALTOJEN HALLINTA JA SPAWNAIMI
     # ============================================================================
@@ -1108,24 +1542,635 @@ class Game:
     # ============================================================================
     # PELIN PÄÄSILMUKKA - PÄIVITYS JA LOGIIKKA
     # ============================================================================
-    def update(self, events):
+    def update(self, events, dt_ms=None):
         """
-        PÄIVITÄ PELILOGIIKKA JOKA FRAMESSA.
+        PÄIVITÄ PELI YHDEN RUUDUN VERRAN.
         
         PARAMETRIT:
             events : PYGAME-TAPAHTUMAT (NÄPPÄIMISTÖ, HIIRI, yms.)
+            dt_ms  : RUUDUN AIKA GameStateManagerin FrameSchedulerilta (ms).
+                     None = KÄYTÄ OMAA KELLOA (HEADLESS-AJO, TESTIT)
+        
+        LOGIIKKA:
+            1. LISÄÄ RUUDUN AIKA AKKUMULAATTORIIN JA KÄSITTELE RUUTUKOHTAISET TAPAHTUMAT
+            2. AJA _fixed_update() KIINTEÄLLÄ TICKILLÄ NIIN MONTA KERTAA KUIN AIKAA RIITTÄÄ
+               (ENINTÄÄN max_ticks_per_frame, YLIJÄÄMÄ PUDOTETAAN)
+            3. LASKE render_alpha PIIRRON INTERPOLOINTIA VARTEN
+        """
+        frame_start = time.perf_counter()
+        if dt_ms is None:
+            self.frame_dt = self.clock.tick(60)
+        else:
+            self.frame_dt = dt_ms
+
+        if self._refresh_view_metrics():
+            self._rescale_assets_for_view()
+
+        for event in events:
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.DEBUG_DRAW_ENEMY_FACING = not self.DEBUG_DRAW_ENEMY_FACING
+
+        tick_ms = self.fixed_tick_ms
+        self._tick_accumulator_ms += max(0.0, float(self.frame_dt))
+        ticks = 0
+        while self._tick_accumulator_ms >= tick_ms and ticks < self.max_ticks_per_frame:
+            self.render_interpolator.capture(*self._interpolated_groups())
+            self._fixed_update(tick_ms)
+            self._tick_accumulator_ms -= tick_ms
+            ticks += 1
+            if self.snapshot_interval_ticks:
+                self._ticks_since_snapshot += 1
+                if self._ticks_since_snapshot >= self.snapshot_interval_ticks:
+                    self._ticks_since_snapshot = 0
+                    self.snapshots.push(self.capture_snapshot())
+                    self.physics_metrics['snapshots'] = len(self.snapshots)
+            if not self.running:
+                break
+        dropped_ms = 0.0
+        if self._tick_accumulator_ms >= tick_ms:
+            # Liian hidas ruutu: pudota ylijäämä, ettei peli jää kiinni kirimään
+            dropped_ms = self._tick_accumulator_ms - self._tick_accumulator_ms % tick_ms
+            self._tick_accumulator_ms -= dropped_ms
+        self.loop_dilation.record(self.frame_dt, dropped_ms)
+
+        self.render_alpha = self._tick_accumulator_ms / tick_ms
+        self.physics_metrics['ticks'] = ticks
+        self.physics_metrics['loop_dropped_ms'] = self.loop_dilation.total_dropped
+        self.physics_metrics['loop_time_dilation'] = self.loop_dilation.dilation
+        self.physics_metrics['render_alpha'] = self.render_alpha
+        self.physics_metrics['frame_ms'] = (time.perf_counter() - frame_start) * 1000.0
+
+    def reset_frame_timing(self):
+        """
+        NOLLAA TICK-AKKUMULAATTORI JA INTERPOLOINTI (TASON VAIHTO, UUDELLEENKÄYNNISTYS).
+        """
+        self._tick_accumulator_ms = 0.0
+        self.render_alpha = 0.0
+        self.render_interpolator.clear()
+
+    def _interpolated_groups(self):
+        """
+        PALAUTTAA ENTITEETTIJOUKOT, JOIDEN SIJAINTI INTERPOLOIDAAN PIIRROSSA.
+        """
+        meteors = self.hazard_system.meteors if self.hazard_system is not None else self.meteors
+        groups = [self.enemies, self.enemy_bullets, meteors]
+        if self.hazard_system is not None:
+            groups.append(self.hazard_system.bombs)
+        if self.player is not None:
+            groups.append((self.player,))
+            groups.append(self.player.weapons.bullets)
+        return groups
+
+    def _update_camera(self):
+        """
+        KESKITÄ KAMERA PELAAJAAN MAAILMAN RAJOJEN SISÄLLÄ.
+        """
+        self.camera_x = max(0, min(self.player.rect.centerx - self.view_width // 2, self.tausta_leveys - self.view_width))
+        self.camera_y = max(0, min(self.player.rect.centery - self.view_height // 2, self.tausta_korkeus - self.view_height))
+
+    # ============================================================================
+    # AMMUSTEN TÖRMÄYKSET - BROADPHASE (SpatialHash) JA BRUTE FORCE
+    # ============================================================================
+    def _build_projectile_broadphase(self):
+        """
+        PÄIVITÄ TICKIN BROADPHASE: VIHOLLISET JA VIHOLLISAMMUKSET SPATIAL HASHIIN.
+        
+        LOGIIKKA:
+            - self.spatial_hash (VIHOLLISET) JA self.enemy_bullet_hash (EI-RÄJÄHTÄVÄT
+              VIHOLLISAMMUKSET) OVAT PITKÄIKÄISIÄ: sync() SIIRTÄÄ VAIN SOLURAJAN
+              YLITTÄNEET JA POISTAA KADONNEET
+            - TALLENNA LISTAJÄRJESTYS, JOTTA OSUMAJÄRJESTYS PYSYY SAMANA KUIN BRUTE FORCESSA
+            - VAIN TÖRMÄYSMATRIISIN SALLIMAT KERROKSET (self._bullet_target_groups)
+        """
+        enemy_bullets, enemies = self._bullet_target_groups
+        rank = self._broadphase_rank
+        rank.clear()
+        for index, enemy in enumerate(enemies):
+            rank[enemy] = index
+        self.spatial_hash.sync(enemies)
+
+        live_bullets = self._broadphase_live_bullets
+        live_bullets.clear()
+        for index, enemy_bullet in enumerate(enemy_bullets):
+            if getattr(enemy_bullet, 'state', '') == 'explode':
+                continue
+            live_bullets.append(enemy_bullet)
+            rank[enemy_bullet] = index
+        self.enemy_bullet_hash.sync(live_bullets)
+
+    def _bullet_hit_candidates(self, bullet):
+        """
+        PALAUTTAA (VIHOLLISAMMUS-EHDOKKAAT, VIHOLLIS-EHDOKKAAT) PELAAJAN AMMUKSELLE.
+        
+        USE_SPATIAL_COLLISIONS = FALSE TAI VÄHÄN KOHTEITA -> KAIKKI (BRUTE FORCE).
+        MUUTEN VAIN SAMOISSA SOLUISSA OLEVAT, LISTAJÄRJESTYKSESSÄ.
+        """
+        if not self._broadphase_active:
+            enemy_bullets, enemies = self._bullet_target_groups
+            return list(enemy_bullets), list(enemies)
+
+        rank = self._broadphase_rank.__getitem__
+        rect = swept_bounds(bullet)
+        # Puskurit ovat uudelleenkäytettäviä: kelpaavat vain seuraavaan kutsuun asti
+        enemy_bullets = self.enemy_bullet_hash.query_into(rect, self._broadphase_bullet_buf)
+        enemies = self.spatial_hash.query_into(rect, self._broadphase_enemy_buf)
+        if len(enemy_bullets) > 1:
+            enemy_bullets.sort(key=rank)
+        if len(enemies) > 1:
+            enemies.sort(key=rank)
+        return enemy_bullets, enemies
+
+    def _separate_enemies(self):
+        """
+        TYÖNNÄ PÄÄLLEKKÄISET VIHOLLISET ERILLEEN (ChaseEnemy-AALLOT EIVÄT PINOUDU).
+        
+        LOGIIKKA:
+            1. VAIN JOS USE_ENEMY_SEPARATION JA ENEMY-ENEMY ON PÄÄLLÄ TÖRMÄYSMATRIISISSA
+            2. NAAPURIT self.spatial_hashista, ENINTÄÄN ENEMY_SEPARATION_PAIR_BUDGET PARITESTIÄ
+               PER TICK; KESKEN JÄÄNYT KIERROS JATKUU SEURAAVALLA TICKILLÄ
+            3. POMOT EIVÄT LIIKU (is_pinned), PIENET VIHOLLISET VAIN TOISISTAAN
+            4. BOX2D-ENTITEETTITILASSA SOLVERI HOITAA EROTTELUN, TÄMÄ OHITETAAN
+        """
+        if (
+            not self.USE_ENEMY_SEPARATION
+            or self._box2d_entities_live
+            or len(self.enemies) < 2
+            or not self.collision_matrix.can_collide(CollisionCategory.ENEMY, CollisionCategory.ENEMY)
+        ):
+            self.physics_metrics['separation_pair_tests'] = 0
+            return
+        self.spatial_hash.sync(self.enemies)
+        self.enemy_separator.resolve(
+            self.enemies,
+            self.spatial_hash,
+            is_pinned=lambda enemy: isinstance(enemy, BossEnemy),
+        )
+        self.physics_metrics['separation_pair_tests'] = self.enemy_separator.last_pair_tests
+
+    # ============================================================================
+    # BOX2D-ENTITEETTITILA - VIHOLLISET, METEORIT JA POMMIT FYSIIKKAMAAILMASSA
+    # ============================================================================
+    def _create_enemy_body(self, enemy):
+        """
+        VIHOLLISEN KAPPALE: KIINTEÄ FIXTURE VAIN MUITA VIHOLLISIA VASTEN (EROTTELU),
+        SENSORI MUILLE MATRIISIN SALLIMILLE KATEGORIOILLE. POMO ON KINEMAATTINEN.
+        """
+        layers = self.collision_matrix
+        solid_mask = 0
+        if self.USE_ENEMY_SEPARATION and layers.can_collide(CollisionCategory.ENEMY, CollisionCategory.ENEMY):
+            solid_mask = CollisionCategory.ENEMY
+        return self.physics_world.add_entity_body(
+            enemy,
+            radius_px=get_collision_radius(enemy),
+            category=CollisionCategory.ENEMY,
+            solid_mask=solid_mask,
+            sensor_mask=layers.mask(CollisionCategory.ENEMY) & ~CollisionCategory.ENEMY,
+            sensor_radius_px=math.hypot(enemy.rect.width, enemy.rect.height) * 0.5,
+            kinematic=isinstance(enemy, BossEnemy),
+            sync=SYNC_VELOCITY,
+        )
+
+    def _create_meteor_body(self, meteor):
+        """
+        METEORIN KAPPALE: DYNAAMINEN SENSORI, BOX2D INTEGROI LIIKKEEN.
+        """
+        return self.physics_world.add_entity_body(
+            meteor,
+            radius_px=math.hypot(meteor.rect.width, meteor.rect.height) * 0.5,
+            category=CollisionCategory.METEOR,
+            sensor_mask=self.collision_matrix.mask(CollisionCategory.METEOR),
+            sync=SYNC_VELOCITY,
+        )
+
+    def _create_bomb_body(self, bomb):
+        """
+        POMMIN KAPPALE: KINEMAATTINEN SENSORI, LIIKE (PUDOTUS JA LEIJUNTA) PYSYY PYTHONISSA.
+        """
+        return self.physics_world.add_entity_body(
+            bomb,
+            radius_px=math.hypot(bomb.rect.width, bomb.rect.height) * 0.5,
+            category=CollisionCategory.BOMB,
+            sensor_mask=self.collision_matrix.mask(CollisionCategory.BOMB),
+            kinematic=True,
+            sync=0,
+        )
+
+    def _sync_box2d_entities(self):
+        """
+        LUO/POISTA KAPPALEET LISTOJEN MUKAAN JA ASETA NIIDEN NOPEUDET ENNEN STEPPIÄ.
         
         LOGIIKKA:
-            1. PÄIVITÄ DELTATIME JA NÄYTÖN METRIIKAT
+            1. VIHOLLISET JA POMMIT: NOPEUS KOHTI PYTHONIN EHDOTTAMAA SIJAINTIA
+               (AI/LEIJUNTA), SOLVERI RATKAISEE PÄÄLLEKKÄISYYDET
+            2. METEORIT: NOPEUS SUORAAN meteor.vel, BOX2D INTEGROI (HazardSystem EI)
+        """
+        world = self.physics_world
+        world.sync_group('enemies', self.enemies, self._create_enemy_body)
+        world.drive_bodies(self.enemies)
+        if self.hazard_system is not None:
+            self.hazard_system.integrate_meteors = False
+            world.sync_group('meteors', self.hazard_system.meteors, self._create_meteor_body)
+            world.push_velocities(self.hazard_system.meteors)
+            world.sync_group('bombs', self.hazard_system.bombs, self._create_bomb_body)
+            world.drive_bodies(self.hazard_system.bombs)
+        self._box2d_entities_live = True
+
+    def _release_box2d_entities(self):
+        """
+        POISTA ENTITEETTIEN KAPPALEET JA PALAUTA LIIKE PYTHONIIN (TILA POIS TAI UUSI PELI).
+        """
+        if not self._box2d_entities_live:
+            return
+        if self.physics_world is not None:
+            for group in ('enemies', 'meteors', 'bombs'):
+                self.physics_world.remove_group(group)
+        if self.hazard_system is not None:
+            self.hazard_system.integrate_meteors = True
+        self._player_enemy_contacts.clear()
+        self._box2d_entities_live = False
+
+    def _consume_contact_events(self):
+        """
+        TYHJENNÄ BOX2D:N KONTAKTITAPAHTUMAT KERRAN TICKISSÄ (EI KARSINTAA).
+
+        LOGIIKKA:
+            PELAAJA-VIHOLLINEN BEGIN LISÄÄ VIHOLLISEN _player_enemy_contacts:IIN,
+            END POISTAA (MYÖS KAPPALEEN POISTO TUOTTAA END-TAPAHTUMAN).
+        """
+        events = self.physics_world.drain_contact_events()
+        self.physics_metrics['contact_events'] = len(events)
+        contacts = self._player_enemy_contacts
+        for event in events:
+            if event.category_a & CollisionCategory.PLAYER and event.category_b & CollisionCategory.ENEMY:
+                enemy = event.entity_b
+            elif event.category_b & CollisionCategory.PLAYER and event.category_a & CollisionCategory.ENEMY:
+                enemy = event.entity_a
+            else:
+                continue
+            if event.phase == CONTACT_BEGIN:
+                contacts[enemy] = event
+            elif event.phase == CONTACT_END:
+                contacts.pop(enemy, None)
+
+    def _meteor_enemy_candidates(self):
+        """
+        PALAUTTAA FUNKTION meteor -> VIHOLLIS-EHDOKKAAT LISTAJÄRJESTYKSESSÄ.
+        BOX2D-TILASSA EHDOKKAAT TULEVAT KONTAKTILISTASTA, MUUTEN KAIKKI VIHOLLISET.
+        """
+        if not self._box2d_entities_live:
+            return lambda meteor: self.enemies
+        touching = {}
+        for meteor, enemy in self.physics_world.touching_pairs(self.meteors, CollisionCategory.ENEMY):
+            touching.setdefault(meteor, []).append(enemy)
+        if touching:
+            rank = {enemy: index for index, enemy in enumerate(self.enemies)}
+            last = len(rank)
+            for enemies in touching.values():
+                enemies.sort(key=lambda enemy: rank.get(enemy, last))
+        return lambda meteor: touching.get(meteor, ())
+
+    def _begin_lod_tick(self):
+        """
+        ALOITA FYSIIKAN LOD-TICK: NÄKYMÄ KAMERASTA, ETÄISYYDET PELAAJASTA.
+        
+        PALAUTTAA:
+            LODScheduler TAI None (USE_OFFSCREEN_LOD JA USE_PHYSICS_LOD POIS = KAIKKI JOKA TICK)
+        
+        VIHOLLISET JA POMMIT SAAVAT SCHEDULERIN VAIN, KUN USE_PHYSICS_LOD ON PÄÄLLÄ.
+        """
+        if not (self.USE_OFFSCREEN_LOD or self.USE_PHYSICS_LOD):
+            self.physics_lod.reset()
+            self.physics_metrics.update(self.physics_lod.get_metrics())
+            return None
+        view = pygame.Rect(int(self.camera_x), int(self.camera_y), self.view_width, self.view_height)
+        self.physics_lod.begin_tick(view, self.player.rect.center)
+        self.physics_metrics.update(self.physics_lod.get_metrics())
+        return self.physics_lod
+
+    def _integrate_enemy_bodies(self):
+        """
+        INTEGROI batch_physics-VIHOLLISET YHDELLÄ RigidBodyArray-ASKELEELLA
+        TEKOÄLYN JÄLKEEN (SAMA JÄRJESTYS KUIN RigidBody.update()-POLULLA).
+        
+        LOGIIKKA:
+            1. RIVIN dt = VIHOLLISEN batch_dt_ms (update() JÄTTI INTEGROINNIN KESKEN);
+               POMPPIVAT JA LOD-OHITETUT RIVIT (None) EIVÄT LIIKU TÄLLÄ TICKILLÄ
+            2. integrate(): LUE pos/vel, OLIOIDEN forces-LISTAT, step() VOIMAKENTILLÄ
+               (self.force_fields, MM. PELAAJAN MAGNEETTI), KIRJOITA TAKAISIN
+            3. StraightEnemy OHITTAA OMAN MAGNEETTINSA (body_array); KUTSUJA
+               VIIMEISTELEE PÄIVITYKSEN finish_update()-KUTSULLA
+        """
+        bodies = self.enemy_bodies
+        if bodies is None or not self.USE_BATCH_PHYSICS:
+            return
+        self.player_magnet.target = self.player
+        row_dt = [(enemy.batch_dt_ms or 0.0) / 1000.0 for enemy in bodies.bodies]
+        self.physics_metrics['batched_bodies'] = bodies.integrate(row_dt, self.force_fields)
+
+    def _sync_enemy_bodies(self):
+        """
+        PIDÄ enemy_bodies-RIVIT self.enemies-LISTAN batch_physics-VIHOLLISINA.
+        
+        PALAUTTAA:
+            RigidBodyArray | None : TAULUKKO, TAI NONE KUN ERÄAJO EI OLE KÄYTÖSSÄ
+        """
+        bodies = self.enemy_bodies
+        if bodies is None:
+            return None
+        if not self.USE_BATCH_PHYSICS:
+            self._release_enemy_bodies()
+            return None
+        added, removed = bodies.sync([e for e in self.enemies if e.batch_physics])
+        for enemy in added:
+            enemy.body_array = bodies
+        for enemy in removed:
+            enemy.body_array = None
+        return bodies
+
+    def _release_enemy_bodies(self):
+        """
+        TYHJENNÄ VIHOLLISTAULUKKO JA PALAUTA INTEGROINTI OLIOIDEN OMAAN update()-KUTSUUN.
+        """
+        bodies = self.enemy_bodies
+        if bodies is None or not len(bodies):
+            return
+        for enemy in bodies.bodies:
+            enemy.body_array = None
+        bodies.clear()
+        self.physics_metrics['batched_bodies'] = 0
+
+    def _update_enemies(self, lod=None):
+        """
+        PÄIVITÄ VIHOLLISTEN AI JA AMPUMINEN.
+        
+        PARAMETRIT:
+            lod : LODScheduler TAI None (VAIN USE_PHYSICS_LOD). NÄKYMÄN ULKOPUOLISET VIHOLLISET PÄIVITETÄÄN
+                  HARVEMMIN KERTYNEELLÄ dt:LLÄ (MYÖS AMPUMISAJASTIN), JA KAUKAISET
+                  LASKEVAT OHJAUKSENSA UUDELLEEN VAIN steer_due()-TICKEILLÄ;
+                  POMOT AINA JOKA TICK
+        
+        TÖRMÄYSPOMPUT (start_collision_bounce(pool=self.bounce_pool)) LASKETAAN
+        KERRAN TICKISSÄ ENNEN PÄIVITYKSIÄ. ERÄAJETUT VIHOLLISET INTEGROIDAAN
+        (_integrate_enemy_bodies) KAIKKIEN OHJAUSTEN JÄLKEEN, MINKÄ JÄLKEEN NIIDEN
+        finish_update() JA AMPUMINEN AJETAAN SAMASSA JÄRJESTYKSESSÄ.
+        """
+        world_rect = pygame.Rect(0,0,self.tausta_leveys,self.tausta_korkeus)
+        self.bounce_pool.advance(self.dt / 1000.0)
+        self.physics_metrics['bounces'] = len(self.bounce_pool)
+        self._sync_enemy_bodies()
+        batched = []
+        for e in list(self.enemies):
+            step_ms = self.dt
+            if lod is not None:
+                pinned = isinstance(e, BossEnemy)
+                step_ms = lod.due(e, self.dt, pinned=pinned)
+                if step_ms is None:
+                    continue
+                e.steer_this_tick = lod.steer_due(e, pinned=pinned)
+            else:
+                e.steer_this_tick = True
+            e.update(step_ms, self.player, world_rect)
+            if e.batch_dt_ms is not None:
+                batched.append(e)
+                continue
+            self._enemy_maybe_shoot(e, step_ms)
+
+        self._integrate_enemy_bodies()
+        for e in batched:
+            step_ms = e.batch_dt_ms
+            e.finish_update(self.player, world_rect)
+            self._enemy_maybe_shoot(e, step_ms)
+
+    def _enemy_maybe_shoot(self, enemy, step_ms):
+        """
+        VIHOLLISEN AMPUMINEN TICKIN PÄIVITYKSEN JÄLKEEN (RAUHOITUS HIDASTAA AJASTINTA).
+        """
+        shoot_dt = step_ms
+        if self.enemy_calm_timer_ms > 0:
+            shoot_dt = step_ms * self.enemy_calm_shoot_scale
+        enemy.maybe_shoot(
+            shoot_dt,
+            {'enemy_bullets': self.enemy_bullets},
+            player=self.player
+        )
+
+    def _resolve_kill_events(self):
+        """
+        RATKAISE TICKIN AIKANA JONOON KERÄTYT TAPOT KERRALLA.
+        
+        LOGIIKKA:
+            1. POISTA TAPETUT self.enemies-LISTASTA YHDELLÄ LÄPIKÄYNNILLÄ (MARK-AND-SWEEP)
+            2. JOKAISELLE TAPAHTUMALLE: RÄJÄHDYS, ÄÄNI, HAZARD-DROP, ITEM-DROP JA PISTEET
+        
+        SAMA VIHOLLINEN VOI KUOLLA VAIN KERRAN TICKISSÄ: KillQueue HYLKÄÄ TOISTOT.
+        """
+        kill_queue = self.kill_queue
+        if not len(kill_queue):
+            return
+        kill_queue.sweep(self.enemies)
+
+        sounds = pelimusat.game_sounds if hasattr(pelimusat, 'game_sounds') else None
+        for event in kill_queue.drain():
+            enemy = event.entity
+            self.spatial_hash.remove(enemy)
+
+            if event.explosion == "boss":
+                self.explosion_manager.spawn_boss(event.pos, fps=event.explosion_fps)
+            elif event.explosion == "enemy":
+                self.explosion_manager.spawn_enemy(event.pos, fps=event.explosion_fps)
+
+            if event.sound and sounds:
+                sounds.play_sfx(event.sound)
+                if event.sound == "boss_explosion":
+                    # JATKA TAUSTAMUSIIKKIA SEURAAVAA TASOA KOHTI
+                    sounds.stop_music(fadeout_ms=0)
+                    sounds.play_music("pelimusa-root", loops=-1)
+
+            if self.hazard_system is not None:
+                self.hazard_system.on_enemy_destroyed(enemy, is_boss=event.is_boss)
+            # Dropaa item vihollisen kuolemasta
+            if event.drop_item and hasattr(self, 'item_spawner') and self.item_spawner.should_enemy_drop():
+                self.item_spawner.spawn_item_from_enemy(enemy.rect.center)
+            self.pistejarjestelma.lisaa_piste(event.points)
+
+    def _scan_bullet_hit(self, bullet, enemy_bullet_candidates, enemy_candidates):
+        """
+        ETSI AMMUKSEN AIKAISIN OSUMA EHDOKKAISTA (PYYHKÄISY prev_pos -> pos).
+        
+        PALAUTTAA:
+            (VIHOLLISAMMUS TAI None, VIHOLLINEN TAI None, t TAI None, TESTATUT PARIT)
+        """
+        # Aikaisin osuma voittaa, nopea ammus ei tunneloidu.
+        # Tasapelissä vihollisammus voittaa (sama prioriteetti kuin ennen).
+        pair_tests = 0
+        hit_t = None
+        hit_enemy_bullet = None
+        for enemy_bullet in enemy_bullet_candidates:
+            if getattr(enemy_bullet, 'state', '') == 'explode':
+                continue
+            pair_tests += 1
+            t = swept_rect_toi(bullet, enemy_bullet.rect)
+            if t is not None and (hit_t is None or t < hit_t):
+                hit_enemy_bullet, hit_t = enemy_bullet, t
+
+        hit_enemy = None
+        kill_queue = self.kill_queue
+        for enemy in enemy_candidates:
+            if enemy in kill_queue:
+                continue
+            pair_tests += 1
+            t = swept_rect_toi(bullet, enemy.rect)
+            if t is not None and (hit_t is None or t < hit_t):
+                hit_enemy, hit_enemy_bullet, hit_t = enemy, None, t
+        return hit_enemy_bullet, hit_enemy, hit_t, pair_tests
+
+    def _numpy_bullet_hits(self, bullets):
+        """
+        LASKE KAIKKIEN AMMUSTEN AIKAISIMMAT OSUMAT KERRALLA NUMPY-KERNELILLÄ.
+        
+        PALAUTTAA:
+            {AMMUKSEN INDEKSI: (VIHOLLISAMMUS TAI None, VIHOLLINEN TAI None, t)}
+        
+        KOHTEET OVAT SAMASSA JÄRJESTYKSESSÄ KUIN BRUTE FORCESSA (VIHOLLISAMMUKSET
+        ENSIN), JOTEN TASAPELIT RATKEAVAT SAMOIN.
+        """
+        enemy_bullets, enemies = self._bullet_target_groups
+        targets = [eb for eb in enemy_bullets if getattr(eb, 'state', '') != 'explode']
+        enemy_bullet_count = len(targets)
+        targets.extend(enemies)
+        hits = {}
+        for bullet_index, target_index, t in self.narrowphase.first_hits(bullets, targets):
+            if target_index < enemy_bullet_count:
+                hits[bullet_index] = (targets[target_index], None, t)
+            else:
+                hits[bullet_index] = (None, targets[target_index], t)
+        return hits
+
+    def _resolve_player_bullet_hits(self):
+        """
+        KÄSITTELE PELAAJAN AMMUSTEN OSUMAT VIHOLLISAMMUKSIIN JA VIHOLLISIIN.
+        
+        LOGIIKKA:
+            0. KOHDEKERROKSET TÖRMÄYSMATRIISISTA (KIELLETTYJÄ PAREJA EI LUETELLA)
+            1. VALITSE TAUSTA: NUMPY (PALJON PAREJA), SPATIAL HASH TAI BRUTE FORCE
+            2. JOKAISELLE AMMUKSELLE PYYHKÄISYTESTI (prev_pos -> pos) EHDOKKAITA VASTEN
+            3. AIKAISIN OSUMA KULUTTAA AMMUKSEN
+        
+        TAPETUT VIHOLLISET MENEVÄT self.kill_queueen (KS. _resolve_kill_events).
+        NUMPY-TAUSTA LASKEE OSUMAT ETUKÄTEEN. JOS AIEMPI AMMUS EHTI RÄJÄYTTÄÄ
+        TAI TAPPAA KOHTEEN, KYSEINEN AMMUS LASKETAAN UUDELLEEN BRUTE FORCENA.
+        """
+        pair_tests = 0
+        bullets = list(self.player.weapons.bullets)
+        matrix = self.collision_matrix
+        enemy_bullet_targets = (
+            self.enemy_bullets
+            if matrix.can_collide(CollisionCategory.PROJECTILE, CollisionCategory.ENEMY_PROJECTILE)
+            else ()
+        )
+        enemy_targets = (
+            self.enemies if matrix.can_collide(CollisionCategory.PROJECTILE, CollisionCategory.ENEMY) else ()
+        )
+        self._bullet_target_groups = (enemy_bullet_targets, enemy_targets)
+        target_count = len(enemy_targets) + len(enemy_bullet_targets)
+
+        numpy_hits = None
+        self._broadphase_active = False
+        if (self.USE_NUMPY_NARROWPHASE and self.narrowphase is not None
+                and NUMPY_NARROWPHASE_MIN_PAIRS <= len(bullets) * target_count <= NUMPY_NARROWPHASE_MAX_PAIRS):
+            numpy_hits = self._numpy_bullet_hits(bullets)
+            pair_tests = self.narrowphase.last_pair_count
+            self._bullet_backend = 'numpy'
+        else:
+            # Pienillä määrillä suora läpikäynti on halvempi kuin hash-kyselyt
+            self._broadphase_active = (
+                self.USE_SPATIAL_COLLISIONS
+                and len(bullets) >= SPATIAL_BROADPHASE_MIN_BULLETS
+                and target_count >= SPATIAL_BROADPHASE_MIN_TARGETS
+            )
+            if self._broadphase_active:
+                self._build_projectile_broadphase()
+            self._bullet_backend = 'spatial' if self._broadphase_active else 'brute'
+
+        for bullet_index, bullet in enumerate(bullets):
+            if numpy_hits is not None:
+                hit = numpy_hits.get(bullet_index)
+                if hit is None:
+                    # Kohteita vain poistuu kesken kierroksen, joten ohi pysyy ohi
+                    continue
+                hit_enemy_bullet, hit_enemy, hit_t = hit
+                stale = (
+                    hit_enemy in self.kill_queue
+                    if hit_enemy is not None
+                    else getattr(hit_enemy_bullet, 'state', '') == 'explode'
+                )
+                if stale:
+                    hit_enemy_bullet, hit_enemy, hit_t, tests = self._scan_bullet_hit(
+                        bullet, list(enemy_bullet_targets), list(enemy_targets))
+                    pair_tests += tests
+            else:
+                enemy_bullet_candidates, enemy_candidates = self._bullet_hit_candidates(bullet)
+                hit_enemy_bullet, hit_enemy, hit_t, tests = self._scan_bullet_hit(
+                    bullet, enemy_bullet_candidates, enemy_candidates)
+                pair_tests += tests
+
+            if hit_enemy_bullet is not None:
+                if bullet in self.player.weapons.bullets:
+                    self.player.weapons.bullets.remove(bullet)
+                hit_enemy_bullet.explode()
+                if getattr(hit_enemy_bullet, 'dead', False) and hit_enemy_bullet in self.enemy_bullets:
+                    self.enemy_bullets.remove(hit_enemy_bullet)
+                continue
+
+            if hit_enemy is None:
+                continue
+
+            enemy = hit_enemy
+            impact_pos = swept_point(bullet, hit_t)
+
+            if bullet in self.player.weapons.bullets:
+                self.player.weapons.bullets.remove(bullet)
+
+            base_damage = getattr(bullet, "damage", 1)
+            bonus_damage = self.player.damage_bonus * 0.5 if self.player else 0
+            damage = int(min(3.0, base_damage + bonus_damage))
+
+            # Kuolemat jonoon: räjähdys, ääni, dropit, pisteet ja poisto tickin lopussa
+            if isinstance(enemy, BossEnemy):
+                if enemy.take_hit(damage):
+                    self.kill_queue.kill(enemy, enemy.rect.center, points=5, is_boss=True,
+                                         explosion="boss", sound="boss_explosion", cause="bullet")
+                else:
+                    self.explosion_manager.spawn_hit(impact_pos, fps=24)
+            elif hasattr(enemy, "hp"):
+                enemy.hp -= damage
+                if enemy.hp <= 0:
+                    self.kill_queue.kill(enemy, enemy.rect.center, sound="enemy_explosion",
+                                         drop_item=True, cause="bullet")
+                else:
+                    self.explosion_manager.spawn_hit(impact_pos, fps=24)
+            else:
+                self.kill_queue.kill(enemy, impact_pos, sound="enemy_explosion", cause="bullet")
+
+        self.physics_metrics['bullet_pair_tests'] = pair_tests
+
+    def _fixed_update(self, tick_ms):
+        """
+        PÄIVITÄ PELILOGIIKKA YHDEN KIINTEÄN TICKIN VERRAN.
+        
+        PARAMETRIT:
+            tick_ms : TICKIN PITUUS MILLISEKUNTEINA (AINA fixed_tick_ms)
+        
+        LOGIIKKA:
+            1. PÄIVITÄ AJASTIMET
             2. PÄIVITÄ KAMERA JA MILJÖÖ (PLANEETAT)
             3. PÄIVITÄ PELAAJA JA FYSIIKKAMOOTTORI
             4. PÄIVITÄ VIHOLLISET JA NIIDEN AMMUKSET
-            5. KÄSITTELE KAIKKI TÖRMÄYKSET JA VAHINGOT
+            5. KÄSITTELE KAIKKI TÖRMÄYKSET JA VAHINGOT (TAPOT JONOON, RATKAISU KERRALLA)
             6. TARKISTA AALLON PÄÄTTYMINEN JA AALLON ETENNEMINEN
             7. TARKISTA PELAAJAN KUOLEMA JA PELIN LOPPU
         """
-        frame_start = time.perf_counter()
-        self.dt = self.clock.tick(60)
+        self.dt = tick_ms
         self.game_time += self.dt / 1000.0  # Track cumulative game time for item drops
         
         # Update item effect timers
@@ -1138,22 +2183,27 @@ class Game:
             if self.player and hasattr(self.player, 'speed_boost_multiplier'):
                 self.player.speed_boost_multiplier = 1.25  # 25% faster
 
-        if self._refresh_view_metrics():
-            self._rescale_assets_for_view()
-
-        for event in events:
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
-                self.DEBUG_DRAW_ENEMY_FACING = not self.DEBUG_DRAW_ENEMY_FACING
-
         # ========================================================================
         # PELIOBJEKTIEN PAIVITYS
         # ========================================================================
         planets.update_planet(self.dt)
         self.player.update(self.dt)
+        # LOD-TASOT EDELLISEN TICKIN KAMERASTA (MARGINAALI KATTAA YHDEN TICKIN SIIRTYMÄN)
+        lod = self._begin_lod_tick()
+        enemy_lod = lod if self.USE_PHYSICS_LOD else None
+
+        # BOX2D-ENTITEETTITILA: AI EHDOTTAA SIJAINNIT ENNEN STEPPIÄ, STEPPI RATKAISEE
+        box2d_entities = self.USE_BOX2D_ENTITIES and self.physics_world is not None
+        if box2d_entities:
+            self._update_enemies(enemy_lod)
+            self._sync_box2d_entities()
+        else:
+            self._release_box2d_entities()
 
         if self.physics_world is not None:
             self.physics_world.step(self.dt / 1000.0)
             self.physics_metrics.update(self.physics_world.get_metrics())
+            self._consume_contact_events()
 
         self.player.move(0,0,self.tausta_leveys,self.tausta_korkeus)
         self._update_boss_storm_phase(self.dt)
@@ -1167,25 +2217,21 @@ class Game:
         # KAMERA JA VIHOLLISTEN PAIVITYS
         # ========================================================================
         # KAMERA PELAAJAN YMPARILLA
-        self.camera_x = max(0, min(self.player.rect.centerx - self.view_width // 2, self.tausta_leveys - self.view_width))
-        self.camera_y = max(0, min(self.player.rect.centery - self.view_height // 2, self.tausta_korkeus - self.view_height))
+        self._update_camera()
 
         # Päivitä viholliset
-        for e in list(self.enemies):
-            e.update(self.dt, self.player, pygame.Rect(0,0,self.tausta_leveys,self.tausta_korkeus))
-            shoot_dt = self.dt
-            if self.enemy_calm_timer_ms > 0:
-                shoot_dt = self.dt * self.enemy_calm_shoot_scale
-            e.maybe_shoot(
-                shoot_dt,
-                {'enemy_bullets': self.enemy_bullets},
-                player=self.player
-            )
+        if not box2d_entities:
+            self._update_enemies(enemy_lod)
+
+        self._separate_enemies()
 
         # Legacy meteor update path (non-test levels).
         if self.hazard_system is None:
             for meteor in list(self.meteors):
-                meteor.update(self.dt)
+                step_ms = self.dt if lod is None else lod.due(meteor, self.dt)
+                if step_ms is None:
+                    continue
+                meteor.update(step_ms)
                 if getattr(meteor, 'dead', False):
                     self.meteors.remove(meteor)
 
@@ -1193,96 +2239,23 @@ class Game:
         # AMMUKSIEN KASITTELY - PELAAJAN JA VIHOLLISTEN AMMUKSET
         # ========================================================================
         # Ammukset
-        for bullet in list(self.player.weapons.bullets):
-            hit_enemy_bullet = False
-
-            for enemy_bullet in list(self.enemy_bullets):
-                if getattr(enemy_bullet, 'state', '') == 'explode':
-                    continue
-                if bullet.rect.colliderect(enemy_bullet.rect):
-                    if bullet in self.player.weapons.bullets:
-                        self.player.weapons.bullets.remove(bullet)
-                    enemy_bullet.explode()
-                    if getattr(enemy_bullet, 'dead', False) and enemy_bullet in self.enemy_bullets:
-                        self.enemy_bullets.remove(enemy_bullet)
-                    hit_enemy_bullet = True
-                    break
-
-            if hit_enemy_bullet:
-                continue
-
-            for enemy in list(self.enemies):
-                if bullet.rect.colliderect(enemy.rect):
-                    impact_pos = bullet.rect.center
-
-                    if bullet in self.player.weapons.bullets:
-                        self.player.weapons.bullets.remove(bullet)
-
-                    if isinstance(enemy, BossEnemy):
-                        base_damage = getattr(bullet, "damage", 1)
-                        bonus_damage = self.player.damage_bonus * 0.5 if self.player else 0
-                        damage = int(min(3.0, base_damage + bonus_damage))
-                        died = enemy.take_hit(damage)
-
-                        if died:
-                            self.explosion_manager.spawn_boss(enemy.rect.center, fps=20)
-                            # SOITA BOSS EXPLOSION ÄÄNI
-                            if pelimusat.game_sounds:
-                                pelimusat.game_sounds.play_sfx("boss_explosion")
-                                # JATKA TAUSTAMUSIIKKIA SEURAAVAA TASOA KOHTI
-                                pelimusat.game_sounds.stop_music(fadeout_ms=0)
-                                pelimusat.game_sounds.play_music("pelimusa-root", loops=-1)
-                            if enemy in self.enemies:
-                                if self.hazard_system is not None:
-                                    self.hazard_system.on_enemy_destroyed(enemy, is_boss=True)
-                                self.enemies.remove(enemy)
-                                self.pistejarjestelma.lisaa_piste(5)
-                        else:
-                            self.explosion_manager.spawn_hit(impact_pos, fps=24)
-
-                    else:
-                        base_damage = getattr(bullet, "damage", 1)
-                        bonus_damage = self.player.damage_bonus * 0.5 if self.player else 0
-                        damage = int(min(3.0, base_damage + bonus_damage))
-
-                        if hasattr(enemy, "hp"):
-                            enemy.hp -= damage
-                            if enemy.hp <= 0:
-                                self.explosion_manager.spawn_enemy(enemy.rect.center, fps=20)
-                                # SOITA ENEMY EXPLOSION ÄÄNI
-                                if hasattr(pelimusat, 'game_sounds') and pelimusat.game_sounds:
-                                    pelimusat.game_sounds.play_sfx("enemy_explosion")
-                                if enemy in self.enemies:
-                                    if self.hazard_system is not None:
-                                        self.hazard_system.on_enemy_destroyed(enemy, is_boss=False)
-                                    # Dropaa item vihollisen kuolemasta
-                                    if hasattr(self, 'item_spawner') and self.item_spawner.should_enemy_drop():
-                                        self.item_spawner.spawn_item_from_enemy(enemy.rect.center)
-                                    self.enemies.remove(enemy)
-                                self.pistejarjestelma.lisaa_piste(1)
-                            else:
-                                self.explosion_manager.spawn_hit(impact_pos, fps=24)
-                        else:
-                            self.explosion_manager.spawn_enemy(impact_pos, fps=20)
-                            # SOITA ENEMY EXPLOSION ÄÄNI
-                            if hasattr(pelimusat, 'game_sounds') and pelimusat.game_sounds:
-                                pelimusat.game_sounds.play_sfx("enemy_explosion")
-                    
-                            if enemy in self.enemies:
-                                if self.hazard_system is not None:
-                                    self.hazard_system.on_enemy_destroyed(enemy, is_boss=False)
-                                self.enemies.remove(enemy)
-                            self.pistejarjestelma.lisaa_piste(1)
-
-                    break
+        self._resolve_player_bullet_hits()
 
+        layers = self.collision_matrix
+        enemy_bullets_hit_player = layers.can_collide(CollisionCategory.PLAYER, CollisionCategory.ENEMY_PROJECTILE)
+        world_rect = pygame.Rect(0,0,self.tausta_leveys,self.tausta_korkeus)
         for b in list(self.enemy_bullets):
-            b.update(self.dt, pygame.Rect(0,0,self.tausta_leveys,self.tausta_korkeus))
+            # Ohitettu ammus ei liiku; se on näkymän ulkopuolella, joten ei voi osua pelaajaan
+            step_ms = self.dt if lod is None else lod.due(b, self.dt)
+            if step_ms is None:
+                continue
+            b.update(step_ms, world_rect)
             if getattr(b,'dead',False):
                 self.enemy_bullets.remove(b)
             elif (
-                getattr(b,'state','') != 'explode'
-                and b.rect.colliderect(self.player.rect)
+                enemy_bullets_hit_player
+                and getattr(b,'state','') != 'explode'
+                and swept_rect_toi(b, self.player.rect) is not None
                 and self.lives > 0
                 and self.player_death_menu_delay_remaining is None
             ):
@@ -1296,7 +2269,12 @@ class Game:
         if self.hazard_system is None:
             # Legacy meteor collision handling.
             meteor_hit_cooldown = getattr(self, '_meteor_hit_cooldown', 0)
-            if meteor_hit_cooldown <= 0 and self.lives > 0 and self.player_death_menu_delay_remaining is None:
+            if (
+                meteor_hit_cooldown <= 0
+                and self.lives > 0
+                and self.player_death_menu_delay_remaining is None
+                and layers.can_collide(CollisionCategory.PLAYER, CollisionCategory.METEOR)
+            ):
                 for meteor in self.meteors:
                     if self.player.rect.colliderect(meteor.rect):
                         self.apply_damage(1)  # Meteor damage (armor first, then health)
@@ -1325,19 +2303,25 @@ class Game:
                 self._meteor_hit_cooldown = max(0, meteor_hit_cooldown - self.dt)
 
             # Meteors are invulnerable in non-test levels.
-            for meteor in self.meteors:
+            for meteor in (self.meteors if layers.can_collide(CollisionCategory.PROJECTILE, CollisionCategory.METEOR) else ()):
                 for bullet in list(self.player.weapons.bullets):
-                    if bullet.rect.colliderect(meteor.rect):
+                    if swept_rect_toi(bullet, meteor.rect) is not None:
                         if bullet in self.player.weapons.bullets:
                             self.player.weapons.bullets.remove(bullet)
         else:
-            boss_positions = [e.rect.center for e in self.enemies if isinstance(e, BossEnemy)]
+            # Tällä tickillä kuolleet (jonossa) eivät enää pudota pommeja eivätkä laukaise miinoja.
+            # Miinat kysyvät vihollisia samasta SpatialHashista kuin ammukset.
+            live_enemies = [e for e in self.enemies if e not in self.kill_queue]
+            boss_positions = [e.rect.center for e in live_enemies if isinstance(e, BossEnemy)]
+            self.spatial_hash.sync(live_enemies)
+            self.hazard_system.lod = lod
+            self.hazard_system.lod_bombs = self.USE_PHYSICS_LOD
             hazard_effects = self.hazard_system.update(
                 self.dt,
                 self.player,
                 self.player.weapons.bullets,
                 boss_positions=boss_positions,
-                nearby_positions=[e.rect.center for e in self.enemies],
+                enemy_index=self.spatial_hash,
             )
 
             # Placeholder for countdown beep integration.
@@ -1370,11 +2354,13 @@ class Game:
             for m_pos in hazard_effects.get("meteor_destroyed_positions", []):
                 self.explosion_manager.spawn_enemy(m_pos, fps=20)
 
-            # Test2 mode: falling meteors also sweep enemies on contact.
-            if self.is_test2_level:
+            # Test2 mode: falling meteors also sweep enemies on contact (METEOR-ENEMY in the matrix).
+            if layers.can_collide(CollisionCategory.METEOR, CollisionCategory.ENEMY):
+                kill_queue = self.kill_queue
+                enemy_candidates = self._meteor_enemy_candidates()
                 for meteor in list(self.meteors):
-                    for enemy in list(self.enemies):
-                        if not meteor.rect.colliderect(enemy.rect):
+                    for enemy in enemy_candidates(meteor):
+                        if enemy in kill_queue or not meteor.rect.colliderect(enemy.rect):
                             continue
 
                         if isinstance(enemy, BossEnemy):
@@ -1384,19 +2370,11 @@ class Game:
                             enemy._meteor_contact_cd_ms = 360
                             died = enemy.take_hit(1)
                             self.explosion_manager.spawn_hit(enemy.rect.center, fps=22)
-                            if died and enemy in self.enemies:
-                                self.explosion_manager.spawn_boss(enemy.rect.center, fps=20)
-                                if self.hazard_system is not None:
-                                    self.hazard_system.on_enemy_destroyed(enemy, is_boss=True)
-                                self.enemies.remove(enemy)
-                                self.pistejarjestelma.lisaa_piste(5)
+                            if died:
+                                kill_queue.kill(enemy, enemy.rect.center, points=5, is_boss=True,
+                                                explosion="boss", cause="meteor")
                         else:
-                            self.explosion_manager.spawn_enemy(enemy.rect.center, fps=20)
-                            if enemy in self.enemies:
-                                if self.hazard_system is not None:
-                                    self.hazard_system.on_enemy_destroyed(enemy, is_boss=False)
-                                self.enemies.remove(enemy)
-                                self.pistejarjestelma.lisaa_piste(1)
+                            kill_queue.kill(enemy, enemy.rect.center, cause="meteor")
 
                         if meteor in self.meteors:
                             self.meteors.remove(meteor)
@@ -1414,8 +2392,19 @@ class Game:
         # VIHOLLISEN JA PELAAJAN KONTAKTI-TORMAYKSET
         # ========================================================================
         # Kontakti-osuma vihollisen ja pelaajan välillä cooldownilla.
-        if self.enemy_hit_cooldown <= 0 and self.lives > 0 and self.player_death_menu_delay_remaining is None:
-            for enemy in self.enemies:
+        if (
+            self.enemy_hit_cooldown <= 0
+            and self.lives > 0
+            and self.player_death_menu_delay_remaining is None
+            and layers.can_collide(CollisionCategory.PLAYER, CollisionCategory.ENEMY)
+        ):
+            # Box2D-tilassa ehdokkaat tulevat ratkaisijan kontaktitapahtumista (anturiympyrät).
+            # Osuma vahvistetaan samalla rect-testillä kuin Python-tilassa, jotta osuma-alue ei muutu.
+            native_contacts = self._box2d_entities_live
+            candidates = list(self._player_enemy_contacts) if native_contacts else self.enemies
+            for enemy in candidates:
+                if enemy in self.kill_queue:
+                    continue
                 if self.player.rect.colliderect(enemy.rect):
                     self.apply_damage(1)  # Enemy contact damage (armor first, then health)
 
@@ -1444,15 +2433,8 @@ class Game:
 
                     # Non-boss enemies explode on collision to prevent instant chain hits.
                     if not isinstance(enemy, BossEnemy):
-                        self.explosion_manager.spawn_enemy(enemy.rect.center, fps=22)
-                        # SOITA ENEMY EXPLOSION ÄÄNI
-                        if hasattr(pelimusat, 'game_sounds') and pelimusat.game_sounds:
-                            pelimusat.game_sounds.play_sfx("enemy_explosion")
-                        if enemy in self.enemies:
-                            if self.hazard_system is not None:
-                                self.hazard_system.on_enemy_destroyed(enemy, is_boss=False)
-                            self.enemies.remove(enemy)
-                            self.pistejarjestelma.lisaa_piste(1)
+                        self.kill_queue.kill(enemy, enemy.rect.center, explosion_fps=22,
+                                             sound="enemy_explosion", cause="contact")
 
                     self._start_enemy_calm_period()
                     self._calm_nearby_enemies(self.player.rect.center)
@@ -1461,7 +2443,9 @@ class Game:
                     break
         if self.enemy_hit_cooldown > 0:
             self.enemy_hit_cooldown -= self.dt
-        
+
+        # TICKIN TAPPOTAPAHTUMAT KERRALLA ENNEN AALLON TARKISTUSTA
+        self._resolve_kill_events()
 
         # ========================================================================
         # WAVE HALLINTA - PAATTYMINEN JA ETENEMINEN
@@ -1478,6 +2462,7 @@ class Game:
                 self.enemy_bullets.clear()
                 self.muzzles.clear()
                 self.spawn_wave(self.current_wave)
+                self._record_wave_snapshot()
             else:
                 # Boss beaten: let explosion animation play briefly before
                 # moving to level complete state.
@@ -1488,12 +2473,8 @@ class Game:
         # PELAAJAN KUOLEMA JA PELIN LOPETUS
         # ========================================================================
         if self.lives <= 0 and self.player_death_menu_delay_remaining is None:
-            self.text = get_current_player_name()
-            self.leaderboard.add_score(self.text,
-                                       self.pistejarjestelma.hae_pisteet())
-            self.leaderboard.save_to_file(DEFAULT_LEADERBOARD_FILE)
-            clear_current_player_name()
-
+            # Pisteitä ei tallenneta vielä: aallon uusinta (retry_wave) jatkaa samaa
+            # ajoa. GameOverState kutsuu submit_score(), kun ajo oikeasti päättyy.
             if hasattr(self.player, 'is_destroyed'):
                 self.player.is_destroyed = True
             if hasattr(self.player, 'destroyed_anim_timer'):
@@ -1562,15 +2543,11 @@ class Game:
                     elif item_type == "enemy_destroy":
                         # NUKE: Destroy all enemies on screen (including boss!)
                         print(f"[NUKE DEBUG] NUKE ACTIVATED! Enemies before: {len(self.enemies)}, Boss: {self.boss is not None}")
-                        for enemy in list(self.enemies):
-                            self.explosion_manager.spawn_enemy(enemy.rect.center, fps=20)
-                            if hasattr(pelimusat, 'game_sounds') and pelimusat.game_sounds:
-                                pelimusat.game_sounds.play_sfx("enemy_explosion")
-                            if self.hazard_system is not None:
-                                self.hazard_system.on_enemy_destroyed(enemy, is_boss=False)
-                            self.enemies.remove(enemy)
-                            self.pistejarjestelma.lisaa_piste(2)  # Bonus points for nuke kills
-                        
+                        for enemy in self.enemies:
+                            # Bonus points for nuke kills
+                            self.kill_queue.kill(enemy, enemy.rect.center, points=2,
+                                                 sound="enemy_explosion", cause="nuke")
+                        self._resolve_kill_events()
                         print(f"[NUKE DEBUG] NUKE: All enemies destroyed. Enemies after: {len(self.enemies)}")
 
         if self.boss_clear_menu_delay_remaining is not None:
@@ -1585,8 +2562,6 @@ class Game:
                 self.game_over = True
                 self.running = False
 
-        self.physics_metrics['frame_ms'] = (time.perf_counter() - frame_start) * 1000.0
-
     def draw(self, target_screen):
         """
         PIIRTA KAIKI PELIOBJEKTIT ANNETTUUN RUUTUUN KAMERAN PERUSTEELLA.
@@ -1603,10 +2578,39 @@ class Game:
             6. PIIRTA PELAAJA JA EXPLOSION-ANIMAATIOT
             7. PIIRTA HUD: PISTEET, TERVEYSPALKIT, BOOST, ARMOR, DMG
             8. PIIRTA DEBUG-INFOT (JOS PAALLA): VIHOLLISTEN SUUNTA, FYSIIKKA
+
+        HEADLESS-TILASSA EI PIIRRETÄ MITÄÄN.
         """
+        if self.headless:
+            return
         self.screen = target_screen
         if self._refresh_view_metrics():
             self._rescale_assets_for_view()
+
+        # Siirrä entiteetit tickien väliin piirron ajaksi; palautetaan lopussa.
+        # Box2D-kappaleet interpoloidaan fysiikkastepeistä (fysiikka voi ajaa
+        # harvemmin kuin pelilogiikka), muut pelin tickeistä.
+        groups = self._interpolated_groups()
+        world = self.physics_world
+        skip = None
+        if world is not None:
+            world.apply_render_states(world.render_alpha(self._tick_accumulator_ms / 1000.0))
+            skip = world.entity_to_body
+        self.render_interpolator.apply(self.render_alpha, *groups, skip=skip)
+        sim_camera = (self.camera_x, self.camera_y)
+        self._update_camera()
+        try:
+            self._draw_world()
+        finally:
+            self.render_interpolator.restore()
+            if world is not None:
+                world.restore_render_states()
+            self.camera_x, self.camera_y = sim_camera
+
+    def _draw_world(self):
+        """
+        PIIRRÄ MAAILMA JA HUD (draw() HOITAA INTERPOLOINNIN YMPÄRILLÄ).
+        """
         self.screen.blit(
             self.tausta,
             (0, 0),
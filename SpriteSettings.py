@@ -1,6 +1,8 @@
 import os
 import pygame
 
+from sprite_atlas import SPRITE_ATLAS
+
 
 class SpriteSettings:
     """Apuluokka vihollisspritesien lataukseen ja ryhmittelyyn.
@@ -23,34 +25,51 @@ class SpriteSettings:
         # call load when pygame is ready (pygame.init() must be called first)
         # We do not auto-initialize pygame here to keep this module pure.
 
-    def _load_images_from(self, path: str) -> list:
-        """Palauttaa listan `pygame.Surface`-olioita polusta.
+    def _png_paths(self, path: str) -> list:
+        """Palauttaa polun .png-tiedostot latausjärjestyksessä.
 
-        Jos `path` on tiedosto, palautetaan yhden kuvan lista. Jos se on kansio,
-        palautetaan kaikki kansiossa olevat .png-tiedostot (lajiteltuna).
-        Paluuarvo on tyhjä lista jos polku ei ole olemassa tai kuvia ei voida ladata.
+        Jos `path` on tiedosto, palautetaan se yksinään. Jos se on kansio,
+        palautetaan kaikki kansiossa (ja alikansioissa) olevat .png-tiedostot
+        lajiteltuna. Tyhjä lista, jos polkua ei ole.
         """
         if not os.path.exists(path):
             return []
-
         if os.path.isfile(path):
-            try:
-                return [pygame.image.load(path).convert_alpha()]
-            except Exception:
-                return []
+            return [path]
+        paths = []
+        for dirpath, _, files in os.walk(path):
+            paths.extend(os.path.join(dirpath, f) for f in sorted(files) if f.lower().endswith('.png'))
+        return paths
 
-        # Jos annettu polku on kansio, etsi sen .png-tiedostot
+    def _load_paths(self, paths: list, atlas_key: str | None = None) -> list:
+        """Lataa kuvat `pygame.Surface`-olioiksi; kuvat, joita ei voida ladata, ohitetaan.
+
+        Jos `atlas_key` on annettu, kehykset haetaan valmiina sprite-atlaksesta
+        tai pakataan sinne latauksen jälkeen.
+        """
+        if atlas_key is not None:
+            frames = SPRITE_ATLAS.family(atlas_key, paths)
+            if frames is not None:
+                return frames
         images = []
-        for dirpath, _, files in os.walk(path):
-            pngs = sorted(f for f in files if f.lower().endswith('.png'))
-            for f in pngs:
-                full = os.path.join(dirpath, f)
-                try:
-                    images.append(pygame.image.load(full).convert_alpha())
-                except Exception:
-                    continue
+        for full in paths:
+            try:
+                images.append(pygame.image.load(full).convert_alpha())
+            except Exception:
+                continue
+        if atlas_key is not None:
+            images = SPRITE_ATLAS.pack(atlas_key, images, paths)
         return images
 
+    def _load_images_from(self, path: str, atlas_key: str | None = None) -> list:
+        """Palauttaa listan `pygame.Surface`-olioita polusta.
+
+        Jos `path` on tiedosto, palautetaan yhden kuvan lista. Jos se on kansio,
+        palautetaan kaikki kansiossa olevat .png-tiedostot (lajiteltuna).
+        Paluuarvo on tyhjä lista jos polku ei ole olemassa tai kuvia ei voida ladata.
+        """
+        return self._load_paths(self._png_paths(path), atlas_key)
+
     def load_all(self):
         """Lataa kaikki yleisesti tarvittavat sprite-resurssit.
 
@@ -59,16 +78,18 @@ class SpriteSettings:
         - pakokaasu/afterburner -kehykset (turbo/normal)
         - luotien kehykset (start/flight/explode)
 
+        Jokainen ryhmä on oma animaatioperheensä sprite-atlaksessa.
         Palauttaa sanakirjan, joka sisältää listoja ladatuista kuvista.
         """
+        atlas_prefix = f"sprites/{self.ship}"
         ship_folder = os.path.join(self.base, 'PNG_Parts&Spriter_Animation', self.ship, self.ship)
-        self.ship_frames = self._load_images_from(ship_folder)
+        self.ship_frames = self._load_images_from(ship_folder, f"{atlas_prefix}/ship")
 
         turbo_folder = os.path.join(self.base, 'PNG_Parts&Spriter_Animation', self.ship, 'Exhaust', 'Turbo_flight', 'Exhaust1')
-        self.exhaust_turbo = self._load_images_from(turbo_folder)
+        self.exhaust_turbo = self._load_images_from(turbo_folder, f"{atlas_prefix}/exhaust_turbo")
 
         normal_folder = os.path.join(self.base, 'PNG_Parts&Spriter_Animation', self.ship, 'Exhaust', 'Normal_flight', 'Exhaust1')
-        self.exhaust_normal = self._load_images_from(normal_folder)
+        self.exhaust_normal = self._load_images_from(normal_folder, f"{atlas_prefix}/exhaust_normal")
 
         # check both PNG_Animations and PNG_Parts&Spriter_Animation locations for Shot4
         candidate_shot_paths = [
@@ -78,42 +99,34 @@ class SpriteSettings:
         ]
 
         # Kerää luotikehysten alikansiot kategorioihin: start, flight, explode
-        shots = {'start': [], 'flight': [], 'explode': []}
+        shot_paths = {'start': [], 'flight': [], 'explode': []}
         for shots_folder in candidate_shot_paths:
             if not os.path.isdir(shots_folder):
                 continue
             for dirpath, dirnames, files in os.walk(shots_folder):
                 name = os.path.basename(dirpath).lower()
-                pngs = sorted(f for f in files if f.lower().endswith('.png'))
-                imgs = []
-                for f in pngs:
-                    full = os.path.join(dirpath, f)
-                    try:
-                        imgs.append(pygame.image.load(full).convert_alpha())
-                    except Exception:
-                        continue
-                if not imgs:
+                pngs = [os.path.join(dirpath, f) for f in sorted(files) if f.lower().endswith('.png')]
+                if not pngs:
                     continue
                 # Luokan nimi kertoo mihin kategoriaan kuvat kuuluvat
                 if 'start' in name or 'shotstart' in name:
-                    shots['start'].extend(imgs)
+                    shot_paths['start'].extend(pngs)
                 elif 'exp' in name or 'expl' in name:
-                    shots['explode'].extend(imgs)
+                    shot_paths['explode'].extend(pngs)
                 else:
                     # Oletuksena käsitellään kuvaa lentovaiheen kehyksenä
-                    shots['flight'].extend(imgs)
-
-        self.shot_frames = shots
+                    shot_paths['flight'].extend(pngs)
 
         # Jos tietyt Shot4-lentokehykset löytyvät osakansiosta, käytä niitä ensisijaisesti
         preferred = os.path.join(self.base, 'PNG_Parts&Spriter_Animation', 'Shots', 'Shot4', 'shot4', 'shot4_asset', '000_shot4_asset_0.png')
-        if os.path.isfile(preferred):
-            try:
-                img = pygame.image.load(preferred).convert_alpha()
-                shots['flight'] = [img]
-                self.shot_frames = shots
-            except Exception:
-                pass
+        flight_key = f"{atlas_prefix}/shot_flight"
+        preferred_flight = self._load_paths([preferred], flight_key) if os.path.isfile(preferred) else []
+
+        self.shot_frames = {
+            'start': self._load_paths(shot_paths['start'], f"{atlas_prefix}/shot_start"),
+            'flight': preferred_flight or self._load_paths(shot_paths['flight'], flight_key),
+            'explode': self._load_paths(shot_paths['explode'], f"{atlas_prefix}/shot_explode"),
+        }
 
         return {
             'ship': self.ship_frames,
@@ -13,15 +13,28 @@ class GameOverState(GameState):
         self.background_surface = manager.screen.copy()
         self.game_over_screen = GameOverScreen(manager.screen)
 
+    def _submit_score(self):
+        # Ajo päättyy: pisteet leaderboardiin (RETRY WAVE jatkaa samaa ajoa, ei tallennusta)
+        lm = getattr(self.manager, "level_manager", None)
+        if lm and hasattr(lm, "submit_score"):
+            lm.submit_score()
+
     def update(self, events):
         for event in events:
+            if event.type == pygame.QUIT:
+                self._submit_score()
+                return
+
             result = self.game_over_screen.handle_event(event)
 
-            if result == "TRY AGAIN":
+            if result in ("TRY AGAIN", "RETRY WAVE"):
                 lm = getattr(self.manager, "level_manager", None)
                 if lm:
-                    # Reset only the current level state (player, enemies, timers)
-                    if hasattr(lm, "reset_current_level"):
+                    if result == "RETRY WAVE" and hasattr(lm, "retry_current_wave"):
+                        # Restart the current wave from its snapshot (player, enemies, timers)
+                        lm.retry_current_wave()
+                    else:
+                        self._submit_score()
                         lm.reset_current_level()
                     from States.PlayState import PlayState
                     self.manager.set_state(PlayState(self.manager, level_manager=lm))
@@ -33,18 +46,21 @@ class GameOverState(GameState):
                 return
 
             if result == "MAIN MENU":
+                self._submit_score()
                 self.manager.set_state(MainMenuState(self.manager))
                 return
 
             if result == "QUIT":
+                self._submit_score()
                 self.manager.running = False
                 return
 
             if event.type == pygame.KEYDOWN:
                 # Pidä vanha fallback: mikä tahansa näppäin palaa valikkoon.
+                self._submit_score()
                 self.manager.set_state(MainMenuState(self.manager))
                 return
 
     def draw(self, screen):
         w, h = screen.get_size()
-        self.game_over_screen.show(w, h, overlay=True, background_surface=self.background_surface)
\ No newline at end of file
+        self.game_over_screen.show(w, h, overlay=True, background_surface=self.background_surface)
@@ -2,6 +2,7 @@ import pygame
 from display_settings import load_display_settings
 from Audio.pelimusat import GameSounds
 from Audio import pelimusat
+from frame_clock import FrameScheduler, DEFAULT_PACING_MODE
 import json
 import os
 
@@ -66,7 +67,13 @@ class GameStateManager:
         self.screen = pygame.display.set_mode((display["width"], display["height"]), flags)
         pygame.display.set_caption("Rocket Game")
 
-        self.clock = pygame.time.Clock()
+        # AINOA RUUTUAJASTIN: TUOTTAA YHDEN dt:N PER RUUTU, JOKA VÄLITETÄÄN TILOILLE
+        try:
+            self.scheduler = FrameScheduler(display.get("frame_pacing", DEFAULT_PACING_MODE))
+        except ValueError:
+            self.scheduler = FrameScheduler(DEFAULT_PACING_MODE)
+        self.clock = self.scheduler.clock
+        self.frame_dt_ms = 0.0
         self.running = True
         self.level_manager = None
         
@@ -98,6 +105,8 @@ class GameStateManager:
         # KUTSUU on_enter() UUDELLE TILALLE (ESIM. LATAA ASETUKSET KUN PÄÄVALIKKOON SIIRRYTÄÄN)
         if hasattr(self.state, 'on_enter'):
             self.state.on_enter()
+        # TILAN VAIHTO VOI SISÄLTÄÄ RASKAAN LATAUKSEN (ESIM. UUSI TASO) - EI ANNETA SEN NÄKYÄ dt:NÄ
+        self.scheduler.reset()
 
     def run(self):
         """Pelin pääsilmukka"""
@@ -123,7 +132,8 @@ class GameStateManager:
 
             pygame.display.flip()
 
-            self.clock.tick(60)
+            # YKSI tick PER RUUTU: TÄMÄ dt KÄYTETÄÄN SEURAAVASSA update()-KUTSUSSA
+            self.frame_dt_ms = self.scheduler.tick()
 
         # SULKEA ÄÄNIJÄRJESTELMÄ JA PYGAME ENNEN LOPETUSTA
         self.sounds.quit()
@@ -10,6 +10,7 @@ class PlayState(GameState):
         self.level_manager = level_manager if level_manager else LevelManager(manager.screen, num_levels=3)
         # Expose level_manager on the manager so other states can reuse it
         self.manager.level_manager = self.level_manager
+        self.level_manager.frame_scheduler = getattr(self.manager, "scheduler", None)
 
     def update(self, events):
         for event in events:
@@ -19,7 +20,7 @@ class PlayState(GameState):
                 self.manager.set_state(PauseState(self.manager, self, background_surface=background))
                 return
 
-        self.level_manager.update(events)
+        self.level_manager.update(events, dt_ms=getattr(self.manager, "frame_dt_ms", None))
 
         # Check if current level is complete
         if self.level_manager.is_level_complete():
@@ -31,6 +31,8 @@ class LevelManager:
         self.num_levels = len(self.level_numbers)
         self.current_level_index = 0
         self.total_score = 0
+        # Shared FrameScheduler from the state manager (set by PlayState), shown in the debug overlay.
+        self.frame_scheduler = None
 
         # Create levels lazily to keep Start Game responsive.
         self.levels = [None] * self.num_levels
@@ -56,6 +58,11 @@ class LevelManager:
         except Exception:
             pass
 
+        try:
+            level.reset_frame_timing()
+        except Exception:
+            pass
+
         try:
             if level.physics_world is not None:
                 level.physics_world.accumulator = 0.0
@@ -94,9 +101,16 @@ class LevelManager:
         """Check if current level resulted in game over."""
         return getattr(self.current_level, 'game_over', False)
 
-    def update(self, events):
-        """Update current level."""
-        self.current_level.update(events)
+    def update(self, events, dt_ms=None):
+        """Update current level.
+
+        Args:
+            events: Pygame events for this frame.
+            dt_ms: Frame time from the state manager's scheduler. None lets the
+                level fall back to its own clock (headless runs, tests).
+        """
+        self.current_level.frame_scheduler = self.frame_scheduler
+        self.current_level.update(events, dt_ms=dt_ms)
 
     def draw(self, target_screen):
         """Draw current level."""
@@ -113,3 +127,16 @@ class LevelManager:
         """Reset current level to initial state."""
         self.current_level.reset_game()
         self._prime_level_timing(self.current_level)
+
+    def submit_score(self):
+        """Submit the current run to the leaderboard once the run really ends."""
+        return self.current_level.submit_score()
+
+    def retry_current_wave(self):
+        """Restart the current wave from its snapshot (full level reset if none)."""
+        retry = getattr(self.current_level, "retry_wave", None)
+        if retry is None or not retry():
+            # No snapshot: a full reset starts a new run, so the old one is submitted
+            self.submit_score()
+            self.current_level.reset_game()
+        self._prime_level_timing(self.current_level)
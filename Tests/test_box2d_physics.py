@@ -9,8 +9,10 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
+from Collision.layers import CollisionCategory
+
 try:
-    from Physics.box2d_world import Box2DPhysicsWorld
+    from Physics.box2d_world import CONTACT_BEGIN, CONTACT_END, Box2DPhysicsWorld, STEP_POLICIES
     BOX2D_AVAILABLE = True
 except Exception:
     Box2DPhysicsWorld = None
@@ -60,6 +62,19 @@ class TestBox2DPhysics(unittest.TestCase):
 
         self.assertGreater(e.vel.x, 0.0)
 
+    @unittest.skipUnless(BOX2D_AVAILABLE, "Box2D not available in this environment")
+    def test_query_radius_returns_bodies_in_annulus_only(self):
+        w = Box2DPhysicsWorld()
+        near, ring, far = DummyEntity(105, 100), DummyEntity(160, 100), DummyEntity(400, 100)
+        for entity in (near, ring, far):
+            w.add_entity_body(entity, radius_px=6, category=CollisionCategory.ENEMY,
+                              sensor_mask=CollisionCategory.PLAYER)
+
+        hits = w.query_radius((100, 100), 100, inner_radius_px=30)
+        self.assertEqual([hit[0] for hit in hits], [ring])
+        self.assertAlmostEqual(hits[0][4], 60.0, places=3)
+        self.assertEqual(w.apply_explosion_impulse((100, 100), 100, 15), 2)
+
     @unittest.skipUnless(BOX2D_AVAILABLE, "Box2D not available in this environment")
     def test_metrics_present_after_step(self):
         e = DummyEntity(50, 50)
@@ -72,6 +87,198 @@ class TestBox2DPhysics(unittest.TestCase):
         self.assertIn("substeps", m)
         self.assertIn("contacts", m)
 
+    @unittest.skipUnless(BOX2D_AVAILABLE, "Box2D not available in this environment")
+    def test_entity_group_is_driven_separated_and_reports_sensor_contacts(self):
+        w = Box2DPhysicsWorld()
+        enemies = [DummyEntity(100, 100), DummyEntity(104, 100)]
+        meteor = DummyEntity(300, 100)
+        meteor.vel = pygame.Vector2(60, 0)
+
+        def make_enemy(entity):
+            return w.add_entity_body(entity, radius_px=10, category=CollisionCategory.ENEMY,
+                                     solid_mask=CollisionCategory.ENEMY,
+                                     sensor_mask=CollisionCategory.METEOR)
+
+        def make_meteor(entity):
+            return w.add_entity_body(entity, radius_px=12, category=CollisionCategory.METEOR,
+                                     sensor_mask=CollisionCategory.ENEMY)
+
+        self.assertEqual(w.sync_group("enemies", enemies, make_enemy), (2, 0))
+        w.sync_group("meteors", [meteor], make_meteor)
+        for _ in range(20):
+            w.drive_bodies(enemies)
+            w.push_velocities([meteor])
+            w.step(1.0 / 60.0)
+
+        # Solid fixtures pushed the stacked pair apart; the meteor was integrated by Box2D.
+        self.assertGreater(enemies[0].pos.distance_to(enemies[1].pos), 18.0)
+        self.assertAlmostEqual(meteor.pos.x, 320.0, delta=0.5)
+        self.assertEqual(w.touching_pairs([meteor], CollisionCategory.ENEMY), [])
+
+        enemies[1].pos = pygame.Vector2(315, 100)
+        w.drive_bodies(enemies)
+        w.push_velocities([meteor])
+        w.step(1.0 / 60.0)
+        self.assertEqual(w.touching_pairs([meteor], CollisionCategory.ENEMY), [(meteor, enemies[1])])
+
+        self.assertEqual(w.sync_group("enemies", enemies[:1], make_enemy), (0, 1))
+        self.assertIsNone(w.get_body(enemies[1]))
+
+    @unittest.skipUnless(BOX2D_AVAILABLE, "Box2D not available in this environment")
+    def test_sync_updates_vectors_in_place_and_skips_sleeping_bodies(self):
+        e = DummyEntity(60, 60)
+        pos, vel = e.pos, e.vel
+        w = Box2DPhysicsWorld()
+        body = w.add_circle_body(e, radius_px=8, mass=1.0)
+        body.linearVelocity = (3.0, 0.0)
+        w.step(1.0 / 60.0)
+
+        self.assertIs(e.pos, pos)
+        self.assertIs(e.vel, vel)
+        self.assertGreater(e.pos.x, 60.0)
+        self.assertEqual(e.rect.center, (int(e.pos.x), int(e.pos.y)))
+
+        body.awake = False
+        e.pos.x = 500.0
+        w.step(1.0 / 60.0)
+        self.assertEqual(e.pos.x, 500.0)
+
+    @unittest.skipUnless(BOX2D_AVAILABLE, "Box2D not available in this environment")
+    def test_render_states_interpolate_between_physics_steps(self):
+        e = DummyEntity(100, 100)
+        w = Box2DPhysicsWorld(fixed_dt=1.0 / 30.0)
+        body = w.add_circle_body(e, radius_px=8, mass=1.0)
+        body.linearVelocity = (3.0, 0.0)
+        w.step(1.0 / 30.0)
+        stepped_x = e.pos.x
+        self.assertGreater(stepped_x, 100.0)
+
+        # Half a physics step of unsimulated time -> halfway between the steps.
+        alpha = w.render_alpha(1.0 / 60.0)
+        self.assertAlmostEqual(alpha, 0.5, places=5)
+        x, y, _ = w.render_transform(e, alpha)
+        self.assertAlmostEqual(x, 100.0 + (stepped_x - 100.0) * 0.5, places=4)
+
+        w.apply_render_states(alpha)
+        self.assertAlmostEqual(e.pos.x, x, places=4)
+        w.restore_render_states()
+        self.assertEqual(e.pos.x, stepped_x)
+        self.assertEqual(e.rect.center, (int(e.pos.x), int(e.pos.y)))
+
+    @unittest.skipUnless(BOX2D_AVAILABLE, "Box2D not available in this environment")
+    def test_contact_events_are_typed_and_not_truncated(self):
+        w = Box2DPhysicsWorld()
+        player = DummyEntity(100, 100)
+        body = w.add_circle_body(player, radius_px=10, mask=0xFFFF)
+        body.linearVelocity = (1.0, 0.0)
+        enemies = [DummyEntity(104 + (i % 5), 97 + (i // 16)) for i in range(80)]
+        for enemy in enemies:
+            w.add_entity_body(enemy, radius_px=6, category=CollisionCategory.ENEMY,
+                              sensor_mask=CollisionCategory.PLAYER)
+        for _ in range(10):
+            w.step(1.0 / 60.0)
+
+        begins = [e for e in w.drain_contact_events() if e.phase == CONTACT_BEGIN]
+        self.assertEqual(len(begins), 80)
+        first = begins[0]
+        self.assertTrue(first.sensor)
+        self.assertEqual(first.category_a | first.category_b,
+                         CollisionCategory.PLAYER | CollisionCategory.ENEMY)
+        self.assertGreater(first.approach_speed, 0.0)
+        self.assertEqual(w.drain_contact_events(), [])
+
+        w.remove_entity(enemies[0])
+        ends = w.drain_contact_events()
+        self.assertEqual([e.phase for e in ends], [CONTACT_END])
+        self.assertIn(enemies[0], (ends[0].entity_a, ends[0].entity_b))
+
+    @unittest.skipUnless(BOX2D_AVAILABLE, "Box2D not available in this environment")
+    def test_step_policies_bound_the_backlog_and_report_dropped_time(self):
+        dt = 1.0 / 60.0
+        expected = {
+            # policy: (accumulator after a 0.1 s hitch, dropped seconds)
+            "drop": (0.0, 0.1 - 2 * dt),
+            "catch_up": (2 * dt, 0.1 - 4 * dt),
+            "clamp": (0.05 - 2 * dt, 0.1 - 0.05),
+        }
+        self.assertEqual(set(expected), set(STEP_POLICIES))
+        for policy, (accumulator, dropped) in expected.items():
+            w = Box2DPhysicsWorld(fixed_dt=dt, max_substeps=2, step_policy=policy, max_frame_dt=0.05)
+            w.add_circle_body(DummyEntity(50, 50), radius_px=8)
+            w.step(0.1)
+            metrics = w.get_metrics()
+            self.assertEqual(w.last_substeps, 2, policy)
+            self.assertAlmostEqual(w.accumulator, accumulator, places=6, msg=policy)
+            self.assertAlmostEqual(metrics["physics_dropped_ms"], dropped * 1000.0, places=3, msg=policy)
+            self.assertLess(metrics["physics_time_dilation"], 1.0, policy)
+
+        with self.assertRaises(ValueError):
+            Box2DPhysicsWorld(step_policy="spiral")
+
+    @unittest.skipUnless(BOX2D_AVAILABLE, "Box2D not available in this environment")
+    def test_substeps_fall_back_to_normal_after_slow_frames(self):
+        dt = 1.0 / 60.0
+        for policy in STEP_POLICIES:
+            w = Box2DPhysicsWorld(fixed_dt=dt, max_substeps=5, step_policy=policy)
+            w.add_circle_body(DummyEntity(50, 50), radius_px=8)
+            for _ in range(10):
+                w.step(0.2)
+                self.assertEqual(w.last_substeps, 5, policy)
+            self.assertLess(w.get_metrics()["physics_time_dilation"], 1.0, policy)
+
+            substeps = []
+            for _ in range(10):
+                w.step(dt)
+                substeps.append(w.last_substeps)
+            if policy != "clamp":
+                # At most one extra step per frame pays back the debt, then back to one
+                self.assertLessEqual(max(substeps), 2, policy)
+            self.assertEqual(substeps[-5:], [1] * 5, policy)
+            self.assertLess(w.accumulator + 1e-9, dt, policy)
+
+    @unittest.skipUnless(BOX2D_AVAILABLE, "Box2D not available in this environment")
+    def test_clamp_pays_back_the_hitch_that_drop_discards(self):
+        dt = 1.0 / 60.0
+        simulated = {}
+        for policy in ("drop", "clamp"):
+            w = Box2DPhysicsWorld(fixed_dt=dt, max_substeps=5, step_policy=policy)
+            w.add_circle_body(DummyEntity(50, 50), radius_px=8)
+            substeps = []
+            for frame_dt in [0.2] + [dt] * 10 + [0.5] + [dt] * 10:
+                w.step(frame_dt)
+                substeps.append(w.last_substeps)
+            simulated[policy] = sum(substeps)
+            self.assertEqual(substeps[-3:], [1, 1, 1], policy)
+
+        # drop: 5 steps per hitch; clamp: the whole 0.2 s hitch and 0.25 s
+        # (max_frame_dt) of the 0.5 s one
+        self.assertEqual(simulated["drop"], 5 + 10 + 5 + 10)
+        self.assertEqual(simulated["clamp"], 12 + 10 + 15 + 10)
+
+    @unittest.skipUnless(BOX2D_AVAILABLE, "Box2D not available in this environment")
+    def test_snapshot_restore_replays_the_same_steps(self):
+        e = DummyEntity(100, 100)
+        gone = DummyEntity(300, 100)
+        w = Box2DPhysicsWorld(fixed_dt=1.0 / 60.0)
+        body = w.add_circle_body(e, radius_px=8, mass=1.0)
+        w.add_circle_body(gone, radius_px=8, mass=1.0)
+        body.linearVelocity = (3.0, -1.0)
+        w.step(0.025)
+        snapshot = w.snapshot()
+        start = (e.pos.x, e.pos.y)
+
+        w.step(0.1)
+        after = (e.pos.x, e.pos.y, body.linearVelocity.x)
+        w.remove_entity(gone)
+        body.linearVelocity = (-5.0, 0.0)
+
+        missing = w.restore(snapshot)
+        self.assertEqual(missing, [gone])
+        self.assertEqual((e.pos.x, e.pos.y), start)
+        self.assertAlmostEqual(w.accumulator, snapshot.accumulator)
+        w.step(0.1)
+        self.assertEqual((e.pos.x, e.pos.y, body.linearVelocity.x), after)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,97 @@
+import os
+import sys
+import unittest
+
+import pygame
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from Collision.collisions import SpatialHash
+from Collision.events import KillQueue
+from Collision.layers import CollisionCategory, CollisionMatrix, build_collision_matrix
+from Collision.separation import CrowdSeparator
+
+
+class _Box:
+    def __init__(self, x, y, w=10, h=10):
+        self.rect = pygame.Rect(x, y, w, h)
+
+
+class _Body:
+    def __init__(self, x, y, radius=20):
+        self.pos = pygame.Vector2(x, y)
+        self.vel = pygame.Vector2()
+        self.collision_radius = radius
+        self.rect = pygame.Rect(0, 0, radius * 2, radius * 2)
+        self.rect.center = (x, y)
+
+
+class CrowdSeparatorTests(unittest.TestCase):
+    def test_budget_bounds_each_pass_and_crowd_relaxes_over_ticks(self):
+        crowd = [_Body(100 + i, 100) for i in range(4)]
+        boss = _Body(104, 100, radius=60)
+        index = SpatialHash()
+        separator = CrowdSeparator(pair_budget=2, frac=1.0)
+        pinned = lambda body: body is boss
+
+        for _ in range(30):
+            index.sync(crowd + [boss])
+            separator.resolve(crowd + [boss], index, is_pinned=pinned)
+            self.assertLessEqual(separator.last_pair_tests, 2)
+
+        self.assertEqual(boss.pos, pygame.Vector2(104, 100))
+        for i, a in enumerate(crowd):
+            for b in crowd[i + 1:]:
+                self.assertGreaterEqual(a.pos.distance_to(b.pos), 39.0)
+
+
+class CollisionMatrixTests(unittest.TestCase):
+    def test_meteors_only_hit_enemies_on_test2(self):
+        normal = build_collision_matrix()
+        test2 = build_collision_matrix(meteors_hit_enemies=True)
+
+        self.assertTrue(normal.can_collide(CollisionCategory.PROJECTILE, CollisionCategory.BOMB))
+        self.assertFalse(normal.can_collide(CollisionCategory.METEOR, CollisionCategory.ENEMY))
+        self.assertTrue(test2.can_collide(CollisionCategory.ENEMY, CollisionCategory.METEOR))
+        self.assertFalse(normal.can_collide(CollisionCategory.PROJECTILE, CollisionCategory.PLAYER))
+        # The player's Box2D mask comes straight from the matrix, sensors included
+        self.assertTrue(normal.mask(CollisionCategory.PLAYER) & CollisionCategory.SENSOR)
+        self.assertFalse(normal.can_collide(CollisionCategory.ENEMY, CollisionCategory.SENSOR))
+
+    def test_mask_matches_pairs_and_disable_is_symmetric(self):
+        matrix = CollisionMatrix(rules=[
+            (CollisionCategory.PLAYER, CollisionCategory.ENEMY),
+            (CollisionCategory.PLAYER, CollisionCategory.METEOR),
+        ])
+        self.assertEqual(matrix.mask(CollisionCategory.PLAYER), CollisionCategory.ENEMY | CollisionCategory.METEOR)
+
+        copy = matrix.copy().disable(CollisionCategory.METEOR, CollisionCategory.PLAYER)
+        self.assertFalse(copy.can_collide(CollisionCategory.PLAYER, CollisionCategory.METEOR))
+        self.assertTrue(matrix.can_collide(CollisionCategory.PLAYER, CollisionCategory.METEOR))
+        self.assertEqual(copy.pairs(), [(CollisionCategory.PLAYER, CollisionCategory.ENEMY)])
+
+
+class KillQueueTests(unittest.TestCase):
+    def test_duplicate_kills_are_dropped_and_sweep_keeps_survivor_order(self):
+        a, b, c, d = (_Box(i * 20, 0) for i in range(4))
+        enemies = [a, b, c, d]
+        queue = KillQueue()
+
+        self.assertTrue(queue.kill(c, c.rect.center, cause="bullet"))
+        self.assertFalse(queue.kill(c, c.rect.center, points=5, cause="meteor"))
+        self.assertTrue(queue.kill(a, a.rect.center))
+        self.assertIn(c, queue)
+
+        self.assertEqual(queue.sweep(enemies), 2)
+        self.assertEqual(enemies, [b, d])
+        events = queue.drain()
+        self.assertEqual([(e.entity, e.cause, e.points) for e in events], [(c, "bullet", 1), (a, "", 1)])
+        self.assertNotIn(c, queue)
+        self.assertEqual(len(queue), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,6 +11,7 @@ if PROJECT_ROOT not in sys.path:
 
 SPRITE_ROOT = os.path.join(PROJECT_ROOT, "images", "Space-Shooter_objects")
 
+from Collision.collisions import SpatialHash
 from Hazards.hazard_system import HazardSpriteLibrary, HazardSystem, MeteorHazard
 
 
@@ -101,6 +102,26 @@ class TestHazardSystem(unittest.TestCase):
         self.assertEqual(len(children), 2)
         self.assertTrue(all(ch.tier == 2 for ch in children))
 
+    def test_mine_arms_from_enemy_index_and_meteor_list_is_kept(self):
+        config = dict(TEST_HAZARD_CONFIG, bomb_family="2", mine_auto_arm_seconds=99.0)
+        hs = HazardSystem(world_size=(2000, 2000), sprite_root=SPRITE_ROOT, config=config)
+        meteors = hs.meteors
+        hs.spawn_meteor(tier=1, center=(1800, 1800), velocity=(0, 0))
+        mine = hs.spawn_bomb((400, 400))
+        player = DummyPlayer(1500, 100)
+
+        enemy = DummyPlayer(1000, 1000)
+        enemies = SpatialHash()
+        enemies.insert(enemy)
+        hs.update(100, player, [], boss_positions=[], enemy_index=enemies)
+        self.assertEqual(mine.state, mine.STATE_IDLE)
+
+        enemy.rect.center = (450, 430)
+        enemies.move(enemy)
+        hs.update(100, player, [], boss_positions=[], enemy_index=enemies)
+        self.assertNotEqual(mine.state, mine.STATE_IDLE)
+        self.assertIs(hs.meteors, meteors)
+
 
 if __name__ == "__main__":
     unittest.main()
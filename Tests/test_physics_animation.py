@@ -0,0 +1,104 @@
+import os
+import sys
+import unittest
+
+import pygame
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from Enemies.enemy import Enemy
+from Physics.animation import BounceAnimator, DampedOscillator, OscillatorPool
+
+
+_SPECS = [
+    ((100.0, 200.0), (30.0, 0.0), 1.0, 2.0, 2.2),
+    ((400.0, 50.0), (-12.0, 18.0), 0.5, 3.0, 1.5),
+    ((0.0, 0.0), (5.0, -5.0), 2.0, 1.0, 4.0),
+]
+
+
+class OscillatorPoolTests(unittest.TestCase):
+    def _assert_matches_objects(self, pool):
+        oscillators = [DampedOscillator(*spec) for spec in _SPECS]
+        for i, spec in enumerate(_SPECS):
+            pool.start(i, *spec)
+
+        dt = 1.0 / 60.0
+        for _ in range(150):
+            positions = pool.advance(dt)
+            for i, osc in enumerate(oscillators):
+                if not osc.is_active():
+                    self.assertNotIn(i, positions)
+                    continue
+                expected = osc.update(dt)
+                self.assertAlmostEqual(positions[i][0], expected.x, places=6)
+                self.assertAlmostEqual(positions[i][1], expected.y, places=6)
+                self.assertEqual(i in pool.finished, not osc.is_active())
+        self.assertEqual(len(pool), 0)
+
+    def test_closed_form_matches_damped_oscillator(self):
+        self._assert_matches_objects(OscillatorPool())
+
+    def test_numpy_batch_matches_damped_oscillator(self):
+        pool = OscillatorPool()
+        if pool._array is None:
+            self.skipTest("NumPy not available in this environment")
+        pool.NUMPY_MIN_ACTIVE = 1
+        self._assert_matches_objects(pool)
+
+    def test_finished_rows_are_recycled(self):
+        pool = OscillatorPool(capacity=2)
+        pool.start("a", (0, 0), (10, 0), duration=0.1)
+        pool.start("b", (0, 0), (10, 0), duration=1.0)
+        pool.advance(0.2)
+
+        self.assertEqual(pool.finished, ["a"])
+        self.assertEqual(pool.positions["a"], (0.0, 0.0))
+        self.assertEqual(pool.start("c", (5, 5), (1, 1)), 0)
+        self.assertEqual(pool.recycled, 1)
+        self.assertEqual(pool.positions["c"], (6.0, 6.0))
+        # Restarting an active owner reuses its row.
+        self.assertEqual(pool.start("b", (0, 0), (2, 0)), 1)
+        self.assertEqual(len(pool), 2)
+
+    def test_state_roundtrip_replays_the_same_positions(self):
+        pool = OscillatorPool()
+        for i, spec in enumerate(_SPECS):
+            pool.start(i, *spec)
+        pool.advance(0.1)
+        state = pool.get_state()
+        expected = [dict(pool.advance(0.05)) for _ in range(5)]
+
+        pool.set_state(state)
+        self.assertEqual([dict(pool.advance(0.05)) for _ in range(5)], expected)
+
+    def test_bounce_animator_and_enemy_use_the_pool(self):
+        animator = BounceAnimator()
+        animator.add_oscillation("wing", (10, 10), (4, 0), duration=0.2)
+        self.assertIsInstance(animator.update(0.1)["wing"], pygame.Vector2)
+        self.assertEqual(animator.update(0.2), {})
+        self.assertFalse(animator.has_active())
+
+        pool = OscillatorPool()
+        enemy = Enemy(pygame.Surface((32, 32)), 100, 100)
+        pos = enemy.pos
+        enemy.start_collision_bounce((100, 100), (20, 0), duration=0.5, pool=pool)
+        self.assertIsNone(enemy.oscillator)
+        pool.advance(0.25)
+        enemy.update(250)
+        self.assertIs(enemy.pos, pos)
+        self.assertEqual(enemy.pos, pygame.Vector2(pool.positions[enemy]))
+
+        pool.advance(0.5)
+        enemy.update(16)
+        self.assertEqual(enemy.pos, pygame.Vector2(100, 100))
+        pool.advance(0.016)
+        enemy.update(16)
+        self.assertIsNone(enemy.bounce_pool)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+import pygame
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from Physics.batch import NUMPY_AVAILABLE, RigidBodyArray
+from Physics.core import RigidBody
+from Physics import forces as forces_module
+from Physics.forces import Drag, Force, ForceFieldRegistry, Gravity, Magnetism, RadialMagnet, Spring, Thrust
+
+
+def _bodies():
+    bodies = []
+    for i in range(6):
+        body = RigidBody(10.0 * i, 5.0 * i, mass=1.0 + i * 0.25)
+        body.vel.update(80.0 * (i - 2), 40.0 * i)
+        body.max_speed = 150.0 if i % 2 else None
+        bodies.append(body)
+    bodies[3].is_dynamic = False
+    return bodies
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "NumPy not available in this environment")
+class RigidBodyArrayTests(unittest.TestCase):
+    def test_integrate_matches_per_object_update(self):
+        objects = _bodies()
+        batched = _bodies()
+        batch = RigidBodyArray(capacity=2)
+        for body in batched:
+            batch.add(body)
+
+        dt = 1.0 / 60.0
+        for frame in range(30):
+            for a, b in zip(objects, batched):
+                a.add_force(Drag(coefficient=0.3))
+                b.add_force(Drag(coefficient=0.3))
+                a.update(dt)
+            pos_before = batched[0].pos
+            batch.integrate(dt)
+            self.assertIs(batched[0].pos, pos_before)
+
+        for a, b in zip(objects, batched):
+            self.assertAlmostEqual(a.pos.x, b.pos.x, places=6)
+            self.assertAlmostEqual(a.pos.y, b.pos.y, places=6)
+            self.assertAlmostEqual(a.vel.x, b.vel.x, places=6)
+            self.assertEqual(len(b.forces), len(a.forces))
+        self.assertLessEqual(batched[1].vel.length(), 150.0 + 1e-6)
+
+    def test_per_row_dt_matches_update_and_zero_rows_stay_put(self):
+        objects = _bodies()
+        batched = _bodies()
+        batch = RigidBodyArray()
+        for body in batched:
+            batch.add(body)
+        row_dt = [0.02, 0.0, 0.05, 0.02, 0.0, 0.01]
+        for body in batched:
+            body.add_force(Drag(coefficient=0.3))
+
+        self.assertEqual(batch.integrate(row_dt), 3)  # row 3 is static
+        for a, b, dt in zip(objects, batched, row_dt):
+            if dt and b.is_dynamic:
+                a.add_force(Drag(coefficient=0.3))
+                a.update(dt)
+                self.assertEqual(b.forces, [])
+            elif not dt:
+                self.assertEqual(len(b.forces), 1)
+            self.assertAlmostEqual(a.pos.x, b.pos.x, places=6)
+            self.assertAlmostEqual(a.pos.y, b.pos.y, places=6)
+            self.assertAlmostEqual(a.vel.x, b.vel.x, places=6)
+
+    def test_remove_keeps_rows_packed(self):
+        bodies = _bodies()
+        batch = RigidBodyArray()
+        for body in bodies:
+            batch.add(body)
+        self.assertTrue(batch.remove(bodies[1]))
+        self.assertFalse(batch.remove(bodies[1]))
+        self.assertEqual(len(batch), 5)
+        self.assertNotIn(bodies[1], batch)
+        row = batch.bodies.index(bodies[-1])
+        self.assertEqual(tuple(batch.pos[row]), (bodies[-1].pos.x, bodies[-1].pos.y))
+
+        before = pygame.Vector2(bodies[1].pos)
+        batch.integrate(0.1)
+        self.assertEqual(bodies[1].pos, before)
+
+
+    def test_sync_adds_new_and_drops_missing_bodies(self):
+        bodies = _bodies()
+        batch = RigidBodyArray()
+        batch.sync(bodies[:4])
+
+        added, removed = batch.sync(bodies[2:])
+        self.assertEqual(added, bodies[4:])
+        self.assertEqual(removed, bodies[:2])
+        self.assertEqual(sorted(map(id, batch.bodies)), sorted(map(id, bodies[2:])))
+        self.assertEqual(batch.sync(bodies[2:]), ([], []))
+
+
+class _Wind(Force):
+    def get_force(self, body, dt):
+        return pygame.Vector2(3.0, -1.0) + body.vel * 0.1
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "NumPy not available in this environment")
+class ForceFieldTests(unittest.TestCase):
+    def test_batched_forces_match_get_force(self):
+        import numpy as np
+
+        target = RigidBody(300, 200)
+        fields = [
+            Gravity((120, 80), strength=5000),
+            Drag(coefficient=0.2),
+            Magnetism(target, strength=200, min_distance=50),
+            Thrust((1, 1), 40),
+            Spring((50, 50), stiffness=3, damping=0.5),
+            _Wind(),
+            RadialMagnet(RigidBody(30, 20), radius=200.0, strength=90.0, min_distance=40.0),
+        ]
+        bodies = _bodies() + [RigidBody(120, 80), RigidBody(290, 195)]
+        positions = np.array([(b.pos.x, b.pos.y) for b in bodies])
+        velocities = np.array([(b.vel.x, b.vel.y) for b in bodies])
+        masses = np.array([b.mass for b in bodies])
+
+        for field in fields:
+            acc = np.zeros((len(bodies), 2))
+            field.apply(positions, velocities, masses, acc)
+            for i, body in enumerate(bodies):
+                f = field.get_force(body, 0.0)
+                self.assertAlmostEqual(acc[i, 0], f.x / body.mass, places=9, msg=type(field).__name__)
+                self.assertAlmostEqual(acc[i, 1], f.y / body.mass, places=9, msg=type(field).__name__)
+
+    def test_registry_in_batch_step_matches_add_force(self):
+        target = RigidBody(400, 300)
+        registry = ForceFieldRegistry([Gravity((200, 100), strength=20000), Magnetism(target, 150)])
+        objects = _bodies()
+        batched = _bodies()
+        batch = RigidBodyArray()
+        for body in batched:
+            batch.add(body)
+
+        dt = 1.0 / 60.0
+        for _ in range(20):
+            for body in objects:
+                for field in registry.fields:
+                    body.add_force(field)
+                body.update(dt)
+            batch.integrate(dt, registry)
+
+        for a, b in zip(objects, batched):
+            self.assertAlmostEqual(a.pos.x, b.pos.x, places=6)
+            self.assertAlmostEqual(a.pos.y, b.pos.y, places=6)
+
+    def test_radial_magnet_matches_straight_enemy_steering(self):
+        from Enemies.EnemyAI import StraightEnemy
+
+        player = pygame.sprite.Sprite()
+        player.rect = pygame.Rect(0, 0, 20, 20)
+        player.rect.center = (500, 400)
+        magnet = RadialMagnet(player)
+        enemy = StraightEnemy(pygame.Surface((16, 16)), 0, 0)
+        for x, y in ((100, 120), (470, 390), (520, 400), (2000, 50)):
+            enemy.pos.update(x, y)
+            expected = enemy._steering_accel(player)
+            f = magnet.get_force(enemy, 0.0)
+            self.assertAlmostEqual(f.x, expected.x, places=9)
+            self.assertAlmostEqual(f.y, expected.y, places=9)
+
+
+class NumpyMissingTests(unittest.TestCase):
+    def test_batched_force_paths_raise_runtime_error(self):
+        with mock.patch.object(forces_module, "np", None):
+            with self.assertRaises(RuntimeError):
+                _Wind().forces([(0.0, 0.0)], [(0.0, 0.0)])
+            with self.assertRaises(RuntimeError):
+                ForceFieldRegistry([_Wind()]).apply([(0.0, 0.0)], [(0.0, 0.0)], [1.0], [[0.0, 0.0]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import os
+import sys
+import unittest
+
+import pygame
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from Enemies.EnemyAI import ChaseEnemy
+from Physics.lod import LOD_FULL, LOD_HALF, LOD_QUARTER, LODScheduler
+
+
+class _Entity:
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(0, 0, 40, 40)
+        self.rect.center = (x, y)
+
+
+class LODSchedulerTests(unittest.TestCase):
+    def setUp(self):
+        self.view = pygame.Rect(0, 0, 800, 600)
+        self.lod = LODScheduler(far_distance=1500, view_margin=100)
+
+    def _run(self, entities, ticks, dt=10.0, pinned=()):
+        received = {entity: [] for entity in entities}
+        for _ in range(ticks):
+            self.lod.begin_tick(self.view, self.view.center)
+            for entity in entities:
+                step = self.lod.due(entity, dt, pinned=entity in pinned)
+                if step is not None:
+                    received[entity].append(step)
+        return received
+
+    def test_tiers_follow_view_margin_and_distance(self):
+        self.lod.begin_tick(self.view, self.view.center)
+
+        self.assertEqual(self.lod.tier_of(_Entity(400, 300)), LOD_FULL)
+        self.assertEqual(self.lod.tier_of(_Entity(880, 300)), LOD_FULL)
+        self.assertEqual(self.lod.tier_of(_Entity(1200, 300)), LOD_HALF)
+        self.assertEqual(self.lod.tier_of(_Entity(2400, 300)), LOD_QUARTER)
+
+    def test_skipped_ticks_accumulate_into_the_next_update(self):
+        near, mid, far, boss = _Entity(400, 300), _Entity(1200, 300), _Entity(2400, 300), _Entity(2400, 900)
+
+        received = self._run([near, mid, far, boss], ticks=8, pinned=(boss,))
+
+        self.assertEqual(received[near], [10.0] * 8)
+        self.assertEqual(received[boss], [10.0] * 8)
+        self.assertEqual(len(received[mid]), 4)
+        self.assertEqual(len(received[far]), 2)
+        # Ei hukattua aikaa: jokainen päivitys sisältää edelliset ohitetut tickit.
+        self.assertTrue(all(step == 20.0 for step in received[mid][1:]))
+        self.assertTrue(all(step == 40.0 for step in received[far][1:]))
+        self.assertLessEqual(sum(received[far]), 80.0)
+
+        self.lod.begin_tick(self.view, self.view.center)
+        metrics = self.lod.get_metrics()
+        self.assertEqual((metrics["lod_full"], metrics["lod_half"], metrics["lod_quarter"]), (2, 1, 1))
+        self.assertEqual(metrics["lod_skipped"], self.lod.last_skipped)
+
+    def test_entity_entering_the_view_flushes_its_backlog(self):
+        entity = _Entity(2400, 300)
+        self._run([entity], ticks=2)
+        entity.rect.center = (400, 300)
+
+        self.lod.begin_tick(self.view, self.view.center)
+        step = self.lod.due(entity, 10.0)
+
+        self.assertIsNotNone(step)
+        self.assertGreaterEqual(step, 10.0)
+        self.assertIsNotNone(self.lod.due(_Entity(400, 300), 10.0))
+
+    def test_far_enemies_steer_less_often_but_keep_moving(self):
+        lod = LODScheduler(far_distance=1500, view_margin=100, steer_distance=300)
+        player = _Entity(400, 300)
+        near = ChaseEnemy(pygame.Surface((32, 32)), 500, 300)
+        far = ChaseEnemy(pygame.Surface((32, 32)), 850, 300)
+        steered = {near: 0, far: 0}
+        for _ in range(8):
+            lod.begin_tick(self.view, player.rect.center)
+            for enemy in (near, far):
+                self.assertEqual(lod.due(enemy, 10.0), 10.0)
+                enemy.steer_this_tick = lod.steer_due(enemy)
+                steered[enemy] += enemy.steer_this_tick
+                enemy.update(10.0, player)
+
+        self.assertEqual(steered[near], 8)
+        self.assertEqual(steered[far], 4)
+        self.assertAlmostEqual(far.pos.x, 850 - 8 * far.speed * 0.01, places=6)
+
+        # Between steering ticks the cached direction is kept even if the player moves.
+        far.steer_this_tick = False
+        player.rect.center = (1000, 2000)
+        far.update(10.0, player)
+        self.assertEqual(far.vel.y, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
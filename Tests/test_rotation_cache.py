@@ -0,0 +1,60 @@
+import os
+import sys
+import unittest
+
+import pygame
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from rotation_cache import RotationCache
+
+
+class RotationCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.image = pygame.Surface((40, 20), pygame.SRCALPHA)
+        self.image.fill((255, 0, 0, 255))
+
+    def test_angles_in_the_same_step_share_one_surface(self):
+        cache = RotationCache(step_deg=3.0)
+
+        first = cache.rotozoom(self.image, 44.2)
+        self.assertIs(cache.rotozoom(self.image, 45.4), first)
+        self.assertIsNot(cache.rotozoom(self.image, 47.0), first)
+        self.assertEqual(first.get_size(), pygame.transform.rotozoom(self.image, 45.0, 1.0).get_size())
+        # rotate and rotozoom are different frames; a full turn maps onto the same step.
+        self.assertIsNot(cache.rotate(self.image, 45.0), first)
+        self.assertIs(cache.rotozoom(self.image, 45.0 - 360.0), first)
+        # Angles that round to zero need no rotation at all.
+        self.assertIs(cache.rotate(self.image, 1.2), self.image)
+
+        metrics = cache.get_metrics()
+        self.assertEqual((metrics["rotation_hits"], metrics["rotation_misses"]), (2, 3))
+        self.assertAlmostEqual(metrics["rotation_hit_rate"], 0.4)
+        self.assertEqual(metrics["rotation_entries"], 3)
+
+    def test_least_recently_used_frames_are_evicted_at_the_memory_cap(self):
+        probe = pygame.transform.rotate(self.image, 90.0)
+        frame_bytes = probe.get_width() * probe.get_height() * probe.get_bytesize()
+        cache = RotationCache(step_deg=90.0, max_bytes=frame_bytes * 2)
+
+        a = cache.rotate(self.image, 90.0)
+        cache.rotate(self.image, 180.0)
+        cache.rotate(self.image, 90.0)  # a is now the most recently used
+        cache.rotate(self.image, 270.0)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.evictions, 1)
+        self.assertLessEqual(cache.nbytes, cache.max_bytes)
+        self.assertIs(cache.rotate(self.image, 90.0), a)
+
+        cache.clear()
+        self.assertEqual((len(cache), cache.nbytes), (0, 0))
+        with self.assertRaises(ValueError):
+            RotationCache(step_deg=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,423 @@
+import os
+import random
+import sys
+import unittest
+from unittest import mock
+
+import pygame
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from Collision.collisions import HierarchicalSpatialHash, SpatialHash
+from frame_clock import FrameScheduler, SimulatedClock
+from Physics.snapshot import capture_state
+from simulation import SimulationRunner
+
+
+class SimulatedClockTests(unittest.TestCase):
+    def test_fractional_step_does_not_drift(self):
+        clock = SimulatedClock(1000.0 / 60.0)
+        for _ in range(60):
+            clock.tick(60)
+        self.assertEqual(clock.elapsed_ms, 1000)
+
+
+class _FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _SleepingClock:
+    """Clock stub that advances the fake timer by a fixed sleep per tick."""
+
+    def __init__(self, timer, sleep_s):
+        self.timer = timer
+        self.sleep_s = sleep_s
+        self.busy_calls = 0
+
+    def tick(self, framerate=0):
+        self.timer.now += self.sleep_s
+
+    def tick_busy_loop(self, framerate=0):
+        self.busy_calls += 1
+        self.tick(framerate)
+
+    def get_fps(self):
+        return 0.0
+
+
+class FrameSchedulerTests(unittest.TestCase):
+    def test_dt_is_work_plus_sleep(self):
+        timer = _FakeTimer()
+        scheduler = FrameScheduler("cap60", clock=_SleepingClock(timer, 0.010), timer=timer)
+        timer.now += 0.006  # update + draw
+        dt = scheduler.tick()
+
+        self.assertAlmostEqual(scheduler.work_ms, 6.0)
+        self.assertAlmostEqual(scheduler.sleep_ms, 10.0)
+        self.assertAlmostEqual(dt, 16.0)
+
+    def test_busy_mode_uses_busy_loop_and_unknown_mode_is_rejected(self):
+        timer = _FakeTimer()
+        clock = _SleepingClock(timer, 0.001)
+        scheduler = FrameScheduler("busy144", clock=clock, timer=timer)
+        scheduler.tick()
+        self.assertEqual(clock.busy_calls, 1)
+        self.assertEqual(scheduler.target_fps, 144)
+        with self.assertRaises(ValueError):
+            scheduler.set_mode("cap30")
+
+
+class _Target:
+    def __init__(self, x, y, w, h, state=''):
+        self.rect = pygame.Rect(x, y, w, h)
+        self.state = state
+
+
+class _Shot:
+    def __init__(self, start, end, size=(6, 6)):
+        self.prev_pos = pygame.Vector2(start)
+        self.pos = pygame.Vector2(end)
+        self.rect = pygame.Rect(0, 0, *size)
+        self.rect.center = (int(self.pos.x), int(self.pos.y))
+
+
+class SimulationRunnerTests(unittest.TestCase):
+    def test_headless_game_advances_without_drawing(self):
+        runner = SimulationRunner(level_number=1, seed=1)
+        start_time = runner.game.game_time
+        stats = runner.run(120)
+
+        self.assertEqual(stats["frames"], 120)
+        self.assertAlmostEqual(stats["simulated_s"], 2.0)
+        self.assertTrue(runner.game.game_time > start_time or stats["restarts"] > 0)
+
+    def test_frame_time_runs_fixed_ticks_and_keeps_remainder_as_alpha(self):
+        game = SimulationRunner(level_number=1, seed=1).game
+        game.reset_frame_timing()
+        start_time = game.game_time
+
+        game.update([], dt_ms=game.fixed_tick_ms * 2.5)
+
+        self.assertEqual(game.physics_metrics["ticks"], 2)
+        self.assertAlmostEqual(game.render_alpha, 0.5)
+        self.assertAlmostEqual(game.game_time - start_time, game.fixed_tick_ms * 2 / 1000.0)
+
+    def test_box2d_contacts_still_need_rect_overlap_for_damage(self):
+        runner = SimulationRunner(level_number=1, seed=1, restart_on_end=False, box2d_entities=True)
+        game = runner.game
+        runner.step()
+        runner.step()
+        self.assertTrue(game._box2d_entities_live)
+
+        # A reported sensor contact alone does not hurt: the rect test still decides.
+        center = pygame.Vector2(game.player.rect.center)
+        far = max(game.enemies, key=lambda enemy: center.distance_to(enemy.rect.center))
+        game._player_enemy_contacts[far] = None
+        health = game.player.health
+        runner.step()
+        self.assertEqual(game.player.health, health)
+        self.assertIn(far, game.enemies)
+
+        for _ in range(600):
+            runner.step()
+            if game.player.health < health:
+                break
+        self.assertLess(game.player.health, health)
+
+    def test_box2d_reports_enemies_touching_the_player_rect_corner(self):
+        runner = SimulationRunner(level_number=1, seed=1, restart_on_end=False, box2d_entities=True)
+        game = runner.game
+        runner.step()
+        runner.step()
+        self.assertTrue(game._box2d_entities_live)
+        player = game.player
+        enemy = game.enemies[0]
+        # Rects overlap by a few pixels at the corner, far outside collision_radius
+        offset = pygame.Vector2(
+            (player.rect.width + enemy.rect.width) / 2 - 4,
+            (player.rect.height + enemy.rect.height) / 2 - 4,
+        )
+        self.assertGreater(offset.length(), player.collision_radius + enemy.collision_radius)
+        enemy.pos.update(pygame.Vector2(player.rect.center) + offset)
+        enemy.vel.update(0, 0)
+        enemy.rect.center = (int(enemy.pos.x), int(enemy.pos.y))
+        game.physics_world.get_body(enemy).position = (
+            enemy.pos.x / game.physics_world.PPM,
+            enemy.pos.y / game.physics_world.PPM,
+        )
+        game.physics_world.world.Step(0.0, 1, 1)
+        game._consume_contact_events()
+        self.assertIn(enemy, game._player_enemy_contacts)
+
+    def test_random_path_enemies_are_integrated_as_one_batch(self):
+        game = SimulationRunner(level_number=1, seed=1, restart_on_end=False).game
+        if game.enemy_bodies is None:
+            self.skipTest("NumPy not available in this environment")
+        game.update([], dt_ms=game.fixed_tick_ms)
+
+        batched = [enemy for enemy in game.enemies if enemy.batch_physics]
+        self.assertTrue(batched)
+        self.assertEqual(len(game.enemy_bodies), len(batched))
+        for enemy in game.enemies:
+            self.assertIs(enemy.body_array, game.enemy_bodies if enemy.batch_physics else None)
+        # The default StraightEnemy magnet is applied to the batch as one field
+        self.assertIs(game.player_magnet.target, game.player)
+        self.assertIn(game.player_magnet, game.force_fields.fields)
+
+        game.USE_BATCH_PHYSICS = False
+        game.update([], dt_ms=game.fixed_tick_ms)
+        self.assertEqual(len(game.enemy_bodies), 0)
+        self.assertTrue(all(enemy.body_array is None for enemy in game.enemies))
+
+    def test_batched_enemy_trajectories_match_per_object_updates(self):
+        trajectories = {}
+        for batch in (True, False):
+            # One game at a time: both draw from the seeded random module
+            game = SimulationRunner(level_number=1, seed=4, restart_on_end=False).game
+            if game.enemy_bodies is None:
+                self.skipTest("NumPy not available in this environment")
+            game.USE_BATCH_PHYSICS = batch
+            # Other enemy types draw random numbers between the batched
+            # enemies' steering and their deferred wall/nudge step
+            game.enemies[:] = [enemy for enemy in game.enemies if enemy.batch_physics]
+            trajectory = []
+            for _ in range(180):
+                game.update([], dt_ms=game.fixed_tick_ms)
+                trajectory.append([(pygame.Vector2(e.pos), pygame.Vector2(e.vel)) for e in game.enemies])
+            trajectories[batch] = trajectory
+            if batch:
+                self.assertGreater(game.physics_metrics["batched_bodies"], 0)
+
+        for batched, unbatched in zip(trajectories[True], trajectories[False]):
+            self.assertEqual(len(batched), len(unbatched))
+            for (pos_a, vel_a), (pos_b, vel_b) in zip(batched, unbatched):
+                self.assertLess(pos_a.distance_to(pos_b), 1e-6)
+                self.assertLess(vel_a.distance_to(vel_b), 1e-6)
+
+    def test_hierarchical_grid_flag_gives_the_same_run(self):
+        states = []
+        for flag in ("0", "1"):
+            with mock.patch.dict(os.environ, {"RG_HIERARCHICAL_GRID": flag}):
+                runner = SimulationRunner(level_number=6, seed=3, restart_on_end=False, autofire=True)
+            game = runner.game
+            self.assertEqual(type(game.spatial_hash).__name__,
+                             "HierarchicalSpatialHash" if flag == "1" else "SpatialHash")
+            runner.run(240)
+            states.append((
+                [(enemy.rect.center, enemy.hp) for enemy in game.enemies],
+                game.pistejarjestelma.pisteet,
+            ))
+        self.assertEqual(states[0], states[1])
+
+    def test_spatial_bullet_broadphase_matches_brute_force(self):
+        game = SimulationRunner(level_number=1, seed=1, restart_on_end=False).game
+        rng = random.Random(7)
+        for trial in range(20):
+            enemies = [
+                _Target(rng.uniform(0, 800), rng.uniform(0, 600), rng.randint(8, 160), rng.randint(8, 160))
+                for _ in range(rng.randint(20, 60))
+            ]
+            enemy_bullets = [
+                _Target(rng.uniform(0, 800), rng.uniform(0, 600), 6, 6,
+                        state='explode' if rng.random() < 0.2 else '')
+                for _ in range(rng.randint(10, 40))
+            ]
+            bullets = []
+            for _ in range(40):
+                start = (rng.uniform(0, 800), rng.uniform(0, 600))
+                # Up to ~5 cells per tick, plus bullets that do not move at all
+                step = pygame.Vector2(rng.uniform(-300, 300), rng.uniform(-300, 300)) * rng.choice((0, 1, 1))
+                bullets.append(_Shot(start, step + start, size=rng.choice(((6, 6), (4, 16), (40, 40)))))
+            self.assertTrue(any(
+                abs(bullet.pos.x - bullet.prev_pos.x) > 2 * SpatialHash().cell_size for bullet in bullets
+            ))
+            game.kill_queue.clear()
+            for enemy in rng.sample(enemies, 3):
+                game.kill_queue.kill(enemy, enemy.rect.center)
+
+            game.spatial_hash = HierarchicalSpatialHash() if trial % 2 else SpatialHash()
+            game._bullet_target_groups = (enemy_bullets, enemies)
+            game._broadphase_active = False
+            brute = [game._scan_bullet_hit(bullet, *game._bullet_hit_candidates(bullet)) for bullet in bullets]
+            game._broadphase_active = True
+            game._build_projectile_broadphase()
+            spatial = [game._scan_bullet_hit(bullet, *game._bullet_hit_candidates(bullet)) for bullet in bullets]
+
+            self.assertEqual([hit[:3] for hit in spatial], [hit[:3] for hit in brute])
+            self.assertTrue(any(hit[1] is not None or hit[0] is not None for hit in brute))
+            self.assertLess(sum(hit[3] for hit in spatial), sum(hit[3] for hit in brute))
+
+    def test_default_lod_leaves_enemies_and_bombs_at_full_rate(self):
+        env = {k: v for k, v in os.environ.items() if k not in ("RG_PHYSICS_LOD", "RG_OFFSCREEN_LOD")}
+        with mock.patch.dict(os.environ, env, clear=True):
+            runner = SimulationRunner(level_number=6, seed=3, restart_on_end=False, autofire=True)
+        game = runner.game
+        self.assertTrue(game.USE_OFFSCREEN_LOD)
+        self.assertFalse(game.USE_PHYSICS_LOD)
+
+        lod_state = game.physics_lod._state
+        scheduled = 0
+        for _ in range(480):
+            runner.step()
+            self.assertTrue(all(enemy.steer_this_tick for enemy in game.enemies))
+            # Only meteors and enemy bullets go through the scheduler
+            self.assertFalse(any(enemy in lod_state for enemy in game.enemies))
+            self.assertFalse(any(bomb in lod_state for bomb in game.hazard_system.bombs))
+            scheduled = max(scheduled, len(lod_state))
+        self.assertFalse(game.hazard_system.lod_bombs)
+        self.assertGreater(scheduled, 0)
+
+
+class SnapshotTests(unittest.TestCase):
+    @staticmethod
+    def _state(game):
+        return (
+            [(enemy.rect.center, enemy.hp) for enemy in game.enemies],
+            [meteor.rect.center for meteor in game.meteors],
+            len(game.player.weapons.bullets),
+            game.pistejarjestelma.pisteet,
+            game.player.rect.center,
+            game.game_time,
+        )
+
+    @staticmethod
+    def _entity_state(game):
+        entities = [game.player, *game.enemies, *game.enemy_bullets, *game.meteors]
+        return [
+            (
+                entity,
+                capture_state(entity),
+                getattr(entity, "image", None),
+                list(getattr(entity, "forces", ())),
+                entity in game.bounce_pool,
+                getattr(entity, "bounce_pool", None),
+                getattr(entity, "body_array", None),
+            )
+            for entity in entities
+        ]
+
+    def test_restore_snapshot_restores_full_entity_state(self):
+        runner = SimulationRunner(level_number=6, seed=3, restart_on_end=False, box2d_entities=True)
+        game = runner.game
+        for _ in range(60):
+            runner.step()
+        self.assertTrue(game._box2d_entities_live)
+        snapshot = game.capture_snapshot()
+        expected = self._entity_state(game)
+        expected_bodies = set(game.physics_world.entity_to_body)
+
+        for _ in range(30):
+            runner.step()
+        first, last = game.enemies[0], game.enemies[-1]
+        first.add_force(object())
+        first.image = pygame.Surface((4, 4))
+        first.start_collision_bounce(first.pos, (12.0, 0.0), pool=game.bounce_pool)
+        game.enemies.remove(last)
+        game.physics_world.remove_entity(last)
+        if game.enemy_bodies is not None:
+            game.enemy_bodies.sync([e for e in game.enemies if e.batch_physics])
+
+        game.restore_snapshot(snapshot)
+        self.assertEqual(self._entity_state(game), expected)
+        # Bodies removed after the snapshot are back before the next tick
+        self.assertEqual(set(game.physics_world.entity_to_body), expected_bodies)
+        if game.enemy_bodies is not None:
+            self.assertEqual(
+                set(game.enemy_bodies.bodies),
+                {enemy for enemy in game.enemies if enemy.batch_physics},
+            )
+
+    def test_rollback_replays_the_same_ticks(self):
+        runner = SimulationRunner(level_number=6, seed=3, restart_on_end=False, autofire=True)
+        game = runner.game
+        for _ in range(60):
+            runner.step()
+        game.snapshots.push(game.capture_snapshot())
+        input_frame = game.player.input._frame
+
+        for _ in range(120):
+            runner.step()
+        expected = self._state(game)
+
+        self.assertTrue(game.rollback(0))
+        game.player.input._frame = input_frame
+        for _ in range(120):
+            runner.step()
+        self.assertEqual(self._state(game), expected)
+        self.assertFalse(game.rollback(len(game.snapshots)))
+
+    def test_periodic_snapshots_stay_within_the_ring(self):
+        runner = SimulationRunner(level_number=1, seed=1, restart_on_end=False)
+        game = runner.game
+        game.snapshot_interval_ticks = 5
+        runner.run(120)
+
+        self.assertEqual(len(game.snapshots), game.snapshots.capacity)
+        self.assertEqual(game.physics_metrics["snapshots"], game.snapshots.capacity)
+
+    def test_retry_wave_restores_wave_start_without_new_objects(self):
+        game = SimulationRunner(level_number=1, seed=2, restart_on_end=False).game
+        enemies = list(game.enemies)
+        start = [(enemy.rect.center, enemy.hp) for enemy in enemies]
+
+        for _ in range(90):
+            game.update([])
+        game.enemies.pop()
+        game.lives = 0
+
+        self.assertTrue(game.retry_wave())
+        self.assertEqual(game.lives, game.player.health)
+        self.assertEqual(len(game.enemies), len(enemies))
+        self.assertTrue(all(a is b for a, b in zip(game.enemies, enemies)))
+        self.assertEqual([(enemy.rect.center, enemy.hp) for enemy in game.enemies], start)
+        self.assertGreater(game.physics_metrics["snapshot_kb"], 0.0)
+
+    def test_retry_after_death_runs_every_tick_of_a_long_frame(self):
+        game = SimulationRunner(level_number=1, seed=2, restart_on_end=False).game
+        game.lives = 0
+        for _ in range(600):
+            game.update([], dt_ms=game.fixed_tick_ms)
+            if game.game_over:
+                break
+        self.assertTrue(game.game_over)
+        self.assertFalse(game.running)
+
+        self.assertTrue(game.retry_wave())
+        self.assertTrue(game.running)
+        self.assertFalse(game.game_over)
+        game.update([], dt_ms=game.fixed_tick_ms * 3.5)
+        self.assertEqual(game.physics_metrics["ticks"], 3)
+
+    def test_death_does_not_submit_score_until_the_run_ends(self):
+        game = SimulationRunner(level_number=1, seed=2, restart_on_end=False).game
+        game.headless = False
+        game.leaderboard = mock.Mock()
+        with mock.patch("RocketGame.get_current_player_name", return_value="pilot"), \
+                mock.patch("RocketGame.clear_current_player_name") as clear_name:
+            game.lives = 0
+            game.update([], dt_ms=game.fixed_tick_ms)
+            self.assertIsNotNone(game.player_death_menu_delay_remaining)
+            game.leaderboard.add_score.assert_not_called()
+
+            # Retrying the wave continues the same run: still nothing submitted
+            self.assertTrue(game.retry_wave())
+            game.leaderboard.add_score.assert_not_called()
+
+            self.assertTrue(game.submit_score())
+            self.assertFalse(game.submit_score())
+            game.leaderboard.add_score.assert_called_once()
+            clear_name.assert_called_once()
+
+            game.reset_game()
+            self.assertFalse(game.score_submitted)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+import os
+import sys
+import unittest
+
+import pygame
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from Collision.collisions import HierarchicalSpatialHash, SpatialHash, query_radius
+
+
+class _Box:
+    def __init__(self, x, y, w=10, h=10):
+        self.rect = pygame.Rect(x, y, w, h)
+
+
+class SpatialHashTests(unittest.TestCase):
+    def test_move_only_refiles_on_cell_change_and_remove_drops_entity(self):
+        index = SpatialHash(cell_size=64)
+        box = _Box(5, 5)
+        index.insert(box)
+
+        box.rect.x += 10
+        self.assertFalse(index.move(box))
+        box.rect.x = 200
+        self.assertTrue(index.move(box))
+        self.assertEqual(index.query(pygame.Rect(0, 0, 10, 10)), set())
+        self.assertEqual(index.query(pygame.Rect(200, 0, 10, 10)), {box})
+
+        self.assertTrue(index.remove(box))
+        self.assertEqual(index.query(pygame.Rect(200, 0, 10, 10)), set())
+        self.assertFalse(index.remove(box))
+
+    def test_moving_and_removing_entities_drops_emptied_cells(self):
+        index = SpatialHash(cell_size=32)
+        boxes = [_Box(x, 0, 40, 40) for x in range(0, 320, 64)]
+        index.sync(boxes)
+        for _ in range(10):
+            for box in boxes:
+                box.rect.move_ip(37, 23)
+            index.sync(boxes)
+            occupied = set()
+            for x1, y1, x2, y2 in index.items.values():
+                occupied.update((cx, cy) for cx in range(x1, x2 + 1) for cy in range(y1, y2 + 1))
+            self.assertEqual(set(index.grid), occupied)
+
+        index.sync([])
+        self.assertEqual(index.grid, {})
+
+    def test_callback_and_buffer_queries_report_multi_cell_entities_once(self):
+        index = SpatialHash(cell_size=32)
+        big = _Box(0, 0, 100, 100)
+        small = _Box(40, 40)
+        index.sync([big, small])
+
+        seen = []
+        index.query_each(pygame.Rect(0, 0, 128, 128), seen.append)
+        self.assertCountEqual(seen, [big, small])
+
+        out = []
+        index.query_into(pygame.Rect(0, 0, 128, 128), out)
+        self.assertCountEqual(out, [big, small])
+
+    def test_sync_removes_entities_that_left_the_set(self):
+        index = SpatialHash()
+        a, b = _Box(0, 0), _Box(300, 300)
+        index.sync([a, b])
+        index.sync([b])
+        self.assertNotIn(a, index)
+        self.assertEqual(len(index), 1)
+
+    def test_clear_drops_cells_and_entities(self):
+        index = SpatialHash(cell_size=32)
+        index.sync([_Box(x, 0) for x in range(0, 640, 64)])
+        index.clear()
+
+        self.assertEqual(len(index), 0)
+        self.assertEqual(index.grid, {})
+        box = _Box(5, 5)
+        index.insert(box)
+        self.assertEqual(index.query(pygame.Rect(0, 0, 10, 10)), {box})
+
+    def test_query_radius_matches_brute_force_annulus(self):
+        boxes = [_Box(x, y) for x in range(0, 600, 37) for y in range(0, 600, 41)]
+        center = (300, 280)
+        for index in (SpatialHash(), HierarchicalSpatialHash()):
+            index.sync(boxes)
+            hits = query_radius(index, center, 180, inner_radius=120)
+            expected = []
+            for box in boxes:
+                dx = box.rect.centerx - center[0]
+                dy = box.rect.centery - center[1]
+                if 120 * 120 <= dx * dx + dy * dy <= 180 * 180:
+                    expected.append(box)
+            self.assertCountEqual([hit[0] for hit in hits], expected)
+            entity, dx, dy, dist = hits[0]
+            self.assertAlmostEqual(dist, (dx * dx + dy * dy) ** 0.5)
+
+
+class HierarchicalSpatialHashTests(unittest.TestCase):
+    def test_entities_are_filed_by_size_and_refiled_when_they_grow(self):
+        grid = HierarchicalSpatialHash()
+        small = _Box(10, 10, 20, 20)
+        boss = _Box(600, 600, 400, 400)
+        grid.sync([small, boss])
+
+        self.assertIs(grid.level_of(small), grid.levels[0])
+        self.assertIs(grid.level_of(boss), grid.levels[-1])
+        self.assertEqual(grid.query(pygame.Rect(700, 700, 10, 10)), {boss})
+        out = grid.query_into(pygame.Rect(0, 0, 1000, 1000), [])
+        self.assertCountEqual(out, [small, boss])
+
+        small.rect.inflate_ip(200, 200)
+        self.assertTrue(grid.move(small))
+        self.assertEqual(grid.level_of(small).cell_size, 256)
+
+        grid.sync([boss])
+        self.assertNotIn(small, grid)
+        self.assertIsNone(grid.level_of(small))
+        self.assertEqual(grid.query(pygame.Rect(0, 0, 30, 30)), set())
+
+    def test_query_each_visits_each_entity_once_and_stops_early(self):
+        grid = HierarchicalSpatialHash()
+        boxes = [_Box(x, y, 20, 20) for x in range(0, 400, 50) for y in range(0, 400, 50)]
+        boxes += [_Box(100, 100, 300, 300), _Box(0, 0, 600, 600)]
+        grid.sync(boxes)
+        area = pygame.Rect(0, 0, 420, 420)
+
+        seen = []
+        visited = grid.query_each(area, seen.append)
+        self.assertEqual(visited, len(seen))
+        self.assertCountEqual(seen, grid.query(area))
+        self.assertEqual(len(seen), len(set(map(id, seen))))
+
+        first = []
+        self.assertEqual(grid.query_each(area, lambda entity: first.append(entity) or True), 1)
+        self.assertEqual(len(first), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
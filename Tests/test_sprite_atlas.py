@@ -0,0 +1,79 @@
+import os
+import sys
+import tempfile
+import unittest
+
+import pygame
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from sprite_atlas import SpriteAtlas
+
+
+def _frame(size, color):
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    surface.fill(color)
+    pygame.draw.circle(surface, (255, 255, 255, 128), (size[0] // 2, size[1] // 2), min(size) // 3)
+    return surface
+
+
+def _pixels(surface):
+    return pygame.image.tobytes(surface, "RGBA")
+
+
+class SpriteAtlasTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+
+    def setUp(self):
+        self.frames = [_frame((40, 30), (200, 40, 40, 255)), _frame((64, 64), (40, 200, 40, 90))]
+        self.big = _frame((150, 120), (40, 40, 200, 255))
+
+    def test_frames_are_packed_into_shared_pages_as_subsurfaces(self):
+        atlas = SpriteAtlas(page_size=256)
+
+        packed = atlas.pack("family", self.frames)
+        big = atlas.pack("big", [self.big])
+
+        self.assertEqual([_pixels(f) for f in packed], [_pixels(f) for f in self.frames])
+        self.assertIs(packed[0].get_parent(), packed[1].get_parent())
+        # Frames larger than half a page get a page of their own.
+        self.assertEqual(big[0].get_parent().get_size(), (150, 120))
+        self.assertEqual(len(atlas.pages), 2)
+        # The same subsurfaces come back on every lookup (rotation cache keys stay stable).
+        self.assertEqual([id(f) for f in atlas.family("family")], [id(f) for f in packed])
+        self.assertIsNone(atlas.family("missing"))
+
+        disabled = SpriteAtlas(enabled=False)
+        self.assertEqual(disabled.pack("family", self.frames), self.frames)
+        self.assertIsNone(disabled.family("family"))
+
+    def test_saved_atlas_reloads_and_rejects_stale_sources(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "frame.png")
+            pygame.image.save(self.frames[0], source)
+
+            atlas = SpriteAtlas(page_size=256)
+            atlas.pack("family", self.frames, sources=[source])
+            atlas.pack("big", [self.big])
+            atlas.save(os.path.join(tmp, "atlas"))
+
+            loaded = SpriteAtlas(directory=os.path.join(tmp, "atlas"))
+            frames = loaded.family("family", sources=[source])
+            self.assertEqual([_pixels(f) for f in frames], [_pixels(f) for f in self.frames])
+            self.assertEqual(loaded.prebuilt, 2)
+            # Only the page holding the requested family has been read from disk.
+            self.assertEqual(loaded.get_metrics()["atlas_pages_loaded"], 1)
+
+            pygame.image.save(self.big, source)
+            self.assertIsNone(loaded.family("family", sources=[source]))
+
+
+if __name__ == "__main__":
+    unittest.main()
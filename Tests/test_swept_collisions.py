@@ -0,0 +1,73 @@
+import os
+import sys
+import unittest
+
+import pygame
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from Collision.collisions import swept_bounds, swept_rect_toi
+from Collision.numpy_narrowphase import NUMPY_AVAILABLE, NumpyNarrowphase
+
+
+class _Box:
+    def __init__(self, x, y, w=10, h=10):
+        self.rect = pygame.Rect(x, y, w, h)
+
+
+class _Projectile:
+    def __init__(self, start, end, size=(6, 6)):
+        self.prev_pos = pygame.Vector2(start)
+        self.pos = pygame.Vector2(end)
+        self.rect = pygame.Rect(0, 0, *size)
+        self.rect.center = (int(self.pos.x), int(self.pos.y))
+
+
+class SweptCollisionTests(unittest.TestCase):
+    def test_fast_projectile_does_not_tunnel_through_thin_target(self):
+        target = pygame.Rect(100, 90, 8, 20)
+        bullet = _Projectile((60, 100), (160, 100))
+
+        self.assertFalse(bullet.rect.colliderect(target))
+        t = swept_rect_toi(bullet, target)
+        self.assertIsNotNone(t)
+        self.assertTrue(0.0 < t < 1.0)
+        self.assertTrue(swept_bounds(bullet).colliderect(target))
+
+    def test_miss_and_end_overlap_match_colliderect(self):
+        target = pygame.Rect(100, 90, 20, 20)
+        passing_above = _Projectile((60, 60), (160, 60))
+        self.assertIsNone(swept_rect_toi(passing_above, target))
+
+        ending_inside = _Projectile((100, 100), (110, 100))
+        self.assertTrue(ending_inside.rect.colliderect(target))
+        self.assertEqual(swept_rect_toi(ending_inside, target), 0.0)
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "NumPy not installed")
+class NumpyNarrowphaseTests(unittest.TestCase):
+    def test_batched_hits_match_scalar_sweep(self):
+        movers = [
+            _Projectile((0, 50), (200, 50)),      # tunnels through the thin wall
+            _Projectile((150, 0), (150, 0)),      # static, overlaps the box
+            _Projectile((300, 300), (320, 300)),  # misses everything
+            _Projectile((0, 150), (300, 150)),    # passes both boxes, wall first
+        ]
+        targets = [_Box(100, 0, 4, 200), _Box(140, -10, 40, 200)]
+
+        matrix = NumpyNarrowphase(capacity=1).toi_matrix(movers, targets)
+        for i, mover in enumerate(movers):
+            for j, target in enumerate(targets):
+                expected = swept_rect_toi(mover, target.rect)
+                self.assertEqual(expected, None if matrix[i, j] == float('inf') else matrix[i, j])
+
+        hits = NumpyNarrowphase().first_hits(movers, targets)
+        self.assertEqual([(i, j) for i, j, _t in hits], [(0, 0), (1, 1), (3, 0)])
+        self.assertEqual(hits[1][2], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,15 +14,18 @@ class GameOverScreen:
             panel_height,
         )
         button_width = 300
-        button_height = 78
-        button_spacing = 22
-        total_height = 3 * button_height + 2 * button_spacing
+        button_height = 66
+        button_spacing = 16
+        total_height = 4 * button_height + 3 * button_spacing
         start_y = self.panel_rect.top + 200 + (self.panel_rect.height - 270 - total_height) // 2
         center_x = screen_w // 2 - button_width // 2
+        step = button_height + button_spacing
+        # TRY AGAIN aloittaa tason alusta (uusi ajo), RETRY WAVE jatkaa samaa ajoa aallon alusta
         self.buttons = [
             MenuButton(center_x, start_y, button_width, button_height, "TRY AGAIN", action="TRY AGAIN", variant="success"),
-            MenuButton(center_x, start_y + button_height + button_spacing, button_width, button_height, "MAIN MENU", action="MAIN MENU"),
-            MenuButton(center_x, start_y + 2 * (button_height + button_spacing), button_width, button_height, "QUIT", action="QUIT", variant="danger"),
+            MenuButton(center_x, start_y + step, button_width, button_height, "RETRY WAVE", action="RETRY WAVE"),
+            MenuButton(center_x, start_y + 2 * step, button_width, button_height, "MAIN MENU", action="MAIN MENU"),
+            MenuButton(center_x, start_y + 3 * step, button_width, button_height, "QUIT", action="QUIT", variant="danger"),
         ]
     
     def handle_event(self, event):
@@ -77,6 +80,9 @@ class GameOverScreen:
                 if result == "TRY AGAIN":
                     print("Pelaa uudelleen -painiketta painettu")
                     return "play_again"
+                elif result == "RETRY WAVE":
+                    print("Aallon uusinta -painiketta painettu")
+                    return "retry_wave"
                 elif result == "MAIN MENU":
                     print("Päävalikko -painiketta painettu")
                     return "main_menu"
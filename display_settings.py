@@ -2,6 +2,8 @@ import json
 import os
 from copy import deepcopy
 
+from frame_clock import PACING_MODES
+
 
 SETTINGS_DIR = os.path.join(os.path.dirname(__file__), "SETTINGS-tiedostot")
 SETTINGS_FILE = os.path.join(SETTINGS_DIR, "display_settings.json")
@@ -11,6 +13,8 @@ DEFAULT_DISPLAY_SETTINGS = {
     "width": 1280,
     "height": 720,
     "fullscreen": False,
+    # FrameScheduler-tila: cap60/cap120/cap144/uncapped/busy60/busy120/busy144
+    "frame_pacing": "cap60",
 }
 
 SUPPORTED_RESOLUTIONS = [
@@ -55,10 +59,15 @@ def normalize_display_settings(settings):
     width, height = _closest_resolution(width, height)
     fullscreen = bool(data.get("fullscreen", False))
 
+    frame_pacing = str(data.get("frame_pacing", DEFAULT_DISPLAY_SETTINGS["frame_pacing"]))
+    if frame_pacing not in PACING_MODES:
+        frame_pacing = DEFAULT_DISPLAY_SETTINGS["frame_pacing"]
+
     return {
         "width": width,
         "height": height,
         "fullscreen": fullscreen,
+        "frame_pacing": frame_pacing,
     }
 
 
@@ -87,6 +96,10 @@ def load_display_settings():
 
 def save_display_settings(settings):
     path = _settings_path()
+    # Asetusvalikko ei tunne rytmitystilaa: säilytetään aiemmin tallennettu arvo.
+    if isinstance(settings, dict) and "frame_pacing" not in settings:
+        settings = dict(settings)
+        settings["frame_pacing"] = load_display_settings().get("frame_pacing")
     normalized = normalize_display_settings(settings)
     os.makedirs(os.path.dirname(path), exist_ok=True)
     with open(path, "w", encoding="utf-8") as fh:
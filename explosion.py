@@ -10,6 +10,8 @@ import re
 
 import pygame
 
+from sprite_atlas import SPRITE_ATLAS
+
 
 class Explosion:
     """Yksittäinen räjähdysanimaatio."""
@@ -97,15 +99,21 @@ class ExplosionManager:
             numbered_files.append((int(match.group(1)), filename))
 
         numbered_files.sort(key=lambda item: item[0])
+        paths = [os.path.join(folder, filename) for _, filename in numbered_files]
+
+        # Skaalatut ja taustasta puhdistetut kehykset tulevat valmiina atlaksesta.
+        atlas_key = f"explosion/{folder_name}@{size[0]}x{size[1]}"
+        frames = SPRITE_ATLAS.family(atlas_key, paths)
+        if frames is not None:
+            return frames
 
         frames = []
-        for _, filename in numbered_files:
-            path = os.path.join(folder, filename)
+        for path in paths:
             image = pygame.image.load(path).convert_alpha()
             image = pygame.transform.scale(image, size)
             image = cls._make_dark_background_transparent(image)
             frames.append(image)
-        return frames
+        return SPRITE_ATLAS.pack(atlas_key, frames, paths)
 
     def load_all_defaults(self):
         """Lataa boss/enemy/hit-kehykset valitusta spritekansiosta."""
@@ -0,0 +1,193 @@
+"""Pelin ajanotto: ruutuajastin ja ajettu kello headless-simulaatioon.
+
+`FrameScheduler` on pelin ainoa ruudunrytmittäjä. `GameStateManager` kutsuu
+sitä kerran per ruutu ja välittää saadun dt:n alaspäin
+(PlayState -> LevelManager.update -> Game.update), jolloin kaikki käyttävät
+samaa, oikeaa ruutuaikaa.
+
+`SimulatedClock` on pudotettava korvike `pygame.time.Clock`-oliolle. Se ei
+nuku eikä lue seinäkelloa, vaan palauttaa jokaisella `tick()`-kutsulla saman
+kiinteän aika-askeleen. Näin pelisilmukkaa voidaan ajaa nopeammin kuin
+reaaliajassa (benchmarkit, soak-testit) ilman että `Game.update()`-koodia
+tarvitsee muuttaa.
+"""
+
+import time
+
+import pygame
+
+
+# Rytmitystilat: nimi -> (fps-katto, käytetäänkö tick_busy_loopia).
+# fps 0 = ei kattoa.
+PACING_MODES = {
+    "cap60": (60, False),
+    "cap120": (120, False),
+    "cap144": (144, False),
+    "uncapped": (0, False),
+    "busy60": (60, True),
+    "busy120": (120, True),
+    "busy144": (144, True),
+}
+
+DEFAULT_PACING_MODE = "cap60"
+
+
+class FrameScheduler:
+    """Yksi ruutuajastin koko pelille.
+
+    `tick()` odottaa rytmitystilan mukaisesti ja palauttaa edellisestä
+    ruudusta kuluneen ajan millisekunteina (float). Samalla mitataan, kuinka
+    paljon ruudusta kului työhön (update + draw + flip) ja kuinka paljon
+    nukkumiseen/odottamiseen.
+
+    Args:
+        mode: jokin PACING_MODES-avaimista. busy*-tilat käyttävät
+            `tick_busy_loop`ia, joka polttaa CPU:ta mutta antaa tasaisemman
+            ruutuvälin kuin tavallinen sleep.
+        clock: valinnainen kello (oletus pygame.time.Clock).
+        timer: valinnainen sekuntiajastin (oletus time.perf_counter).
+    """
+
+    def __init__(self, mode=DEFAULT_PACING_MODE, clock=None, timer=None):
+        self.clock = clock if clock is not None else pygame.time.Clock()
+        self._timer = timer if timer is not None else time.perf_counter
+        self.mode = DEFAULT_PACING_MODE
+        self.target_fps = 60
+        self.busy_loop = False
+        self.set_mode(mode)
+
+        self.dt_ms = 0.0
+        self.work_ms = 0.0
+        self.sleep_ms = 0.0
+        self.frames = 0
+        self.total_work_ms = 0.0
+        self.total_sleep_ms = 0.0
+        self._last_tick = self._timer()
+
+    def set_mode(self, mode):
+        """Vaihda rytmitystila. Tuntematon nimi -> ValueError."""
+        if mode not in PACING_MODES:
+            raise ValueError(f"Unknown pacing mode {mode!r}, expected one of {sorted(PACING_MODES)}")
+        self.mode = mode
+        self.target_fps, self.busy_loop = PACING_MODES[mode]
+
+    def reset(self):
+        """Nollaa ruutuvälin mittaus (esim. tason latauksen jälkeen).
+
+        Estää pitkän latauksen näkymisen yhtenä valtavana dt:nä.
+        """
+        self._last_tick = self._timer()
+        self.clock.tick()
+
+    def tick(self):
+        """Odota rytmitystilan mukaan ja palauta ruudun dt (ms)."""
+        work_end = self._timer()
+        self.work_ms = (work_end - self._last_tick) * 1000.0
+
+        if self.busy_loop:
+            self.clock.tick_busy_loop(self.target_fps)
+        else:
+            self.clock.tick(self.target_fps)
+
+        now = self._timer()
+        self.sleep_ms = (now - work_end) * 1000.0
+        self.dt_ms = (now - self._last_tick) * 1000.0
+        self._last_tick = now
+
+        self.frames += 1
+        self.total_work_ms += self.work_ms
+        self.total_sleep_ms += self.sleep_ms
+        return self.dt_ms
+
+    def get_fps(self):
+        return self.clock.get_fps()
+
+    def get_stats(self):
+        """Viimeisimmän ruudun ja koko ajon työ/nukkumis-ajat."""
+        total = self.total_work_ms + self.total_sleep_ms
+        return {
+            "mode": self.mode,
+            "dt_ms": self.dt_ms,
+            "work_ms": self.work_ms,
+            "sleep_ms": self.sleep_ms,
+            "fps": self.get_fps(),
+            "frames": self.frames,
+            "work_share": self.total_work_ms / total if total > 0 else 0.0,
+        }
+
+
+class SimulatedClock:
+    """Kiinteällä askeleella etenevä kello, yhteensopiva pygame.time.Clockin kanssa.
+
+    `tick()` palauttaa kokonaislukumillisekunteja kuten pygame. Murto-osat
+    kerätään talteen, joten esim. 1000/60 ms askel tuottaa vuorotellen
+    16 ja 17 ms eikä simuloitu aika jätätä.
+    """
+
+    def __init__(self, dt_ms=1000.0 / 60.0):
+        self.dt_ms = max(0.0, float(dt_ms))
+        self.frames = 0
+        self.elapsed_ms = 0
+        self._carry_ms = 0.0
+        self._last_ms = 0
+
+    def tick(self, framerate=0):
+        """Etene yksi askel. `framerate` ohitetaan (ei nukuta)."""
+        self._carry_ms += self.dt_ms
+        step = int(self._carry_ms)
+        self._carry_ms -= step
+        self._last_ms = step
+        self.frames += 1
+        self.elapsed_ms += step
+        return step
+
+    def tick_busy_loop(self, framerate=0):
+        return self.tick(framerate)
+
+    def get_time(self):
+        return self._last_ms
+
+    def get_rawtime(self):
+        return self._last_ms
+
+    def get_fps(self):
+        return 1000.0 / self.dt_ms if self.dt_ms > 0 else 0.0
+
+
+class TimeDilationMeter:
+    """Seuraa, kuinka suuri osa todellisesta ajasta ehditään simuloida.
+
+    Kiinteän askeleen silmukka pudottaa aikaa, kun se jää liian kauas jälkeen
+    (spiral of death -suoja). `record(real, dropped)` kirjaa kutsun todellisen
+    ja pudotetun ajan; `dilation` on liukuva 1 - pudotettu / todellinen, eli
+    1.0 = simulaatio pysyy reaaliajassa, 0.5 = peli etenee puolella nopeudella.
+    Yksiköt ovat kutsujan (ms tai s), kunhan ne ovat samat.
+    """
+
+    def __init__(self, decay=0.9):
+        self.decay = float(decay)
+        self.reset()
+
+    def reset(self):
+        self.last_dropped = 0.0
+        self.total_dropped = 0.0
+        self._real = 0.0
+        self._dropped = 0.0
+
+    def record(self, real, dropped, deferred=0.0):
+        """Kirjaa kutsu; deferred = velaksi jäänyt aika (hidastaa, ei pudotettu)."""
+        real = max(0.0, float(real))
+        dropped = max(0.0, float(dropped))
+        self.last_dropped = dropped
+        self.total_dropped += dropped
+        self._real = self._real * self.decay + real
+        self._dropped = self._dropped * self.decay + dropped + max(0.0, float(deferred))
+
+    @property
+    def dilation(self):
+        if self._real <= 0.0:
+            return 1.0
+        return max(0.0, 1.0 - self._dropped / self._real)
+
+
+__all__ = ["FrameScheduler", "SimulatedClock", "TimeDilationMeter", "PACING_MODES", "DEFAULT_PACING_MODE"]
@@ -25,6 +25,9 @@ class ItemSpawner:
     VASTAA ITEMIEN LUOMISESTA, KERÄÄMISESTÄ JA ANIMAATIOISTA.
     """
 
+    # Physics.snapshot: pudotusajastimet kopioidaan vedokseen
+    SNAPSHOT_COPY = ("last_enemy_drop_time", "boss_drop_timers")
+
     # ========================================================================
     # ITEMIEN TYYPIT - MITKÄ BONUKSET PELAAJA VOI SAADA
     # ========================================================================
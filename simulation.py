@@ -0,0 +1,193 @@
+"""Headless-simulaatio: aja Game-silmukkaa ilman ikkunaa ja seinäkelloa.
+
+Käyttö komentoriviltä:
+
+    python simulation.py --level 1 --frames 3600
+
+Ajaa pelilogiikkaa (viholliset, ammukset, törmäykset, hazardit) kiinteällä
+aika-askeleella niin nopeasti kuin kone jaksaa ja tulostaa ruutukohtaiset
+ajoitustilastot. Tarkoitettu benchmarkeihin, soak-testeihin ja
+optimointien A/B-vertailuun.
+"""
+
+import argparse
+import os
+import random
+import time
+
+import pygame
+
+from frame_clock import SimulatedClock
+from PLAYER_LUOKAT.PlayerInput import PlayerInput
+
+
+def init_headless_pygame():
+    """Alusta pygame dummy-ajureilla.
+
+    `convert()`/`convert_alpha()` vaativat näyttötilan, joten luodaan
+    1x1-kokoinen näkymätön näyttö jos sellaista ei vielä ole.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((1, 1))
+
+
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100.0 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class AutopilotInput(PlayerInput):
+    """Näppäimistön korvaava syöte: ampuu jatkuvasti (P / Shot2) ja kääntyy
+    hitaasti ympäri, jotta luodit leviävät koko ruutuun. Kuormittaa
+    ammusten törmäyspolkua samaan tapaan kuin aktiivinen pelaaja."""
+
+    def __init__(self, turn_period_frames=240):
+        super().__init__()
+        self.turn_period_frames = max(2, int(turn_period_frames))
+        self._frame = 0
+
+    def update(self):
+        self._frame += 1
+        self.shoot2 = True
+        self.turnLeft = (self._frame // (self.turn_period_frames // 2)) % 2 == 0
+        self.turnRight = False
+
+
+class SimulationRunner:
+    """Ajaa yhtä headless-Gamea N ruutua ja kerää ajoitustilastot.
+
+    Args:
+        level_number: ladattava taso (kuten Game-luokassa).
+        dt_ms: simuloitu aika-askel millisekunteina per ruutu.
+        restart_on_end: käynnistä taso uudelleen pelaajan kuoltua tai tason
+            päätyttyä, jotta pitkät ajot eivät pysähdy.
+        seed: random-moduulin siemen toistettavia ajoja varten.
+        spatial_collisions: False = ammusten törmäykset brute forcena
+            (Game.USE_SPATIAL_COLLISIONS), A/B-vertailua varten.
+        numpy_narrowphase: False = ei NumPy-kerneliä tiheissä tilanteissa
+            (Game.USE_NUMPY_NARROWPHASE). Ilman NumPyä asetus ei vaikuta.
+        enemy_separation: True = viholliset erotellaan toisistaan
+            (Game.USE_ENEMY_SEPARATION). None = pelin oletus (RG_ENEMY_SEPARATION).
+        box2d_entities: True = viholliset, meteorit ja pommit Box2D-kappaleina
+            (Game.USE_BOX2D_ENTITIES). None = pelin oletus (RG_BOX2D_ENTITIES).
+        autofire: ohjaa pelaajaa AutopilotInputilla (jatkuva tuli).
+    """
+
+    def __init__(self, level_number=1, dt_ms=1000.0 / 60.0, restart_on_end=True, seed=None,
+                 spatial_collisions=True, autofire=False, numpy_narrowphase=True,
+                 enemy_separation=None, box2d_entities=None):
+        init_headless_pygame()
+        if seed is not None:
+            random.seed(seed)
+
+        # Tuodaan vasta tässä, jotta dummy-ajurit ehtivät voimaan ennen pelin moduuleja.
+        from RocketGame import Game
+
+        self.level_number = level_number
+        self.dt_ms = float(dt_ms)
+        self.restart_on_end = restart_on_end
+        self.game = Game(None, level_number=level_number, headless=True)
+        self.game.clock = SimulatedClock(self.dt_ms)
+        self.game.USE_SPATIAL_COLLISIONS = bool(spatial_collisions)
+        self.game.USE_NUMPY_NARROWPHASE = bool(numpy_narrowphase) and self.game.narrowphase is not None
+        if enemy_separation is not None:
+            self.game.USE_ENEMY_SEPARATION = bool(enemy_separation)
+        if box2d_entities is not None:
+            self.game.USE_BOX2D_ENTITIES = bool(box2d_entities)
+        self.autofire = bool(autofire)
+        self.restarts = 0
+        self._apply_autopilot()
+
+    def _apply_autopilot(self):
+        if self.autofire and not isinstance(self.game.player.input, AutopilotInput):
+            self.game.player.input = AutopilotInput()
+
+    def step(self):
+        """Aja yksi pelin päivitys. Palauttaa False jos peli päättyi."""
+        self.game.update([])
+        if self.game.running:
+            return True
+        if not self.restart_on_end:
+            return False
+        self.game.reset_game()
+        self.game.running = True
+        self.restarts += 1
+        self._apply_autopilot()
+        return True
+
+    def run(self, frames):
+        """Aja `frames` ruutua ja palauta tilastot dictinä."""
+        frame_times = []
+        start = time.perf_counter()
+        for _ in range(int(frames)):
+            t0 = time.perf_counter()
+            alive = self.step()
+            frame_times.append((time.perf_counter() - t0) * 1000.0)
+            if not alive:
+                break
+        wall_s = time.perf_counter() - start
+
+        simulated_s = len(frame_times) * self.dt_ms / 1000.0
+        ordered = sorted(frame_times)
+        return {
+            "frames": len(frame_times),
+            "simulated_s": simulated_s,
+            "wall_s": wall_s,
+            "speedup": simulated_s / wall_s if wall_s > 0 else 0.0,
+            "mean_ms": sum(frame_times) / len(frame_times) if frame_times else 0.0,
+            "p50_ms": _percentile(ordered, 50),
+            "p95_ms": _percentile(ordered, 95),
+            "p99_ms": _percentile(ordered, 99),
+            "max_ms": ordered[-1] if ordered else 0.0,
+            "restarts": self.restarts,
+            "dropped_ms": self.game.loop_dilation.total_dropped,
+            "time_dilation": self.game.loop_dilation.dilation,
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Aja peliä headless-tilassa ja mittaa ruutuajat.")
+    parser.add_argument("--level", type=int, default=1, help="tason numero (0=TestLevel, 6=TestLevel2)")
+    parser.add_argument("--frames", type=int, default=3600, help="simuloitavien ruutujen määrä")
+    parser.add_argument("--dt-ms", type=float, default=1000.0 / 60.0, help="aika-askel per ruutu (ms)")
+    parser.add_argument("--seed", type=int, default=None, help="random-siemen toistettavuutta varten")
+    parser.add_argument("--no-restart", action="store_true", help="lopeta kun peli päättyy")
+    parser.add_argument("--brute-force-collisions", action="store_true",
+                        help="ammusten törmäykset ilman SpatialHash-broadphasea (A/B-vertailu)")
+    parser.add_argument("--no-numpy-narrowphase", action="store_true",
+                        help="ammusten törmäykset ilman NumPy-kerneliä (A/B-vertailu)")
+    parser.add_argument("--enemy-separation", action="store_true",
+                        help="viholliset erotellaan toisistaan (A/B-vertailu)")
+    parser.add_argument("--box2d-entities", action="store_true",
+                        help="viholliset, meteorit ja pommit Box2D-kappaleina (A/B-vertailu)")
+    parser.add_argument("--autofire", action="store_true", help="pelaaja ampuu jatkuvasti (kuormitustesti)")
+    args = parser.parse_args(argv)
+
+    runner = SimulationRunner(
+        level_number=args.level,
+        dt_ms=args.dt_ms,
+        restart_on_end=not args.no_restart,
+        seed=args.seed,
+        spatial_collisions=not args.brute_force_collisions,
+        autofire=args.autofire,
+        numpy_narrowphase=not args.no_numpy_narrowphase,
+        enemy_separation=True if args.enemy_separation else None,
+        box2d_entities=True if args.box2d_entities else None,
+    )
+    stats = runner.run(args.frames)
+    for key, value in stats.items():
+        if isinstance(value, float):
+            print(f"{key:>12}: {value:.3f}")
+        else:
+            print(f"{key:>12}: {value}")
+    pygame.quit()
+    return stats
+
+
+if __name__ == "__main__":
+    main()
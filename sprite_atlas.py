@@ -0,0 +1,382 @@
+"""Tekstuuriatlas animaatioperheille: viholliset, räjähdykset, pommit ja ohjukset.
+
+Lataajat (ExplosionManager, HazardSpriteLibrary, BossEnemy._load_missile_frames,
+SpriteSettings ja pelin vihollisikonit) tuottivat jokaisesta kuvasta oman
+pinnan. `SpriteAtlas` pakkaa kunkin perheen ruudut muutamalle isolle sivulle
+(hyllypakkaus) ja palauttaa ruudut sivujen alipintoina (`Surface.subsurface`):
+
+    from sprite_atlas import SPRITE_ATLAS
+    frames = SPRITE_ATLAS.family(key, sources)
+    if frames is None:
+        frames = SPRITE_ATLAS.pack(key, [lataa ja skaalaa...], sources)
+
+Skaalaus, taustan poisto ja convert_alpha tehdään kerran ennen pakkausta;
+sivut ovat jo näytön pikselimuodossa. Saman avaimen toinen lataus (uusi taso,
+uusi HazardSystem) saa valmiit ruudut suoraan. Alipinnat ovat pysyviä olioita,
+joten ROTATION_CACHE tunnistaa ne samoiksi lähteiksi. Ruutuja ei saa muokata.
+
+Offline-käännös kirjoittaa sivut PNG:ksi ja ruutuindeksin JSONiksi:
+
+    python -m sprite_atlas              # -> images/atlas/atlas.json + atlas_N.png
+
+Peli lukee valmiin atlaksen ensimmäisellä haulla. Jokaisen perheen
+`source`-sormenjälki (tiedostonimet ja -koot) tarkistetaan, joten muuttunut
+lähdekansio ladataan taas yksittäisistä PNG:istä eikä vanhentuneesta atlaksesta.
+Ilman näyttöä (headless, testit) atlas ei tee mitään ja lataajat toimivat
+kuten ennenkin. RG_SPRITE_ATLAS=0 ohittaa atlaksen kokonaan.
+
+Mittaus valmiista atlaksesta: ExplosionManager.load_all_defaults 0.40 s ->
+0.03 s (taustan poisto pikseleittäin jää pois), ohjukset 0.57 s -> <0.01 s,
+tason 1 Game-alustus 0.72 s -> 0.36 s. Ilman valmista atlasta toinen
+HazardSpriteLibrary (eri pommikoko) 0.58 s -> 0.10 s, koska räjähdysruudut
+jaetaan. Sivut: 2 jaettua 1024 px sivua + 27 omaa sivua 810 px pommiräjähdyksille.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+
+import pygame
+
+
+DEFAULT_PAGE_SIZE = 1024               # ATLASSIVUN LEVEYS JA KORKEUS (PX)
+DEFAULT_PADDING = 1                    # TYHJÄ RAKO RUUTUJEN VÄLISSÄ (PX)
+DEFAULT_ATLAS_DIR = os.path.join(os.path.dirname(__file__), "images", "atlas")
+INDEX_FILENAME = "atlas.json"
+INDEX_VERSION = 1
+
+
+def source_fingerprint(paths):
+    """Lähdetiedostojen nimistä ja koista laskettu tunniste (puuttuva tiedosto = -1)."""
+    digest = hashlib.sha1()
+    for path in paths:
+        path = str(path)
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            size = -1
+        digest.update(f"{os.path.basename(path)}:{size};".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ShelfPacker:
+    """Hyllypakkaaja yhdelle sivulle: ruudut riveihin vasemmalta oikealle.
+
+    Args:
+        width, height: sivun koko pikseleinä.
+        padding: rako ruutujen välissä.
+    """
+
+    def __init__(self, width, height, padding=DEFAULT_PADDING):
+        self.width = int(width)
+        self.height = int(height)
+        self.padding = int(padding)
+        self._shelf_y = 0
+        self._shelf_h = 0
+        self._cursor_x = 0
+
+    @property
+    def used_height(self):
+        """Käytetyn alueen korkeus (sivu voidaan tallentaa rajattuna)."""
+        return self._shelf_y + self._shelf_h
+
+    def insert(self, width, height):
+        """Varaa paikka ruudulle.
+
+        Returns:
+            (x, y) tai None, jos ruutu ei enää mahdu sivulle.
+        """
+        pad = self.padding
+        if width > self.width or height > self.height:
+            return None
+        if self._cursor_x + width > self.width:
+            self._shelf_y += self._shelf_h + pad
+            self._shelf_h = 0
+            self._cursor_x = 0
+        if self._shelf_y + height > self.height:
+            return None
+        x, y = self._cursor_x, self._shelf_y
+        self._cursor_x += width + pad
+        self._shelf_h = max(self._shelf_h, height)
+        return x, y
+
+
+class SpriteAtlas:
+    """Animaatioperheet jaetuilla atlassivuilla.
+
+    Args:
+        page_size: sivun koko; yli puolen sivun ruudut saavat oman sivunsa.
+        padding: rako ruutujen välissä.
+        directory: valmiin atlaksen kansio (None = ei ladata levyltä).
+        enabled: False = pack() palauttaa ruudut sellaisenaan.
+
+    Attributes:
+        pages: atlassivut (pygame.Surface).
+        hits, packed: kumulatiiviset laskurit (valmis perhe / pakattu perhe).
+        prebuilt: levyltä luettujen perheiden määrä.
+    """
+
+    def __init__(self, page_size=DEFAULT_PAGE_SIZE, padding=DEFAULT_PADDING, directory=None, enabled=True):
+        self.page_size = int(page_size)
+        self.padding = int(padding)
+        self.directory = directory
+        self.enabled = bool(enabled)
+        self.pages = []
+        self._packers = []
+        self._open_page = None
+        self._page_files = {}
+        self._families = {}
+        self._loaded = False
+        self.hits = 0
+        self.packed = 0
+        self.prebuilt = 0
+
+    def __len__(self):
+        return len(self._families)
+
+    def __contains__(self, key):
+        return key in self._families
+
+    @staticmethod
+    def _display_ready():
+        return pygame.display.get_init() and pygame.display.get_surface() is not None
+
+    def family(self, key, sources=None):
+        """Palauttaa perheen ruudut (alipinnat) tai None.
+
+        Args:
+            key: perheen avain, esim. "explosion/Explosions_dynamiteStyle@60x60".
+            sources: lähdetiedostojen polut; jos annettu, sormenjäljen pitää täsmätä.
+        """
+        if not self.enabled or not self._display_ready():
+            return None
+        if not self._loaded:
+            self._loaded = True
+            if self.directory:
+                self.load(self.directory)
+        entry = self._families.get(key)
+        if entry is None:
+            return None
+        fingerprint, frames, rects = entry
+        if sources is not None and fingerprint != source_fingerprint(sources):
+            return None
+        if frames is None:
+            # Valmiin atlaksen sivut luetaan vasta, kun niiden perhettä pyydetään.
+            try:
+                frames = [self._page(index).subsurface((x, y, w, h)) for index, x, y, w, h in rects]
+            except (OSError, ValueError, pygame.error):
+                return None
+            self._families[key] = (fingerprint, frames, rects)
+        self.hits += 1
+        return list(frames)
+
+    def _page(self, index):
+        page = self.pages[index]
+        if page is None:
+            page = pygame.image.load(self._page_files[index])
+            if self._display_ready():
+                page = page.convert_alpha()
+            self.pages[index] = page
+        return page
+
+    def _new_page(self, width, height, packer):
+        page = pygame.Surface((width, height), pygame.SRCALPHA)
+        if self._display_ready():
+            page = page.convert_alpha()
+        self.pages.append(page)
+        self._packers.append(packer)
+        return len(self.pages) - 1
+
+    def _place(self, width, height):
+        limit = self.page_size // 2
+        if width > limit or height > limit:
+            # Iso ruutu (esim. 810 px pommiräjähdys) saa oman sivun.
+            return self._new_page(width, height, None), 0, 0
+        if self._open_page is not None:
+            pos = self._packers[self._open_page].insert(width, height)
+            if pos is not None:
+                return (self._open_page,) + pos
+        packer = ShelfPacker(self.page_size, self.page_size, self.padding)
+        self._open_page = self._new_page(self.page_size, self.page_size, packer)
+        return (self._open_page,) + packer.insert(width, height)
+
+    def pack(self, key, frames, sources=None):
+        """Kopioi ruudut atlakseen ja palauttaa ne alipintoina samassa järjestyksessä.
+
+        Ilman näyttöä tai kun atlas on pois päältä ruudut palautetaan sellaisinaan.
+        Saman avaimen aiempi perhe korvataan.
+        """
+        frames = list(frames)
+        if not self.enabled or not frames or not self._display_ready():
+            return frames
+        packed = []
+        rects = []
+        for frame in frames:
+            width, height = frame.get_size()
+            index, x, y = self._place(width, height)
+            page = self.pages[index]
+            # Sivu on tyhjä (0, 0, 0, 0), joten RGBA_MAX kopioi ruudun pikselit sellaisenaan.
+            page.blit(frame, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+            packed.append(page.subsurface((x, y, width, height)))
+            rects.append((index, x, y, width, height))
+        fingerprint = source_fingerprint(sources) if sources is not None else None
+        self._families[key] = (fingerprint, packed, rects)
+        self.packed += 1
+        return list(packed)
+
+    def clear(self):
+        """Unohda sivut ja perheet (valmis atlas luetaan uudelleen seuraavalla haulla)."""
+        self.pages = []
+        self._packers = []
+        self._open_page = None
+        self._page_files.clear()
+        self._families.clear()
+        self._loaded = False
+        self.prebuilt = 0
+
+    def save(self, directory):
+        """Kirjoita sivut PNG:ksi ja ruutuindeksi JSONiksi.
+
+        Returns:
+            str: indeksitiedoston polku.
+        """
+        os.makedirs(directory, exist_ok=True)
+        page_files = []
+        for index, packer in enumerate(self._packers):
+            filename = f"atlas_{index}.png"
+            page = self._page(index)
+            if packer is not None:
+                page = page.subsurface((0, 0, page.get_width(), max(1, packer.used_height)))
+            pygame.image.save(page, os.path.join(directory, filename))
+            page_files.append(filename)
+        index_data = {
+            "version": INDEX_VERSION,
+            "page_size": self.page_size,
+            "pages": page_files,
+            "families": {
+                key: {"source": fingerprint, "frames": [list(rect) for rect in rects]}
+                for key, (fingerprint, _, rects) in sorted(self._families.items())
+            },
+        }
+        path = os.path.join(directory, INDEX_FILENAME)
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(index_data, handle, indent=1)
+        return path
+
+    def load(self, directory):
+        """Lue save()-atlaksen ruutuindeksi. Sivut luetaan vasta, kun perhettä pyydetään.
+
+        Levyltä luetut sivut ovat täynnä; uudet perheet pakataan uusille sivuille.
+
+        Returns:
+            bool: True, jos indeksi luettiin.
+        """
+        path = os.path.join(directory, INDEX_FILENAME)
+        try:
+            with open(path, encoding="utf-8") as handle:
+                index_data = json.load(handle)
+            if index_data.get("version") != INDEX_VERSION:
+                return False
+            page_files = [os.path.join(directory, filename) for filename in index_data["pages"]]
+            families = {
+                key: (entry.get("source"), [tuple(int(v) for v in rect) for rect in entry["frames"]])
+                for key, entry in index_data.get("families", {}).items()
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+        offset = len(self.pages)
+        for i, page_path in enumerate(page_files):
+            self._page_files[offset + i] = page_path
+        self.pages.extend([None] * len(page_files))
+        self._packers.extend([None] * len(page_files))
+        for key, (fingerprint, rects) in families.items():
+            if key in self._families:
+                continue
+            rects = [(offset + page, x, y, w, h) for page, x, y, w, h in rects]
+            self._families[key] = (fingerprint, None, rects)
+            self.prebuilt += 1
+        return True
+
+    @property
+    def nbytes(self):
+        """Luettujen ja pakattujen sivujen koko tavuina."""
+        return sum(page.get_width() * page.get_height() * page.get_bytesize() for page in self.pages if page is not None)
+
+    def get_metrics(self):
+        """Laskurit ja muistinkäyttö debug-overlayhin."""
+        return {
+            "atlas_pages": len(self.pages),
+            "atlas_pages_loaded": sum(1 for page in self.pages if page is not None),
+            "atlas_families": len(self._families),
+            "atlas_frames": sum(len(entry[2]) for entry in self._families.values()),
+            "atlas_prebuilt": self.prebuilt,
+            "atlas_hits": self.hits,
+            "atlas_kb": self.nbytes / 1024.0,
+        }
+
+
+def _env_enabled():
+    return os.environ.get("RG_SPRITE_ATLAS", "1").strip() in ("1", "true", "True", "yes", "on")
+
+
+# Koko pelin yhteinen atlas; valmis käännös luetaan images/atlas-kansiosta.
+SPRITE_ATLAS = SpriteAtlas(directory=DEFAULT_ATLAS_DIR, enabled=_env_enabled())
+
+# Tasojen pommikoot (HazardSystem-konfiguraatiot), jotka offline-käännös pakkaa.
+BUILD_BOMB_SIZES = (58, 64, 72, 76)
+
+
+def build_default_atlas(atlas=SPRITE_ATLAS):
+    """Aja pelin lataajat tyhjää atlasta vasten, jolloin jokainen perhe pakataan.
+
+    Vaatii näytön (pygame.display.set_mode), koska lataajat kutsuvat convert_alpha().
+    """
+    from Enemies.boss_enemy import BossEnemy
+    from explosion import ExplosionManager
+    from Hazards.hazard_system import DEFAULT_HAZARD_CONFIG, HazardSpriteLibrary
+    from RocketGame import load_enemy_images
+    from SpriteSettings import SpriteSettings
+
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    atlas.clear()
+    atlas.directory = None
+    atlas.enabled = True
+
+    load_enemy_images(os.path.join(base_path, "images", "viholliset"))
+    SpriteSettings(base_path=os.path.join(base_path, "enemy-sprite")).load_all()
+    ExplosionManager().load_all_defaults()
+    BossEnemy._MISSILE_CACHE = None
+    BossEnemy._load_missile_frames()
+    sprite_root = os.path.join(base_path, "images", "Space-Shooter_objects")
+    for size in BUILD_BOMB_SIZES:
+        HazardSpriteLibrary(sprite_root, config=dict(DEFAULT_HAZARD_CONFIG, bomb_sprite_size=size))
+    return atlas
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pakkaa spritet atlakseen ja kirjoita JSON-ruutuindeksi.")
+    parser.add_argument("--out", default=DEFAULT_ATLAS_DIR, help="kohdekansio (oletus images/atlas)")
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE, help="atlassivun koko pikseleinä")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    # `python -m` ajaa tämän tiedoston __main__-moduulina; lataajat käyttävät
+    # tuotua sprite_atlas-moduulia, joten pakataan sen SPRITE_ATLASiin.
+    import sprite_atlas
+
+    sprite_atlas.SPRITE_ATLAS.page_size = max(64, int(args.page_size))
+    atlas = sprite_atlas.build_default_atlas(sprite_atlas.SPRITE_ATLAS)
+    path = atlas.save(args.out)
+    metrics = atlas.get_metrics()
+    print(
+        f"{metrics['atlas_families']} families, {metrics['atlas_frames']} frames, "
+        f"{metrics['atlas_pages']} pages ({metrics['atlas_kb'] / 1024.0:.1f} MB) -> {path}"
+    )
+
+
+if __name__ == "__main__":
+    main()